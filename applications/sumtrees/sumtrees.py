@@ -36,14 +36,18 @@ import socket
 import math
 import csv
 import json
+import shutil
+import tempfile
+import time
+import timeit
+import cProfile
 
+import multiprocessing
 try:
-    # Python 3
-    import queue
+    import resource
 except ImportError:
-    # Python 2.7
-    import Queue as queue
-import multiprocessing
+    # not available on Windows
+    resource = None
 
 import dendropy
 if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
@@ -55,6 +59,8 @@ from dendropy.utility import messaging
 from dendropy.utility import timeprocessing
 from dendropy.utility import bitprocessing
 from dendropy.utility import textprocessing
+from dendropy.calculate import statistics
+from dendropy.calculate import treesum
 
 ##############################################################################
 ## Preamble
@@ -74,6 +80,407 @@ _program_citation = """\
 Sukumaran, J and MT Holder. {prog_name}: {prog_subtitle}. {prog_version}. Available at https://github.com/jeetsukumaran/DendroPy.
 """.format(prog_name=_program_name, prog_subtitle=_program_subtitle, prog_version=_program_version)
 
+##############################################################################
+## Checkpointing
+
+_CHECKPOINT_MAGIC = b"SUMTREESCKPT"
+_CHECKPOINT_FILENAME_EXTENSION = ".checkpoint"
+
+def _checkpoint_source_key(tree_source):
+    if textprocessing.is_str_type(tree_source):
+        return os.path.abspath(tree_source)
+    return None
+
+class TreeAnalysisCheckpointer(object):
+    """
+    Periodically saves the progress of the analysis of trees by a process, so
+    that an interrupted run can be resumed (see :func:`load_checkpoints()`).
+
+    Each checkpoint is written to a new file, and consists of the trees
+    analyzed since the previous checkpoint of the same process (in the compact
+    columnar format of |TreeArray|) along with, for each source, the number of
+    trees read and the file position from which to resume reading. As each
+    checkpoint only holds the new trees, checkpoints are cheap to write even
+    late in a long run. Checkpoint files are written under a temporary name
+    and then renamed, so that an interruption while writing never leaves an
+    incomplete checkpoint behind.
+    """
+
+    def __init__(self,
+            checkpoint_dirpath,
+            name,
+            settings,
+            checkpoint_frequency=0,
+            checkpoint_interval=0,
+            ):
+        """
+        Parameters
+        ----------
+        checkpoint_dirpath : str
+            Directory in which to write the checkpoint files.
+        name : str
+            Prefix for the checkpoint files; must be unique for each process
+            of each run.
+        settings : dict
+            Analysis settings that must be the same when resuming.
+        checkpoint_frequency : int
+            Save a checkpoint after this many trees have been read (0: never).
+        checkpoint_interval : float
+            Save a checkpoint after this many seconds have elapsed (0: never).
+        """
+        self.checkpoint_dirpath = checkpoint_dirpath
+        self.name = name
+        self.settings = settings
+        self.checkpoint_frequency = checkpoint_frequency
+        self.checkpoint_interval = checkpoint_interval
+        self.source_states = collections.OrderedDict()
+        self.num_checkpoints_saved = 0
+        self._num_trees_since_checkpoint = 0
+        self._last_checkpoint_time = time.time()
+
+    def new_tree_array(self, tree_array):
+        """
+        Returns a new empty |TreeArray| configured like ``tree_array``.
+        """
+        return dendropy.TreeArray(
+                taxon_namespace=tree_array.taxon_namespace,
+                is_rooted_trees=tree_array.is_rooted_trees,
+                ignore_edge_lengths=tree_array.ignore_edge_lengths,
+                ignore_node_ages=tree_array.ignore_node_ages,
+                use_tree_weights=tree_array.use_tree_weights,
+                ultrametricity_precision=tree_array.split_distribution.ultrametricity_precision,
+                is_force_max_age=tree_array.split_distribution.is_force_max_age,
+                taxon_label_age_map=tree_array.taxon_label_age_map,
+                )
+
+    def count_tree(self):
+        """
+        Registers that a tree has been read; returns |True| if a checkpoint is
+        due.
+        """
+        self._num_trees_since_checkpoint += 1
+        if self.checkpoint_frequency and self._num_trees_since_checkpoint >= self.checkpoint_frequency:
+            return True
+        if self.checkpoint_interval and (time.time() - self._last_checkpoint_time) >= self.checkpoint_interval:
+            return True
+        return False
+
+    def update_source_state(self, source_key, trees_read, resume_offset, is_complete):
+        if source_key is None:
+            return
+        self.source_states[source_key] = {
+                "trees_read": trees_read,
+                "resume_offset": resume_offset,
+                "is_complete": is_complete,
+                }
+
+    def save(self, tree_array):
+        """
+        Saves the trees in ``tree_array`` (which should be those read since
+        the last checkpoint) and the current state of the sources.
+        """
+        self.num_checkpoints_saved += 1
+        filepath = os.path.join(self.checkpoint_dirpath, "{}-{:06d}{}".format(
+            self.name,
+            self.num_checkpoints_saved,
+            _CHECKPOINT_FILENAME_EXTENSION))
+        header = json.dumps({
+            "settings": self.settings,
+            "sources": self.source_states,
+            }).encode("utf-8")
+        temp_filepath = filepath + ".tmp"
+        with open(temp_filepath, "wb") as dest:
+            dest.write(_CHECKPOINT_MAGIC)
+            dest.write(bitprocessing.int_to_bytes(len(header), 8))
+            dest.write(header)
+            tree_array.write_columns(dest)
+            dest.flush()
+            os.fsync(dest.fileno())
+        os.rename(temp_filepath, filepath)
+        self._num_trees_since_checkpoint = 0
+        self._last_checkpoint_time = time.time()
+        return filepath
+
+def find_checkpoints(checkpoint_dirpath):
+    """
+    Returns the paths of all (complete) checkpoint files in
+    ``checkpoint_dirpath``.
+    """
+    if not os.path.isdir(checkpoint_dirpath):
+        return []
+    return sorted(os.path.join(checkpoint_dirpath, f)
+            for f in os.listdir(checkpoint_dirpath)
+            if f.endswith(_CHECKPOINT_FILENAME_EXTENSION))
+
+def next_checkpoint_run_name(checkpoint_dirpath):
+    """
+    Returns a prefix for the names of the checkpoint files of a new run that
+    does not clash with those of previous (interrupted) runs.
+    """
+    run_indexes = [0]
+    for filepath in find_checkpoints(checkpoint_dirpath):
+        m = re.match(r"run(\d+)-", os.path.basename(filepath))
+        if m:
+            run_indexes.append(int(m.group(1)))
+    return "run{:04d}".format(max(run_indexes) + 1)
+
+def load_checkpoints(checkpoint_dirpath, tree_array, settings):
+    """
+    Adds the trees saved in all the checkpoints in ``checkpoint_dirpath`` to
+    ``tree_array``, and returns a dictionary mapping each source to the state
+    from which its analysis is to be resumed.
+    """
+    source_states = {}
+    for filepath in find_checkpoints(checkpoint_dirpath):
+        with open(filepath, "rb") as src:
+            if src.read(len(_CHECKPOINT_MAGIC)) != _CHECKPOINT_MAGIC:
+                raise ValueError("'{}' is not a SumTrees checkpoint file".format(filepath))
+            header_len = bitprocessing.int_from_bytes(src.read(8))
+            header = json.loads(src.read(header_len).decode("utf-8"))
+            for key in settings:
+                if header["settings"].get(key) != settings[key]:
+                    raise ValueError("Checkpoint '{}' was saved with '{}' of '{}' but current run has '{}'".format(
+                        filepath, key, header["settings"].get(key), settings[key]))
+            tree_array.read_columns(src)
+        for source_key, state in header["sources"].items():
+            current_state = source_states.get(source_key)
+            if current_state is None:
+                source_states[source_key] = state
+            elif current_state["is_complete"]:
+                continue
+            elif state["is_complete"] or state["trees_read"] > current_state["trees_read"]:
+                source_states[source_key] = state
+    for source_key, state in source_states.items():
+        if (not state["is_complete"]
+                and state["resume_offset"] is not None
+                and os.path.exists(source_key)
+                and os.path.getsize(source_key) < state["resume_offset"]):
+            raise ValueError("Source '{}' is shorter than when checkpoint was saved".format(source_key))
+    return source_states
+
+##############################################################################
+## Convergence Diagnostics
+
+class ConvergenceTracker(object):
+    """
+    Keeps a separate |SplitDistribution| for the trees of each source, as well
+    as running moments of the edge lengths of each split in each source, as
+    the trees are analyzed. Convergence diagnostics across sources (e.g.,
+    independent MCMC runs) can then be calculated without having to re-read
+    the trees.
+    """
+
+    def __init__(self,
+            taxon_namespace,
+            is_rooted_trees,
+            use_tree_weights,
+            ignore_edge_lengths,
+            window_size=0):
+        self.taxon_namespace = taxon_namespace
+        self.is_rooted_trees = is_rooted_trees
+        self.use_tree_weights = use_tree_weights
+        self.ignore_edge_lengths = ignore_edge_lengths
+        self.window_size = window_size
+        self.source_names = []
+        self.source_split_distributions = {}
+        self.source_edge_length_moments = {}
+        self.source_window_split_distributions = {}
+        self.source_window_split_frequencies = {}
+
+    def _new_split_distribution(self):
+        return dendropy.SplitDistribution(
+                taxon_namespace=self.taxon_namespace,
+                ignore_edge_lengths=True,
+                ignore_node_ages=True,
+                use_tree_weights=self.use_tree_weights)
+
+    def count_tree(self, source_name, tree, split_bitmasks, edge_lengths):
+        """
+        Counts the splits of ``tree`` (which must have its bipartitions
+        encoded), with bitmasks and edge lengths ``split_bitmasks`` and
+        ``edge_lengths``, as given by :meth:`TreeArray.add_tree()`, for
+        source ``source_name``.
+        """
+        split_distribution = self.source_split_distributions.get(source_name)
+        if split_distribution is None:
+            self.source_names.append(source_name)
+            split_distribution = self._new_split_distribution()
+            self.source_split_distributions[source_name] = split_distribution
+            self.source_edge_length_moments[source_name] = {}
+            self.source_window_split_frequencies[source_name] = []
+            if self.window_size:
+                self.source_window_split_distributions[source_name] = self._new_split_distribution()
+        split_distribution.count_splits_on_tree(tree, is_bipartitions_updated=True)
+        if self.window_size:
+            window_split_distribution = self.source_window_split_distributions[source_name]
+            window_split_distribution.count_splits_on_tree(tree, is_bipartitions_updated=True)
+            if window_split_distribution.total_trees_counted >= self.window_size:
+                self.source_window_split_frequencies[source_name].append(
+                        dict(window_split_distribution.split_frequencies))
+                self.source_window_split_distributions[source_name] = self._new_split_distribution()
+        if not self.ignore_edge_lengths:
+            # Welford's algorithm: [n, mean, sum of squared deviations]
+            edge_length_moments = self.source_edge_length_moments[source_name]
+            for split_bitmask, edge_length in zip(split_bitmasks, edge_lengths):
+                if edge_length is None:
+                    continue
+                moments = edge_length_moments.get(split_bitmask)
+                if moments is None:
+                    moments = [0, 0.0, 0.0]
+                    edge_length_moments[split_bitmask] = moments
+                moments[0] += 1
+                delta = edge_length - moments[1]
+                moments[1] += delta / moments[0]
+                moments[2] += delta * (edge_length - moments[1])
+
+    def update(self, other):
+        """
+        Adds the sources tracked by ``other`` (which must not be tracked by
+        ``self``).
+        """
+        for source_name in other.source_names:
+            if source_name in self.source_split_distributions:
+                raise ValueError("Source '{}' tracked multiple times".format(source_name))
+            self.source_names.append(source_name)
+            self.source_split_distributions[source_name] = other.source_split_distributions[source_name]
+            self.source_edge_length_moments[source_name] = other.source_edge_length_moments[source_name]
+            self.source_window_split_frequencies[source_name] = other.source_window_split_frequencies[source_name]
+
+    def num_sources(self):
+        return len(self.source_names)
+
+    def split_frequency_standard_deviations(self, min_freq=0.1):
+        return treesum.split_frequency_standard_deviations(
+                split_frequencies=[self.source_split_distributions[s].split_frequencies for s in self.source_names],
+                all_taxa_bitmask=self.taxon_namespace.all_taxa_bitmask(),
+                is_rooted=self.is_rooted_trees,
+                min_freq=min_freq)
+
+    def edge_length_psrfs(self):
+        """
+        Returns a dictionary mapping split bitmasks to the potential scale
+        reduction factor of their edge lengths across sources, for all splits
+        with edge lengths sampled at least twice in every source.
+        """
+        psrfs = {}
+        if len(self.source_names) < 2:
+            return psrfs
+        all_moments = [self.source_edge_length_moments[s] for s in self.source_names]
+        for split_bitmask in all_moments[0]:
+            chain_moments = [m.get(split_bitmask) for m in all_moments]
+            if any(m is None or m[0] < 2 for m in chain_moments):
+                continue
+            psrf = statistics.potential_scale_reduction_factor(
+                    chain_sizes=[m[0] for m in chain_moments],
+                    chain_means=[m[1] for m in chain_moments],
+                    chain_variances=[m[2] / (m[0] - 1) for m in chain_moments])
+            if psrf is not None:
+                psrfs[split_bitmask] = psrf
+        return psrfs
+
+    def window_trace(self, min_freq=0.1):
+        """
+        Returns a list of tuples, (index of window, ASDSF, max SDSF), for each
+        successive window of ``window_size`` trees completed by all sources.
+        """
+        trace = []
+        if len(self.source_names) < 2 or not self.window_size:
+            return trace
+        num_windows = min(len(self.source_window_split_frequencies[s]) for s in self.source_names)
+        for window_idx in range(num_windows):
+            asdsf, max_sdsf = treesum.average_standard_deviation_of_split_frequencies(
+                    split_frequencies=[self.source_window_split_frequencies[s][window_idx] for s in self.source_names],
+                    all_taxa_bitmask=self.taxon_namespace.all_taxa_bitmask(),
+                    is_rooted=self.is_rooted_trees,
+                    min_freq=min_freq)
+            trace.append((window_idx, asdsf, max_sdsf))
+        return trace
+
+##############################################################################
+## Performance Instrumentation
+
+_performance_timer = timeit.default_timer
+
+def _peak_rss_bytes():
+    """
+    Returns the peak resident set size of the current process in bytes, or
+    |None| if this cannot be determined on the current platform.
+    """
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        # reported in bytes on macOS, but in kilobytes elsewhere
+        return peak_rss
+    return peak_rss * 1024
+
+class PerformanceRecorder(object):
+    """
+    Accumulates the time spent in each phase of the work of a process (e.g.,
+    parsing, bipartition encoding, writing), and counts of the work done
+    (e.g., trees and bytes read), for the run report written with
+    '--performance-report'.
+
+    Phases are expected not to overlap, so that the times of all the phases
+    of a process add up to (at most) its total running time.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.phase_times = collections.OrderedDict()
+        self.counts = collections.OrderedDict()
+        self.peak_rss_bytes = None
+        self._phase_start_times = {}
+
+    def start_phase(self, phase):
+        self._phase_start_times[phase] = _performance_timer()
+
+    def stop_phase(self, phase):
+        """
+        Ends the timing of ``phase`` started by :meth:`start_phase()`; ignored
+        if ``phase`` is not being timed.
+        """
+        start_time = self._phase_start_times.pop(phase, None)
+        if start_time is not None:
+            self.add_phase_time(phase, _performance_timer() - start_time)
+
+    def add_phase_time(self, phase, seconds):
+        self.phase_times[phase] = self.phase_times.get(phase, 0.0) + seconds
+
+    def count(self, name, value=1):
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    def record_peak_rss(self):
+        """
+        Samples the peak memory usage of the current process: must be called
+        from the process being recorded.
+        """
+        self.peak_rss_bytes = _peak_rss_bytes()
+
+    def total_phase_time(self, phases=None):
+        if phases is None:
+            phases = self.phase_times.keys()
+        return sum(self.phase_times.get(phase, 0.0) for phase in phases)
+
+    def as_dict(self):
+        """
+        Returns the measurements as a dictionary, with the rates of the
+        reading of trees and bytes over the total time of all phases.
+        """
+        d = collections.OrderedDict()
+        d["name"] = self.name
+        d["phase_seconds"] = collections.OrderedDict(self.phase_times)
+        d["total_seconds"] = self.total_phase_time()
+        d["counts"] = collections.OrderedDict(self.counts)
+        for count_name, rate_name in (("trees_read", "trees_per_second"), ("bytes_read", "bytes_per_second")):
+            if count_name in self.counts:
+                if d["total_seconds"] > 0:
+                    d[rate_name] = self.counts[count_name] / d["total_seconds"]
+                else:
+                    d[rate_name] = None
+        d["peak_rss_bytes"] = self.peak_rss_bytes
+        return d
+
 ##############################################################################
 ## Primary Analyzing
 
@@ -90,8 +497,21 @@ def _read_into_tree_array(
         error_message_func,
         log_frequency,
         debug_mode,
+        checkpointer=None,
+        source_resume_states=None,
+        follow=False,
+        follow_timeout=None,
+        follow_update_func=None,
+        follow_update_interval=0,
+        convergence_tracker=None,
+        performance_recorder=None,
         ):
-    if not log_frequency:
+    if (not log_frequency
+            and checkpointer is None
+            and not source_resume_states
+            and not follow
+            and convergence_tracker is None
+            and performance_recorder is None):
         tree_array.read_from_files(
             files=tree_sources,
             schema=schema,
@@ -105,6 +525,7 @@ def _read_into_tree_array(
         def _log_progress(source_name, current_tree_offset):
             if (
                     info_message_func is not None
+                    and log_frequency
                     and (
                         (log_frequency == 1)
                         or (tree_offset > 0 and current_tree_offset == tree_offset)
@@ -120,6 +541,17 @@ def _read_into_tree_array(
                     current_tree_offset=current_tree_offset,
                     coda=coda,
                     ), wrap=False)
+        # Sources being resumed: if the position in the source from which to
+        # resume is known, reading starts from there; otherwise, the trees
+        # already analyzed are re-read and skipped.
+        source_resume_offsets = [None] * len(tree_sources)
+        source_start_tree_offsets = [0] * len(tree_sources)
+        if source_resume_states:
+            for source_idx, tree_source in enumerate(tree_sources):
+                resume_state = source_resume_states.get(_checkpoint_source_key(tree_source))
+                if resume_state is not None:
+                    source_resume_offsets[source_idx] = resume_state["resume_offset"]
+                    source_start_tree_offsets[source_idx] = resume_state["trees_read"]
         tree_yielder = dendropy.Tree.yield_from_files(
                 tree_sources,
                 schema=schema,
@@ -127,35 +559,131 @@ def _read_into_tree_array(
                 store_tree_weights=use_tree_weights,
                 preserve_underscores=preserve_underscores,
                 rooting=rooting,
+                resume_offsets=source_resume_offsets if source_resume_states else None,
+                follow=follow,
+                follow_timeout=follow_timeout,
                 ignore_unrecognized_keyword_arguments=True,
                 )
+        # With checkpointing, trees are accumulated in a separate collection
+        # which is saved and then merged into ``tree_array`` at each
+        # checkpoint, so that each checkpoint only stores the new trees.
+        if checkpointer is not None:
+            target_tree_array = checkpointer.new_tree_array(tree_array)
+        else:
+            target_tree_array = tree_array
+        # Trees of different sources are interleaved when following sources,
+        # so the position reached in each is tracked separately.
+        source_tree_offsets = {}
+        source_analysis_tree_offsets = {}
+        completed_source_indexes = set()
+        def _update_source_states(is_complete):
+            for source_index in source_tree_offsets:
+                if source_index in completed_source_indexes:
+                    continue
+                if is_complete:
+                    resume_offset = None
+                    completed_source_indexes.add(source_index)
+                else:
+                    resume_offset = tree_yielder.get_file_resume_offset(source_index)
+                checkpointer.update_source_state(_checkpoint_source_key(tree_sources[source_index]),
+                        trees_read=source_tree_offsets[source_index],
+                        resume_offset=resume_offset,
+                        is_complete=is_complete)
+        def _save_checkpoint(target_tree_array):
+            if performance_recorder is not None:
+                performance_recorder.start_phase("checkpointing")
+            checkpointer.save(target_tree_array)
+            if len(target_tree_array) > 0:
+                tree_array.update(target_tree_array)
+                target_tree_array = checkpointer.new_tree_array(tree_array)
+            if performance_recorder is not None:
+                performance_recorder.stop_phase("checkpointing")
+            return target_tree_array
         current_source_index = None
         current_tree_offset = None
+        last_follow_update_time = time.time()
+        is_follow_update_pending = False
+        # the time spent parsing a tree is taken to be the time between the
+        # end of the processing of the previous tree and the yielding of the
+        # tree
+        parse_start_time = _performance_timer()
         try:
             for aggregate_tree_idx, tree in enumerate(tree_yielder):
-                current_yielder_index = tree_yielder.current_file_index
-                if current_yielder_index != current_source_index:
-                    current_source_index = current_yielder_index
-                    current_tree_offset = 0
-                    source_name = tree_yielder.current_file_name
-                    if source_name is None:
-                        source_name = "<stdin>"
+                if performance_recorder is not None:
+                    performance_recorder.add_phase_time("parsing", _performance_timer() - parse_start_time)
+                    performance_recorder.count("trees_read")
+                current_source_index = tree_yielder.current_file_index
+                source_name = tree_yielder.current_file_name
+                if source_name is None:
+                    source_name = "<stdin>"
+                if current_source_index not in source_tree_offsets:
+                    if checkpointer is not None and not follow:
+                        _update_source_states(is_complete=True)
+                    if source_resume_offsets[current_source_index] is not None:
+                        source_tree_offsets[current_source_index] = source_start_tree_offsets[current_source_index]
+                        source_analysis_tree_offsets[current_source_index] = tree_offset
+                    else:
+                        source_tree_offsets[current_source_index] = 0
+                        source_analysis_tree_offsets[current_source_index] = max(tree_offset, source_start_tree_offsets[current_source_index])
                     if len(tree_sources) > 1:
                         info_message_func("Analyzing {} of {}: '{}'".format(current_source_index+1, len(tree_sources), source_name), wrap=False)
                     else:
                         info_message_func("Analyzing: '{}'".format(source_name), wrap=False)
-                if current_tree_offset >= tree_offset:
-                    tree_array.add_tree(tree=tree, is_bipartitions_updated=False)
-                    _log_progress(source_name, current_tree_offset)
-                else:
-                    _log_progress(source_name, current_tree_offset)
+                    if source_tree_offsets[current_source_index] > 0:
+                        info_message_func("'{}': resuming at tree offset {}".format(source_name, source_tree_offsets[current_source_index]), wrap=False)
+                current_tree_offset = source_tree_offsets[current_source_index]
+                if current_tree_offset >= source_analysis_tree_offsets[current_source_index]:
+                    if performance_recorder is None:
+                        index, split_bitmasks, edge_lengths, weight = target_tree_array.add_tree(tree=tree, is_bipartitions_updated=False)
+                    else:
+                        counting_start_time = _performance_timer()
+                        index, split_bitmasks, edge_lengths, weight = target_tree_array.add_tree(tree=tree, is_bipartitions_updated=False)
+                        performance_recorder.add_phase_time("split_counting", _performance_timer() - counting_start_time)
+                        performance_recorder.count("trees_analyzed")
+                    if convergence_tracker is not None:
+                        convergence_tracker.count_tree(
+                                source_name=source_name,
+                                tree=tree,
+                                split_bitmasks=split_bitmasks,
+                                edge_lengths=edge_lengths)
+                    is_follow_update_pending = True
+                _log_progress(source_name, current_tree_offset)
                 current_tree_offset += 1
+                source_tree_offsets[current_source_index] = current_tree_offset
+                if checkpointer is not None and checkpointer.count_tree():
+                    _update_source_states(is_complete=False)
+                    target_tree_array = _save_checkpoint(target_tree_array)
+                if (follow_update_func is not None
+                        and is_follow_update_pending
+                        and time.time() - last_follow_update_time >= follow_update_interval):
+                    if checkpointer is not None:
+                        _update_source_states(is_complete=False)
+                        target_tree_array = _save_checkpoint(target_tree_array)
+                    if len(tree_array) > 0:
+                        follow_update_func(tree_array)
+                    last_follow_update_time = time.time()
+                    is_follow_update_pending = False
+                parse_start_time = _performance_timer()
         except (Exception, KeyboardInterrupt) as e:
             if debug_mode and not isinstance(e, KeyboardInterrupt):
                 raise
             e.exception_tree_source_name = tree_yielder.current_file_name
             e.exception_tree_offset = current_tree_offset
             raise e
+        if checkpointer is not None:
+            _update_source_states(is_complete=True)
+            _save_checkpoint(target_tree_array)
+        if performance_recorder is not None:
+            # bytes consumed by the reader: from the position at which
+            # reading started to the position following the last tree read
+            for source_index in source_tree_offsets:
+                end_offset = tree_yielder.get_file_resume_offset(source_index)
+                if end_offset is None:
+                    continue
+                start_offset = source_resume_offsets[source_index]
+                if start_offset is None:
+                    start_offset = 0
+                performance_recorder.count("bytes_read", end_offset - start_offset)
 
 class TreeAnalysisWorker(multiprocessing.Process):
 
@@ -177,10 +705,17 @@ class TreeAnalysisWorker(multiprocessing.Process):
             messenger,
             messenger_lock,
             debug_mode,
+            results_dirpath,
+            checkpointer=None,
+            source_resume_states=None,
+            convergence_window_size=None,
+            is_record_performance=False,
+            profile_dirpath=None,
             ):
         multiprocessing.Process.__init__(self, name=name)
         self.work_queue = work_queue
         self.results_queue = results_queue
+        self.results_dirpath = results_dirpath
         self.source_schema = source_schema
         self.taxon_labels = taxon_labels
         self.taxon_namespace = dendropy.TaxonNamespace(self.taxon_labels)
@@ -211,6 +746,22 @@ class TreeAnalysisWorker(multiprocessing.Process):
         self.num_tasks_received = 0
         self.num_tasks_completed = 0
         self.debug_mode = debug_mode
+        self.checkpointer = checkpointer
+        self.source_resume_states = source_resume_states
+        if convergence_window_size is not None:
+            self.convergence_tracker = ConvergenceTracker(
+                    taxon_namespace=self.taxon_namespace,
+                    is_rooted_trees=self.is_source_trees_rooted,
+                    use_tree_weights=self.use_tree_weights,
+                    ignore_edge_lengths=self.ignore_edge_lengths,
+                    window_size=convergence_window_size)
+        else:
+            self.convergence_tracker = None
+        if is_record_performance:
+            self.performance_recorder = PerformanceRecorder(self.name)
+        else:
+            self.performance_recorder = None
+        self.profile_dirpath = profile_dirpath
 
     def send_message(self, msg, level, wrap=True):
         if self.messenger is None:
@@ -234,10 +785,14 @@ class TreeAnalysisWorker(multiprocessing.Process):
         self.send_message(msg, messaging.ConsoleMessenger.ERROR_MESSAGING_LEVEL, wrap=wrap)
 
     def run(self):
+        if self.profile_dirpath is not None:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        else:
+            profiler = None
         while not self.kill_received:
-            try:
-                tree_source = self.work_queue.get_nowait()
-            except queue.Empty:
+            tree_source = self.work_queue.get()
+            if tree_source is None:
                 break
             self.num_tasks_received += 1
             # self.send_info("Received task {task_count}: '{task_name}'".format(
@@ -267,6 +822,10 @@ class TreeAnalysisWorker(multiprocessing.Process):
                         error_message_func=self.send_error,
                         log_frequency=self.log_frequency,
                         debug_mode=self.debug_mode,
+                        checkpointer=self.checkpointer,
+                        source_resume_states=self.source_resume_states,
+                        convergence_tracker=self.convergence_tracker,
+                        performance_recorder=self.performance_recorder,
                         )
             except (KeyboardInterrupt, Exception) as e:
                 e.worker_name = self.name
@@ -282,7 +841,61 @@ class TreeAnalysisWorker(multiprocessing.Process):
         if self.kill_received:
             self.send_warning("Terminating in response to kill request")
         else:
-            self.results_queue.put(self.tree_array)
+            try:
+                result = TreeArrayColumnsResult(
+                        worker_name=self.name,
+                        filepath=os.path.join(self.results_dirpath, "{}.columns".format(self.name)),
+                        num_trees=len(self.tree_array),
+                        convergence_tracker=self.convergence_tracker,
+                        performance_recorder=self.performance_recorder)
+                if self.performance_recorder is not None:
+                    self.performance_recorder.start_phase("result_writing")
+                self.tree_array.write_columns(result.filepath)
+                if self.performance_recorder is not None:
+                    self.performance_recorder.stop_phase("result_writing")
+                    self.performance_recorder.count("unique_splits", len(self.tree_array.split_distribution))
+                    self.performance_recorder.record_peak_rss()
+                if profiler is not None:
+                    profiler.disable()
+                    profiler.dump_stats(os.path.join(self.profile_dirpath, "{}.prof".format(self.name)))
+            except (KeyboardInterrupt, Exception) as e:
+                e.worker_name = self.name
+                result = e
+            self.results_queue.put(result)
+
+class TreeArrayColumnsResult(object):
+    """
+    Handle to the results of a worker process, stored in the compact columnar
+    format of |TreeArray| in a (temporary) file, so that only the path to the
+    file needs to be sent back through the results queue.
+    """
+
+    def __init__(self,
+            worker_name,
+            filepath,
+            num_trees,
+            convergence_tracker=None,
+            performance_recorder=None):
+        self.worker_name = worker_name
+        self.filepath = filepath
+        self.num_trees = num_trees
+        self.convergence_tracker = convergence_tracker
+        self.performance_recorder = performance_recorder
+
+def _merge_tree_array_columns(filepaths, dest_filepath, taxon_labels):
+    """
+    Merges the |TreeArray| data stored in columnar format in ``filepaths`` into
+    a single file, ``dest_filepath``, removing the source files. Used as the
+    unit of work of the reduction of worker results.
+    """
+    taxon_namespace = dendropy.TaxonNamespace(taxon_labels)
+    tree_array = dendropy.TreeArray(taxon_namespace=taxon_namespace)
+    for filepath in filepaths:
+        tree_array.read_columns(filepath)
+    tree_array.write_columns(dest_filepath)
+    for filepath in filepaths:
+        os.remove(filepath)
+    return dest_filepath
 
 class TreeProcessor(object):
 
@@ -297,6 +910,17 @@ class TreeProcessor(object):
             log_frequency,
             messenger,
             debug_mode,
+            checkpoint_dirpath=None,
+            checkpoint_frequency=0,
+            checkpoint_interval=0,
+            is_resume_from_checkpoints=False,
+            follow=False,
+            follow_timeout=None,
+            follow_update_func=None,
+            follow_update_interval=0,
+            convergence_window_size=None,
+            performance_recorder=None,
+            profile_dirpath=None,
             ):
         self.is_source_trees_rooted = is_source_trees_rooted
         self.rooting_interpretation = dendropy.get_rooting_argument(is_rooted=self.is_source_trees_rooted)
@@ -309,6 +933,36 @@ class TreeProcessor(object):
         self.log_frequency = log_frequency
         self.messenger = messenger
         self.debug_mode = debug_mode
+        self.checkpoint_dirpath = checkpoint_dirpath
+        self.checkpoint_frequency = checkpoint_frequency
+        self.checkpoint_interval = checkpoint_interval
+        self.is_resume_from_checkpoints = is_resume_from_checkpoints
+        self.checkpoint_settings = None
+        self.checkpoint_run_name = None
+        self.follow = follow
+        self.follow_timeout = follow_timeout
+        self.follow_update_func = follow_update_func
+        self.follow_update_interval = follow_update_interval
+        # if not |None|, convergence diagnostics are tracked, with a trace
+        # over windows of this many trees if not 0
+        self.convergence_window_size = convergence_window_size
+        self.convergence_tracker = None
+        # if not |None|, the time spent reading and merging trees is
+        # recorded in this, and the measurements of each process that reads
+        # trees are collected in ``process_performance_recorders``
+        self.performance_recorder = performance_recorder
+        self.process_performance_recorders = []
+        self.profile_dirpath = profile_dirpath
+
+    def new_convergence_tracker(self, taxon_namespace):
+        if self.convergence_window_size is None:
+            return None
+        return ConvergenceTracker(
+                taxon_namespace=taxon_namespace,
+                is_rooted_trees=self.is_source_trees_rooted,
+                use_tree_weights=self.use_tree_weights,
+                ignore_edge_lengths=self.ignore_edge_lengths,
+                window_size=self.convergence_window_size)
 
     def info_message(self, msg, wrap=True, prefix=""):
         if self.messenger:
@@ -329,13 +983,62 @@ class TreeProcessor(object):
             tree_offset=0,
             preserve_underscores=False,
             ):
-        if self.num_processes is None or self.num_processes <= 1:
+        if self.performance_recorder is not None:
+            self.performance_recorder.start_phase("reading")
+        resumed_tree_array = None
+        source_resume_states = None
+        if self.checkpoint_dirpath is not None:
+            self.checkpoint_settings = {
+                    "schema": schema,
+                    "tree_offset": tree_offset,
+                    "preserve_underscores": preserve_underscores,
+                    "is_source_trees_rooted": self.is_source_trees_rooted,
+                    "ignore_edge_lengths": self.ignore_edge_lengths,
+                    "ignore_node_ages": self.ignore_node_ages,
+                    "use_tree_weights": self.use_tree_weights,
+                    }
+            self.checkpoint_run_name = next_checkpoint_run_name(self.checkpoint_dirpath)
+            if self.is_resume_from_checkpoints:
+                resumed_tree_array = dendropy.TreeArray(
+                        taxon_namespace=taxon_namespace if taxon_namespace is not None else dendropy.TaxonNamespace(),
+                        is_rooted_trees=self.is_source_trees_rooted,
+                        ignore_edge_lengths=self.ignore_edge_lengths,
+                        ignore_node_ages=self.ignore_node_ages,
+                        use_tree_weights=self.use_tree_weights,
+                        ultrametricity_precision=self.ultrametricity_precision,
+                        taxon_label_age_map=self.taxon_label_age_map,
+                        )
+                source_resume_states = load_checkpoints(
+                        checkpoint_dirpath=self.checkpoint_dirpath,
+                        tree_array=resumed_tree_array,
+                        settings=self.checkpoint_settings)
+                if len(resumed_tree_array.taxon_namespace) > 0:
+                    taxon_namespace = resumed_tree_array.taxon_namespace
+                remaining_tree_sources = []
+                for tree_source in tree_sources:
+                    state = source_resume_states.get(_checkpoint_source_key(tree_source))
+                    if state is not None and state["is_complete"]:
+                        self.info_message("'{}': completed in previous run".format(tree_source), wrap=False)
+                    else:
+                        remaining_tree_sources.append(tree_source)
+                self.info_message("Resuming analysis: {} trees recovered from checkpoints, {} of {} sources remaining".format(
+                    len(resumed_tree_array),
+                    len(remaining_tree_sources),
+                    len(tree_sources)))
+                tree_sources = remaining_tree_sources
+                if not tree_sources:
+                    if self.performance_recorder is not None:
+                        self.performance_recorder.stop_phase("reading")
+                    return resumed_tree_array
+        if self.follow or self.num_processes is None or self.num_processes <= 1:
             tree_array = self.serial_analyze_trees(
                     tree_sources=tree_sources,
                     schema=schema,
                     taxon_namespace=taxon_namespace,
                     tree_offset=tree_offset,
                     preserve_underscores=preserve_underscores,
+                    resumed_tree_array=resumed_tree_array,
+                    source_resume_states=source_resume_states,
                     )
         else:
             tree_array = self.parallel_analyze_trees(
@@ -344,15 +1047,32 @@ class TreeProcessor(object):
                     taxon_namespace=taxon_namespace,
                     tree_offset=tree_offset,
                     preserve_underscores=preserve_underscores,
+                    resumed_tree_array=resumed_tree_array,
+                    source_resume_states=source_resume_states,
                     )
+        if self.performance_recorder is not None:
+            # (in parallel mode, already stopped before merging)
+            self.performance_recorder.stop_phase("reading")
         return tree_array
 
+    def new_checkpointer(self, name):
+        if self.checkpoint_dirpath is None:
+            return None
+        return TreeAnalysisCheckpointer(
+                checkpoint_dirpath=self.checkpoint_dirpath,
+                name="{}-{}".format(self.checkpoint_run_name, name),
+                settings=self.checkpoint_settings,
+                checkpoint_frequency=self.checkpoint_frequency,
+                checkpoint_interval=self.checkpoint_interval)
+
     def serial_analyze_trees(self,
             tree_sources,
             schema,
             taxon_namespace=None,
             tree_offset=0,
             preserve_underscores=False,
+            resumed_tree_array=None,
+            source_resume_states=None,
             ):
         if taxon_namespace is None:
             taxon_namespace = dendropy.TaxonNamespace()
@@ -366,6 +1086,13 @@ class TreeProcessor(object):
                 ultrametricity_precision=self.ultrametricity_precision,
                 taxon_label_age_map=self.taxon_label_age_map,
                 )
+        if resumed_tree_array is not None and len(resumed_tree_array) > 0:
+            tree_array.update(resumed_tree_array)
+        self.convergence_tracker = self.new_convergence_tracker(taxon_namespace)
+        if self.performance_recorder is not None:
+            process_performance_recorder = PerformanceRecorder("Main")
+        else:
+            process_performance_recorder = None
         _read_into_tree_array(
                 tree_array=tree_array,
                 tree_sources=tree_sources,
@@ -379,7 +1106,19 @@ class TreeProcessor(object):
                 error_message_func=self.error_message,
                 log_frequency=self.log_frequency,
                 debug_mode=self.debug_mode,
+                checkpointer=self.new_checkpointer("serial"),
+                source_resume_states=source_resume_states,
+                follow=self.follow,
+                follow_timeout=self.follow_timeout,
+                follow_update_func=self.follow_update_func,
+                follow_update_interval=self.follow_update_interval,
+                convergence_tracker=self.convergence_tracker,
+                performance_recorder=process_performance_recorder,
                 )
+        if process_performance_recorder is not None:
+            process_performance_recorder.count("unique_splits", len(tree_array.split_distribution))
+            process_performance_recorder.record_peak_rss()
+            self.process_performance_recorders.append(process_performance_recorder)
         return tree_array
 
     def parallel_analyze_trees(self,
@@ -388,6 +1127,8 @@ class TreeProcessor(object):
             tree_offset=0,
             preserve_underscores=False,
             taxon_namespace=None,
+            resumed_tree_array=None,
+            source_resume_states=None,
             ):
         # describe
         self.info_message("Running in multiprocessing mode (up to {} processes)".format(self.num_processes))
@@ -415,6 +1156,39 @@ class TreeProcessor(object):
         work_queue = multiprocessing.Queue()
         for f in tree_sources:
             work_queue.put(f)
+        # one sentinel per worker; (polling the queue with ``get_nowait()``
+        # may find it empty before the queued items become visible to the
+        # worker)
+        for idx in range(self.num_processes):
+            work_queue.put(None)
+
+        # worker results are passed back through files in here
+        results_dirpath = tempfile.mkdtemp(prefix="sumtrees-")
+        try:
+            return self._run_parallel_analysis(
+                    work_queue=work_queue,
+                    results_dirpath=results_dirpath,
+                    schema=schema,
+                    tree_offset=tree_offset,
+                    preserve_underscores=preserve_underscores,
+                    taxon_namespace=taxon_namespace,
+                    taxon_labels=taxon_labels,
+                    resumed_tree_array=resumed_tree_array,
+                    source_resume_states=source_resume_states)
+        finally:
+            shutil.rmtree(results_dirpath, ignore_errors=True)
+
+    def _run_parallel_analysis(self,
+            work_queue,
+            results_dirpath,
+            schema,
+            tree_offset,
+            preserve_underscores,
+            taxon_namespace,
+            taxon_labels,
+            resumed_tree_array=None,
+            source_resume_states=None,
+            ):
 
         # launch processes
         self.info_message("Launching {} worker processes".format(self.num_processes))
@@ -440,27 +1214,31 @@ class TreeProcessor(object):
                     messenger=self.messenger,
                     messenger_lock=messenger_lock,
                     log_frequency=self.log_frequency,
-                    debug_mode=self.debug_mode)
+                    debug_mode=self.debug_mode,
+                    results_dirpath=results_dirpath,
+                    checkpointer=self.new_checkpointer("Process-{}".format(idx+1)),
+                    source_resume_states=source_resume_states,
+                    convergence_window_size=self.convergence_window_size,
+                    is_record_performance=self.performance_recorder is not None,
+                    profile_dirpath=self.profile_dirpath)
             tree_analysis_worker.start()
             workers.append(tree_analysis_worker)
 
-        # collate results
+        # collect results
         result_count = 0
-        master_tree_array = dendropy.TreeArray(
-                taxon_namespace=taxon_namespace,
-                is_rooted_trees=self.is_source_trees_rooted,
-                ignore_edge_lengths=self.ignore_edge_lengths,
-                ignore_node_ages=self.ignore_node_ages,
-                use_tree_weights=self.use_tree_weights,
-                ultrametricity_precision=self.ultrametricity_precision,
-                )
+        result_filepaths = []
+        self.convergence_tracker = self.new_convergence_tracker(taxon_namespace)
         try:
             while result_count < self.num_processes:
                 result = results_queue.get()
                 if isinstance(result, Exception) or isinstance(result, KeyboardInterrupt):
                     self.info_message("Exception raised in worker process '{}'".format(result.worker_name))
                     raise result
-                master_tree_array.update(result)
+                result_filepaths.append(result.filepath)
+                if self.convergence_tracker is not None:
+                    self.convergence_tracker.update(result.convergence_tracker)
+                if result.performance_recorder is not None:
+                    self.process_performance_recorders.append(result.performance_recorder)
                 self.info_message("Recovered results from worker process '{}'".format(result.worker_name))
                 result_count += 1
                 # self.info_message("Recovered results from {} of {} worker processes".format(result_count, self.num_processes))
@@ -469,6 +1247,47 @@ class TreeProcessor(object):
                 worker.terminate()
             raise
         self.info_message("All {} worker processes terminated".format(self.num_processes))
+        if self.performance_recorder is not None:
+            self.performance_recorder.stop_phase("reading")
+            self.performance_recorder.start_phase("merging")
+
+        # reduce results: pairs of results are merged in parallel, until only
+        # two are left to be read directly by this process
+        reduction_round = 0
+        if len(result_filepaths) > 2:
+            self.info_message("Merging results from {} worker processes".format(len(result_filepaths)))
+            pool = multiprocessing.Pool(processes=min(self.num_processes, len(result_filepaths) // 2))
+            try:
+                while len(result_filepaths) > 2:
+                    reduction_round += 1
+                    async_results = []
+                    next_filepaths = []
+                    if len(result_filepaths) % 2:
+                        next_filepaths.append(result_filepaths.pop())
+                    for idx in range(0, len(result_filepaths), 2):
+                        dest_filepath = os.path.join(results_dirpath, "merged-{}-{}.columns".format(reduction_round, idx // 2))
+                        async_results.append(pool.apply_async(_merge_tree_array_columns,
+                            (result_filepaths[idx:idx+2], dest_filepath, taxon_labels)))
+                    for async_result in async_results:
+                        next_filepaths.append(async_result.get())
+                    result_filepaths = next_filepaths
+            finally:
+                pool.terminate()
+                pool.join()
+        master_tree_array = dendropy.TreeArray(
+                taxon_namespace=taxon_namespace,
+                is_rooted_trees=self.is_source_trees_rooted,
+                ignore_edge_lengths=self.ignore_edge_lengths,
+                ignore_node_ages=self.ignore_node_ages,
+                use_tree_weights=self.use_tree_weights,
+                ultrametricity_precision=self.ultrametricity_precision,
+                )
+        if resumed_tree_array is not None and len(resumed_tree_array) > 0:
+            master_tree_array.update(resumed_tree_array)
+        for filepath in result_filepaths:
+            master_tree_array.read_columns(filepath)
+        if self.performance_recorder is not None:
+            self.performance_recorder.stop_phase("merging")
         return master_tree_array
 
     def discover_taxa(self,
@@ -529,6 +1348,114 @@ def _write_trees(trees,
     else:
         raise ValueError(args.output_tree_format)
 
+def _write_interim_summary(tree_array, output_filepath, args, messenger):
+    """
+    Summarizes the trees analyzed so far when following sources. If a summary
+    target topology (rather than target trees) is being built, it is written
+    to ``output_filepath`` by replacing the file, so that the summary is never
+    seen partially written.
+    """
+    num_splits, num_unique_splits, num_nt_splits, num_nt_unique_splits = tree_array.split_distribution.splits_considered()
+    messenger.info("Interim summary: {} trees analyzed, {} unique non-trivial splits".format(
+        len(tree_array),
+        num_nt_unique_splits))
+    if output_filepath is None or args.target_tree_filepath is not None:
+        return
+    if args.summary_target is None or args.summary_target == "consensus":
+        if args.min_clade_freq is None:
+            min_freq = constants.GREATER_THAN_HALF
+        else:
+            min_freq = args.min_clade_freq
+        tree = tree_array.consensus_tree(min_freq=min_freq, summarize_splits=False)
+    elif args.summary_target == "greedy":
+        tree = tree_array.greedy_consensus_tree(min_freq=args.min_clade_freq, summarize_splits=False)
+    elif args.summary_target == "mcct" or args.summary_target == "mcc":
+        tree = tree_array.maximum_product_of_split_support_tree(
+                include_external_splits=False,
+                summarize_splits=False)
+    elif args.summary_target == "msct":
+        tree = tree_array.maximum_sum_of_split_support_tree(
+                include_external_splits=False,
+                summarize_splits=False)
+    else:
+        raise ValueError(args.summary_target)
+    tree.encode_bipartitions()
+    if args.edge_length_summarization is not None:
+        set_edge_lengths = args.edge_length_summarization
+    elif args.summarize_node_ages:
+        set_edge_lengths = "mean-age"
+    else:
+        set_edge_lengths = "mean-length"
+    tree_array.summarize_splits_on_tree(
+            tree=tree,
+            is_bipartitions_updated=True,
+            support_as_percentages=args.support_as_percentages,
+            support_label_decimals=max(args.support_label_decimals, 2) if not args.support_as_percentages else args.support_label_decimals,
+            set_support_as_node_label=args.node_labels == "support",
+            set_edge_lengths=set_edge_lengths,
+            error_on_negative_edge_lengths=False,
+            add_support_as_node_attribute=not args.suppress_annotations,
+            add_support_as_node_annotation=not args.suppress_annotations,
+            add_node_age_summaries_as_node_attributes=not args.suppress_annotations,
+            add_node_age_summaries_as_node_annotations=not args.suppress_annotations,
+            add_edge_length_summaries_as_edge_attributes=not args.suppress_annotations,
+            add_edge_length_summaries_as_edge_annotations=not args.suppress_annotations,
+            )
+    target_trees = dendropy.TreeList([tree], taxon_namespace=tree_array.taxon_namespace)
+    temp_filepath = output_filepath + ".tmp"
+    with open(temp_filepath, "w") as dest:
+        _write_trees(trees=target_trees,
+                output_dest=dest,
+                args=args,
+                file_comments=["Interim summary of {} trees generated by SumTrees.".format(len(tree_array))])
+    if hasattr(os, "replace"):
+        os.replace(temp_filepath, output_filepath)
+    else:
+        os.rename(temp_filepath, output_filepath)
+
+def _write_performance_report(
+        filepath,
+        run_performance_recorder,
+        process_performance_recorders,
+        tree_array,
+        tree_sources,
+        num_processes,
+        start_time,
+        end_time):
+    """
+    Writes the measurements of the performance of the run, as collected by
+    ``run_performance_recorder`` (for the phases of the run as a whole) and
+    ``process_performance_recorders`` (one for each process that read source
+    trees), in JSON format to ``filepath``.
+    """
+    run_performance_recorder.record_peak_rss()
+    num_splits, num_unique_splits, num_nt_splits, num_nt_unique_splits = tree_array.split_distribution.splits_considered()
+    process_reports = [r.as_dict() for r in sorted(process_performance_recorders, key=lambda r: r.name)]
+    trees_read = sum(r.counts.get("trees_read", 0) for r in process_performance_recorders)
+    bytes_read = sum(r.counts.get("bytes_read", 0) for r in process_performance_recorders)
+    reading_time = run_performance_recorder.total_phase_time(["reading"])
+    report = collections.OrderedDict()
+    report["program"] = _program_name
+    report["version"] = _program_version
+    report["started"] = start_time.isoformat(" ")
+    report["ended"] = end_time.isoformat(" ")
+    report["elapsed_seconds"] = (end_time - start_time).total_seconds()
+    report["num_processes"] = num_processes
+    report["sources"] = [src if textprocessing.is_str_type(src) else "<stdin>" for src in tree_sources]
+    report["trees_read"] = trees_read
+    report["trees_analyzed"] = len(tree_array)
+    report["bytes_read"] = bytes_read
+    report["trees_per_second"] = trees_read / reading_time if reading_time > 0 else None
+    report["bytes_per_second"] = bytes_read / reading_time if reading_time > 0 else None
+    report["unique_splits"] = num_unique_splits
+    report["unique_non_trivial_splits"] = num_nt_unique_splits
+    report["phase_seconds"] = collections.OrderedDict(run_performance_recorder.phase_times)
+    report["peak_rss_bytes"] = run_performance_recorder.peak_rss_bytes
+    report["processes"] = process_reports
+    with open(filepath, "w") as dest:
+        json.dump(report, dest, indent=4)
+        dest.write("\n")
+
 ##############################################################################
 ## Front-End
 
@@ -753,6 +1680,34 @@ def main():
             help="By default, whitespace will be trimmed from the labels"
                  " found in the tip ages data source. Specifing this option"
                  " suppresses this.")
+    source_options.add_argument("--follow",
+            action="store_true",
+            default=False,
+            help=(
+                 "Follow the sources as they are being written to (e.g., by a"
+                 " running MCMC analysis), analyzing new trees as they are"
+                 " added and periodically writing updated summaries. A source"
+                 " is no longer followed when the end of its trees block is"
+                 " read or when it has not grown for the period given by"
+                 " '--follow-timeout'. Only NEXUS and NEWICK sources can be"
+                 " followed, and these are read in serial mode."
+                 ))
+    source_options.add_argument("--follow-timeout",
+            type=float,
+            metavar="SECONDS",
+            default=300,
+            help=(
+                 "When following sources, stop following a source if it has"
+                 " not grown for SECONDS seconds (default: %(default)s)."
+                 ))
+    source_options.add_argument("--follow-update-interval",
+            type=float,
+            metavar="SECONDS",
+            default=60,
+            help=(
+                 "When following sources, summarize the trees analyzed so far"
+                 " every SECONDS seconds (default: %(default)s)."
+                 ))
 
     target_tree_options = parser.add_argument_group("Target Tree Topology Options")
     target_tree_options.add_argument(
@@ -770,7 +1725,7 @@ def main():
     target_tree_options.add_argument(
             "-s", "--summary-target",
             default=None,
-            choices=["consensus", "mcct", "msct"],
+            choices=["consensus", "greedy", "mcct", "msct"],
             metavar="SUMMARY-TYPE",
             help=cli.CustomFormatter.format_definition_list_help(
                     preamble=
@@ -790,6 +1745,16 @@ def main():
                                 "through the '-t' or '--target-tree-filepath'       "
                                 "options.                                      "
                             ),
+                            ("'greedy'",
+                                "A greedy (or extended majority-rule)  "
+                                "consensus tree. Clades are added in   "
+                                "order of decreasing frequency as long "
+                                "as they are compatible with clades    "
+                                "already added. If '-f' or             "
+                                "'--min-clade-freq' is specified, only "
+                                "clades with at least this frequency   "
+                                "are considered.                       "
+                            ),
                             ("'mcct'",
                                 "The maximum clade credibility tree.   "
                                 "The tree from the source set that     "
@@ -1115,6 +2080,110 @@ def main():
                  "local machine; i.e., same as specifying '-M' or '--maximum-multiprocessing')."
                  ))
 
+    checkpoint_options = parser.add_argument_group("Checkpointing Options")
+    checkpoint_options.add_argument("--checkpoint-dir",
+            dest="checkpoint_dirpath",
+            metavar="DIRPATH",
+            default=None,
+            help=(
+                 "Periodically save the progress of the analysis of the "
+                 "source trees to files in DIRPATH, so that the run can be "
+                 "resumed (using '--resume') if it is interrupted."
+                 ))
+    checkpoint_options.add_argument("--checkpoint-frequency",
+            type=int,
+            metavar="NUM-TREES",
+            default=0,
+            help=(
+                 "Save a checkpoint after every NUM-TREES trees read by each "
+                 "process (default: %(default)s, i.e., save checkpoints "
+                 "based on time only)."
+                 ))
+    checkpoint_options.add_argument("--checkpoint-interval",
+            type=float,
+            metavar="SECONDS",
+            default=600,
+            help=(
+                 "Save a checkpoint every SECONDS seconds (default: "
+                 "%(default)s; set to 0 to save checkpoints based on the "
+                 "number of trees read only)."
+                 ))
+    checkpoint_options.add_argument("--resume",
+            action="store_true",
+            default=False,
+            help=(
+                 "Resume an interrupted run from the checkpoints saved in the "
+                 "directory given by '--checkpoint-dir'. The sources and "
+                 "analysis options must be the same as those of the "
+                 "interrupted run. Sources that have grown since the "
+                 "interruption are read up to their new end."
+                 ))
+
+    convergence_options = parser.add_argument_group("Convergence Diagnostic Options")
+    convergence_options.add_argument("--convergence-diagnostics",
+            action="store_true",
+            default=False,
+            help=(
+                 "Treat each source as an independent sample (e.g., a separate "
+                 "MCMC run) and, while the trees are analyzed, calculate the "
+                 "average and maximum standard deviation of split frequencies "
+                 "(ASDSF and max SDSF) across sources, as well as the "
+                 "potential scale reduction factor (PSRF) of the edge lengths "
+                 "of each split. These are reported in the output "
+                 "meta-information and, if '-x'/'--extended-output' is "
+                 "specified, in the bipartition table. Requires at least two "
+                 "sources."
+                 ))
+    convergence_options.add_argument("--sdsf-min-freq",
+            type=float,
+            metavar="#.##",
+            default=0.1,
+            help=(
+                 "Only splits with at least this frequency in at least one "
+                 "source are included in the calculation of the ASDSF "
+                 "(default: %(default)s)."
+                 ))
+    convergence_options.add_argument("--convergence-window",
+            type=int,
+            metavar="NUM-TREES",
+            default=0,
+            help=(
+                 "Also report the ASDSF and max SDSF for each successive "
+                 "window of NUM-TREES trees analyzed in each source "
+                 "(default: %(default)s, i.e., do not trace diagnostics "
+                 "over windows)."
+                 ))
+
+    performance_options = parser.add_argument_group("Performance Instrumentation Options")
+    performance_options.add_argument("--performance-report",
+            dest="performance_report_filepath",
+            metavar="FILEPATH",
+            default=None,
+            help=(
+                 "Write a report of the run in JSON format to FILEPATH, "
+                 "giving the time spent in each phase of the run (reading "
+                 "and merging the source trees, building the target trees, "
+                 "mapping support onto the target trees and writing the "
+                 "results) and, for each process that reads source trees, "
+                 "the time spent parsing trees and counting splits "
+                 "(including encoding the bipartitions and calculating the "
+                 "node ages of the trees, which are done in a single "
+                 "traversal of each tree), the number of trees and bytes "
+                 "read (and their rates), the number of unique splits and "
+                 "the peak memory usage."
+                 ))
+    performance_options.add_argument("--profile",
+            dest="profile_dirpath",
+            metavar="DIRPATH",
+            default=None,
+            help=(
+                 "Profile the run using the Python profiler, writing the "
+                 "statistics of each process to a separate file in DIRPATH "
+                 "('Main.prof' for the main process and 'Process-N.prof' for "
+                 "each worker process; these can be examined using the "
+                 "'pstats' module)."
+                 ))
+
     logging_options = parser.add_argument_group("Program Logging Options")
     logging_options.add_argument("-g", "--log-frequency",
             type=int,
@@ -1285,6 +2354,84 @@ def main():
         messenger.info("{} initial trees to be discarded/ignored as burn-in from *each* source".format(args.burnin))
         processing_report_lines.append("{} initial trees discarded/ignored as burn-in from *each* source".format(args.burnin))
 
+    ######################################################################
+    ## Checkpointing
+
+    if args.checkpoint_dirpath is not None:
+        args.checkpoint_dirpath = os.path.expanduser(os.path.expandvars(args.checkpoint_dirpath))
+        if tree_sources[0] is sys.stdin:
+            messenger.error("Cannot checkpoint analysis of trees read from standard input")
+            sys.exit(1)
+        existing_checkpoints = find_checkpoints(args.checkpoint_dirpath)
+        if args.resume:
+            if existing_checkpoints:
+                messenger.info("Resuming from {} checkpoint(s) in '{}'".format(len(existing_checkpoints), args.checkpoint_dirpath))
+            else:
+                messenger.warning("No checkpoints found in '{}': analysis will start from the beginning".format(args.checkpoint_dirpath))
+        elif existing_checkpoints:
+            if args.replace:
+                for filepath in existing_checkpoints:
+                    os.remove(filepath)
+            else:
+                messenger.error("Checkpoint directory '{}' contains checkpoints from a previous run: specify '--resume' to resume the run, or '-r'/'--replace' to discard them".format(args.checkpoint_dirpath))
+                sys.exit(1)
+        if not os.path.exists(args.checkpoint_dirpath):
+            os.makedirs(args.checkpoint_dirpath)
+        messenger.info("Checkpoints will be saved to '{}'".format(args.checkpoint_dirpath))
+    elif args.resume:
+        messenger.error("'--resume' requires the checkpoint directory to be specified using '--checkpoint-dir'")
+        sys.exit(1)
+
+    ######################################################################
+    ## Convergence Diagnostics
+
+    if args.convergence_diagnostics:
+        if tree_sources[0] is sys.stdin or len(tree_sources) < 2:
+            messenger.error("Convergence diagnostics require at least two sources")
+            sys.exit(1)
+        if args.resume:
+            messenger.error("Convergence diagnostics cannot be calculated when resuming from checkpoints")
+            sys.exit(1)
+        if args.convergence_window < 0:
+            messenger.error("Convergence diagnostic window size must be a positive integer")
+            sys.exit(1)
+        convergence_window_size = args.convergence_window
+    elif args.convergence_window:
+        messenger.error("'--convergence-window' requires '--convergence-diagnostics'")
+        sys.exit(1)
+    else:
+        convergence_window_size = None
+
+    ######################################################################
+    ## Performance Instrumentation
+
+    if args.profile_dirpath is not None:
+        args.profile_dirpath = os.path.expanduser(os.path.expandvars(args.profile_dirpath))
+        if not os.path.exists(args.profile_dirpath):
+            os.makedirs(args.profile_dirpath)
+        main_profiler = cProfile.Profile()
+        main_profiler.enable()
+    else:
+        main_profiler = None
+    if args.performance_report_filepath is not None:
+        run_performance_recorder = PerformanceRecorder("Main")
+    else:
+        run_performance_recorder = None
+
+    ######################################################################
+    ## Following
+
+    if args.follow:
+        if tree_sources[0] is sys.stdin:
+            messenger.error("Cannot follow trees read from standard input")
+            sys.exit(1)
+        if args.input_format not in ("nexus/newick", "nexus", "newick"):
+            messenger.error("Only NEXUS and NEWICK sources can be followed")
+            sys.exit(1)
+        messenger.info("Sources will be followed until they have not grown for {} seconds, with interim summaries every {} seconds".format(
+            args.follow_timeout,
+            args.follow_update_interval))
+
     ######################################################################
     ## Target Validation
 
@@ -1427,7 +2574,12 @@ def main():
     else:
         output_fpath = os.path.expanduser(os.path.expandvars(args.output_tree_filepath))
         if cli.confirm_overwrite(filepath=output_fpath, replace_without_asking=args.replace):
-            output_dest = open(output_fpath, "w")
+            if args.follow:
+                # interim summaries replace the file: opened when the
+                # final results are written
+                output_dest = None
+            else:
+                output_dest = open(output_fpath, "w")
         else:
             sys.exit(1)
 
@@ -1454,11 +2606,23 @@ def main():
             else:
                 sys.exit(1)
 
+    # performance report
+    if args.performance_report_filepath is not None:
+        args.performance_report_filepath = os.path.expanduser(os.path.expandvars(args.performance_report_filepath))
+        if not cli.confirm_overwrite(
+                filepath=args.performance_report_filepath,
+                replace_without_asking=args.replace):
+            sys.exit(1)
+
     ######################################################################
     ## Multiprocessing Setup
 
     num_cpus = multiprocessing.cpu_count()
-    if len(tree_sources) > 1 and args.multiprocess is not None:
+    if args.follow:
+        if args.multiprocess is not None:
+            messenger.info("Sources are being followed: forcing serial processing")
+        num_processes = 1
+    elif len(tree_sources) > 1 and args.multiprocess is not None:
         if (
                 args.multiprocess.lower() == "max"
                 or args.multiprocess == "#"
@@ -1503,6 +2667,13 @@ def main():
     ######################################################################
     ## Main Work
 
+    def _follow_update(tree_array):
+        _write_interim_summary(
+                tree_array=tree_array,
+                output_filepath=output_fpath if args.output_tree_filepath is not None else None,
+                args=args,
+                messenger=messenger)
+
     tree_processor = TreeProcessor(
             is_source_trees_rooted=args.is_source_trees_rooted,
             ignore_edge_lengths=False,
@@ -1514,6 +2685,17 @@ def main():
             log_frequency=args.log_frequency if not args.quiet else 0,
             messenger=messenger,
             debug_mode=args.debug_mode,
+            checkpoint_dirpath=args.checkpoint_dirpath,
+            checkpoint_frequency=args.checkpoint_frequency,
+            checkpoint_interval=args.checkpoint_interval,
+            is_resume_from_checkpoints=args.resume,
+            follow=args.follow,
+            follow_timeout=args.follow_timeout,
+            follow_update_func=_follow_update if args.follow else None,
+            follow_update_interval=args.follow_update_interval,
+            convergence_window_size=convergence_window_size,
+            performance_recorder=run_performance_recorder,
+            profile_dirpath=args.profile_dirpath,
             )
     analysis_time_start = datetime.datetime.now()
     # messenger.info("Processing of source trees starting at {}".format(
@@ -1618,6 +2800,40 @@ def main():
         _bulleted_message_and_log("{} unique splits out of a total of {} splits".format(num_unique_splits, int(num_splits)))
         _bulleted_message_and_log("{} unique non-trivial splits counted out of a total of non-trivial {} splits".format(num_nt_unique_splits, int(num_nt_splits)))
 
+    ###  convergence diagnostics
+    convergence_tracker = tree_processor.convergence_tracker
+    if convergence_tracker is not None:
+        _message_and_log("Convergence diagnostics across {} sources:".format(convergence_tracker.num_sources()))
+        if convergence_tracker.num_sources() < 2:
+            _bulleted_message_and_log("Not calculated: trees retained for analysis from fewer than two sources")
+        else:
+            split_sdsfs = convergence_tracker.split_frequency_standard_deviations(min_freq=args.sdsf_min_freq)
+            if split_sdsfs:
+                _bulleted_message_and_log("Average standard deviation of split frequencies (ASDSF): {:.6f} (over {} non-trivial splits with a frequency of at least {} in at least one source)".format(
+                    sum(split_sdsfs.values()) / len(split_sdsfs),
+                    len(split_sdsfs),
+                    args.sdsf_min_freq))
+                _bulleted_message_and_log("Maximum standard deviation of split frequencies (max SDSF): {:.6f}".format(max(split_sdsfs.values())))
+            else:
+                _bulleted_message_and_log("No non-trivial splits with a frequency of at least {} in any source: ASDSF not calculated".format(args.sdsf_min_freq))
+            split_edge_length_psrfs = convergence_tracker.edge_length_psrfs()
+            if split_edge_length_psrfs:
+                _bulleted_message_and_log("Potential scale reduction factor (PSRF) of edge lengths: average of {:.6f}, maximum of {:.6f} (over {} splits sampled at least twice in every source)".format(
+                    sum(split_edge_length_psrfs.values()) / len(split_edge_length_psrfs),
+                    max(split_edge_length_psrfs.values()),
+                    len(split_edge_length_psrfs)))
+            for window_idx, asdsf, max_sdsf in convergence_tracker.window_trace(min_freq=args.sdsf_min_freq):
+                if asdsf is None:
+                    _bulleted_message_and_log("Trees {}-{} of each source: ASDSF not calculated".format(
+                        window_idx * args.convergence_window + 1,
+                        (window_idx + 1) * args.convergence_window))
+                else:
+                    _bulleted_message_and_log("Trees {}-{} of each source: ASDSF = {:.6f}, max SDSF = {:.6f}".format(
+                        window_idx * args.convergence_window + 1,
+                        (window_idx + 1) * args.convergence_window,
+                        asdsf,
+                        max_sdsf))
+
     ###  tip ages
     if not taxon_label_age_map:
         pass
@@ -1631,6 +2847,8 @@ def main():
             _bulleted_message_and_log(taxon_age_template.format(taxon.label, taxon_label_age_map.get(taxon.label, 0.0)))
 
     ### build target tree(s)
+    if run_performance_recorder is not None:
+        run_performance_recorder.start_phase("target_tree_construction")
     target_trees = dendropy.TreeList(taxon_namespace=tree_array.taxon_namespace)
     if target_tree_filepath is None:
         args.include_external_splits_when_scoring_clade_credibility_tree = False
@@ -1647,6 +2865,12 @@ def main():
                 min_freq = args.min_clade_freq
             tree = tree_array.consensus_tree(min_freq=min_freq, summarize_splits=False)
             msg = "Summarized onto consensus tree with minimum clade frequency threshold of {}:".format(min_freq)
+        elif args.summary_target == "greedy":
+            tree = tree_array.greedy_consensus_tree(min_freq=args.min_clade_freq, summarize_splits=False)
+            if args.min_clade_freq is None:
+                msg = "Summarized onto greedy (extended majority-rule) consensus tree:"
+            else:
+                msg = "Summarized onto greedy (extended majority-rule) consensus tree with minimum clade frequency threshold of {}:".format(args.min_clade_freq)
         elif args.summary_target == "mcct" or args.summary_target == "mcc":
             tree = tree_array.maximum_product_of_split_support_tree(
                     include_external_splits=args.include_external_splits_when_scoring_clade_credibility_tree,
@@ -1704,6 +2928,9 @@ def main():
         msg += " defined in '{}':".format(target_tree_filepath)
         _message_and_log(msg, wrap=False)
 
+    if run_performance_recorder is not None:
+        run_performance_recorder.stop_phase("target_tree_construction")
+
     ###  set up summarization regime
 
     split_summarization_kwargs = {}
@@ -1773,17 +3000,31 @@ def main():
         split_summarization_kwargs["add_edge_length_summaries_as_edge_annotations"] = True
         _bulleted_message_and_log("Support and other summarization annotations added to target trees as metadata".format())
 
-    for tree in target_trees:
-        tree_array.summarize_splits_on_tree(
-                tree=tree,
-                is_bipartitions_updated=True,
-                **split_summarization_kwargs)
+    if run_performance_recorder is not None:
+        run_performance_recorder.start_phase("support_mapping")
+    # with many target trees, the summarization is farmed out to the worker
+    # processes; trees are dispatched and collected in chunks, in order
+    if len(target_trees) > 1:
+        summarization_num_processes = min(num_processes, len(target_trees))
+    else:
+        summarization_num_processes = 1
+    summarized_trees = tree_array.summarize_splits_on_trees(
+            trees=target_trees,
+            is_bipartitions_updated=True,
+            num_processes=summarization_num_processes,
+            chunk_size=max(1, min(100, len(target_trees) // (4 * summarization_num_processes))),
+            **split_summarization_kwargs)
+    target_trees = dendropy.TreeList(taxon_namespace=tree_array.taxon_namespace)
+    for tree in summarized_trees:
         if args.node_labels == "clear":
             for nd in tree:
                 nd.label = None
+        target_trees.append(tree)
+    if run_performance_recorder is not None:
+        run_performance_recorder.stop_phase("support_mapping")
 
     # collapse if below minimum threshold
-    if args.min_clade_freq is not None and args.summary_target != "consensus":
+    if args.min_clade_freq is not None and args.summary_target not in ("consensus", "greedy"):
         msg = "Collapsing clades or splits with support frequency less than {}".format(args.min_clade_freq)
         for tree in target_trees:
             tree_array.collapse_edges_with_less_than_minimum_support(
@@ -1886,6 +3127,8 @@ def main():
         summarization_metainfo = []
 
     ### PRIMARY OUTPUT
+    if run_performance_recorder is not None:
+        run_performance_recorder.start_phase("writing")
     if not args.suppress_analysis_metainformation:
         primary_output_metainfo = []
         primary_output_metainfo.append("=============")
@@ -1896,6 +3139,8 @@ def main():
         primary_output_metainfo.extend(summarization_metainfo)
     else:
         primary_output_metainfo = []
+    if output_dest is None:
+        output_dest = open(output_fpath, "w")
     if hasattr(output_dest, "name"):
         messenger.info("Writing primary results to: '{}'".format(output_dest.name))
     else:
@@ -1919,6 +3164,9 @@ def main():
 
         #### get data: bipartitions
         all_taxa_bitmask = tree_array.taxon_namespace.all_taxa_bitmask()
+        if convergence_tracker is not None and convergence_tracker.num_sources() > 1:
+            all_split_sdsfs = convergence_tracker.split_frequency_standard_deviations(min_freq=0.0)
+            all_split_edge_length_psrfs = convergence_tracker.edge_length_psrfs()
         seen_split_bitmasks = set()
         all_bipartitions = collections.OrderedDict()
         bipartition_table = []
@@ -1973,6 +3221,9 @@ def main():
                     )
             bipartition_data["count"] = tree_array.split_distribution.split_counts[split_bitmask]
             bipartition_data["frequency"] = tree_array.split_distribution[split_bitmask]
+            if convergence_tracker is not None and convergence_tracker.num_sources() > 1:
+                bipartition_data["frequencySd"] = all_split_sdsfs.get(split_bitmask)
+                bipartition_data["edgeLengthPsrf"] = all_split_edge_length_psrfs.get(split_bitmask)
             for summary_stat_prefix, summary_source in (
                     ("edge_length", tree_array.split_distribution.split_edge_length_summaries),
                     ("node_age", tree_array.split_distribution.split_node_age_summaries),
@@ -2021,6 +3272,8 @@ def main():
                 if key in ("newick", ):
                     continue
                 value = bipartition_data[key]
+                if value is None:
+                    continue
                 if key in ("bipartitionId", "bipartitionBitmask", "bitpartitionLeafset"):
                     # FigTree cannot cast bigger integers values to float
                     value = '"{}"'.format(value)
@@ -2184,9 +3437,28 @@ def main():
                 writer.writeheader()
                 writer.writerows(rows)
 
+    if run_performance_recorder is not None:
+        run_performance_recorder.stop_phase("writing")
+
     ###################################################
     #  WRAP UP
 
+    if main_profiler is not None:
+        main_profiler.disable()
+        main_profiler.dump_stats(os.path.join(args.profile_dirpath, "Main.prof"))
+        messenger.info("Profiling statistics written to: '{}'".format(args.profile_dirpath))
+    if run_performance_recorder is not None:
+        messenger.info("Writing performance report to: '{}'".format(args.performance_report_filepath))
+        _write_performance_report(
+                filepath=args.performance_report_filepath,
+                run_performance_recorder=run_performance_recorder,
+                process_performance_recorders=tree_processor.process_performance_recorders,
+                tree_array=tree_array,
+                tree_sources=tree_sources,
+                num_processes=num_processes,
+                start_time=main_time_start,
+                end_time=datetime.datetime.now())
+
     messenger.info("Summarization completed")
     messenger.info_lines(final_run_report)
     messenger.silent = True
@@ -22,7 +22,12 @@ Population genetic statistics.
 """
 
 import math
+import bisect
+import collections
+import multiprocessing
+import operator
 import dendropy
+from dendropy.utility import bitprocessing
 from dendropy.calculate import probability
 from dendropy.calculate import combinatorics
 
@@ -30,46 +35,219 @@ from dendropy.calculate import combinatorics
 ## internal functions: generally taking lower-level data, such as sequences etc.
 ###############################################################################
 
-def _count_differences(char_sequences, state_alphabet, ignore_uncertain=True):
+def _encode_states(states, state_alphabet, ignore_uncertain=True, is_between_populations=False):
     """
-    Returns pair of values: total number of pairwise differences observed between
-    all sequences, and mean number of pairwise differences pair base.
+    Returns list of integer codes of ``states``, such that two states have the
+    same code if and only if they are treated as the same state, and the set
+    of the codes of the states to be ignored.
+
+    If ``is_between_populations`` is |True|, then states are treated as in
+    the comparisons of sequences between populations of
+    `PopulationPairSummaryStatistics`: only the gap and no-data states
+    themselves are ignored (so that, e.g., 'N' differs from 'C'), and two
+    states are the same if their fundamental indexes are equal. Otherwise,
+    all states with the fundamental indexes of the gap or no-data states are
+    ignored, and two states are the same if they share their fundamental
+    indexes.
     """
-    sum_diff = 0.0
-    mean_diff = 0.0
-    sq_diff = 0.0
-    comps = 0
-
-    #Check that all sequences are the same length
-    if len(set([len(seq) for seq in char_sequences])) != 1:
-        raise Exception("sequences of unequal length")
-
     if ignore_uncertain:
         attr = "fundamental_indexes_with_gaps_as_missing"
         _states_to_ignore = [state_alphabet.gap_state, state_alphabet.no_data_state]
         states_to_ignore = set([getattr(char, attr) for char in _states_to_ignore])
     else:
         attr = "fundamental_indexes"
+        _states_to_ignore = []
         states_to_ignore = set()
-
-    reduced_char_sequences = []
+    # values are kept referenced while their ids are in use
+    values = [getattr(char, attr) for char in states]
+    value_codes = {}
+    ignored_codes = set()
+    codes = []
+    for char, value in zip(states, values):
+        if is_between_populations:
+            key = value
+            is_ignored = any(char is state for state in _states_to_ignore)
+        else:
+            key = id(value)
+            is_ignored = value in states_to_ignore
+        if is_ignored:
+            key = ("ignored", key)
+        try:
+            code = value_codes[key]
+        except KeyError:
+            code = len(value_codes)
+            value_codes[key] = code
+            if is_ignored:
+                ignored_codes.add(code)
+        codes.append(code)
+    return codes, ignored_codes
+
+def _encode_sequences(char_sequences, state_alphabet, ignore_uncertain=True, is_between_populations=False):
+    """
+    Returns a list of rows of integer codes, one for each sequence in
+    ``char_sequences``, where two cells have the same code if and only if
+    their states are treated as the same (see `_encode_states`), and the set
+    of codes of the states to be ignored.
+    """
+    states = {}
     for sequence in char_sequences:
-        seq = [getattr(char, attr) for char in sequence]
-        reduced_char_sequences.append(seq)
+        states.update(zip(map(id, sequence), sequence))
+    state_ids = list(states)
+    codes, ignored_codes = _encode_states([states[state_id] for state_id in state_ids], state_alphabet, ignore_uncertain, is_between_populations)
+    state_codes = dict(zip(state_ids, codes))
+    rows = [list(map(state_codes.__getitem__, map(id, sequence))) for sequence in char_sequences]
+    if len(set(codes)) <= 256:
+        rows = [bytearray(row) for row in rows]
+    return rows, ignored_codes
+
+def _encode_char_matrix(char_matrix, ignore_uncertain=True):
+    """
+    Returns the rows of codes (as returned by `_encode_sequences`) of the site
+    patterns of ``char_matrix``, the set of codes of the states to be
+    ignored, and the number of sites of each site pattern.
+    """
+    site_patterns = char_matrix.site_patterns()
+    codes, ignored_codes = _encode_states(site_patterns.states, char_matrix.default_state_alphabet, ignore_uncertain)
+    if not site_patterns.patterns:
+        rows = [bytearray() for taxon in site_patterns.taxa]
+    elif len(codes) <= 256:
+        table = bytearray(256)
+        table[:len(codes)] = bytearray(codes)
+        table = bytes(table)
+        rows = [bytearray(row).translate(table) for row in zip(*site_patterns.patterns)]
+    else:
+        rows = [[codes[code] for code in row] for row in zip(*site_patterns.patterns)]
+    return rows, ignored_codes, site_patterns.weights
+
+def _pairwise_differences(rows, ignored_codes, weights=None, block_size=65536):
+    """
+    Returns pair of matrices (lists of lists), ``diffs`` and ``counts``, such
+    that ``diffs[i][j]`` is the number of sites that differ between the
+    ``i``-th and ``j``-th (``i != j``) rows of codes in ``rows`` (as returned
+    by `_encode_sequences`), and ``counts[i][j]`` is the number of sites in
+    which neither row has a code in ``ignored_codes``. If given, ``weights`` is the
+    number of sites represented by each column of ``rows``.
+
+    Columns in which all rows have the same (non-ignored) code contribute to
+    ``counts`` only; the remaining sites are processed in blocks of
+    ``block_size`` sites, with the sites of each code of each row represented
+    as bits of an integer, so that all sites of a block are compared with a
+    few bitwise operations for each pair of rows.
+    """
+    num_rows = len(rows)
+    if len(set([len(row) for row in rows])) > 1:
+        raise Exception("sequences of unequal length")
+    if weights is None:
+        weights = [1] * (len(rows[0]) if rows else 0)
+    base_count = 0
+    variable_columns = []
+    for cidx, column in enumerate(zip(*rows)):
+        codes = set(column)
+        if len(codes) == 1 and not codes & ignored_codes:
+            base_count += weights[cidx]
+        else:
+            variable_columns.append(cidx)
+    if all(int(weights[cidx]) == weights[cidx] for cidx in variable_columns):
+        # each column repeated as many times as the number of sites it
+        # represents, so that the sites of blocks are counted without weights
+        block_columns = []
+        for cidx in variable_columns:
+            block_columns.extend([cidx] * int(weights[cidx]))
+        block_weights = None
+    else:
+        # columns grouped by weight, so that most blocks have a single weight
+        block_columns = sorted(variable_columns, key=weights.__getitem__)
+        block_weights = weights
+    diffs = [[0] * num_rows for i in range(num_rows)]
+    counts = [[base_count] * num_rows for i in range(num_rows)]
+    for block_start in range(0, len(block_columns), block_size):
+        block = block_columns[block_start:block_start+block_size]
+        if len(block) == 1:
+            get_block = lambda row: (row[block[0]],)
+        else:
+            get_block = operator.itemgetter(*block)
+        block_rows = [get_block(row) for row in rows]
+        codes = set()
+        for block_row in block_rows:
+            codes.update(block_row)
+        is_translatable = max(codes) < 256
+        if block_weights is None:
+            weighted_count = bitprocessing.num_set_bits
+            block_count = len(block)
+        else:
+            block_weight_codes = {}
+            for cidx in block:
+                block_weight_codes.setdefault(block_weights[cidx], len(block_weight_codes))
+            block_column_weight_codes = [block_weight_codes[block_weights[cidx]] for cidx in block]
+            weight_masks = [(weight, _bitmask(block_column_weight_codes, [code], len(block_weight_codes) <= 256))
+                    for weight, code in block_weight_codes.items()]
+            weighted_count = lambda bits: sum(weight * bitprocessing.num_set_bits(bits & mask) for weight, mask in weight_masks)
+            block_count = sum(block_weights[cidx] for cidx in block)
+        has_ignored = bool(codes & ignored_codes)
+        row_code_bitsets = []
+        row_valid_bitsets = []
+        for block_row in block_rows:
+            row_codes = set(block_row)
+            row_code_bitsets.append(dict((code, _bitmask(block_row, [code], is_translatable)) for code in row_codes - ignored_codes))
+            if has_ignored:
+                row_valid_bitsets.append(_bitmask(block_row, row_codes - ignored_codes, is_translatable))
+        for i in range(num_rows - 1):
+            code_bitsets1 = row_code_bitsets[i]
+            row_diffs = diffs[i]
+            row_counts = counts[i]
+            for j in range(i + 1, num_rows):
+                code_bitsets2 = row_code_bitsets[j]
+                same = 0
+                for code, bits in code_bitsets1.items():
+                    bits2 = code_bitsets2.get(code)
+                    if bits2:
+                        same |= bits & bits2
+                if has_ignored:
+                    count = weighted_count(row_valid_bitsets[i] & row_valid_bitsets[j])
+                else:
+                    count = block_count
+                row_diffs[j] += count - weighted_count(same)
+                row_counts[j] += count
+    for i in range(num_rows):
+        for j in range(i + 1, num_rows):
+            diffs[j][i] = diffs[i][j]
+            counts[j][i] = counts[i][j]
+    return diffs, counts
+
+def _bitmask(codes, selected_codes, is_translatable=True):
+    """
+    Returns integer in which bit ``i`` is set if and only if ``codes[i]`` is
+    in ``selected_codes``.
+    """
+    if is_translatable:
+        table = bytearray(b"0" * 256)
+        for code in selected_codes:
+            table[code] = ord("1")
+        bits = bytes(bytearray(codes).translate(bytes(table)))
+    else:
+        bits = "".join("1" if code in selected_codes else "0" for code in codes)
+    if not bits:
+        return 0
+    return int(bits[::-1], 2)
 
-    for vidx, i in enumerate(reduced_char_sequences[:-1]):
-        for j in reduced_char_sequences[vidx+1:]:
-            diff = 0
-            counted = 0
+def _summarize_pairwise_differences(diffs, counts, indexes):
+    """
+    Returns triplet of values: total number of pairwise differences observed
+    between all rows of ``diffs`` and ``counts`` (as returned by
+    `_pairwise_differences`) given by ``indexes``, mean number of pairwise
+    differences per base, and sum of squares of the pairwise differences.
+    """
+    sum_diff = 0.0
+    mean_diff = 0.0
+    sq_diff = 0.0
+    comps = 0
+    for vidx, i in enumerate(indexes[:-1]):
+        row_diffs = diffs[i]
+        row_counts = counts[i]
+        for j in indexes[vidx+1:]:
+            diff = row_diffs[j]
+            counted = row_counts[j]
             comps += 1
-            for cidx, c in enumerate(i):
-                c1 = c
-                c2 = j[cidx]
-                if c1 in states_to_ignore or c2 in states_to_ignore:
-                    continue
-                counted += 1
-                if c1 is not c2:
-                    diff += 1
             sum_diff += float(diff)
             # If counted < 0, this means that there is sites between these sequences
             # in which both are not ignored: i.e., one or the other has a gap
@@ -82,14 +260,25 @@ def _count_differences(char_sequences, state_alphabet, ignore_uncertain=True):
             sq_diff += (diff ** 2)
     return sum_diff, mean_diff / comps, sq_diff
 
-def _nucleotide_diversity(char_sequences, state_alphabet, ignore_uncertain=True):
+def _count_differences(char_sequences, state_alphabet, ignore_uncertain=True, weights=None):
+    """
+    Returns pair of values: total number of pairwise differences observed between
+    all sequences, and mean number of pairwise differences pair base.
+    If given, ``weights`` is the number of sites represented by each column of
+    ``char_sequences``.
+    """
+    rows, ignored_codes = _encode_sequences(char_sequences, state_alphabet, ignore_uncertain)
+    diffs, counts = _pairwise_differences(rows, ignored_codes, weights)
+    return _summarize_pairwise_differences(diffs, counts, list(range(len(rows))))
+
+def _nucleotide_diversity(char_sequences, state_alphabet, ignore_uncertain=True, weights=None):
     """
     Returns $\pi$, the proportional nucleotide diversity, calculated for a
     list of character sequences.
     """
-    return _count_differences(char_sequences, state_alphabet, ignore_uncertain)[1]
+    return _count_differences(char_sequences, state_alphabet, ignore_uncertain, weights)[1]
 
-def _average_number_of_pairwise_differences(char_sequences, state_alphabet, ignore_uncertain=True):
+def _average_number_of_pairwise_differences(char_sequences, state_alphabet, ignore_uncertain=True, weights=None):
     """
     Returns $k$ (Tajima 1983; Wakely 1996), calculated for a set of sequences:
 
@@ -99,31 +288,37 @@ def _average_number_of_pairwise_differences(char_sequences, state_alphabet, igno
     $i$th and $j$th sequence, and $n$ is the number of DNA sequences
     sampled.
     """
-    sum_diff, mean_diff, sq_diff = _count_differences(char_sequences, state_alphabet, ignore_uncertain)
+    sum_diff, mean_diff, sq_diff = _count_differences(char_sequences, state_alphabet, ignore_uncertain, weights)
     return sum_diff / combinatorics.choose(len(char_sequences), 2)
 
-def _num_segregating_sites(char_sequences, state_alphabet, ignore_uncertain=True):
+def _num_segregating_sites(char_sequences, state_alphabet, ignore_uncertain=True, weights=None):
     """
     Returns the raw number of segregating sites (polymorphic sites).
+    If given, ``weights`` is the number of sites represented by each column of
+    ``char_sequences``.
+    """
+    rows, ignored_codes = _encode_sequences(char_sequences, state_alphabet, ignore_uncertain)
+    return _count_segregating_sites(rows, ignored_codes, weights)
+
+def _count_segregating_sites(rows, ignored_codes, weights=None):
+    """
+    Returns the number of columns of the rows of codes in ``rows`` (as returned
+    by `_encode_sequences`) in which the code of the first row is not in
+    ``ignored_codes``, and differs from the code of some other row that is not
+    in ``ignored_codes``. If given, ``weights`` is the number of sites
+    represented by each column of ``rows``.
     """
     s = 0
-    if ignore_uncertain:
-        attr = "fundamental_indexes_with_gaps_as_missing"
-        _states_to_ignore = [state_alphabet.gap_state, state_alphabet.no_data_state]
-        states_to_ignore= set([getattr(char, attr) for char in _states_to_ignore])
-    else:
-        attr = "fundamental_indexes"
-        states_to_ignore = set()
-    for i, c1 in enumerate(char_sequences[0]):
-        for v in char_sequences[1:]:
-            c2 = v[i]
-            f1 = getattr(c1, attr)
-            f2 = getattr(c2, attr)
-            if f1 in states_to_ignore or f2 in states_to_ignore:
-                continue
-            if f1 is not f2:
+    for i, column in enumerate(zip(*rows)):
+        c1 = column[0]
+        if c1 in ignored_codes:
+            continue
+        codes = set(column)
+        if len(codes) > 1 and codes - ignored_codes - set([c1]):
+            if weights is None:
                 s += 1
-                break
+            else:
+                s += weights[i]
     return s
 
 def _tajimas_d(num_sequences, avg_num_pairwise_differences, num_segregating_sites):
@@ -166,46 +361,45 @@ def num_segregating_sites(char_matrix, ignore_uncertain=True):
     """
     Returns the raw number of segregating sites (polymorphic sites).
     """
-    return _num_segregating_sites(
-            char_matrix.sequences(),
-            char_matrix.default_state_alphabet,
-            ignore_uncertain)
+    rows, ignored_codes, weights = _encode_char_matrix(char_matrix, ignore_uncertain)
+    return _count_segregating_sites(rows, ignored_codes, weights)
 
 def average_number_of_pairwise_differences(char_matrix, ignore_uncertain=True):
     """
     Returns $k$, calculated for a character block.
     """
-    return _average_number_of_pairwise_differences(char_matrix.sequences(), char_matrix.default_state_alphabet, ignore_uncertain)
+    rows, ignored_codes, weights = _encode_char_matrix(char_matrix, ignore_uncertain)
+    diffs, counts = _pairwise_differences(rows, ignored_codes, weights)
+    sum_diff, mean_diff, sq_diff = _summarize_pairwise_differences(diffs, counts, list(range(len(rows))))
+    return sum_diff / combinatorics.choose(len(rows), 2)
 
 def nucleotide_diversity(char_matrix, ignore_uncertain=True):
     """
     Returns $\pi$, calculated for a character block.
     """
-    return _nucleotide_diversity(char_matrix.sequences(), char_matrix.default_state_alphabet, ignore_uncertain)
+    rows, ignored_codes, weights = _encode_char_matrix(char_matrix, ignore_uncertain)
+    diffs, counts = _pairwise_differences(rows, ignored_codes, weights)
+    return _summarize_pairwise_differences(diffs, counts, list(range(len(rows))))[1]
 
 def tajimas_d(char_matrix, ignore_uncertain=True):
     """
     Returns Tajima's D.
     """
-    sequences = char_matrix.sequences()
-    num_sequences = len(sequences)
-    avg_num_pairwise_differences = _average_number_of_pairwise_differences(sequences, char_matrix.default_state_alphabet, ignore_uncertain=ignore_uncertain)
-    num_segregating_sites = _num_segregating_sites(
-            sequences,
-            char_matrix.default_state_alphabet,
-            ignore_uncertain=ignore_uncertain)
+    rows, ignored_codes, weights = _encode_char_matrix(char_matrix, ignore_uncertain)
+    num_sequences = len(rows)
+    diffs, counts = _pairwise_differences(rows, ignored_codes, weights)
+    sum_diff, mean_diff, sq_diff = _summarize_pairwise_differences(diffs, counts, list(range(num_sequences)))
+    avg_num_pairwise_differences = sum_diff / combinatorics.choose(num_sequences, 2)
+    num_segregating_sites = _count_segregating_sites(rows, ignored_codes, weights)
     return _tajimas_d(num_sequences, avg_num_pairwise_differences, num_segregating_sites)
 
 def wattersons_theta(char_matrix, ignore_uncertain=True):
     """
     Returns Watterson's Theta (per sequence)
     """
-    sequences = char_matrix.sequences()
-    num_segregating_sites = _num_segregating_sites(
-            sequences,
-            char_matrix.default_state_alphabet,
-            ignore_uncertain=ignore_uncertain)
-    a1 = sum([1.0/i for i in range(1, len(sequences))])
+    rows, ignored_codes, weights = _encode_char_matrix(char_matrix, ignore_uncertain)
+    num_segregating_sites = _count_segregating_sites(rows, ignored_codes, weights)
+    a1 = sum([1.0/i for i in range(1, len(rows))])
     return float(num_segregating_sites) / a1
 
 ###############################################################################
@@ -242,8 +436,18 @@ class PopulationPairSummaryStatistics(object):
         Returns a summary of a set of sequences that can be partitioned into
         the list of lists of taxa given by ``taxon_groups``.
         """
-        diffs_x, mean_diffs_x, sq_diff_x = _count_differences(self.pop1_seqs, self.state_alphabet, self.ignore_uncertain)
-        diffs_y, mean_diffs_y, sq_diff_y = _count_differences(self.pop2_seqs, self.state_alphabet, self.ignore_uncertain)
+        rows, ignored_codes = _encode_sequences(self.combined_seqs, self.state_alphabet, self.ignore_uncertain)
+        self._pairwise_diffs, self._pairwise_counts = _pairwise_differences(rows, ignored_codes)
+        between_rows, between_ignored_codes = _encode_sequences(self.combined_seqs, self.state_alphabet, self.ignore_uncertain, is_between_populations=True)
+        if between_rows == rows and between_ignored_codes == ignored_codes:
+            # no states (e.g., 'N') treated differently between populations
+            self._between_pairwise_diffs = self._pairwise_diffs
+        else:
+            self._between_pairwise_diffs = _pairwise_differences(between_rows, between_ignored_codes)[0]
+        pop1_indexes = list(range(len(self.pop1_seqs)))
+        pop2_indexes = list(range(len(self.pop1_seqs), len(self.combined_seqs)))
+        diffs_x, mean_diffs_x, sq_diff_x = _summarize_pairwise_differences(self._pairwise_diffs, self._pairwise_counts, pop1_indexes)
+        diffs_y, mean_diffs_y, sq_diff_y = _summarize_pairwise_differences(self._pairwise_diffs, self._pairwise_counts, pop2_indexes)
         d_x = diffs_x / combinatorics.choose(len(self.pop1_seqs), 2)
         d_y = diffs_y / combinatorics.choose(len(self.pop2_seqs), 2)
         d_xy = self._average_number_of_pairwise_differences_between_populations()
@@ -256,8 +460,8 @@ class PopulationPairSummaryStatistics(object):
         a = float(n * (n-1))
         ax = float(n_x * (n_x - 1))
         ay = float(n_y * (n_y - 1))
-        k = _average_number_of_pairwise_differences(self.combined_seqs, self.state_alphabet, self.ignore_uncertain)
-        n = len(self.combined_seqs)
+        diffs = _summarize_pairwise_differences(self._pairwise_diffs, self._pairwise_counts, pop1_indexes + pop2_indexes)[0]
+        k = diffs / combinatorics.choose(n, 2)
 
         # Hickerson 2006: pi #
         self.average_number_of_pairwise_differences = k
@@ -272,10 +476,7 @@ class PopulationPairSummaryStatistics(object):
         self.average_number_of_pairwise_differences_net = d_xy - (d_x + d_y)
 
         # Hickerson 2006: S #
-        self.num_segregating_sites = _num_segregating_sites(
-                self.combined_seqs,
-                self.state_alphabet,
-                self.ignore_uncertain)
+        self.num_segregating_sites = _count_segregating_sites(rows, ignored_codes)
 
         # Hickerson 2006: theta #
         a1 = sum([1.0/i for i in range(1, n)])
@@ -296,17 +497,9 @@ class PopulationPairSummaryStatistics(object):
         369-386.
         """
         diffs = 0
-        for sx in self.pop1_seqs:
-            for sy in self.pop2_seqs:
-                for cidx, c in enumerate(sx):
-                    c1 = c
-                    c2 = sy[cidx]
-                    if c1 in self.states_to_ignore or c2 in self.states_to_ignore:
-                        continue
-                    f1 = getattr(c1, self.state_attr)
-                    f2 = getattr(c2, self.state_attr)
-                    if f1 != f2:
-                        diffs += 1
+        for i in range(len(self.pop1_seqs)):
+            for j in range(len(self.pop1_seqs), len(self.combined_seqs)):
+                diffs += self._between_pairwise_diffs[i][j]
         dxy = float(1)/(len(self.pop1_seqs) * len(self.pop2_seqs)) * float(diffs)
         return dxy
 
@@ -319,21 +512,297 @@ class PopulationPairSummaryStatistics(object):
         369-386.
         """
         ss_diffs = 0
-        for sx in self.pop1_seqs:
-            for sy in self.pop2_seqs:
-                diffs = 0
-                for cidx, c in enumerate(sx):
-                    c1 = c
-                    c2 = sy[cidx]
-                    if c1 in self.states_to_ignore or c2 in self.states_to_ignore:
-                        continue
-                    f1 = getattr(c1, self.state_attr)
-                    f2 = getattr(c2, self.state_attr)
-                    if f1 != f2:
-                        diffs += 1
+        for i in range(len(self.pop1_seqs)):
+            for j in range(len(self.pop1_seqs), len(self.combined_seqs)):
+                diffs = self._between_pairwise_diffs[i][j]
                 ss_diffs += (float(diffs - mean_diff) ** 2)
         return float(ss_diffs)/(len(self.pop1_seqs)*len(self.pop2_seqs))
 
+def _site_statistics(site_keys, state_codes, ignored_codes, state_values, is_ignored_ancestral_states):
+    """
+    Returns list of tuples (``is_segregating``, ``num_pairwise_differences``,
+    ``num_derived``) for each pair (``pattern``, ``ancestral_state_index``) in
+    ``site_keys``, where ``pattern`` is a tuple of indexes of states and
+    ``ancestral_state_index`` is the index of the ancestral state of the site,
+    or |None| if it is the state of the first row of the pattern. States are
+    compared by their codes in ``state_codes`` (as returned by
+    `_encode_states`) when counting segregating sites and pairwise
+    differences, and by their values in ``state_values`` when counting
+    derived states.
+    """
+    results = []
+    for pattern, ancestral_state_index in site_keys:
+        state_counts = collections.Counter(pattern)
+        code_counts = collections.Counter()
+        for state_index, count in state_counts.items():
+            code = state_codes[state_index]
+            if code not in ignored_codes:
+                code_counts[code] += count
+        num_valid = sum(code_counts.values())
+        num_pairwise_differences = num_valid * (num_valid - 1) // 2
+        for count in code_counts.values():
+            num_pairwise_differences -= count * (count - 1) // 2
+        is_segregating = len(code_counts) > 1 and state_codes[pattern[0]] not in ignored_codes
+        if ancestral_state_index is None:
+            ancestral_state_index = pattern[0]
+        num_derived = 0
+        if not is_ignored_ancestral_states[ancestral_state_index]:
+            ancestral_value = state_values[ancestral_state_index]
+            for state_index, count in state_counts.items():
+                if not is_ignored_ancestral_states[state_index] and state_values[state_index] != ancestral_value:
+                    num_derived += count
+        results.append((is_segregating, num_pairwise_differences, num_derived))
+    return results
+
+_SITE_STATISTICS_WORKER_DATA = None
+
+def _init_site_statistics_worker(*worker_data):
+    global _SITE_STATISTICS_WORKER_DATA
+    _SITE_STATISTICS_WORKER_DATA = worker_data
+
+def _site_statistics_worker(site_keys):
+    return _site_statistics(site_keys, *_SITE_STATISTICS_WORKER_DATA)
+
+class SlidingWindowStatistics(object):
+    """
+    Population genetic statistics of windows of consecutive sites of a
+    character matrix.
+
+    The numbers of segregating sites, pairwise differences and derived states
+    of all sites are calculated once (for each distinct site pattern), so that
+    the statistics of any window of sites are calculated from cumulative sums
+    of these numbers, in time that does not depend on the length of the
+    window.
+
+    Examples
+    --------
+
+    ::
+
+        windows = popgenstat.SlidingWindowStatistics(char_matrix)
+        for row in windows.calc(window_size=10000, step_size=5000):
+            print(row["start"], row["stop"], row["tajimas_d"])
+
+    """
+
+    STATISTICS = (
+            "num_segregating_sites",
+            "average_number_of_pairwise_differences",
+            "nucleotide_diversity",
+            "wattersons_theta",
+            "tajimas_d",
+            "unfolded_site_frequency_spectrum",
+            )
+
+    def __init__(self,
+            char_matrix,
+            ancestral_sequence=None,
+            ignore_uncertain=True,
+            num_processes=None):
+        """
+        Parameters
+        ----------
+        char_matrix : |DiscreteCharacterMatrix|
+            The sequences.
+        ancestral_sequence : iterable of states
+            The ancestral sequence with reference to which derived states
+            (and the unfolded site frequency spectrum) are determined. If
+            |None|, then the first sequence in ``char_matrix`` is taken to be
+            the ancestral sequence.
+        ignore_uncertain : bool
+            If |True| [default], then gaps and missing data are ignored.
+        num_processes : int
+            If greater than 1, then the numbers of segregating sites, pairwise
+            differences and derived states of the sites are calculated by a
+            pool of (up to) this many processes.
+        """
+        self.ignore_uncertain = ignore_uncertain
+        site_patterns = char_matrix.site_patterns()
+        self.num_sequences = len(site_patterns.taxa)
+        self.num_sites = site_patterns.num_sites
+        state_alphabet = char_matrix.default_state_alphabet
+        states = list(site_patterns.states)
+        site_keys = []
+        site_key_indexes = []
+        if ancestral_sequence is None:
+            site_keys = [(pattern, None) for pattern in site_patterns.patterns]
+            site_key_indexes = site_patterns.site_pattern_indices
+        else:
+            if len(ancestral_sequence) != self.num_sites:
+                raise ValueError("Ancestral sequence has {} characters, but {} expected".format(len(ancestral_sequence), self.num_sites))
+            state_indexes = dict((id(state), idx) for idx, state in enumerate(states))
+            key_indexes = {}
+            for pattern_index, state in zip(site_patterns.site_pattern_indices, ancestral_sequence):
+                try:
+                    state_index = state_indexes[id(state)]
+                except KeyError:
+                    state_index = len(states)
+                    states.append(state)
+                    state_indexes[id(state)] = state_index
+                key = (pattern_index, state_index)
+                try:
+                    site_key_indexes.append(key_indexes[key])
+                except KeyError:
+                    key_indexes[key] = len(site_keys)
+                    site_key_indexes.append(len(site_keys))
+                    site_keys.append((site_patterns.patterns[pattern_index], state_index))
+        state_codes, ignored_codes = _encode_states(states, state_alphabet, ignore_uncertain)
+        if ignore_uncertain:
+            attr = "fundamental_indexes_with_gaps_as_missing"
+            ancestral_states_to_ignore = set([state_alphabet.gap_state, state_alphabet.no_data_state])
+        else:
+            attr = "fundamental_indexes"
+            ancestral_states_to_ignore = set()
+        state_values = [getattr(state, attr) for state in states]
+        is_ignored_ancestral_states = [state in ancestral_states_to_ignore for state in states]
+        worker_data = (state_codes, ignored_codes, state_values, is_ignored_ancestral_states)
+        if num_processes is None or num_processes <= 1 or len(site_keys) < 2:
+            site_key_statistics = _site_statistics(site_keys, *worker_data)
+        else:
+            chunk_size = max(1, len(site_keys) // (num_processes * 4))
+            chunks = [site_keys[idx:idx+chunk_size] for idx in range(0, len(site_keys), chunk_size)]
+            pool = multiprocessing.Pool(
+                    processes=min(num_processes, len(chunks)),
+                    initializer=_init_site_statistics_worker,
+                    initargs=worker_data)
+            try:
+                results = pool.map(_site_statistics_worker, chunks)
+            finally:
+                pool.close()
+                pool.join()
+            site_key_statistics = []
+            for result in results:
+                site_key_statistics.extend(result)
+        self._segregating_sites_sums = [0]
+        self._pairwise_differences_sums = [0]
+        self._derived_frequency_sites = [[] for idx in range(self.num_sequences + 1)]
+        num_segregating_sites = 0
+        num_pairwise_differences = 0
+        for site_index, key_index in enumerate(site_key_indexes):
+            is_segregating, site_pairwise_differences, num_derived = site_key_statistics[key_index]
+            if is_segregating:
+                num_segregating_sites += 1
+            num_pairwise_differences += site_pairwise_differences
+            self._segregating_sites_sums.append(num_segregating_sites)
+            self._pairwise_differences_sums.append(num_pairwise_differences)
+            if num_derived:
+                self._derived_frequency_sites[num_derived].append(site_index)
+
+    def window_bounds(self, window_size, step_size=None):
+        """
+        Returns list of (``start``, ``stop``) pairs of indexes of the windows
+        of ``window_size`` sites, starting at the first site and every
+        ``step_size`` sites (by default, ``window_size``: i.e.,
+        non-overlapping windows) thereafter, until the last site is included.
+        The last window is truncated at the last site.
+        """
+        if window_size < 1:
+            raise ValueError("Window size must be positive: {}".format(window_size))
+        if step_size is None:
+            step_size = window_size
+        elif step_size < 1:
+            raise ValueError("Step size must be positive: {}".format(step_size))
+        bounds = []
+        start = 0
+        while start < self.num_sites:
+            stop = min(start + window_size, self.num_sites)
+            bounds.append((start, stop))
+            if stop == self.num_sites:
+                break
+            start += step_size
+        return bounds
+
+    def num_segregating_sites(self, start, stop):
+        """
+        Returns the raw number of segregating sites (polymorphic sites) in the
+        window of sites ``start`` to ``stop`` (exclusive).
+        """
+        return self._segregating_sites_sums[stop] - self._segregating_sites_sums[start]
+
+    def average_number_of_pairwise_differences(self, start, stop):
+        """
+        Returns $k$, calculated for the window of sites ``start`` to ``stop``
+        (exclusive).
+        """
+        num_pairwise_differences = self._pairwise_differences_sums[stop] - self._pairwise_differences_sums[start]
+        return float(num_pairwise_differences) / combinatorics.choose(self.num_sequences, 2)
+
+    def nucleotide_diversity(self, start, stop):
+        """
+        Returns $\pi$, calculated for the window of sites ``start`` to
+        ``stop`` (exclusive) as $k$ per site. This is the same as the value
+        given by :func:`nucleotide_diversity` for sequences without ignored
+        states.
+        """
+        if stop <= start:
+            return 0.0
+        return self.average_number_of_pairwise_differences(start, stop) / (stop - start)
+
+    def wattersons_theta(self, start, stop):
+        """
+        Returns Watterson's Theta (per sequence), calculated for the window of
+        sites ``start`` to ``stop`` (exclusive).
+        """
+        a1 = sum([1.0/i for i in range(1, self.num_sequences)])
+        return float(self.num_segregating_sites(start, stop)) / a1
+
+    def tajimas_d(self, start, stop):
+        """
+        Returns Tajima's D, calculated for the window of sites ``start`` to
+        ``stop`` (exclusive), or |None| if there are no segregating sites in
+        the window.
+        """
+        num_segregating_sites = self.num_segregating_sites(start, stop)
+        if num_segregating_sites == 0:
+            return None
+        return _tajimas_d(self.num_sequences,
+                self.average_number_of_pairwise_differences(start, stop),
+                num_segregating_sites)
+
+    def unfolded_site_frequency_spectrum(self, start, stop, pad=True):
+        """
+        Returns the site frequency spectrum, calculated for the window of
+        sites ``start`` to ``stop`` (exclusive), as a dictionary mapping
+        numbers of derived states to numbers of sites (see
+        :func:`unfolded_site_frequency_spectrum`).
+        """
+        freqs = {}
+        num_derived_sites = 0
+        for num_derived, sites in enumerate(self._derived_frequency_sites):
+            if num_derived == 0:
+                continue
+            count = bisect.bisect_left(sites, stop) - bisect.bisect_left(sites, start)
+            if count or pad:
+                freqs[num_derived] = count
+            num_derived_sites += count
+        if stop > start + num_derived_sites or pad:
+            freqs[0] = stop - start - num_derived_sites
+        return freqs
+
+    def calc(self, window_size, step_size=None, statistics=None):
+        """
+        Returns list of dictionaries, one for each window of ``window_size``
+        sites every ``step_size`` sites (see
+        :meth:`SlidingWindowStatistics.window_bounds`), mapping "start" and
+        "stop" to the indexes of the first site and one past the last site of
+        the window, and each of ``statistics`` (by default, all statistics in
+        :attr:`SlidingWindowStatistics.STATISTICS`) to its value for the
+        window.
+        """
+        if statistics is None:
+            statistics = self.STATISTICS
+        for statistic in statistics:
+            if statistic not in self.STATISTICS:
+                raise ValueError("Unrecognized statistic: '{}'".format(statistic))
+        statistic_fns = [(statistic, getattr(self, statistic)) for statistic in statistics]
+        rows = []
+        for start, stop in self.window_bounds(window_size, step_size):
+            row = {"start": start, "stop": stop}
+            for statistic, fn in statistic_fns:
+                row[statistic] = fn(start, stop)
+            rows.append(row)
+        return rows
+
 def derived_state_matrix(
         char_matrix,
         ancestral_sequence=None,
@@ -247,6 +247,30 @@ def variance_covariance(data, population_variance=False):
     # print ""
     return covar
 
+def potential_scale_reduction_factor(chain_sizes, chain_means, chain_variances):
+    """
+    Returns the potential scale reduction factor (PSRF) of Gelman and Rubin
+    (1992) for a parameter sampled by multiple chains, given the number of
+    samples, the mean, and the sample variance of the parameter in each chain.
+    As in MrBayes, the average number of samples is used if chains differ in
+    size. Values close to 1.0 indicate that the chains have converged on the
+    same distribution.
+
+    Returns |None| if there are fewer than two chains or there is no variation
+    within chains.
+    """
+    num_chains = len(chain_sizes)
+    if num_chains < 2:
+        return None
+    n = float(sum(chain_sizes)) / num_chains
+    within_chain_variance = float(sum(chain_variances)) / num_chains
+    if within_chain_variance <= 0.0:
+        return None
+    grand_mean = float(sum(chain_means)) / num_chains
+    between_chain_variance = sum((m - grand_mean) ** 2 for m in chain_means) / (num_chains - 1)
+    pooled_variance = ((n - 1) / n) * within_chain_variance + (1.0 + 1.0/num_chains) * between_chain_variance
+    return math.sqrt(pooled_variance / within_chain_variance)
+
 def rank(value_to_be_ranked, value_providing_rank):
     """
     Returns the rank of ``value_to_be_ranked`` in set of values, ``values``.
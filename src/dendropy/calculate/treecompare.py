@@ -22,8 +22,10 @@ Statistics, metrics, measurements, and values calculated *between* *two* trees.
 """
 
 import math
+import array
 import collections
 import itertools
+import multiprocessing
 import dendropy
 from dendropy.utility import error
 
@@ -89,11 +91,136 @@ def symmetric_difference(tree1, tree2, is_bipartitions_updated=False):
             is_bipartitions_updated=is_bipartitions_updated)
     return t[0] + t[1]
 
-def unweighted_robinson_foulds_distance(tree1, tree2, is_bipartitions_updated=False):
+def unweighted_robinson_foulds_distance(
+        tree1,
+        tree2,
+        is_bipartitions_updated=False,
+        algorithm="bipartitions"):
     """
-    Alias for ``symmetric_difference()``.
+    Returns *unweighted* Robinson-Foulds distance between two trees.
+
+    Parameters
+    ----------
+    tree1 : |Tree| object
+        The first tree of the two trees being compared. This must share the
+        same |TaxonNamespace| reference as ``tree2``.
+    tree2 : |Tree| object
+        The second tree of the two trees being compared. This must share the
+        same |TaxonNamespace| reference as ``tree1``.
+    is_bipartitions_updated : bool
+        If |False|, then the bipartitions on *both* trees will be updated
+        before comparison. If |True| then the bipartitions will only be
+        calculated for a |Tree| object if they have not been calculated
+        before, either explicitly or implicitly. Not used by the "day"
+        algorithm.
+    algorithm : string
+        If "bipartitions" (default), then the distance is calculated from the
+        bipartition encodings of the trees, as by ``symmetric_difference()``.
+        If "day", then the distance is calculated in linear time using Day's
+        (1985) algorithm (see ``day_robinson_foulds_distance()``), which is
+        much faster for large trees, but requires that the trees have the
+        same leaf set.
+
+    Returns
+    -------
+    d : int
+        The symmetric difference (a.k.a. the unweighted Robinson-Foulds
+        distance) between ``tree1`` and ``tree2``.
+    """
+    if algorithm == "bipartitions":
+        return symmetric_difference(tree1, tree2, is_bipartitions_updated)
+    elif algorithm == "day":
+        return day_robinson_foulds_distance(tree1, tree2)
+    else:
+        raise ValueError("Unrecognized algorithm: '{}'".format(algorithm))
+
+def day_robinson_foulds_distance(tree1, tree2):
     """
-    return symmetric_difference(tree1, tree2, is_bipartitions_updated)
+    Returns *unweighted* Robinson-Foulds distance between two trees with the
+    same leaf set, calculated in linear time using Day's algorithm.
+
+    The leaves are labeled in the order in which they are visited in a
+    depth-first traversal of ``tree1``, so that each cluster (the leaf set of
+    a subtree) of ``tree1`` is an interval of labels, and the intervals are
+    stored in a table. A cluster of ``tree2``, with minimum and maximum label
+    and size found in a single traversal, is then shared with ``tree1`` if
+    it is an interval (i.e., its size is equal to the span of its labels)
+    that is in the table. Unrooted trees are traversed from the same leaf,
+    so that their clusters correspond to their bipartitions. Neither tree is
+    modified, and the bipartitions of the trees are not used.
+
+    Day, W. H. E. 1985. Optimal algorithms for comparing trees with labeled
+    leaves. Journal of Classification 2: 7-28.
+
+    Parameters
+    ----------
+    tree1 : |Tree| object
+        The first tree of the two trees being compared. This must share the
+        same |TaxonNamespace| reference as ``tree2``, have the same rooting
+        state, and have the same set of taxa on its leaves.
+    tree2 : |Tree| object
+        The second tree of the two trees being compared. This must share the
+        same |TaxonNamespace| reference as ``tree1``, have the same rooting
+        state, and have the same set of taxa on its leaves.
+
+    Returns
+    -------
+    d : int
+        The symmetric difference (a.k.a. the unweighted Robinson-Foulds
+        distance) between ``tree1`` and ``tree2``.
+    """
+    if tree1.taxon_namespace is not tree2.taxon_namespace:
+        raise error.TaxonNamespaceIdentityError(tree1, tree2)
+    if bool(tree1.is_rooted) != bool(tree2.is_rooted):
+        raise error.MixedRootingError("Cannot compare a rooted tree with an unrooted tree")
+    is_rooted = bool(tree1.is_rooted)
+    if is_rooted:
+        start_node1 = tree1.seed_node
+    else:
+        start_node1 = None
+        for start_node1 in tree1.leaf_node_iter():
+            break
+        if start_node1 is None:
+            return 0
+    nodes1, dfs_parent_indexes1, num_dfs_children1 = _day_depth_first_traversal(start_node1, is_rooted)
+    leaf_labels = {}
+    for node_idx, node in enumerate(nodes1):
+        if num_dfs_children1[node_idx] == 0 and node_idx > 0:
+            if node.taxon is None:
+                raise ValueError("Leaf node without taxon: {}".format(node))
+            leaf_labels[node.taxon] = len(leaf_labels)
+        elif is_rooted and node_idx == 0 and num_dfs_children1[0] == 0:
+            leaf_labels[node.taxon] = 0
+    num_leaves = len(leaf_labels)
+    clusters1 = set()
+    for node_idx, min_label, max_label, size in _day_cluster_iter(nodes1, dfs_parent_indexes1, num_dfs_children1, leaf_labels, num_leaves):
+        clusters1.add(min_label * num_leaves + max_label)
+    if is_rooted:
+        start_node2 = tree2.seed_node
+    else:
+        start_node2 = None
+        for nd in tree2.leaf_node_iter():
+            if nd.taxon is start_node1.taxon:
+                start_node2 = nd
+                break
+        if start_node2 is None:
+            raise ValueError("Trees do not have the same leaf set")
+    nodes2, dfs_parent_indexes2, num_dfs_children2 = _day_depth_first_traversal(start_node2, is_rooted)
+    num_leaves2 = 0
+    for node_idx, node in enumerate(nodes2):
+        if num_dfs_children2[node_idx] == 0 and (node_idx > 0 or is_rooted):
+            if node.taxon not in leaf_labels:
+                raise ValueError("Trees do not have the same leaf set")
+            num_leaves2 += 1
+    if num_leaves2 != num_leaves:
+        raise ValueError("Trees do not have the same leaf set")
+    num_clusters2 = 0
+    num_shared_clusters = 0
+    for node_idx, min_label, max_label, size in _day_cluster_iter(nodes2, dfs_parent_indexes2, num_dfs_children2, leaf_labels, num_leaves):
+        num_clusters2 += 1
+        if max_label - min_label + 1 == size and (min_label * num_leaves + max_label) in clusters1:
+            num_shared_clusters += 1
+    return len(clusters1) + num_clusters2 - 2 * num_shared_clusters
 
 def weighted_robinson_foulds_distance(
         tree1,
@@ -356,6 +483,491 @@ def find_missing_bipartitions(reference_tree, comparison_tree, is_bipartitions_u
             missing.append(bipartition)
     return missing
 
+##############################################################################
+### Tree Distance Matrices
+
+UNWEIGHTED_ROBINSON_FOULDS = "unweighted_robinson_foulds"
+WEIGHTED_ROBINSON_FOULDS = "weighted_robinson_foulds"
+EUCLIDEAN = "euclidean"
+TREE_DISTANCE_METRICS = (
+        UNWEIGHTED_ROBINSON_FOULDS,
+        WEIGHTED_ROBINSON_FOULDS,
+        EUCLIDEAN,
+        )
+
+def tree_distance_matrix(
+        trees,
+        metric=UNWEIGHTED_ROBINSON_FOULDS,
+        edge_weight_attr="length",
+        is_bipartitions_updated=False,
+        num_processes=1):
+    """
+    Returns the distances between all pairs of trees in ``trees`` as a
+    condensed distance matrix.
+
+    The bipartitions of each tree are encoded once, rather than once for
+    every pair of trees as would be the case if calling, e.g.,
+    :func:`symmetric_difference` for every pair.
+
+    Parameters
+    ----------
+    trees : iterable of |Tree| objects
+        The trees to be compared. These must all share the same
+        |TaxonNamespace| reference.
+    metric : string
+        One of: "unweighted_robinson_foulds" (the symmetric difference;
+        see :func:`symmetric_difference`), "weighted_robinson_foulds" (see
+        :func:`weighted_robinson_foulds_distance`), or "euclidean" (see
+        :func:`euclidean_distance`).
+    edge_weight_attr : string
+        Name of attribute on edges of trees to be used as the weight for the
+        weighted metrics.
+    is_bipartitions_updated : bool
+        If |False| (default), then the bipartitions of all the trees will be
+        updated before comparison. If |True|, then the bipartitions will only
+        be calculated for a |Tree| object if they have not been calculated
+        before, either explicitly or implicitly.
+    num_processes : int
+        Number of processes over which to distribute the calculations.
+
+    Returns
+    -------
+    d : ``array.array``
+        The condensed distance matrix: the distances between all pairs of
+        trees, ``i`` < ``j``, in the order (0,1), (0,2), ..., (0,n-1), (1,2),
+        ..., (n-2,n-1), where n is the number of trees. The distance between
+        trees ``i`` and ``j`` is at index ``condensed_matrix_index(n, i, j)``.
+
+    Examples
+    --------
+
+    ::
+
+        import dendropy
+        from dendropy.calculate import treecompare
+        trees = dendropy.TreeList.get_from_path("pythonidae.nex", "nexus")
+        d = treecompare.tree_distance_matrix(trees)
+        print(d[treecompare.condensed_matrix_index(len(trees), 0, 1)])
+
+    """
+    if metric not in TREE_DISTANCE_METRICS:
+        raise ValueError("Unrecognized metric: '{}'".format(metric))
+    tree_split_bitmasks = []
+    if metric == UNWEIGHTED_ROBINSON_FOULDS:
+        tree_split_weights = None
+    else:
+        tree_split_weights = []
+    first_tree = None
+    for tree in trees:
+        if first_tree is None:
+            first_tree = tree
+        elif tree.taxon_namespace is not first_tree.taxon_namespace:
+            raise error.TaxonNamespaceIdentityError(first_tree, tree)
+        if not is_bipartitions_updated or tree.bipartition_encoding is None:
+            tree.encode_bipartitions()
+        if tree_split_weights is None:
+            tree_split_bitmasks.append([b.split_bitmask for b in tree.bipartition_encoding])
+        else:
+            split_bitmasks = []
+            split_weights = []
+            for bipartition, edge in tree.bipartition_edge_map.items():
+                split_bitmasks.append(bipartition.split_bitmask)
+                split_weights.append(getattr(edge, edge_weight_attr))
+            tree_split_bitmasks.append(split_bitmasks)
+            tree_split_weights.append(split_weights)
+    return split_bitmask_set_distance_matrix(
+            tree_split_bitmasks=tree_split_bitmasks,
+            tree_split_weights=tree_split_weights,
+            metric=metric,
+            num_processes=num_processes)
+
+def split_bitmask_set_distance_matrix(
+        tree_split_bitmasks,
+        tree_split_weights=None,
+        metric=UNWEIGHTED_ROBINSON_FOULDS,
+        num_processes=1):
+    """
+    Returns the distances between all pairs of trees, each given by the
+    bitmasks of its splits (and, for the weighted metrics, the weights of the
+    splits), as a condensed distance matrix (see :func:`tree_distance_matrix`).
+
+    Parameters
+    ----------
+    tree_split_bitmasks : list of iterables of ints
+        The split bitmasks of each tree, normalized in the same way for all
+        trees.
+    tree_split_weights : list of iterables of floats
+        The weight (e.g., edge length) of each split of each tree, in the same
+        order as ``tree_split_bitmasks``. |None| weights are taken to be 0.
+        Required for the weighted metrics.
+    metric : string
+        One of: "unweighted_robinson_foulds", "weighted_robinson_foulds", or
+        "euclidean".
+    num_processes : int
+        Number of processes over which to distribute the calculations.
+
+    Returns
+    -------
+    d : ``array.array``
+        The condensed distance matrix.
+    """
+    if metric not in TREE_DISTANCE_METRICS:
+        raise ValueError("Unrecognized metric: '{}'".format(metric))
+    if metric != UNWEIGHTED_ROBINSON_FOULDS and tree_split_weights is None:
+        raise ValueError("Split weights are required for metric '{}'".format(metric))
+    encoded_trees = _encode_split_bitmask_sets(
+            tree_split_bitmasks=tree_split_bitmasks,
+            tree_split_weights=tree_split_weights if metric != UNWEIGHTED_ROBINSON_FOULDS else None)
+    num_trees = len(encoded_trees)
+    if num_processes is None or num_processes <= 1 or num_trees < 3:
+        return _calc_distance_matrix_rows(encoded_trees, metric, 0, num_trees)
+    # rows are split into blocks with about the same number of pairs
+    num_pairs = num_trees * (num_trees - 1) // 2
+    pairs_per_block = max(1, num_pairs // (num_processes * 4))
+    row_blocks = []
+    row_start = 0
+    block_pairs = 0
+    for row in range(num_trees):
+        block_pairs += num_trees - row - 1
+        if block_pairs >= pairs_per_block:
+            row_blocks.append((row_start, row + 1))
+            row_start = row + 1
+            block_pairs = 0
+    if row_start < num_trees:
+        row_blocks.append((row_start, num_trees))
+    pool = multiprocessing.Pool(
+            processes=num_processes,
+            initializer=_init_distance_matrix_worker,
+            initargs=(encoded_trees, metric))
+    try:
+        results = pool.map(_distance_matrix_worker, row_blocks)
+    finally:
+        pool.close()
+        pool.join()
+    distances = results[0]
+    for result in results[1:]:
+        distances.extend(result)
+    return distances
+
+def condensed_matrix_index(num_items, i, j):
+    """
+    Returns the index of the entry for the pair of items ``i`` and ``j`` in a
+    condensed distance matrix of ``num_items`` items (see
+    :func:`tree_distance_matrix`).
+    """
+    if i == j:
+        raise ValueError("No entry for an item paired with itself")
+    if i > j:
+        i, j = j, i
+    return num_items * i - (i * (i + 1)) // 2 + j - i - 1
+
+def _encode_split_bitmask_sets(tree_split_bitmasks, tree_split_weights=None):
+    # Splits are interned as small integer ids, so that sets of splits can be
+    # compared without hashing (potentially very large) bitmasks.
+    split_ids = {}
+    encoded_trees = []
+    for tree_idx, split_bitmasks in enumerate(tree_split_bitmasks):
+        ids = []
+        for split_bitmask in split_bitmasks:
+            split_id = split_ids.get(split_bitmask, None)
+            if split_id is None:
+                split_id = len(split_ids)
+                split_ids[split_bitmask] = split_id
+            ids.append(split_id)
+        if tree_split_weights is None:
+            encoded_trees.append(frozenset(ids))
+        else:
+            weights = {}
+            for split_id, weight in zip(ids, tree_split_weights[tree_idx]):
+                weights[split_id] = float(weight) if weight is not None else 0.0
+            encoded_trees.append((frozenset(weights), weights))
+    return encoded_trees
+
+def _calc_distance_matrix_rows(encoded_trees, metric, row_start, row_end):
+    num_trees = len(encoded_trees)
+    if metric == UNWEIGHTED_ROBINSON_FOULDS:
+        distances = array.array("l")
+        for i in range(row_start, row_end):
+            splits1 = encoded_trees[i]
+            len1 = len(splits1)
+            distances.extend([len1 + len(splits2) - 2 * len(splits1 & splits2)
+                for splits2 in itertools.islice(encoded_trees, i+1, num_trees)])
+        return distances
+    distances = array.array("d")
+    for i in range(row_start, row_end):
+        splits1, weights1 = encoded_trees[i]
+        for j in range(i+1, num_trees):
+            splits2, weights2 = encoded_trees[j]
+            if metric == WEIGHTED_ROBINSON_FOULDS:
+                d = sum([abs(weights1[k] - weights2[k]) for k in splits1 & splits2])
+                d += sum([abs(weights1[k]) for k in splits1 - splits2])
+                d += sum([abs(weights2[k]) for k in splits2 - splits1])
+            else:
+                d = sum([(weights1[k] - weights2[k]) ** 2 for k in splits1 & splits2])
+                d += sum([weights1[k] ** 2 for k in splits1 - splits2])
+                d += sum([weights2[k] ** 2 for k in splits2 - splits1])
+                d = math.sqrt(d)
+            distances.append(d)
+    return distances
+
+_distance_matrix_worker_data = None
+
+def _init_distance_matrix_worker(encoded_trees, metric):
+    global _distance_matrix_worker_data
+    _distance_matrix_worker_data = (encoded_trees, metric)
+
+def _distance_matrix_worker(row_block):
+    encoded_trees, metric = _distance_matrix_worker_data
+    return _calc_distance_matrix_rows(encoded_trees, metric, row_block[0], row_block[1])
+
+##############################################################################
+### ReferenceTreeComparator
+
+class ReferenceTreeComparator(object):
+    """
+    Compares multiple trees to a single reference tree.
+
+    The bipartitions (and edge weights) of the reference tree are indexed
+    once, when the comparator is created, instead of on every comparison as
+    is the case when calling, e.g., :func:`false_positives_and_negatives`
+    for each tree.
+
+    Examples
+    --------
+
+    ::
+
+        import dendropy
+        from dendropy.calculate import treecompare
+        tns = dendropy.TaxonNamespace()
+        reference_tree = dendropy.Tree.get_from_path(
+                "ref.nex",
+                "nexus",
+                taxon_namespace=tns)
+        comparator = treecompare.ReferenceTreeComparator(reference_tree)
+        trees = dendropy.TreeList.get_from_path(
+                "boots.nex",
+                "nexus",
+                taxon_namespace=tns)
+        for row in comparator.compare_trees(trees):
+            print(row["unweighted_robinson_foulds"])
+        # or, reading the trees in parallel
+        table = comparator.compare_files(
+                ["boots1.nex", "boots2.nex"],
+                "nexus",
+                num_processes=2)
+
+    """
+
+    METRICS = (
+            "false_positives",
+            "false_negatives",
+            UNWEIGHTED_ROBINSON_FOULDS,
+            WEIGHTED_ROBINSON_FOULDS,
+            EUCLIDEAN,
+            )
+
+    def __init__(self,
+            reference_tree,
+            edge_weight_attr="length",
+            is_bipartitions_updated=False):
+        """
+        Parameters
+        ----------
+        reference_tree : |Tree| object
+            The tree to which other trees will be compared. Trees compared to
+            it must share the same |TaxonNamespace| reference.
+        edge_weight_attr : string
+            Name of attribute on edges of trees to be used as the weight for
+            the weighted metrics.
+        is_bipartitions_updated : bool
+            If |False| (default), then the bipartitions of the reference tree
+            will be updated. If |True| then the bipartitions will only be
+            calculated if they have not been calculated before.
+        """
+        self.reference_tree = reference_tree
+        self.taxon_namespace = reference_tree.taxon_namespace
+        self.edge_weight_attr = edge_weight_attr
+        if not is_bipartitions_updated or reference_tree.bipartition_encoding is None:
+            reference_tree.encode_bipartitions()
+        self._reference_bipartitions = list(reference_tree.bipartition_encoding)
+        self._reference_split_weights = _split_weights(
+                reference_tree.bipartition_edge_map,
+                edge_weight_attr)
+
+    def _get_split_weights(self, tree, is_bipartitions_updated):
+        if tree.taxon_namespace is not self.taxon_namespace:
+            raise error.TaxonNamespaceIdentityError(self.reference_tree, tree)
+        if not is_bipartitions_updated or tree.bipartition_encoding is None:
+            tree.encode_bipartitions()
+        return _split_weights(tree.bipartition_edge_map, self.edge_weight_attr)
+
+    def compare(self, tree, metrics=None, is_bipartitions_updated=False):
+        """
+        Returns a dictionary (``collections.OrderedDict``) of the values of
+        ``metrics`` (default: all metrics in ``METRICS``) for the comparison
+        of ``tree`` to the reference tree.
+        """
+        return _compare_split_weights(
+                self._reference_split_weights,
+                self._get_split_weights(tree, is_bipartitions_updated),
+                self.METRICS if metrics is None else metrics)
+
+    def compare_trees(self, trees, metrics=None, is_bipartitions_updated=False):
+        """
+        Returns a list of dictionaries (see :meth:`compare`) of the values of
+        ``metrics`` for the comparison of each tree in ``trees`` (which can be
+        an iterator, e.g. over trees yielded from files) to the reference
+        tree.
+        """
+        return [self.compare(tree, metrics=metrics, is_bipartitions_updated=is_bipartitions_updated)
+                for tree in trees]
+
+    def compare_files(self,
+            files,
+            schema,
+            metrics=None,
+            num_processes=1,
+            **kwargs):
+        """
+        Returns a list of dictionaries (see :meth:`compare`) of the values of
+        ``metrics`` for the comparison of each tree in ``files`` to the
+        reference tree, in order of the files and of the trees within each
+        file. The files are distributed over ``num_processes`` processes.
+
+        Trees are read using a copy of the |TaxonNamespace| of the reference
+        tree, which is therefore not modified by the reading of the files.
+        Keyword arguments are passed to the reader (see
+        :meth:`Tree.yield_from_files`).
+        """
+        metrics = self.METRICS if metrics is None else metrics
+        taxon_labels = [taxon.label for taxon in self.taxon_namespace]
+        tasks = [(f, schema, kwargs) for f in files]
+        worker_data = (taxon_labels, self._reference_split_weights, self.edge_weight_attr, metrics)
+        if num_processes is None or num_processes <= 1 or len(tasks) < 2:
+            _init_reference_tree_comparison_worker(*worker_data)
+            try:
+                results = [_reference_tree_comparison_worker(task) for task in tasks]
+            finally:
+                _init_reference_tree_comparison_worker(None, None, None, None)
+        else:
+            pool = multiprocessing.Pool(
+                    processes=min(num_processes, len(tasks)),
+                    initializer=_init_reference_tree_comparison_worker,
+                    initargs=worker_data)
+            try:
+                results = pool.map(_reference_tree_comparison_worker, tasks)
+            finally:
+                pool.close()
+                pool.join()
+        table = []
+        for result in results:
+            table.extend(result)
+        return table
+
+    def false_positives_and_negatives(self, tree, is_bipartitions_updated=False):
+        """
+        Returns the numbers of false positive bipartitions (bipartitions found
+        in ``tree`` but not in the reference tree) and false negative
+        bipartitions (bipartitions found in the reference tree but not in
+        ``tree``). See :func:`false_positives_and_negatives`.
+        """
+        row = self.compare(tree,
+                metrics=("false_positives", "false_negatives"),
+                is_bipartitions_updated=is_bipartitions_updated)
+        return row["false_positives"], row["false_negatives"]
+
+    def symmetric_difference(self, tree, is_bipartitions_updated=False):
+        """
+        Returns the *unweighted* Robinson-Foulds distance between ``tree`` and
+        the reference tree. See :func:`symmetric_difference`.
+        """
+        return self.compare(tree,
+                metrics=(UNWEIGHTED_ROBINSON_FOULDS,),
+                is_bipartitions_updated=is_bipartitions_updated)[UNWEIGHTED_ROBINSON_FOULDS]
+
+    def weighted_robinson_foulds_distance(self, tree, is_bipartitions_updated=False):
+        """
+        Returns the *weighted* Robinson-Foulds distance between ``tree`` and
+        the reference tree. See :func:`weighted_robinson_foulds_distance`.
+        """
+        return self.compare(tree,
+                metrics=(WEIGHTED_ROBINSON_FOULDS,),
+                is_bipartitions_updated=is_bipartitions_updated)[WEIGHTED_ROBINSON_FOULDS]
+
+    def euclidean_distance(self, tree, is_bipartitions_updated=False):
+        """
+        Returns the Euclidean distance between ``tree`` and the reference
+        tree. See :func:`euclidean_distance`.
+        """
+        return self.compare(tree,
+                metrics=(EUCLIDEAN,),
+                is_bipartitions_updated=is_bipartitions_updated)[EUCLIDEAN]
+
+    def find_missing_bipartitions(self, tree, is_bipartitions_updated=False):
+        """
+        Returns a list of the bipartitions of the reference tree that are not
+        in ``tree``. See :func:`find_missing_bipartitions`.
+        """
+        split_weights = self._get_split_weights(tree, is_bipartitions_updated)
+        return [bipartition for bipartition in self._reference_bipartitions
+                if bipartition.split_bitmask not in split_weights]
+
+def _split_weights(bipartition_edge_map, edge_weight_attr):
+    split_weights = {}
+    for bipartition, edge in bipartition_edge_map.items():
+        weight = getattr(edge, edge_weight_attr, None)
+        split_weights[bipartition.split_bitmask] = float(weight) if weight is not None else 0.0
+    return split_weights
+
+def _compare_split_weights(reference_split_weights, split_weights, metrics):
+    row = collections.OrderedDict()
+    shared_splits = [split for split in split_weights if split in reference_split_weights]
+    for metric in metrics:
+        if metric == "false_positives":
+            row[metric] = len(split_weights) - len(shared_splits)
+        elif metric == "false_negatives":
+            row[metric] = len(reference_split_weights) - len(shared_splits)
+        elif metric == UNWEIGHTED_ROBINSON_FOULDS:
+            row[metric] = len(split_weights) + len(reference_split_weights) - 2 * len(shared_splits)
+        elif metric == WEIGHTED_ROBINSON_FOULDS:
+            d = sum([abs(w - reference_split_weights.get(split, 0.0)) for split, w in split_weights.items()])
+            d += sum([abs(w) for split, w in reference_split_weights.items() if split not in split_weights])
+            row[metric] = d
+        elif metric == EUCLIDEAN:
+            d = sum([(w - reference_split_weights.get(split, 0.0)) ** 2 for split, w in split_weights.items()])
+            d += sum([w ** 2 for split, w in reference_split_weights.items() if split not in split_weights])
+            row[metric] = math.sqrt(d)
+        else:
+            raise ValueError("Unrecognized metric: '{}'".format(metric))
+    return row
+
+_reference_tree_comparison_worker_data = None
+
+def _init_reference_tree_comparison_worker(taxon_labels, reference_split_weights, edge_weight_attr, metrics):
+    global _reference_tree_comparison_worker_data
+    if taxon_labels is None:
+        _reference_tree_comparison_worker_data = None
+    else:
+        _reference_tree_comparison_worker_data = (taxon_labels, reference_split_weights, edge_weight_attr, metrics)
+
+def _reference_tree_comparison_worker(task):
+    taxon_labels, reference_split_weights, edge_weight_attr, metrics = _reference_tree_comparison_worker_data
+    src, schema, kwargs = task
+    taxon_namespace = dendropy.TaxonNamespace(taxon_labels)
+    rows = []
+    for tree in dendropy.Tree.yield_from_files(
+            files=[src],
+            schema=schema,
+            taxon_namespace=taxon_namespace,
+            **kwargs):
+        tree.encode_bipartitions()
+        rows.append(_compare_split_weights(
+            reference_split_weights,
+            _split_weights(tree.bipartition_edge_map, edge_weight_attr),
+            metrics))
+    return rows
+
 ##############################################################################
 ### TreeshapeKernel
 
@@ -828,6 +1440,65 @@ def _get_length_diffs(
     else:
         return length_diffs
 
+def _day_depth_first_traversal(start_node, is_rooted):
+    """
+    Returns the nodes of the tree in depth-first (preorder) traversal order
+    starting from ``start_node``, with the index (in this order) of the
+    parent of each node in the traversal, and the number of its children in
+    the traversal. If ``is_rooted`` is |False|, then the tree is traversed as
+    an undirected graph, i.e., as if rooted at ``start_node``.
+    """
+    nodes = []
+    dfs_parent_indexes = []
+    num_dfs_children = []
+    stack = [(start_node, None, -1)]
+    while stack:
+        node, dfs_parent, dfs_parent_idx = stack.pop()
+        node_idx = len(nodes)
+        nodes.append(node)
+        dfs_parent_indexes.append(dfs_parent_idx)
+        neighbors = node.child_nodes()
+        if not is_rooted and node.parent_node is not None:
+            neighbors.append(node.parent_node)
+        if dfs_parent is not None:
+            neighbors = [nd for nd in neighbors if nd is not dfs_parent]
+        num_dfs_children.append(len(neighbors))
+        for nd in reversed(neighbors):
+            stack.append((nd, node, node_idx))
+    return nodes, dfs_parent_indexes, num_dfs_children
+
+def _day_cluster_iter(nodes, dfs_parent_indexes, num_dfs_children, leaf_labels, num_leaves):
+    """
+    Iterates over the non-trivial clusters of a tree traversed by
+    ``_day_depth_first_traversal()``, yielding the index of the node
+    subtending each cluster, the minimum and maximum label of the leaves in
+    the cluster, and the number of leaves in the cluster. Nodes with a single
+    child in the traversal are skipped, as their cluster is that of their
+    child.
+    """
+    num_nodes = len(nodes)
+    min_labels = [num_leaves] * num_nodes
+    max_labels = [-1] * num_nodes
+    sizes = [0] * num_nodes
+    for node_idx in range(num_nodes-1, 0, -1):
+        if num_dfs_children[node_idx] == 0:
+            label = leaf_labels[nodes[node_idx].taxon]
+            min_label = label
+            max_label = label
+            size = 1
+        else:
+            min_label = min_labels[node_idx]
+            max_label = max_labels[node_idx]
+            size = sizes[node_idx]
+            if num_dfs_children[node_idx] > 1 and 1 < size < num_leaves:
+                yield node_idx, min_label, max_label, size
+        parent_idx = dfs_parent_indexes[node_idx]
+        if min_label < min_labels[parent_idx]:
+            min_labels[parent_idx] = min_label
+        if max_label > max_labels[parent_idx]:
+            max_labels[parent_idx] = max_label
+        sizes[parent_idx] += size
+
 def _bipartition_difference(
         tree1,
         tree2,
@@ -25,6 +25,7 @@ import math
 import collections
 import dendropy
 from dendropy.datamodel import taxonmodel
+from dendropy.utility import bitprocessing
 from dendropy.calculate.statistics import mean_and_sample_variance
 
 ##############################################################################
@@ -380,30 +381,68 @@ def consensus_tree(trees, min_freq=0.5, is_bipartitions_updated=False, **kwargs)
 class TopologyCounter(object):
     """
     Tracks frequency of occurrences of topologies.
+
+    Topologies are keyed by a compact fixed-width fingerprint of their set of
+    splits (see :func:`dendropy.utility.bitprocessing.split_bitmask_set_fingerprint`)
+    rather than by the set of splits itself. The split bitmasks of each
+    distinct topology are kept in ``topology_split_bitmasks`` (keyed by
+    topology hash) to reconstruct the topologies and to verify that different
+    topologies do not share a fingerprint.
     """
 
     def hash_topology(tree):
         """
-        Set of all splits on tree: default topology hash.
+        Fingerprint of the set of all splits on tree: default topology hash.
         """
-        return frozenset(tree.bipartition_encoding)
+        return bitprocessing.split_bitmask_set_fingerprint(
+                TopologyCounter.topology_split_bitmasks_of(tree))
     hash_topology = staticmethod(hash_topology)
 
+    def topology_split_bitmasks_of(tree):
+        """
+        Canonical representation of the set of all splits on tree.
+        """
+        return bitprocessing.canonical_split_bitmask_set(
+                b.split_bitmask for b in tree.bipartition_encoding)
+    topology_split_bitmasks_of = staticmethod(topology_split_bitmasks_of)
+
     def __init__(self):
         self.topology_hash_map = {}
+        self.topology_split_bitmasks = {}
         self.total_trees_counted = 0
 
+    def _register_topology(self, split_bitmasks):
+        # Returns the key of the topology, verifying that it does not collide
+        # with that of a different topology; colliding topologies are keyed
+        # by their split bitmasks.
+        topology_hash = bitprocessing.split_bitmask_set_fingerprint(split_bitmasks)
+        existing_split_bitmasks = self.topology_split_bitmasks.get(topology_hash, None)
+        if existing_split_bitmasks is None:
+            self.topology_split_bitmasks[topology_hash] = split_bitmasks
+        elif existing_split_bitmasks != split_bitmasks:
+            topology_hash = split_bitmasks
+            self.topology_split_bitmasks[topology_hash] = split_bitmasks
+        return topology_hash
+
     def update_topology_hash_map(self,
-            src_map):
+            src_map,
+            src_topology_split_bitmasks=None):
         """
-        Imports data from another counter.
+        Imports data from another counter, given its ``topology_hash_map``
+        and ``topology_split_bitmasks``. If ``src_topology_split_bitmasks`` is
+        not given, then the keys of ``src_map`` are taken to be topologies
+        given as sets of |Bipartition| objects.
         """
-        trees_counted = 0
         for topology_hash in src_map:
-            if topology_hash not in self.topology_hash_map:
-                self.topology_hash_map[topology_hash] = src_map[topology_hash]
+            if src_topology_split_bitmasks is not None:
+                split_bitmasks = src_topology_split_bitmasks[topology_hash]
+            else:
+                split_bitmasks = bitprocessing.canonical_split_bitmask_set(b.split_bitmask for b in topology_hash)
+            key = self._register_topology(split_bitmasks)
+            if key not in self.topology_hash_map:
+                self.topology_hash_map[key] = src_map[topology_hash]
             else:
-                self.topology_hash_map[topology_hash] = self.topology_hash_map[topology_hash] + src_map[topology_hash]
+                self.topology_hash_map[key] = self.topology_hash_map[key] + src_map[topology_hash]
             self.total_trees_counted += src_map[topology_hash]
 
     def count(self,
@@ -414,7 +453,7 @@ class TopologyCounter(object):
         """
         if not is_bipartitions_updated:
             tree.encode_bipartitions()
-        topology = self.hash_topology(tree)
+        topology = self._register_topology(self.topology_split_bitmasks_of(tree))
         if topology not in self.topology_hash_map:
             self.topology_hash_map[topology] = 1
         else:
@@ -429,7 +468,7 @@ class TopologyCounter(object):
         """
         t_freqs = collections.OrderedDict()
         count_topology = [(v, k) for k, v in self.topology_hash_map.items()]
-        count_topology.sort(reverse=True)
+        count_topology.sort(key=lambda x: x[0], reverse=True)
         for count, topology_hash in count_topology:
             freq = float(count) / self.total_trees_counted
             t_freqs[topology_hash] = (count, freq)
@@ -444,8 +483,8 @@ class TopologyCounter(object):
         hash_freqs = self.calc_hash_freqs()
         tree_freqs = collections.OrderedDict()
         for topology_hash, (count, freq) in hash_freqs.items():
-            tree = dendropy.Tree.from_bipartition_encoding(
-                bipartition_encoding=topology_hash,
+            tree = dendropy.Tree.from_split_bitmasks(
+                split_bitmasks=self.topology_split_bitmasks[topology_hash],
                 taxon_namespace=taxon_namespace,
                 is_rooted=is_rooted)
             tree_freqs[tree] = (count, freq)
@@ -454,3 +493,81 @@ class TopologyCounter(object):
 ## TreeCounter
 ##############################################################################
 
+##############################################################################
+## Convergence Diagnostics
+
+def split_frequency_standard_deviations(
+        split_frequencies,
+        all_taxa_bitmask,
+        is_rooted=False,
+        min_freq=0.1):
+    """
+    Returns the standard deviations of the frequencies of the splits across
+    independent samples of trees (e.g., separate MCMC runs).
+
+    Parameters
+    ----------
+    split_frequencies : iterable of dict
+        For each sample of trees, a dictionary mapping split bitmasks to their
+        frequencies in that sample, e.g. :attr:`SplitDistribution.split_frequencies`.
+    all_taxa_bitmask : int
+        Bitmask with bits set for all leaves, used to exclude trivial splits.
+    is_rooted : bool
+        Whether splits are rooted (clades) or not.
+    min_freq : float
+        Only splits with a frequency of at least this value in at least one
+        sample are included (as in MrBayes, which uses 0.10 by default).
+
+    Returns
+    -------
+    d : dict
+        Dictionary mapping split bitmasks to the (sample) standard deviation of
+        their frequencies, with splits not found in a sample taken to have a
+        frequency of 0.0 in it. Empty if there are fewer than two samples.
+    """
+    split_frequencies = list(split_frequencies)
+    num_samples = len(split_frequencies)
+    sdsfs = {}
+    if num_samples < 2:
+        return sdsfs
+    split_bitmasks = set()
+    for freqs in split_frequencies:
+        for split_bitmask in freqs:
+            if freqs[split_bitmask] < min_freq:
+                continue
+            if is_rooted:
+                if split_bitmask == all_taxa_bitmask or not ((split_bitmask - 1) & split_bitmask):
+                    continue
+            elif dendropy.Bipartition.is_trivial_bitmask(split_bitmask, all_taxa_bitmask):
+                continue
+            split_bitmasks.add(split_bitmask)
+    for split_bitmask in split_bitmasks:
+        values = [freqs.get(split_bitmask, 0.0) for freqs in split_frequencies]
+        mean, variance = mean_and_sample_variance(values)
+        sdsfs[split_bitmask] = math.sqrt(max(variance, 0.0))
+    return sdsfs
+
+def average_standard_deviation_of_split_frequencies(
+        split_frequencies,
+        all_taxa_bitmask,
+        is_rooted=False,
+        min_freq=0.1):
+    """
+    Returns the average and maximum standard deviation of split frequencies
+    (ASDSF and max SDSF) across independent samples of trees. See
+    :func:`split_frequency_standard_deviations` for the parameters.
+
+    Returns
+    -------
+    r : tuple
+        A pair, (ASDSF, max SDSF); both elements are |None| if there are
+        fewer than two samples or no splits meet the frequency threshold.
+    """
+    sdsfs = split_frequency_standard_deviations(
+            split_frequencies=split_frequencies,
+            all_taxa_bitmask=all_taxa_bitmask,
+            is_rooted=is_rooted,
+            min_freq=min_freq)
+    if not sdsfs:
+        return None, None
+    return sum(sdsfs.values()) / len(sdsfs), max(sdsfs.values())
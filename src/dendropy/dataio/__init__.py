@@ -23,6 +23,7 @@ from dendropy.dataio import newickwriter
 from dendropy.dataio import newickyielder
 from dendropy.dataio import fastareader
 from dendropy.dataio import fastawriter
+from dendropy.dataio import fastayielder
 from dendropy.dataio import nexusreader
 from dendropy.dataio import nexuswriter
 from dendropy.dataio import nexusyielder
@@ -31,23 +32,24 @@ from dendropy.dataio import nexmlwriter
 from dendropy.dataio import nexmlyielder
 from dendropy.dataio import phylipreader
 from dendropy.dataio import phylipwriter
+from dendropy.dataio import phylipyielder
 from dendropy.utility import container
 
 _IOServices = collections.namedtuple(
         "_IOServices",
-        ["reader", "writer", "tree_yielder"]
+        ["reader", "writer", "tree_yielder", "sequence_yielder"]
         )
 
 _IO_SERVICE_REGISTRY = container.CaseInsensitiveDict()
-_IO_SERVICE_REGISTRY["newick"] = _IOServices(newickreader.NewickReader, newickwriter.NewickWriter, newickyielder.NewickTreeDataYielder)
-_IO_SERVICE_REGISTRY["nexus"] = _IOServices(nexusreader.NexusReader, nexuswriter.NexusWriter, nexusyielder.NexusTreeDataYielder)
-_IO_SERVICE_REGISTRY["nexus/newick"] = _IOServices(None, None, nexusyielder.NexusNewickTreeDataYielder)
-_IO_SERVICE_REGISTRY["nexml"] = _IOServices(nexmlreader.NexmlReader, nexmlwriter.NexmlWriter, nexmlyielder.NexmlTreeDataYielder)
-_IO_SERVICE_REGISTRY["fasta"] = _IOServices(fastareader.FastaReader, fastawriter.FastaWriter, None)
-_IO_SERVICE_REGISTRY["dnafasta"] = _IOServices(fastareader.DnaFastaReader, fastawriter.FastaWriter, None)
-_IO_SERVICE_REGISTRY["rnafasta"] = _IOServices(fastareader.RnaFastaReader, fastawriter.FastaWriter, None)
-_IO_SERVICE_REGISTRY["proteinfasta"] = _IOServices(fastareader.ProteinFastaReader, fastawriter.FastaWriter, None)
-_IO_SERVICE_REGISTRY["phylip"] = _IOServices(phylipreader.PhylipReader, phylipwriter.PhylipWriter, None)
+_IO_SERVICE_REGISTRY["newick"] = _IOServices(newickreader.NewickReader, newickwriter.NewickWriter, newickyielder.NewickTreeDataYielder, None)
+_IO_SERVICE_REGISTRY["nexus"] = _IOServices(nexusreader.NexusReader, nexuswriter.NexusWriter, nexusyielder.NexusTreeDataYielder, nexusyielder.NexusCharacterDataYielder)
+_IO_SERVICE_REGISTRY["nexus/newick"] = _IOServices(None, None, nexusyielder.NexusNewickTreeDataYielder, None)
+_IO_SERVICE_REGISTRY["nexml"] = _IOServices(nexmlreader.NexmlReader, nexmlwriter.NexmlWriter, nexmlyielder.NexmlTreeDataYielder, None)
+_IO_SERVICE_REGISTRY["fasta"] = _IOServices(fastareader.FastaReader, fastawriter.FastaWriter, None, fastayielder.FastaCharacterDataYielder)
+_IO_SERVICE_REGISTRY["dnafasta"] = _IOServices(fastareader.DnaFastaReader, fastawriter.FastaWriter, None, None)
+_IO_SERVICE_REGISTRY["rnafasta"] = _IOServices(fastareader.RnaFastaReader, fastawriter.FastaWriter, None, None)
+_IO_SERVICE_REGISTRY["proteinfasta"] = _IOServices(fastareader.ProteinFastaReader, fastawriter.FastaWriter, None, None)
+_IO_SERVICE_REGISTRY["phylip"] = _IOServices(phylipreader.PhylipReader, phylipwriter.PhylipWriter, None, phylipyielder.PhylipCharacterDataYielder)
 
 def get_reader(schema, **kwargs):
     try:
@@ -90,9 +92,28 @@ def get_tree_yielder(
     except KeyError:
         raise NotImplementedError("'{}' is not a supported data yielding schema".format(schema))
 
-def register_service(schema, reader=None, writer=None, tree_yielder=None):
+def get_sequence_yielder(
+        files,
+        schema,
+        taxon_namespace,
+        char_matrix_type,
+        **kwargs):
+    try:
+        yielder_type =_IO_SERVICE_REGISTRY[schema].sequence_yielder
+        if yielder_type is None:
+            raise KeyError
+        yielder = yielder_type(
+                files=files,
+                taxon_namespace=taxon_namespace,
+                char_matrix_type=char_matrix_type,
+                **kwargs)
+        return yielder
+    except KeyError:
+        raise NotImplementedError("'{}' is not a supported sequence yielding schema".format(schema))
+
+def register_service(schema, reader=None, writer=None, tree_yielder=None, sequence_yielder=None):
     global _IO_SERVICE_REGISTRY
-    _IO_SERVICE_REGISTRY[schema] = _IOServices(reader, writer, tree_yielder)
+    _IO_SERVICE_REGISTRY[schema] = _IOServices(reader, writer, tree_yielder, sequence_yielder)
 
 def register_reader(schema, reader):
     global _IO_SERVICE_REGISTRY
@@ -101,7 +122,8 @@ def register_reader(schema, reader):
         register_service(schema=schema,
                 reader=reader,
                 writer=current.writer,
-                tree_yielder=current.tree_yielder)
+                tree_yielder=current.tree_yielder,
+                sequence_yielder=current.sequence_yielder)
     except KeyError:
         register_service(schema=schema, reader=reader)
 
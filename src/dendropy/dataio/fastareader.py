@@ -21,6 +21,7 @@
 Implementation of FASTA-format data reader.
 """
 
+import string
 from dendropy.dataio import ioservice
 from dendropy.utility.error import DataParseError
 from dendropy.utility import deprecate
@@ -58,6 +59,21 @@ class FastaReader(ioservice.DataReader):
             state_alphabet_factory=None,
             global_annotations_target=None):
         taxon_namespace = taxon_namespace_factory(label=None)
+        char_matrix = self._new_char_matrix(
+                taxon_namespace=taxon_namespace,
+                char_matrix_factory=char_matrix_factory)
+        for taxon, sequence in self._yield_sequences(
+                stream=stream,
+                char_matrix=char_matrix,
+                sequence_factory=char_matrix.character_sequence_type):
+            char_matrix[taxon] = sequence
+        product = self.Product(
+                taxon_namespaces=None,
+                tree_lists=None,
+                char_matrices=[char_matrix])
+        return product
+
+    def _new_char_matrix(self, taxon_namespace, char_matrix_factory):
         if self.data_type is None:
             raise TypeError("Data type must be specified for this schema")
         if self.data_type == "standard" and self.default_state_alphabet is not None:
@@ -72,7 +88,19 @@ class FastaReader(ioservice.DataReader):
                     self.data_type,
                     label=None,
                     taxon_namespace=taxon_namespace)
-        symbol_state_map = char_matrix.default_state_alphabet.full_symbol_state_map
+        return char_matrix
+
+    def _yield_sequences(self, stream, char_matrix, sequence_factory):
+        """
+        Yields ``(taxon, sequence)`` for each sequence in ``stream`` as soon
+        as it has been read, with ``sequence`` created by calling
+        ``sequence_factory()`` and populated with states of the alphabet of
+        ``char_matrix`` (to which it is not added).
+        """
+        taxon_namespace = char_matrix.taxon_namespace
+        state_alphabet = char_matrix.default_state_alphabet
+        symbol_state_map = state_alphabet.full_symbol_state_map
+        seen_taxa = set()
         curr_vec = None
         curr_taxon = None
         for line_index, line in enumerate(stream):
@@ -81,15 +109,24 @@ class FastaReader(ioservice.DataReader):
                 continue
             if s.startswith('>'):
                 name = s[1:].strip()
-                curr_taxon = taxon_namespace.require_taxon(label=name)
-                if curr_taxon in char_matrix:
+                taxon = taxon_namespace.require_taxon(label=name)
+                if taxon in seen_taxa:
                     raise DataParseError(message="FASTA error: Repeated sequence name ('{}') found".format(name), line_num=line_index + 1, stream=stream)
                 if curr_vec is not None and len(curr_vec) == 0:
                     raise DataParseError(message="FASTA error: Expected sequence, but found another sequence name ('{}')".format(name), line_num=line_index + 1, stream=stream)
-                curr_vec = char_matrix[curr_taxon]
+                if curr_vec is not None:
+                    yield curr_taxon, curr_vec
+                seen_taxa.add(taxon)
+                curr_taxon = taxon
+                curr_vec = sequence_factory()
             elif curr_vec is None:
                 raise DataParseError(message="FASTA error: Expecting a lines starting with > before sequences", line_num=line_index + 1, stream=stream)
             else:
+                # fast path: translate the whole line at once
+                state_codes = state_alphabet.translate_symbols(s, ignored_symbols=string.whitespace)
+                if state_codes is not None:
+                    curr_vec.extend_state_codes(state_codes, state_alphabet.states)
+                    continue
                 states = []
                 for col_ind, c in enumerate(s):
                     c = c.strip()
@@ -101,11 +138,8 @@ class FastaReader(ioservice.DataReader):
                         raise DataParseError(message="Unrecognized sequence symbol '{}'".format(c), line_num=line_index + 1, col_num=col_ind + 1, stream=stream)
                     states.append(state)
                 curr_vec.extend(states)
-        product = self.Product(
-                taxon_namespaces=None,
-                tree_lists=None,
-                char_matrices=[char_matrix])
-        return product
+        if curr_vec is not None:
+            yield curr_taxon, curr_vec
 
 
 class DnaFastaReader(FastaReader):
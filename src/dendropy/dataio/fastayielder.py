@@ -0,0 +1,76 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+
+"""
+Implementation of FASTA-schema sequence iterator.
+"""
+
+from dendropy.dataio import ioservice
+from dendropy.dataio import fastareader
+
+class FastaCharacterDataYielder(
+        ioservice.CharacterDataYielder,
+        fastareader.FastaReader):
+
+    def __init__(self,
+            files=None,
+            taxon_namespace=None,
+            char_matrix_type=None,
+            **kwargs):
+        """
+
+        Parameters
+        ----------
+        files : iterable of sources
+            Iterable of sources, which can either be strings specifying file
+            paths or file-like objects open for reading. If a source element is
+            a string (``isinstance(i,str) == True``), then it is assumed to be
+            a path to a file. Otherwise, the source is assumed to be a file-like
+            object.
+        taxon_namespace : |TaxonNamespace| instance
+            The operational taxonomic unit concept namespace to use to manage
+            taxon definitions.
+        char_matrix_type : |CharacterMatrix| subclass
+            The type of character matrix of the data, which determines the
+            type of the sequences yielded.
+        \*\*kwargs : keyword arguments
+            These will be passed directly to the base `fastareader.FastaReader`
+            class. See `fastareader.FastaReader` for details.
+        """
+        yielder_kwargs = self.extract_yielder_kwargs(kwargs)
+        fastareader.FastaReader.__init__(self, **kwargs)
+        ioservice.CharacterDataYielder.__init__(self,
+                files=files,
+                taxon_namespace=taxon_namespace,
+                char_matrix_type=char_matrix_type,
+                **yielder_kwargs)
+
+    ###########################################################################
+    ## Implementation of DataYielder interface
+
+    def _yield_items_from_stream(self, stream):
+        char_matrix = self._new_char_matrix(
+                taxon_namespace=self.attached_taxon_namespace,
+                char_matrix_factory=self.char_matrix_factory)
+        for taxon, sequence in self._yield_sequences(
+                stream=stream,
+                char_matrix=char_matrix,
+                sequence_factory=char_matrix.character_sequence_type):
+            yield taxon, sequence
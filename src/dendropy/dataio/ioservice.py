@@ -17,10 +17,13 @@
 ##
 ##############################################################################
 
+import os
 import sys
+import time
 import collections
 import warnings
 from dendropy.datamodel import taxonmodel
+from dendropy.datamodel import charstatemodel
 from dendropy.utility import deprecate
 from dendropy.utility import textprocessing
 if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
@@ -471,6 +474,26 @@ class DataWriter(IOService):
                 char_matrices=None,
                 global_annotations_target=None)
 
+    def write_trees(self, trees, stream, taxon_namespace=None):
+        """
+        Writes the trees in ``trees``, which can be any iterable of trees
+        (e.g., a generator that yields trees one at a time), to ``stream`` as a
+        single collection. Writers that can do so override this to write each
+        tree as it is drawn from ``trees``; by default, the trees are first
+        collected into a |TreeList|.
+        """
+        from dendropy.datamodel import treecollectionmodel
+        tree_list = None
+        for tree in trees:
+            if tree_list is None:
+                if taxon_namespace is None:
+                    taxon_namespace = tree.taxon_namespace
+                tree_list = treecollectionmodel.TreeList(taxon_namespace=taxon_namespace)
+            tree_list.append(tree)
+        if tree_list is None:
+            tree_list = treecollectionmodel.TreeList(taxon_namespace=taxon_namespace)
+        self.write_tree_list(tree_list, stream)
+
     def write_tree_lists(self, tree_lists, stream):
         self._write(
                 stream=stream,
@@ -500,12 +523,54 @@ class DataWriter(IOService):
 
 class DataYielder(IOService):
 
-    def __init__(self, files=None):
+    # Whether or not this yielder tracks positions between items and can
+    # resume reading a file from such a position (see ``resume_offsets``).
+    # Following files requires this.
+    is_resumable = False
+
+    # Keyword arguments consumed by the yielder itself rather than by the
+    # reader of the schema.
+    yielder_kwarg_names = (
+            "resume_offsets",
+            "follow",
+            "follow_poll_interval",
+            "follow_timeout",
+            )
+
+    @classmethod
+    def extract_yielder_kwargs(cls, kwargs):
+        """
+        Removes and returns the keyword arguments in ``kwargs`` that are
+        consumed by the yielder itself.
+        """
+        yielder_kwargs = {}
+        for kwarg_name in cls.yielder_kwarg_names:
+            if kwarg_name in kwargs:
+                yielder_kwargs[kwarg_name] = kwargs.pop(kwarg_name)
+        return yielder_kwargs
+
+    def __init__(self,
+            files=None,
+            resume_offsets=None,
+            follow=False,
+            follow_poll_interval=1.0,
+            follow_timeout=None):
         IOService.__init__(self)
         self.files = files
+        self.resume_offsets = resume_offsets
+        self.follow = follow
+        self.follow_poll_interval = follow_poll_interval
+        self.follow_timeout = follow_timeout
         self._current_file_index = None
         self._current_file = None
         self._current_file_name = None
+        self._current_file_start_offset = None
+        self._current_file_char_anchor = None
+        self._current_file_resume_char_offset = None
+        self._current_file_tokenizer = None
+        self._is_current_file_complete = False
+        self._follow_resume_offsets = None
+        self._completed_file_resume_states = {}
 
     def reset(self):
         self.current_file_index = None
@@ -524,11 +589,185 @@ class DataYielder(IOService):
         return self._current_file_name
     current_file_name = property(_get_current_file_name)
 
+    def _get_current_file_resume_offset(self):
+        """
+        Position in the current file, as a value that can be passed to
+        ``seek()`` of the file opened in text mode (which, for all practical
+        purposes, is the byte offset), of the beginning of the statement
+        following the last item yielded. Passing this value in
+        ``resume_offsets`` to a new yielder will resume reading the file
+        from this position. |None| if not known (e.g., if the yielder does
+        not support resumption, or if the source cannot be reopened by
+        name).
+        """
+        position, self._current_file_char_anchor = self._resolve_resume_offset(
+                self._current_file_name,
+                self._current_file_char_anchor,
+                self._current_file_resume_char_offset)
+        return position
+    current_file_resume_offset = property(_get_current_file_resume_offset)
+
+    def _resolve_resume_offset(self, file_name, char_anchor, resume_char_offset):
+        """
+        Returns pair of the file position corresponding to the character
+        offset ``resume_char_offset`` in file ``file_name`` (or |None| if it
+        cannot be determined), given ``char_anchor``, a pair of a character
+        offset and its file position, and the new anchor (which is the
+        resume point if it was resolved, or ``char_anchor`` otherwise).
+        """
+        if (resume_char_offset is None
+                or char_anchor is None
+                or file_name is None):
+            return None, char_anchor
+        anchor_char_offset, anchor_position = char_anchor
+        nchars = resume_char_offset - anchor_char_offset
+        if nchars < 0:
+            return None, char_anchor
+        if nchars > 0:
+            # The positions of a text stream are opaque values (and the
+            # stream being parsed has read ahead of the resume point), so
+            # the file is re-opened and read forward from the last known
+            # position to the resume point. Only the characters read since
+            # the last call need to be decoded.
+            try:
+                with open(file_name, "r") as src:
+                    src.seek(anchor_position)
+                    while nchars > 0:
+                        n = len(src.read(min(nchars, 1048576)))
+                        if n == 0:
+                            return None, char_anchor
+                        nchars -= n
+                    position = src.tell()
+            except (IOError, OSError):
+                return None, char_anchor
+            char_anchor = (resume_char_offset, position)
+        return char_anchor[1], char_anchor
+
+    def _set_current_file_char_anchor(self, position):
+        """
+        To be called by derived classes whenever a new tokenizer is set to
+        read from the current file at ``position``, so that character offsets
+        reported by the tokenizer can be mapped to file positions.
+        """
+        self._current_file_char_anchor = (0, position)
+        self._current_file_resume_char_offset = None
+
+    def _set_current_file_resume_char_offset(self, tokenizer):
+        """
+        To be called by derived classes after parsing each item, with the
+        tokenizer positioned on the first token following the item (or at
+        the end of the stream).
+        """
+        self._current_file_resume_char_offset = tokenizer.token_char_offset
+
+    def get_file_resume_offset(self, file_index):
+        """
+        Returns the position from which to resume reading the file at index
+        ``file_index`` of ``files`` (see ``current_file_resume_offset``), if
+        known: i.e., if it is the current file, a file that has been read
+        to the end, or a file being followed.
+        """
+        if file_index == self._current_file_index:
+            return self.current_file_resume_offset
+        if self._follow_resume_offsets is not None:
+            return self._follow_resume_offsets[file_index]
+        if file_index in self._completed_file_resume_states:
+            file_name, char_anchor, resume_char_offset = self._completed_file_resume_states[file_index]
+            position, char_anchor = self._resolve_resume_offset(file_name, char_anchor, resume_char_offset)
+            self._completed_file_resume_states[file_index] = (file_name, char_anchor, resume_char_offset)
+            return position
+        return None
+
     def __iter__(self):
+        if self.follow:
+            for item in self._follow_files():
+                yield item
+            return
         for current_file_index, current_file in enumerate(self.files):
             self._current_file_index = current_file_index
             for item in self.iterate_over_file(current_file):
                 yield item
+            # kept so that the resume offset of the file can be resolved
+            # (only if requested) after moving on to the next file
+            self._completed_file_resume_states[current_file_index] = (
+                    self._current_file_name,
+                    self._current_file_char_anchor,
+                    self._current_file_resume_char_offset)
+
+    def _follow_files(self):
+        """
+        Yields items from files that are still being written to (e.g., by a
+        running MCMC analysis), reading from each file in turn whatever has
+        been added since it was last read.
+
+        Each file is read from the position following the last complete item
+        read from it, so that data is never read twice. A failure to parse
+        the data at the end of a file is taken to be due to a partially
+        written statement, which is re-read once the file grows. A file is
+        no longer followed once its data is complete (e.g., the end of the
+        trees block of a NEXUS file has been read), or once it has not grown
+        for ``follow_timeout`` seconds.
+        """
+        if not self.is_resumable:
+            raise NotImplementedError("Following files is not supported for this format")
+        files = list(self.files)
+        for f in files:
+            if not textprocessing.is_str_type(f):
+                raise TypeError("Following files requires file paths, not file objects: {}".format(f))
+        if self.resume_offsets is not None:
+            self._follow_resume_offsets = list(self.resume_offsets)
+        else:
+            self._follow_resume_offsets = [None] * len(files)
+        is_following = [True] * len(files)
+        file_sizes = [None] * len(files)
+        last_growth_times = [time.time()] * len(files)
+        pending_errors = [None] * len(files)
+        resume_offsets = self.resume_offsets
+        try:
+            while any(is_following):
+                is_any_file_read = False
+                for file_index, filepath in enumerate(files):
+                    if not is_following[file_index]:
+                        continue
+                    try:
+                        file_size = os.path.getsize(filepath)
+                    except OSError:
+                        # not yet created
+                        file_size = None
+                    current_time = time.time()
+                    if file_size is None or file_size == file_sizes[file_index]:
+                        if (self.follow_timeout is not None
+                                and current_time - last_growth_times[file_index] >= self.follow_timeout):
+                            is_following[file_index] = False
+                            if pending_errors[file_index] is not None:
+                                raise pending_errors[file_index]
+                        continue
+                    file_sizes[file_index] = file_size
+                    last_growth_times[file_index] = current_time
+                    is_any_file_read = True
+                    self._current_file_index = file_index
+                    self.resume_offsets = self._follow_resume_offsets
+                    pending_errors[file_index] = None
+                    try:
+                        for item in self.iterate_over_file(filepath):
+                            yield item
+                    except UnicodeDecodeError as e:
+                        # partially-written multibyte character
+                        pending_errors[file_index] = e
+                    except Exception as e:
+                        if self._current_file_tokenizer is None or not self._current_file_tokenizer.is_eof():
+                            raise
+                        # partially-written statement
+                        pending_errors[file_index] = e
+                    resume_offset = self.current_file_resume_offset
+                    if resume_offset is not None:
+                        self._follow_resume_offsets[file_index] = resume_offset
+                    if self._is_current_file_complete and pending_errors[file_index] is None:
+                        is_following[file_index] = False
+                if not is_any_file_read and any(is_following):
+                    time.sleep(self.follow_poll_interval)
+        finally:
+            self.resume_offsets = resume_offsets
 
     def iterate_over_file(self, current_file):
         if textprocessing.is_str_type(current_file):
@@ -540,6 +779,19 @@ class DataYielder(IOService):
                 self._current_file_name = self.current_file.name
             except AttributeError:
                 self._current_file_name = None
+        if self.resume_offsets is not None:
+            self._current_file_start_offset = self.resume_offsets[self._current_file_index]
+        else:
+            self._current_file_start_offset = None
+        if self._current_file_start_offset is not None and not self.is_resumable:
+            raise NotImplementedError("Resuming from a file position is not supported for this format")
+        try:
+            self._current_file_char_anchor = (0, self._current_file.tell())
+        except (AttributeError, IOError, OSError, ValueError):
+            self._current_file_char_anchor = None
+        self._current_file_resume_char_offset = None
+        self._current_file_tokenizer = None
+        self._is_current_file_complete = False
         if hasattr(self._current_file, "__exit__"):
             with self._current_file:
                 for item in self._yield_items_from_stream(stream=self._current_file):
@@ -558,8 +810,9 @@ class TreeDataYielder(DataYielder):
     def __init__(self,
             files=None,
             taxon_namespace=None,
-            tree_type=None):
-        DataYielder.__init__(self, files=files)
+            tree_type=None,
+            **kwargs):
+        DataYielder.__init__(self, files=files, **kwargs)
         self.taxon_namespace = taxon_namespace
         assert self.taxon_namespace is not None
         self.attached_taxon_namespace = self.taxon_namespace
@@ -568,4 +821,45 @@ class TreeDataYielder(DataYielder):
     def tree_factory(self):
         return self.tree_type(taxon_namespace=self.taxon_namespace)
 
+###############################################################################
+## CharacterDataYielder
 
+class CharacterDataYielder(DataYielder):
+    """
+    Base class for yielders of the sequences of character data sources, one
+    at a time, as ``(taxon, sequence)`` tuples, where ``taxon`` is a |Taxon|
+    object and ``sequence`` is an object of the ``character_sequence_type``
+    of ``char_matrix_type`` that is not held by any character matrix.
+
+    The character matrix created for each character data source (or block)
+    is available as ``char_matrix``, e.g., for access to the state alphabets
+    of the sequences, but the sequences are not added to it.
+    """
+
+    def __init__(self,
+            files=None,
+            taxon_namespace=None,
+            char_matrix_type=None,
+            **kwargs):
+        DataYielder.__init__(self, files=files, **kwargs)
+        self.taxon_namespace = taxon_namespace
+        assert self.taxon_namespace is not None
+        self.attached_taxon_namespace = self.taxon_namespace
+        self.char_matrix_type = char_matrix_type
+        self.char_matrix = None
+
+    def taxon_namespace_factory(self, label=None):
+        return self.taxon_namespace
+
+    def char_matrix_factory(self, data_type, **kwargs):
+        if data_type != self.char_matrix_type.data_type:
+            raise ValueError(
+                "Data source is of type '{}', "
+                "but current CharacterMatrix is of type '{}'.".format(
+                    data_type,
+                    self.char_matrix_type.data_type))
+        self.char_matrix = self.char_matrix_type(**kwargs)
+        return self.char_matrix
+
+    def state_alphabet_factory(self, *args, **kwargs):
+        return charstatemodel.StateAlphabet(*args, **kwargs)
@@ -181,6 +181,8 @@ class NewickWriter(ioservice.DataWriter):
         # self.unquoted_underscores = not kwargs.pop('quote_underscores', not self.unquoted_underscores) # legacy
         self.preserve_spaces = kwargs.pop("preserve_spaces", False)
         self.store_tree_weights = kwargs.pop("store_tree_weights", False)
+        self._escaped_taxon_tree_tokens = {}
+        self._taxon_token_map = None
         self.taxon_token_map = kwargs.pop("taxon_token_map", {})
         self.suppress_annotations = kwargs.pop("suppress_annotations", True)
         # self.suppress_annotations = not kwargs.pop("annotations_as_comments", not self.suppress_annotations) # legacy
@@ -197,14 +199,33 @@ class NewickWriter(ioservice.DataWriter):
             self.edge_label_compose_fn = self._format_edge_length
         self.check_for_unused_keyword_arguments(kwargs)
 
+    def _get_taxon_token_map(self):
+        return self._taxon_token_map
+    def _set_taxon_token_map(self, m):
+        self._taxon_token_map = m
+        self._escaped_taxon_tree_tokens = {}
+    taxon_token_map = property(_get_taxon_token_map, _set_taxon_token_map)
+
     def _get_taxon_tree_token(self, taxon):
-        if self.taxon_token_map is None:
+        if self._taxon_token_map is None:
             self.taxon_token_map = {}
         try:
-            return self.taxon_token_map[taxon]
+            return self._taxon_token_map[taxon]
         except KeyError:
             t = str(taxon.label)
-            self.taxon_token_map[taxon] = t
+            self._taxon_token_map[taxon] = t
+            return t
+
+    def _get_escaped_taxon_tree_token(self, taxon):
+        # Quoting decisions are made once per taxon rather than once per
+        # node of every tree written.
+        try:
+            return self._escaped_taxon_tree_tokens[taxon]
+        except KeyError:
+            t = nexusprocessing.escape_nexus_token(self._get_taxon_tree_token(taxon),
+                    preserve_spaces=self.preserve_spaces,
+                    quote_underscores=not self.unquoted_underscores)
+            self._escaped_taxon_tree_tokens[taxon] = t
             return t
 
     def _get_real_value_format_specifier(self):
@@ -213,8 +234,12 @@ class NewickWriter(ioservice.DataWriter):
         if f is None:
             f = ""
         self._real_value_format_specifier = f
-        s = "{:" + self._real_value_format_specifier + "}"
-        self._real_value_formatter = s.format
+        if not f:
+            # equivalent to, but faster than, "{:}".format
+            self._real_value_formatter = str
+        else:
+            s = "{:" + self._real_value_format_specifier + "}"
+            self._real_value_formatter = s.format
     real_value_format_specifier = property(_get_real_value_format_specifier, _set_real_value_format_specifier)
 
     def _format_edge_length(self, edge):
@@ -239,9 +264,7 @@ class NewickWriter(ioservice.DataWriter):
         """
         Writes a |TreeList| in Newick schema to ``stream``.
         """
-        for tree in tree_list:
-            self._write_tree(stream, tree)
-            stream.write("\n")
+        self.write_trees(tree_list, stream)
         # In Newick format, no clear way to distinguish between
         # annotations/comments associated with tree collection and
         # annotations/comments associated with first tree. So we place them at
@@ -258,6 +281,16 @@ class NewickWriter(ioservice.DataWriter):
                 annotation_comments,
                 treelist_comments))
 
+    def write_trees(self, trees, stream, taxon_namespace=None):
+        """
+        Writes each tree in ``trees``, which can be any iterable of trees
+        (e.g., a generator that yields trees one at a time), to ``stream``,
+        one tree statement per line, as it is drawn from ``trees``.
+        """
+        for tree in trees:
+            self._write_tree(stream, tree)
+            stream.write("\n")
+
     def _write_tree(self, stream, tree):
         """
         Composes and writes ``tree`` to ``stream``.
@@ -282,49 +315,51 @@ class NewickWriter(ioservice.DataWriter):
         else:
             annotation_comments = ""
         tree_comments = self._compose_comment_string(tree)
-        stream.write("{}{}{}{}".format(
-                rooting,
-                weight,
-                annotation_comments,
-                tree_comments,
-                ))
-        tree.apply(
-                before_fn=lambda x: self._write_node_open(x, stream),
-                after_fn=lambda x: self._write_node_close(x, stream),
-                leaf_fn=lambda x: self._write_leaf(x, stream),
-                )
-        stream.write(";")
-
-    def _write_node_open(self, node, out):
-        if node._parent_node is None or node._parent_node._child_nodes[0] is node:
-            out.write("(")
-        else:
-            out.write(",(")
-
-    def _write_leaf(self, node, out):
-        if not (node._parent_node is None or node._parent_node._child_nodes[0] is node):
-            out.write(",")
-        self._write_node_body(node, out)
+        parts = [rooting, weight, annotation_comments, tree_comments]
+        self._compose_subtree(tree.seed_node, parts)
+        parts.append(";")
+        stream.write("".join(parts))
 
-    def _write_node_close(self, node, out):
-        out.write(")")
-        self._write_node_body(node, out)
+    def _compose_subtree(self, node, parts):
+        """
+        Appends the elements of the Newick representation of the subtree
+        rooted at ``node`` to the list ``parts``, visiting the nodes in the
+        same order as ``Node.apply()``, but without recursion.
+        """
+        to_visit = [(node, False)]
+        while to_visit:
+            nd, is_closing = to_visit.pop()
+            if is_closing:
+                parts.append(")")
+                self._compose_node_body(nd, parts)
+                continue
+            if not (nd._parent_node is None or nd._parent_node._child_nodes[0] is nd):
+                parts.append(",")
+            if nd._child_nodes:
+                parts.append("(")
+                to_visit.append((nd, True))
+                for ch in reversed(nd._child_nodes):
+                    to_visit.append((ch, False))
+            else:
+                self._compose_node_body(nd, parts)
 
-    def _write_node_body(self, node, out):
-        out.write(self._render_node_tag(node))
-        if node.edge and node.edge.length != None and not self.suppress_edge_lengths:
-            out.write(":{}".format(self.edge_label_compose_fn(node.edge)))
+    def _compose_node_body(self, node, parts):
+        parts.append(self._render_node_tag(node))
+        edge = node.edge
+        if edge and edge.length is not None and not self.suppress_edge_lengths:
+            parts.append(":{}".format(self.edge_label_compose_fn(edge)))
         if not self.suppress_annotations:
-            node_annotation_comments = nexusprocessing.format_item_annotations_as_comments(node,
-                    nhx=self.annotations_as_nhx,
-                    real_value_format_specifier=self.real_value_format_specifier)
-            out.write(node_annotation_comments)
-            edge_annotation_comments = nexusprocessing.format_item_annotations_as_comments(node.edge,
-                    nhx=self.annotations_as_nhx,
-                    real_value_format_specifier=self.real_value_format_specifier)
-            out.write(edge_annotation_comments)
-        out.write(self._compose_comment_string(node))
-        out.write(self._compose_comment_string(node.edge))
+            if node.has_annotations:
+                parts.append(nexusprocessing.format_item_annotations_as_comments(node,
+                        nhx=self.annotations_as_nhx,
+                        real_value_format_specifier=self.real_value_format_specifier))
+            if edge.has_annotations:
+                parts.append(nexusprocessing.format_item_annotations_as_comments(edge,
+                        nhx=self.annotations_as_nhx,
+                        real_value_format_specifier=self.real_value_format_specifier))
+        if not self.suppress_item_comments:
+            parts.append(self._compose_comment_string(node))
+            parts.append(self._compose_comment_string(edge))
 
     def _compose_comment_string(self, item):
         if not self.suppress_item_comments and item.comments:
@@ -348,12 +383,14 @@ class NewickWriter(ioservice.DataWriter):
             tag = self.node_label_compose_fn(node)
         else:
             tag_parts = []
-            is_leaf = len(node.child_nodes()) == 0
+            is_leaf = not node._child_nodes
             if is_leaf:
                 if hasattr(node, 'taxon') \
                         and node.taxon \
                         and node.taxon.label is not None \
                         and not self.suppress_leaf_taxon_labels:
+                    if self.suppress_leaf_node_labels or not node.label:
+                        return self._get_escaped_taxon_tree_token(node.taxon)
                     tag_parts.append(self._get_taxon_tree_token(node.taxon))
                 if hasattr(node, 'label') \
                         and node.label \
@@ -28,6 +28,8 @@ from dendropy.dataio import nexusprocessing
 
 class NewickTreeDataYielder(ioservice.TreeDataYielder):
 
+    is_resumable = True
+
     def __init__(self,
             files=None,
             taxon_namespace=None,
@@ -45,6 +47,23 @@ class NewickTreeDataYielder(ioservice.TreeDataYielder):
         taxon_namespace : |TaxonNamespace| instance
             The operational taxonomic unit concept namespace to use to manage
             taxon definitions.
+        resume_offsets : iterable of positions
+            If given, then, for each source in ``files``, the position
+            (typically, a value of ``current_file_resume_offset`` from a
+            previous yielder) from which to resume reading the source, or
+            |None| to read it from the beginning.
+        follow : bool
+            If |True|, then the sources (which must be file paths) are
+            followed as they are written to, e.g. by a running MCMC analysis:
+            whatever has been added to each source is read in turn, waiting
+            for more data if none is available, until the data in all sources
+            is complete or has not grown for ``follow_timeout`` seconds.
+        follow_poll_interval : float
+            Number of seconds to wait before checking sources being followed
+            for new data.
+        follow_timeout : float
+            If not |None|, stop following a source if it has not grown in
+            this many seconds.
         \*\*kwargs : keyword arguments
             These will be passed directly to the base `newickreader.NexusReader`
             class. See `newickreader.NexusReader` for details.
@@ -52,24 +71,40 @@ class NewickTreeDataYielder(ioservice.TreeDataYielder):
         ioservice.TreeDataYielder.__init__(self,
                 files=files,
                 taxon_namespace=taxon_namespace,
-                tree_type=tree_type)
+                tree_type=tree_type,
+                **self.extract_yielder_kwargs(kwargs))
         self.newick_reader = newickreader.NewickReader(**kwargs)
 
     ###########################################################################
     ## Implementation of DataYielder interface
 
     def _yield_items_from_stream(self, stream):
+        if self._current_file_start_offset is not None:
+            stream.seek(self._current_file_start_offset)
+            self._set_current_file_char_anchor(self._current_file_start_offset)
         nexus_tokenizer = nexusprocessing.NexusTokenizer(stream,
                 preserve_unquoted_underscores=self.newick_reader.preserve_unquoted_underscores)
+        self._current_file_tokenizer = nexus_tokenizer
+        if self._current_file_start_offset is not None:
+            # prime the tokenizer, so that resuming at the end of the
+            # stream is not treated as a truncated tree statement
+            nexus_tokenizer.next_token()
         taxon_symbol_mapper = nexusprocessing.NexusTaxonSymbolMapper(
                 taxon_namespace=self.attached_taxon_namespace,
                 enable_lookup_by_taxon_number=False,
                 case_sensitive=self.newick_reader.case_sensitive_taxon_labels)
-        while True:
-            tree = self.newick_reader._parse_tree_statement(
-                    nexus_tokenizer=nexus_tokenizer,
-                    tree_factory=self.tree_factory,
-                    taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol)
-            if tree is None:
-                break
-            yield tree
+        try:
+            while True:
+                tree = self.newick_reader._parse_tree_statement(
+                        nexus_tokenizer=nexus_tokenizer,
+                        tree_factory=self.tree_factory,
+                        taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol)
+                if tree is None:
+                    break
+                self._set_current_file_resume_char_offset(nexus_tokenizer)
+                yield tree
+        finally:
+            # do not rely on the mapper being garbage-collected (e.g., it
+            # will not be while the traceback of an exception raised here
+            # is alive)
+            taxon_symbol_mapper.restore_taxon_namespace_mutability()
@@ -56,7 +56,8 @@ class NexmlTreeDataYielder(
         ioservice.TreeDataYielder.__init__(self,
                 files=files,
                 taxon_namespace=taxon_namespace,
-                tree_type=tree_type)
+                tree_type=tree_type,
+                **self.extract_yielder_kwargs(kwargs))
         nexmlreader.NexmlReader.__init__(self,
                 **kwargs)
         self.attached_taxon_namespace = self.taxon_namespace
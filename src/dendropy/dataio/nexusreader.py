@@ -622,7 +622,9 @@ class NexusReader(ioservice.DataReader):
         self._nexus_tokenizer.allow_eof = True
 
     def _get_taxon(self, taxon_namespace, label):
-        if not self._file_specified_ntax or len(taxon_namespace) < self._file_specified_ntax:
+        if (not self._file_specified_ntax
+                or len(taxon_namespace) < self._file_specified_ntax
+                or self.unconstrained_taxa_accumulation_mode):
             taxon = taxon_namespace.require_taxon(label=label,
                     is_case_sensitive=self.case_sensitive_taxon_labels)
         else:
@@ -869,6 +871,15 @@ class NexusReader(ioservice.DataReader):
         is positioned right after the "MATRIX" token in a MATRIX command,
         and that NTAX and NCHAR have been specified accurately.
         """
+        char_block = self._new_matrix_char_block(
+                block_title=block_title,
+                link_title=link_title)
+        if self._data_type == "continuous":
+            self._process_continuous_matrix_data(char_block)
+        else:
+            self._process_discrete_matrix_data(char_block)
+
+    def _new_matrix_char_block(self, block_title=None, link_title=None):
         if not self._file_specified_ntax:
             raise self._nexus_error('NTAX must be defined by DIMENSIONS command to non-zero value before MATRIX command')
         elif not self._file_specified_nchar:
@@ -878,34 +889,24 @@ class NexusReader(ioservice.DataReader):
                 self._data_type,
                 taxon_namespace=taxon_namespace,
                 title=block_title)
-        if self._data_type == "continuous":
-            self._process_continuous_matrix_data(char_block)
-        else:
-            self._process_discrete_matrix_data(char_block)
+        return char_block
 
     def _process_continuous_matrix_data(self, char_block):
-        taxon_namespace = char_block.taxon_namespace
-        token = self._nexus_tokenizer.next_token()
-        first_sequence_defined = None
         if self._interleave:
+            taxon_namespace = char_block.taxon_namespace
+            token = self._nexus_tokenizer.next_token()
             try:
                 while token != ";" and not self._nexus_tokenizer.is_eof():
                     taxon = self._get_taxon(taxon_namespace=taxon_namespace, label=token)
                     self._read_continuous_character_values(char_block[taxon])
-                    # if first_sequence_defined is None:
-                    #     first_sequence_defined = char_block[taxon]
                     token = self._nexus_tokenizer.next_token()
             except NexusReader.BlockTerminatedException:
                 token = self._nexus_tokenizer.next_token()
         else:
-            while token != ';' and not self._nexus_tokenizer.is_eof():
-                taxon = self._get_taxon(taxon_namespace=taxon_namespace, label=token)
-                self._read_continuous_character_values(char_block[taxon])
-                # if first_sequence_defined is None:
-                #     first_sequence_defined = char_block[taxon]
-                if len(char_block[taxon]) < self._file_specified_nchar:
-                    raise self._nexus_error("Insufficient characters given for taxon '{}': expecting {} but only found {} ('{}')".format(taxon.label, self._file_specified_nchar, len(char_block[taxon]), char_block[taxon].symbols_as_string()))
-                token = self._nexus_tokenizer.next_token()
+            for taxon, sequence in self._yield_sequential_matrix_rows(
+                    char_block=char_block,
+                    sequence_for_taxon=char_block.__getitem__):
+                pass
         # if self._interleave:
         #     raise NotImplementedError("Continuous interleaved characters in NEXUS schema not yet supported")
         # taxon_namespace = char_block.taxon_namespace
@@ -924,11 +925,11 @@ class NexusReader(ioservice.DataReader):
     def _process_discrete_matrix_data(self, char_block):
         if self._data_type == "standard":
             self._build_state_alphabet(char_block, self._symbols)
-        taxon_namespace = char_block.taxon_namespace
-        token = self._nexus_tokenizer.next_token()
-        state_alphabet = char_block.default_state_alphabet
-        first_sequence_defined = None
         if self._interleave:
+            taxon_namespace = char_block.taxon_namespace
+            token = self._nexus_tokenizer.next_token()
+            state_alphabet = char_block.default_state_alphabet
+            first_sequence_defined = None
             try:
                 while token != ";" and not self._nexus_tokenizer.is_eof():
                     taxon = self._get_taxon(taxon_namespace=taxon_namespace, label=token)
@@ -939,15 +940,38 @@ class NexusReader(ioservice.DataReader):
             except NexusReader.BlockTerminatedException:
                 token = self._nexus_tokenizer.next_token()
         else:
-            while token != ';' and not self._nexus_tokenizer.is_eof():
-                taxon = self._get_taxon(taxon_namespace=taxon_namespace, label=token)
-                self._read_character_states(char_block[taxon], state_alphabet, first_sequence_defined)
+            for taxon, sequence in self._yield_sequential_matrix_rows(
+                    char_block=char_block,
+                    sequence_for_taxon=char_block.__getitem__):
+                pass
+
+    def _yield_sequential_matrix_rows(self, char_block, sequence_for_taxon):
+        """
+        Reads the rows of a non-interleaved MATRIX command, yielding
+        ``(taxon, sequence)`` for each row as soon as it has been read. The
+        states of the row for each taxon are added to the sequence returned by
+        ``sequence_for_taxon(taxon)``. Assumes that the file reader is
+        positioned right after the "MATRIX" token.
+        """
+        taxon_namespace = char_block.taxon_namespace
+        if self._data_type != "continuous":
+            state_alphabet = char_block.default_state_alphabet
+        first_sequence_defined = None
+        token = self._nexus_tokenizer.next_token()
+        while token != ';' and not self._nexus_tokenizer.is_eof():
+            taxon = self._get_taxon(taxon_namespace=taxon_namespace, label=token)
+            sequence = sequence_for_taxon(taxon)
+            if self._data_type == "continuous":
+                self._read_continuous_character_values(sequence)
+            else:
+                self._read_character_states(sequence, state_alphabet, first_sequence_defined)
                 if first_sequence_defined is None:
-                    first_sequence_defined = char_block[taxon]
-                if len(char_block[taxon]) < self._file_specified_nchar:
-                    raise self._nexus_error("Insufficient characters given for taxon '%s': expecting %d but only found %d ('%s')" \
-                        % (taxon.label, self._file_specified_nchar, len(char_block[taxon]), char_block[taxon].symbols_as_string()))
-                token = self._nexus_tokenizer.next_token()
+                    first_sequence_defined = sequence
+            if len(sequence) < self._file_specified_nchar:
+                raise self._nexus_error("Insufficient characters given for taxon '%s': expecting %d but only found %d ('%s')" \
+                    % (taxon.label, self._file_specified_nchar, len(sequence), sequence.symbols_as_string()))
+            yield taxon, sequence
+            token = self._nexus_tokenizer.next_token()
 
     def _get_state_for_multistate_tokens(self,
             state_char_seq,
@@ -1292,6 +1316,14 @@ class NexusReader(ioservice.DataReader):
             elif token == ";":
                 raise NexusReader.BlockTerminatedException
             else:
+                # fast path: translate the whole token at once
+                if (len(character_data_vector) + len(states_to_add) + len(token) <= self._file_specified_nchar
+                        and self._match_char.isdisjoint(token)):
+                    state_codes = state_alphabet.translate_symbols(token)
+                    if state_codes is not None:
+                        states = state_alphabet.states
+                        states_to_add.extend([states[code] for code in bytearray(state_codes)])
+                        continue
                 for c in token:
                     if c in self._match_char:
                         try:
@@ -24,6 +24,7 @@ Writing data in NEXUS format to an output stream.
 import re
 import warnings
 import collections
+import itertools
 from dendropy.utility import textprocessing
 from dendropy.dataio import ioservice
 from dendropy.dataio import newick
@@ -230,22 +231,8 @@ class NexusWriter(ioservice.DataWriter):
             char_matrices=None,
             global_annotations_target=None):
 
-        # Header
-        stream.write('#NEXUS\n\n')
-
-        # File/Document-level annotations and comments
-        if self.file_comments:
-            self._write_comments(stream, self.file_comments)
-        if global_annotations_target is not None:
-            self._write_item_annotations(stream, global_annotations_target)
-            self._write_item_comments(stream, global_annotations_target)
-
-        # Other blocks
-        if self.preamble_blocks:
-            for block in self.preamble_blocks:
-                stream.write(block)
-                stream.write("\n")
-            stream.write("\n")
+        # Header, file/document-level annotations and comments, other blocks
+        self._write_header(stream, global_annotations_target)
 
         # Taxon namespace discovery
         candidate_taxon_namespaces = collections.OrderedDict()
@@ -290,6 +277,74 @@ class NexusWriter(ioservice.DataWriter):
                             tree_list=tree_list)
 
         # Write out remaining
+        self._write_supplemental_blocks(stream)
+
+    def write_trees(self, trees, stream, taxon_namespace=None):
+        """
+        Writes each tree in ``trees``, which can be any iterable of trees
+        (e.g., a generator that yields trees one at a time), to ``stream`` as
+        a single "TREES" block, writing each tree statement as the tree is
+        drawn from ``trees``. The header, "TAXA" block and translate
+        statement are written once, before the first tree. If
+        ``taxon_namespace`` is not given, then the |TaxonNamespace| of the
+        first tree is used. All trees must reference the same
+        |TaxonNamespace|, and this must already hold all the taxa of the
+        trees when the first tree is drawn (e.g., if the trees are read
+        lazily from a source without a "TAXA" block, read its taxa into
+        ``taxon_namespace`` first): as the "TAXA" block and translate
+        statement cannot be revised once written, a `ValueError` is raised
+        for a tree drawn after taxa were added to (or removed from) the
+        |TaxonNamespace|. In that case, or if drawing a tree from ``trees``
+        fails, the "TREES" block is closed after the trees already written,
+        so that ``stream`` holds a complete document with fewer trees,
+        before the exception is propagated.
+        """
+        trees = iter(trees)
+        pending_trees = []
+        if taxon_namespace is None:
+            for tree in trees:
+                taxon_namespace = tree.taxon_namespace
+                pending_trees.append(tree)
+                break
+        self._write_header(stream, None)
+        if taxon_namespace is None:
+            self.taxon_namespaces_to_write = []
+        else:
+            self.taxon_namespaces_to_write = [taxon_namespace]
+            if not self.simple and not self.suppress_taxa_blocks:
+                self._write_taxa_block(stream, taxon_namespace)
+            stream.write("BEGIN TREES;\n")
+            self._set_and_write_translate_block(stream, taxon_namespace)
+            # taxa can only have been added to (or removed from) the
+            # namespace since the taxa were written if its size has changed
+            num_declared_taxa = len(taxon_namespace)
+            tree_idx = 0
+            try:
+                for tree in itertools.chain(pending_trees, trees):
+                    if tree.taxon_namespace is not taxon_namespace:
+                        raise ValueError("Tree {} does not reference the taxon namespace of the trees being written".format(tree_idx+1))
+                    if len(taxon_namespace) != num_declared_taxa:
+                        raise ValueError("Taxa were added to or removed from the taxon namespace after it was written, before tree {}: the taxon namespace must be complete before the first tree is written".format(tree_idx+1))
+                    self._write_tree_statement(stream, tree, tree_idx)
+                    tree_idx += 1
+            finally:
+                stream.write("END;\n\n")
+        self._write_supplemental_blocks(stream)
+
+    def _write_header(self, stream, global_annotations_target):
+        stream.write('#NEXUS\n\n')
+        if self.file_comments:
+            self._write_comments(stream, self.file_comments)
+        if global_annotations_target is not None:
+            self._write_item_annotations(stream, global_annotations_target)
+            self._write_item_comments(stream, global_annotations_target)
+        if self.preamble_blocks:
+            for block in self.preamble_blocks:
+                stream.write(block)
+                stream.write("\n")
+            stream.write("\n")
+
+    def _write_supplemental_blocks(self, stream):
         if self.supplemental_blocks:
             for block in self.supplemental_blocks:
                 stream.write(block)
@@ -348,19 +403,22 @@ class NexusWriter(ioservice.DataWriter):
         self._write_link_to_taxa_block(stream, tree_list.taxon_namespace)
         self._set_and_write_translate_block(stream, tree_list.taxon_namespace)
         for tree_idx, tree in enumerate(tree_list):
-            if tree.label:
-                tree_name = tree.label
-            else:
-                tree_name = str(tree_idx+1)
-            tree_name = nexusprocessing.escape_nexus_token(
-                    tree_name,
-                    preserve_spaces=self.preserve_spaces,
-                    quote_underscores=not self.unquoted_underscores)
-            stream.write("    TREE {} = ".format(tree_name))
-            self._newick_writer._write_tree(stream, tree)
-            stream.write("\n")
+            self._write_tree_statement(stream, tree, tree_idx)
         stream.write("END;\n\n")
 
+    def _write_tree_statement(self, stream, tree, tree_idx):
+        if tree.label:
+            tree_name = tree.label
+        else:
+            tree_name = str(tree_idx+1)
+        tree_name = nexusprocessing.escape_nexus_token(
+                tree_name,
+                preserve_spaces=self.preserve_spaces,
+                quote_underscores=not self.unquoted_underscores)
+        stream.write("    TREE {} = ".format(tree_name))
+        self._newick_writer._write_tree(stream, tree)
+        stream.write("\n")
+
     def _write_char_block(self, stream, char_matrix):
         taxon_label_map = collections.OrderedDict()
         for taxon in char_matrix:
@@ -33,6 +33,8 @@ class NexusTreeDataYielder(
         ioservice.TreeDataYielder,
         nexusreader.NexusReader):
 
+    is_resumable = True
+
     def __init__(self,
             files=None,
             taxon_namespace=None,
@@ -51,6 +53,23 @@ class NexusTreeDataYielder(
         taxon_namespace : |TaxonNamespace| instance
             The operational taxonomic unit concept namespace to use to manage
             taxon definitions.
+        resume_offsets : iterable of positions
+            If given, then, for each source in ``files``, the position
+            (typically, a value of ``current_file_resume_offset`` from a
+            previous yielder) from which to resume reading the source, or
+            |None| to read it from the beginning.
+        follow : bool
+            If |True|, then the sources (which must be file paths) are
+            followed as they are written to, e.g. by a running MCMC analysis:
+            whatever has been added to each source is read in turn, waiting
+            for more data if none is available, until the data in all sources
+            is complete or has not grown for ``follow_timeout`` seconds.
+        follow_poll_interval : float
+            Number of seconds to wait before checking sources being followed
+            for new data.
+        follow_timeout : float
+            If not |None|, stop following a source if it has not grown in
+            this many seconds.
         \*\*kwargs : keyword arguments
             These will be passed directly to the base `nexusreader.NexusReader`
             class. See `nexusreader.NexusReader` for details.
@@ -58,7 +77,8 @@ class NexusTreeDataYielder(
         ioservice.TreeDataYielder.__init__(self,
                 files=files,
                 taxon_namespace=taxon_namespace,
-                tree_type=tree_type)
+                tree_type=tree_type,
+                **self.extract_yielder_kwargs(kwargs))
         self.assume_newick_if_not_nexus = kwargs.pop("assume_newick_if_not_nexus", False)
         kwargs["attached_taxon_namespace"] = self.attached_taxon_namespace
         nexusreader.NexusReader.__init__(self, **kwargs)
@@ -74,20 +94,28 @@ class NexusTreeDataYielder(
                 preserve_unquoted_underscores=self.preserve_underscores)
         else:
             self._nexus_tokenizer.set_stream(stream)
+        self._current_file_tokenizer = self._nexus_tokenizer
         token = self._nexus_tokenizer.next_token()
         if token.upper() != "#NEXUS":
             if self.assume_newick_if_not_nexus:
+                if self._current_file_start_offset is not None:
+                    self._resume_from_start_offset()
+                    self._nexus_tokenizer.next_token()
                 taxon_symbol_mapper = self._get_taxon_symbol_mapper(
                         taxon_namespace=self.attached_taxon_namespace,
                         enable_lookup_by_taxon_number=False,
                         )
-                while True:
-                    tree = self._build_tree_from_newick_tree_string(
-                            tree_factory=self.tree_factory,
-                            taxon_symbol_mapper=taxon_symbol_mapper)
-                    if tree is None:
-                        break
-                    yield tree
+                try:
+                    while True:
+                        tree = self._build_tree_from_newick_tree_string(
+                                tree_factory=self.tree_factory,
+                                taxon_symbol_mapper=taxon_symbol_mapper)
+                        if tree is None:
+                            break
+                        self._set_current_file_resume_char_offset(self._nexus_tokenizer)
+                        yield tree
+                finally:
+                    taxon_symbol_mapper.restore_taxon_namespace_mutability()
             else:
                 raise self._nexus_error("Expecting '#NEXUS', but found '{}'".format(token),
                         nexusreader.NexusReader.NotNexusFileError)
@@ -151,6 +179,16 @@ class NexusTreeDataYielder(
                     taxon_namespace = self._get_taxon_namespace(link_title)
                 if taxon_symbol_mapper is None:
                     taxon_symbol_mapper = self._get_taxon_symbol_mapper(taxon_namespace=taxon_namespace)
+                if self._current_file_start_offset is not None:
+                    # Taxa and translations have been processed: skip
+                    # directly to the statement at which to resume.
+                    self._resume_from_start_offset()
+                    token = self._nexus_tokenizer.next_token()
+                    if token is None:
+                        break
+                    token = self._nexus_tokenizer.cast_current_token_to_ucase()
+                    if token != "TREE":
+                        continue
                 pre_tree_comments = self._nexus_tokenizer.pull_captured_comments()
                 tree_factory = self.tree_factory
                 while True:
@@ -163,6 +201,7 @@ class NexusTreeDataYielder(
                     tree = self._parse_tree_statement(
                             tree_factory=tree_factory,
                             taxon_symbol_mapper=taxon_symbol_mapper)
+                    self._set_current_file_resume_char_offset(self._nexus_tokenizer)
                     yield tree
                     if self._nexus_tokenizer.is_eof() or not self._nexus_tokenizer.current_token:
                         break
@@ -172,9 +211,24 @@ class NexusTreeDataYielder(
             elif token == 'BEGIN':
                 raise self._nexus_error("'BEGIN' found without completion of previous block",
                         nexusreader.NexusReader.IncompleteBlockError)
+        if token == 'END' or token == 'ENDBLOCK':
+            self._is_current_file_complete = True
         self._nexus_tokenizer.skip_to_semicolon() # move past END command
         return
 
+    def _resume_from_start_offset(self):
+        """
+        Repositions the current stream and tokenizer to resume reading from
+        the start offset given for the current file. The start offset is
+        consumed, so that any subsequent blocks are read in full.
+        """
+        start_offset = self._current_file_start_offset
+        self._current_file_start_offset = None
+        stream = self._nexus_tokenizer.src
+        stream.seek(start_offset)
+        self._nexus_tokenizer.set_stream(stream)
+        self._set_current_file_char_anchor(start_offset)
+
 class NexusNewickTreeDataYielder(NexusTreeDataYielder):
 
     def __init__(self,
@@ -188,3 +242,145 @@ class NexusNewickTreeDataYielder(NexusTreeDataYielder):
                 taxon_namespace=taxon_namespace,
                 tree_type=tree_type,
                 **kwargs)
+
+class NexusCharacterDataYielder(
+        ioservice.CharacterDataYielder,
+        nexusreader.NexusReader):
+
+    def __init__(self,
+            files=None,
+            taxon_namespace=None,
+            char_matrix_type=None,
+            **kwargs):
+        """
+
+        The rows of non-interleaved MATRIX commands are yielded as they are
+        read. Interleaved rows cannot be read one at a time, and so each
+        interleaved MATRIX command is read in full before its sequences are
+        yielded. As the taxon namespace is shared across all sources, the
+        number of taxa declared by a source ('NTAX') is not enforced unless
+        'unconstrained_taxa_accumulation_mode' is explicitly given as |False|.
+
+        Parameters
+        ----------
+        files : iterable of sources
+            Iterable of sources, which can either be strings specifying file
+            paths or file-like objects open for reading. If a source element is
+            a string (``isinstance(i,str) == True``), then it is assumed to be
+            a path to a file. Otherwise, the source is assumed to be a file-like
+            object.
+        taxon_namespace : |TaxonNamespace| instance
+            The operational taxonomic unit concept namespace to use to manage
+            taxon definitions.
+        char_matrix_type : |CharacterMatrix| subclass
+            The type of character matrix of the data, which determines the
+            type of the sequences yielded.
+        \*\*kwargs : keyword arguments
+            These will be passed directly to the base `nexusreader.NexusReader`
+            class. See `nexusreader.NexusReader` for details.
+        """
+        ioservice.CharacterDataYielder.__init__(self,
+                files=files,
+                taxon_namespace=taxon_namespace,
+                char_matrix_type=char_matrix_type,
+                **self.extract_yielder_kwargs(kwargs))
+        kwargs["attached_taxon_namespace"] = self.attached_taxon_namespace
+        kwargs.setdefault("unconstrained_taxa_accumulation_mode", True)
+        nexusreader.NexusReader.__init__(self, **kwargs)
+        self.exclude_chars = False
+        self.exclude_trees = True
+        self._char_matrix_factory = self.char_matrix_factory
+        self._state_alphabet_factory = self.state_alphabet_factory
+
+    ###########################################################################
+    ## Implementation of DataYielder interface
+
+    def _yield_items_from_stream(self, stream):
+        if self._nexus_tokenizer is None:
+            self.create_tokenizer(stream,
+                preserve_unquoted_underscores=self.preserve_underscores)
+        else:
+            self._nexus_tokenizer.set_stream(stream)
+        self._current_file_tokenizer = self._nexus_tokenizer
+        token = self._nexus_tokenizer.next_token()
+        if token.upper() != "#NEXUS":
+            raise self._nexus_error("Expecting '#NEXUS', but found '{}'".format(token),
+                    nexusreader.NexusReader.NotNexusFileError)
+        while not self._nexus_tokenizer.is_eof():
+            token = self._nexus_tokenizer.next_token_ucase()
+            while token != None and token != 'BEGIN' and not self._nexus_tokenizer.is_eof():
+                token = self._nexus_tokenizer.next_token_ucase()
+            self._nexus_tokenizer.process_and_clear_comments_for_item(
+                    self._global_annotations_target,
+                    self.extract_comment_metadata)
+            token = self._nexus_tokenizer.next_token_ucase()
+            if token == 'TAXA':
+                self._parse_taxa_block()
+            elif token == 'CHARACTERS' or token == 'DATA':
+                for item in self._yield_from_characters_data_block():
+                    yield item
+            elif token == 'BEGIN':
+                raise self._nexus_error("'BEGIN' found without completion of previous block",
+                        nexusreader.NexusReader.IncompleteBlockError)
+            else:
+                # unknown block
+                token = self._consume_to_end_of_block(token)
+
+    ###########################################################################
+    ## Supporting Functions
+
+    def _yield_from_characters_data_block(self):
+        """
+        Expectations:
+            - current token: "CHARACTERS" or "DATA" [part of "BEGIN CHARACTERS"
+              or "BEGIN DATA"]
+        """
+        token = self._nexus_tokenizer.cast_current_token_to_ucase()
+        self._nexus_tokenizer.skip_to_semicolon() # move past BEGIN command
+        block_title = None
+        link_title = None
+        self._data_type = "standard" # set as default
+        while (token != 'END'
+                and token != 'ENDBLOCK'
+                and not self._nexus_tokenizer.is_eof()
+                and not token==None):
+            token = self._nexus_tokenizer.next_token_ucase()
+            if token == 'TITLE':
+                block_title = self._parse_title_statement()
+            elif token == "LINK":
+                link_title = self._parse_link_statement().get('taxa')
+            elif token == 'DIMENSIONS':
+                self._parse_dimensions_statement()
+            elif token == 'FORMAT':
+                self._parse_format_statement()
+            elif token == 'MATRIX':
+                for item in self._yield_from_matrix_statement(
+                        block_title=block_title,
+                        link_title=link_title):
+                    yield item
+            elif token == 'BEGIN':
+                raise self._nexus_error("'BEGIN' found without completion of previous block",
+                        nexusreader.NexusReader.IncompleteBlockError)
+        self._nexus_tokenizer.skip_to_semicolon() # move past END command
+
+    def _yield_from_matrix_statement(self, block_title=None, link_title=None):
+        char_block = self._new_matrix_char_block(
+                block_title=block_title,
+                link_title=link_title)
+        if self._interleave:
+            if self._data_type == "continuous":
+                self._process_continuous_matrix_data(char_block)
+            else:
+                self._process_discrete_matrix_data(char_block)
+            sequences = list(char_block.items())
+            char_block.clear()
+            for taxon, sequence in sequences:
+                yield taxon, sequence
+        else:
+            if self._data_type == "standard":
+                self._build_state_alphabet(char_block, self._symbols)
+            sequence_factory = char_block.character_sequence_type
+            for taxon, sequence in self._yield_sequential_matrix_rows(
+                    char_block=char_block,
+                    sequence_for_taxon=lambda taxon: sequence_factory()):
+                yield taxon, sequence
@@ -154,6 +154,27 @@ class PhylipReader(ioservice.DataReader):
         self.reset()
         self.stream = stream
         self.taxon_namespace = taxon_namespace_factory(label=None)
+        self._new_char_matrix(
+                char_matrix_factory=char_matrix_factory,
+                state_alphabet_factory=state_alphabet_factory)
+        lines = filesys.get_lines(stream)
+        if len(lines) == 0:
+            raise error.DataSourceError("No data in source", stream=self.stream)
+        elif len(lines) <= 2:
+            raise error.DataParseError("Expecting at least 2 lines in PHYLIP format data source", stream=self.stream)
+        self._parse_description_line(lines[0])
+        lines = lines[1:]
+        if self.interleaved:
+            self._parse_interleaved(lines)
+        else:
+            self._parse_sequential(lines)
+        product = self.Product(
+                taxon_namespaces=None,
+                tree_lists=None,
+                char_matrices=[self.char_matrix])
+        return product
+
+    def _new_char_matrix(self, char_matrix_factory, state_alphabet_factory):
         if self.data_type is None:
             raise TypeError("Data type must be specified for this schema")
         if self.data_type == "standard" and self.default_state_alphabet is not None:
@@ -175,13 +196,9 @@ class PhylipReader(ioservice.DataReader):
                     gap_symbol="-",
                     case_sensitive=False)
                 self.char_matrix.state_alphabets.append(state_alphabet)
-        lines = filesys.get_lines(stream)
-        if len(lines) == 0:
-            raise error.DataSourceError("No data in source", stream=self.stream)
-        elif len(lines) <= 2:
-            raise error.DataParseError("Expecting at least 2 lines in PHYLIP format data source", stream=self.stream)
-        desc_line = lines[0]
-        lines = lines[1:]
+        return self.char_matrix
+
+    def _parse_description_line(self, desc_line):
         m = re.match('\s*(\d+)\s+(\d+)\s*$', desc_line)
         if m is None:
             raise self._data_parse_error("Invalid data description line: '%s'" % desc_line)
@@ -189,15 +206,6 @@ class PhylipReader(ioservice.DataReader):
         self.nchar = int(m.groups()[1])
         if self.ntax == 0 or self.nchar == 0:
             raise error.DataSourceError("No data in source", stream=self.stream)
-        if self.interleaved:
-            self._parse_interleaved(lines)
-        else:
-            self._parse_sequential(lines)
-        product = self.Product(
-                taxon_namespaces=None,
-                tree_lists=None,
-                char_matrices=[self.char_matrix])
-        return product
 
     def _parse_taxon_from_line(self, line, line_index):
         if self.strict:
@@ -219,15 +227,13 @@ class PhylipReader(ioservice.DataReader):
         if self.underscores_to_spaces:
             seq_label = seq_label.replace('_', ' ')
         current_taxon = self.char_matrix.taxon_namespace.require_taxon(label=seq_label)
-        if current_taxon not in self.char_matrix:
-            self.char_matrix[current_taxon] = self.char_matrix.new_sequence(taxon=current_taxon)
-        else:
-            if len(self.char_matrix[current_taxon]) >= self.nchar:
-                raise self._data_parse_error("Cannot add characters to sequence for taxon '%s': already has declared number of characters (%d)" \
-                        % (current_taxon.label, self.char_matrix[current_taxon]), line_index=line_index)
         return current_taxon, line
 
-    def _parse_sequence_from_line(self, current_taxon, line, line_index):
+    def _too_many_characters_error(self, current_taxon, line_index):
+        return self._data_parse_error("Cannot add characters to sequence for taxon '%s': already has declared number of characters (%d)" \
+                % (current_taxon.label, self.nchar), line_index=line_index)
+
+    def _parse_sequence_from_line(self, current_taxon, current_sequence, line, line_index):
         if self.data_type == "continuous":
             for c in line.split():
                 if not c:
@@ -239,36 +245,63 @@ class PhylipReader(ioservice.DataReader):
                         raise self._data_parse_error("Invalid state for taxon '%s': '%s'" % (current_taxon.label, c),
                                 line_index=line_index)
                 else:
-                    self.char_matrix[current_taxon].append(state)
+                    current_sequence.append(state)
         else:
+            state_alphabet = self.char_matrix.default_state_alphabet
+            # fast path: translate the whole line at once
+            state_codes = state_alphabet.translate_symbols(line,
+                    ignored_symbols=" \t",
+                    ignore_unrecognized_symbols=self.ignore_invalid_chars)
+            if state_codes is not None:
+                current_sequence.extend_state_codes(state_codes, state_alphabet.states)
+                return
             for c in line:
                 if c in [' ', '\t']:
                     continue
                 try:
-                    state = self.char_matrix.default_state_alphabet[c]
+                    state = state_alphabet[c]
                 except KeyError:
                     if not self.ignore_invalid_chars:
                         raise self._data_parse_error("Invalid state symbol for taxon '%s': '%s'" % (current_taxon.label, c),
                                 line_index=line_index)
                 else:
-                    self.char_matrix[current_taxon].append(state)
+                    current_sequence.append(state)
 
     def _parse_sequential(self, lines, line_num_start=1):
-        seq_labels = []
+        for taxon, sequence in self._yield_sequential_sequences(
+                lines=lines,
+                sequence_factory=self.char_matrix.character_sequence_type):
+            self.char_matrix[taxon] = sequence
+
+    def _yield_sequential_sequences(self, lines, sequence_factory):
+        """
+        Yields ``(taxon, sequence)`` for each sequence in ``lines`` (of
+        sequential data) as soon as it has been read, with ``sequence``
+        created by calling ``sequence_factory()`` (and not added to
+        ``self.char_matrix``).
+        """
+        seen_taxa = set()
         current_taxon = None
+        current_sequence = None
         for line_index, line in enumerate(lines):
             line = line.rstrip()
             if line == '':
                 continue
             if current_taxon is None:
-                seq_label = None
                 current_taxon, line = self._parse_taxon_from_line(line, line_index)
                 # if current_taxon not in self.char_matrix and len(self.char_matrix.taxon_namespace) >= self.ntax:
                 #     raise self._data_parse_error("Cannot add new sequence %s: declared number of sequences (%d) already defined" \
                 #                 % (current_taxon, len(self.char_matrix.taxon_namespace)), line_index=line_index)
-            self._parse_sequence_from_line(current_taxon, line, line_index)
-            if len(self.char_matrix[current_taxon]) >= self.nchar:
+                if current_taxon in seen_taxa:
+                    raise self._too_many_characters_error(current_taxon, line_index)
+                seen_taxa.add(current_taxon)
+                current_sequence = sequence_factory()
+            self._parse_sequence_from_line(current_taxon, current_sequence, line, line_index)
+            if len(current_sequence) >= self.nchar:
+                yield current_taxon, current_sequence
                 current_taxon = None
+        if current_taxon is not None:
+            yield current_taxon, current_sequence
 
     def _parse_interleaved(self, lines, line_num_start=1):
         seq_labels = []
@@ -287,10 +320,14 @@ class PhylipReader(ioservice.DataReader):
                 current_taxon = self.char_matrix.taxon_namespace[paged_row]
             else:
                 current_taxon, line = self._parse_taxon_from_line(line, line_index)
+                if current_taxon not in self.char_matrix:
+                    self.char_matrix.new_sequence(taxon=current_taxon)
+                elif len(self.char_matrix[current_taxon]) >= self.nchar:
+                    raise self._too_many_characters_error(current_taxon, line_index)
                 if len(self.char_matrix.taxon_namespace) == self.ntax:
                     paged = True
                     paged_row = -1
-            self._parse_sequence_from_line(current_taxon, line, line_index)
+            self._parse_sequence_from_line(current_taxon, self.char_matrix[current_taxon], line, line_index)
 
     def _data_parse_error(self, message, line_index=None):
         if line_index is None:
@@ -0,0 +1,96 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+
+"""
+Implementation of PHYLIP-schema sequence iterator.
+"""
+
+from dendropy.dataio import ioservice
+from dendropy.dataio import phylipreader
+from dendropy.utility import error
+
+class PhylipCharacterDataYielder(
+        ioservice.CharacterDataYielder,
+        phylipreader.PhylipReader):
+
+    def __init__(self,
+            files=None,
+            taxon_namespace=None,
+            char_matrix_type=None,
+            **kwargs):
+        """
+
+        Sequences of sequential data are yielded as they are read. Interleaved
+        data cannot be read one sequence at a time, and so each source of
+        interleaved data is read in full before its sequences are yielded.
+
+        Parameters
+        ----------
+        files : iterable of sources
+            Iterable of sources, which can either be strings specifying file
+            paths or file-like objects open for reading. If a source element is
+            a string (``isinstance(i,str) == True``), then it is assumed to be
+            a path to a file. Otherwise, the source is assumed to be a file-like
+            object.
+        taxon_namespace : |TaxonNamespace| instance
+            The operational taxonomic unit concept namespace to use to manage
+            taxon definitions.
+        char_matrix_type : |CharacterMatrix| subclass
+            The type of character matrix of the data, which determines the
+            type of the sequences yielded.
+        \*\*kwargs : keyword arguments
+            These will be passed directly to the base `phylipreader.PhylipReader`
+            class. See `phylipreader.PhylipReader` for details.
+        """
+        yielder_kwargs = self.extract_yielder_kwargs(kwargs)
+        phylipreader.PhylipReader.__init__(self, **kwargs)
+        ioservice.CharacterDataYielder.__init__(self,
+                files=files,
+                taxon_namespace=taxon_namespace,
+                char_matrix_type=char_matrix_type,
+                **yielder_kwargs)
+
+    ###########################################################################
+    ## Implementation of DataYielder interface
+
+    def _yield_items_from_stream(self, stream):
+        phylipreader.PhylipReader.reset(self)
+        self.stream = stream
+        self.taxon_namespace = self.attached_taxon_namespace
+        self._new_char_matrix(
+                char_matrix_factory=self.char_matrix_factory,
+                state_alphabet_factory=self.state_alphabet_factory)
+        lines = iter(stream)
+        for desc_line in lines:
+            break
+        else:
+            raise error.DataSourceError("No data in source", stream=self.stream)
+        self._parse_description_line(desc_line)
+        if self.interleaved:
+            self._parse_interleaved(lines)
+            sequences = list(self.char_matrix.items())
+            self.char_matrix.clear()
+            for taxon, sequence in sequences:
+                yield taxon, sequence
+        else:
+            for taxon, sequence in self._yield_sequential_sequences(
+                    lines=lines,
+                    sequence_factory=self.char_matrix.character_sequence_type):
+                yield taxon, sequence
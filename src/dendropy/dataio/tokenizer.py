@@ -102,6 +102,9 @@ class Tokenizer(object):
         self.current_column_num = 0
         self.token_line_num = 0
         self.token_column_num = 0
+        self.token_char_offset = 0
+        self._token_search_char_offset = 0
+        self._line_start_char_offset = 0
 
     def reset(self):
         self.set_stream(src=None)
@@ -116,6 +119,9 @@ class Tokenizer(object):
         self.current_column_num = 0
         self.token_line_num = 0
         self.token_column_num = 0
+        self.token_char_offset = 0
+        self._token_search_char_offset = 0
+        self._line_start_char_offset = 0
 
     def is_eof(self):
         return self._cur_char == ""
@@ -176,18 +182,27 @@ class Tokenizer(object):
         self.is_token_quoted = False
         if self._cur_char is None:
             self._get_next_char()
+        # Offset just past the end of the previous token: if the stream is
+        # exhausted before another token is found, ``token_char_offset`` is
+        # set to this.
+        self._token_search_char_offset = self._line_start_char_offset + self.current_column_num
+        if self._cur_char != "":
+            self._token_search_char_offset -= 1
         self._skip_to_significant_char()
         if self._cur_char == "":
+            self.token_char_offset = self._token_search_char_offset
             raise StopIteration
         if self._cur_char in self.captured_delimiters:
             self.current_token = self._cur_char
             self.token_line_num = self.current_line_num
             self.token_column_num = self.current_column_num
+            self.token_char_offset = self._line_start_char_offset + self.current_column_num - 1
             self._get_next_char()
             return self.current_token
         elif self._cur_char in self.quote_chars:
             self.token_line_num = self.current_line_num
             self.token_column_num = self.current_column_num
+            self.token_char_offset = self._line_start_char_offset + self.current_column_num - 1
             dest = []
             self.is_token_quoted = True
             cur_quote_char = self._cur_char
@@ -222,6 +237,7 @@ class Tokenizer(object):
             # unquoted
             self.token_line_num = self.current_line_num
             self.token_column_num = self.current_column_num
+            self.token_char_offset = self._line_start_char_offset + self.current_column_num - 1
             dest = []
             self.is_token_quoted = False
             while self._cur_char != "":
@@ -243,8 +259,17 @@ class Tokenizer(object):
             self.current_token = "".join(dest)
             if self.current_token == "":
                 if self._cur_char != "":
-                    self.__next__()
+                    # token offset includes any leading comments
+                    token_char_offset = self.token_char_offset
+                    token_search_char_offset = self._token_search_char_offset
+                    try:
+                        self.__next__()
+                    except StopIteration:
+                        self.token_char_offset = token_search_char_offset
+                        raise
+                    self.token_char_offset = token_char_offset
                 else:
+                    self.token_char_offset = self._token_search_char_offset
                     raise StopIteration
             return self.current_token
     next = __next__ # Python 2 legacy support
@@ -264,6 +289,7 @@ class Tokenizer(object):
         self._cur_char = self.src.read(1)
         if self._cur_char != "":
             if self._cur_char == "\n":
+                self._line_start_char_offset += self.current_column_num
                 self.current_line_num += 1
                 self.current_column_num = 1
             else:
@@ -25,11 +25,15 @@ import warnings
 import copy
 import math
 import collections
+import array
+import bisect
+import random
 from dendropy.utility.textprocessing import StringIO
 from dendropy.utility import textprocessing
 from dendropy.utility import error
 from dendropy.utility import deprecate
 from dendropy.utility import container
+from dendropy.utility import GLOBAL_RNG
 from dendropy.datamodel import charstatemodel
 from dendropy.datamodel.charstatemodel import DNA_STATE_ALPHABET
 from dendropy.datamodel.charstatemodel import RNA_STATE_ALPHABET
@@ -239,6 +243,21 @@ class CharacterDataSequence(
             assert len(character_annotations) == len(character_values)
             self._character_annotations.extend(character_annotations)
 
+    def extend_state_codes(self, state_codes, states):
+        """
+        Extends ``self`` with values given by their indexes in ``states``.
+
+        Parameters
+        ----------
+        state_codes : bytes
+            Byte string in which each byte is the index of a value in
+            ``states``, as, e.g., returned by
+            :meth:`StateAlphabet.translate_symbols()`.
+        states : sequence of objects
+            Values indexed by ``state_codes``.
+        """
+        self.extend([states[code] for code in bytearray(state_codes)])
+
     def __len__(self):
         return len(self._character_values)
 
@@ -294,25 +313,724 @@ class CharacterDataSequence(
         self._character_types[idx] = character_type
         self._character_annotations[idx] = character_annotations
 
-    def insert(self, idx, character_value, character_type=None, character_annotations=None):
-        """
-        Insert value and associated character type and metadata annotations for
-        element at ``idx``.
+    def insert(self, idx, character_value, character_type=None, character_annotations=None):
+        """
+        Insert value and associated character type and metadata annotations for
+        element at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element to set.
+        character_value : object
+            Value to be stored.
+        character_type : |CharacterType|
+            Description of character value.
+        character_annotations : |AnnotationSet|
+            Metadata annotations associated with this character.
+        """
+        self._character_values.insert(idx, character_value)
+        self._character_types.insert(idx, character_type)
+        self._character_annotations.insert(idx, character_annotations)
+
+    def value_at(self, idx):
+        """
+        Return value of character at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element value to return.
+
+        Returns
+        -------
+        c : object
+            Value of character at index ``idx``.
+        """
+        return self._character_values[idx]
+
+    def character_type_at(self, idx):
+        """
+        Return type of character at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element character type to return.
+
+        Returns
+        -------
+        c : |CharacterType|
+            |CharacterType| associated with character index ``idx``.
+        """
+        return self._character_types[idx]
+
+    def annotations_at(self, idx):
+        """
+        Return metadata annotations of character at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element annotations to return.
+
+        Returns
+        -------
+        c : |AnnotationSet|
+            |AnnotationSet| representing metadata annotations of character at index ``idx``.
+        """
+        if self._character_annotations[idx] is None:
+            self._character_annotations[idx] = basemodel.AnnotationSet(self._character_types[idx])
+        return self._character_annotations[idx]
+
+    def has_annotations_at(self, idx):
+        """
+        Return |True| if character at ``idx`` has metadata annotations.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element annotations to check.
+
+        Returns
+        -------
+        b : bool
+            |True| if character at ``idx`` has metadata annotations, |False|
+            otherwise.
+        """
+        return not self._character_annotations[idx] is None
+
+    def set_character_type_at(self, idx, character_type):
+        """
+        Set type of character at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element character type to set.
+        """
+        self._character_types[idx] = character_type
+
+    def set_annotations_at(self, idx, annotations):
+        """
+        Set metadata annotations of character at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element annotations to set.
+        """
+        self._character_annotations[idx] = annotations
+
+###############################################################################
+## PackedCharacterDataSequence
+
+class PackedCharacterDataSequence(CharacterDataSequence):
+    """
+    A `CharacterDataSequence` that stores its values compactly, for use with
+    discrete data, where the values are (typically) drawn from a small set of
+    |StateIdentity| objects shared by all the cells of a matrix.
+
+    Instead of a list holding a reference to a value for each cell, each
+    distinct value is stored once, in a per-sequence table of states, and each
+    cell holds the (unsigned) integer index of its value in this table, in a
+    contiguous ``array.array``. One byte per cell is used as long as there are
+    no more than 256 distinct values in the sequence, two bytes per cell if
+    there are no more than 65536, and four bytes per cell otherwise. Character
+    types and metadata annotations, which are rarely set on individual cells,
+    are held in dictionaries keyed by the index of the cell, so that no
+    storage is used for cells that do not have them.
+
+    The interface is that of `CharacterDataSequence`, with the exception that
+    :meth:`PackedCharacterDataSequence.values()` returns a new list of the
+    values instead of the underlying storage.
+    """
+
+    _max_state_codes = {"B": 0xFF, "H": 0xFFFF}
+
+    def __init__(self,
+            character_values=None,
+            character_types=None,
+            character_annotations=None):
+        """
+        Parameters
+        ----------
+        character_values : iterable of values
+            A set of values for this sequence.
+        """
+        self._state_codes = array.array("B")
+        self._states = []
+        self._state_identity_map = {}
+        self._state_value_map = {}
+        self._sparse_character_types = {}
+        self._sparse_character_annotations = {}
+        self._state_code_translation = (None, None)
+        if character_values:
+            self.extend(
+                    character_values=character_values,
+                    character_types=character_types,
+                    character_annotations=character_annotations)
+
+    def __deepcopy__(self, memo=None):
+        other = basemodel.Annotable.__deepcopy__(self, memo=memo)
+        other._rebuild_state_identity_map()
+        return other
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._rebuild_state_identity_map()
+
+    def _rebuild_state_identity_map(self):
+        # keyed by ``id()``, and so only valid for the objects in
+        # ``self._states``, not for copies of them
+        self._state_identity_map = {}
+        for code, state in enumerate(self._states):
+            self._state_identity_map[id(state)] = code
+
+    def _get_state_code(self, value):
+        code = self._state_identity_map.get(id(value))
+        if code is not None:
+            return code
+        try:
+            code = self._state_value_map[value]
+        except (KeyError, TypeError):
+            return self._add_state(value)
+        if self._states[code].__class__ is not value.__class__:
+            # e.g., ``1`` and ``True``, which are equal but not
+            # interchangeable
+            return self._add_state(value)
+        return code
+
+    def _add_state(self, value):
+        code = len(self._states)
+        self._states.append(value)
+        self._state_identity_map[id(value)] = code
+        try:
+            self._state_value_map.setdefault(value, code)
+        except TypeError:
+            # unhashable value: only found by identity
+            pass
+        max_state_code = self._max_state_codes.get(self._state_codes.typecode)
+        if max_state_code is not None and code > max_state_code:
+            if self._state_codes.typecode == "B":
+                typecode = "H"
+            else:
+                typecode = "L"
+            self._state_codes = array.array(typecode, self._state_codes)
+        return code
+
+    def _normalize_index(self, idx):
+        n = len(self._state_codes)
+        if idx < 0:
+            idx += n
+        if idx < 0 or idx >= n:
+            raise IndexError("sequence index out of range")
+        return idx
+
+    def _reindex_sparse_data(self, index_map_fn):
+        for d in (self._sparse_character_types, self._sparse_character_annotations):
+            if not d:
+                continue
+            reindexed = {}
+            for idx in d:
+                new_idx = index_map_fn(idx)
+                if new_idx is not None:
+                    reindexed[new_idx] = d[idx]
+            d.clear()
+            d.update(reindexed)
+
+    def _set_sparse_data(self, d, idx, value):
+        if value is None:
+            d.pop(idx, None)
+        else:
+            d[idx] = value
+
+    def values(self):
+        """
+        Returns list of values of this vector.
+
+        Returns
+        -------
+        v : list
+            List of values making up this vector. Note that, unlike with
+            `CharacterDataSequence`, this is a new list, and so changes to it
+            are not reflected in this vector.
+        """
+        states = self._states
+        return [states[code] for code in self._state_codes]
+
+    def symbols_as_list(self):
+        """
+        Returns list of string representation of values of this vector.
+
+        Returns
+        -------
+        v : list
+            List of string representation of values making up this vector.
+        """
+        symbols = [str(state) for state in self._states]
+        return [symbols[code] for code in self._state_codes]
+
+    def symbols_as_string(self, sep=""):
+        """
+        Returns values of this vector as a single string, with individual value
+        elements separated by ``sep``.
+
+        Returns
+        -------
+        s : string
+            String representation of values making up this vector.
+        """
+        return sep.join(self.symbols_as_list())
+
+    def append(self, character_value, character_type=None, character_annotations=None):
+        """
+        Adds a value to ``self``.
+
+        Parameters
+        ----------
+        character_value : object
+            Value to be stored.
+        character_type : |CharacterType|
+            Description of character value.
+        character_annotations : |AnnotationSet|
+            Metadata annotations associated with this character.
+        """
+        idx = len(self._state_codes)
+        self._state_codes.append(self._get_state_code(character_value))
+        if character_type is not None:
+            self._sparse_character_types[idx] = character_type
+        if character_annotations is not None:
+            self._sparse_character_annotations[idx] = character_annotations
+
+    def extend(self, character_values, character_types=None, character_annotations=None):
+        """
+        Extends ``self`` with values.
+
+        Parameters
+        ----------
+        character_values : iterable of objects
+            Values to be stored.
+        character_types : iterable of |CharacterType| objects
+            Descriptions of character values.
+        character_annotations : iterable |AnnotationSet| objects
+            Metadata annotations associated with characters.
+        """
+        start = len(self._state_codes)
+        if not isinstance(character_values, (list, tuple)):
+            character_values = list(character_values)
+        value_ids = list(map(id, character_values))
+        codes = list(map(self._state_identity_map.get, value_ids))
+        if None in codes:
+            # code each distinct object not yet seen only once
+            values_by_id = dict(zip(value_ids, character_values))
+            value_id_codes = {}
+            for value_id in set(value_ids).difference(self._state_identity_map):
+                value_id_codes[value_id] = self._get_state_code(values_by_id[value_id])
+            value_id_codes.update(self._state_identity_map)
+            codes = list(map(value_id_codes.get, value_ids))
+        # the storage may have been widened while coding the values
+        self._state_codes.extend(codes)
+        if character_types is not None:
+            assert len(character_types) == len(codes)
+            for idx, character_type in enumerate(character_types):
+                if character_type is not None:
+                    self._sparse_character_types[start + idx] = character_type
+        if character_annotations is not None:
+            assert len(character_annotations) == len(codes)
+            for idx, annotations in enumerate(character_annotations):
+                if annotations is not None:
+                    self._sparse_character_annotations[start + idx] = annotations
+
+    def extend_state_codes(self, state_codes, states):
+        """
+        Extends ``self`` with values given by their indexes in ``states``.
+
+        If the values of ``self`` are coded in the same way as in ``states``
+        (as is the case if ``self`` was populated using only this method with
+        the same ``states``), ``state_codes`` is copied directly into the
+        storage of ``self``, without dereferencing any values.
+
+        Parameters
+        ----------
+        state_codes : bytes
+            Byte string in which each byte is the index of a value in
+            ``states``, as, e.g., returned by
+            :meth:`StateAlphabet.translate_symbols()`.
+        states : sequence of objects
+            Values indexed by ``state_codes``.
+        """
+        source_states, code_map = self._state_code_translation
+        if source_states is not states:
+            code_map = [self._get_state_code(state) for state in states]
+            if code_map == list(range(len(code_map))):
+                code_map = None
+            self._state_code_translation = (states, code_map)
+        if code_map is not None:
+            state_codes = [code_map[code] for code in bytearray(state_codes)]
+        elif self._state_codes.typecode != "B":
+            state_codes = bytearray(state_codes)
+        self._state_codes.extend(array.array(self._state_codes.typecode, state_codes))
+
+    def __len__(self):
+        return len(self._state_codes)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            states = self._states
+            return [states[code] for code in self._state_codes[idx]]
+        return self._states[self._state_codes[idx]]
+
+    def __setitem__(self, idx, value):
+        if isinstance(idx, slice):
+            values = self.values()
+            values[idx] = value
+            self._state_codes = array.array(self._state_codes.typecode)
+            self._state_codes.extend([self._get_state_code(v) for v in values])
+        else:
+            self._state_codes[idx] = self._get_state_code(value)
+
+    def __next__(self):
+        states = self._states
+        for code in self._state_codes:
+            yield states[code]
+
+    next = __next__ # Python 2 legacy support
+
+    def cell_iter(self):
+        """
+        Iterate over triplets of character values and associated
+        |CharacterType| and |AnnotationSet| instances.
+        """
+        states = self._states
+        character_types = self._sparse_character_types
+        character_annotations = self._sparse_character_annotations
+        for idx, code in enumerate(self._state_codes):
+            yield states[code], character_types.get(idx), character_annotations.get(idx)
+
+    def __delitem__(self, idx):
+        if isinstance(idx, slice):
+            removed = set(range(len(self._state_codes))[idx])
+            del self._state_codes[idx]
+            if removed and (self._sparse_character_types or self._sparse_character_annotations):
+                removed_indexes = sorted(removed)
+                def _map_index(i):
+                    if i in removed:
+                        return None
+                    return i - bisect.bisect_left(removed_indexes, i)
+                self._reindex_sparse_data(_map_index)
+        else:
+            idx = self._normalize_index(idx)
+            del self._state_codes[idx]
+            self._reindex_sparse_data(lambda i: None if i == idx else (i - 1 if i > idx else i))
+
+    def set_at(self, idx, character_value, character_type=None, character_annotations=None):
+        """
+        Set value and associated character type and metadata annotations for
+        element at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element to set.
+        character_value : object
+            Value to be stored.
+        character_type : |CharacterType|
+            Description of character value.
+        character_annotations : |AnnotationSet|
+            Metadata annotations associated with this character.
+        """
+        to_add = (idx+1) - len(self._state_codes)
+        while to_add > 0:
+            self.append(None)
+            to_add -= 1
+        idx = self._normalize_index(idx)
+        self._state_codes[idx] = self._get_state_code(character_value)
+        self._set_sparse_data(self._sparse_character_types, idx, character_type)
+        self._set_sparse_data(self._sparse_character_annotations, idx, character_annotations)
+
+    def insert(self, idx, character_value, character_type=None, character_annotations=None):
+        """
+        Insert value and associated character type and metadata annotations for
+        element at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element to set.
+        character_value : object
+            Value to be stored.
+        character_type : |CharacterType|
+            Description of character value.
+        character_annotations : |AnnotationSet|
+            Metadata annotations associated with this character.
+        """
+        n = len(self._state_codes)
+        if idx < 0:
+            idx = max(0, idx + n)
+        elif idx > n:
+            idx = n
+        self._state_codes.insert(idx, self._get_state_code(character_value))
+        self._reindex_sparse_data(lambda i: i + 1 if i >= idx else i)
+        self._set_sparse_data(self._sparse_character_types, idx, character_type)
+        self._set_sparse_data(self._sparse_character_annotations, idx, character_annotations)
+
+    def value_at(self, idx):
+        """
+        Return value of character at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element value to return.
+
+        Returns
+        -------
+        c : object
+            Value of character at index ``idx``.
+        """
+        return self._states[self._state_codes[idx]]
+
+    def character_type_at(self, idx):
+        """
+        Return type of character at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element character type to return.
+
+        Returns
+        -------
+        c : |CharacterType|
+            |CharacterType| associated with character index ``idx``.
+        """
+        return self._sparse_character_types.get(self._normalize_index(idx))
+
+    def annotations_at(self, idx):
+        """
+        Return metadata annotations of character at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element annotations to return.
+
+        Returns
+        -------
+        c : |AnnotationSet|
+            |AnnotationSet| representing metadata annotations of character at index ``idx``.
+        """
+        idx = self._normalize_index(idx)
+        try:
+            return self._sparse_character_annotations[idx]
+        except KeyError:
+            annotations = basemodel.AnnotationSet(self._sparse_character_types.get(idx))
+            self._sparse_character_annotations[idx] = annotations
+            return annotations
+
+    def has_annotations_at(self, idx):
+        """
+        Return |True| if character at ``idx`` has metadata annotations.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element annotations to check.
+
+        Returns
+        -------
+        b : bool
+            |True| if character at ``idx`` has metadata annotations, |False|
+            otherwise.
+        """
+        return self._normalize_index(idx) in self._sparse_character_annotations
+
+    def set_character_type_at(self, idx, character_type):
+        """
+        Set type of character at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element character type to set.
+        """
+        self._set_sparse_data(self._sparse_character_types, self._normalize_index(idx), character_type)
+
+    def set_annotations_at(self, idx, annotations):
+        """
+        Set metadata annotations of character at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element annotations to set.
+        """
+        self._set_sparse_data(self._sparse_character_annotations, self._normalize_index(idx), annotations)
+
+###############################################################################
+## CharacterDataSequenceView
+
+class CharacterDataSequenceView(CharacterDataSequence):
+    """
+    A read-only view of some of the characters (columns) of a
+    `CharacterDataSequence`, given by a list (or range) of their indexes, as
+    found in the matrices returned by
+    :meth:`CharacterMatrix.character_indices_view()`.
+
+    Values, character types and metadata annotations are looked up in the
+    viewed sequence when accessed, and so are not copied: changes to the
+    viewed sequence are reflected in the view. Methods that would modify the
+    sequence raise `TypeError`. A (deep) copy of a view is a new sequence of
+    the same type as the viewed sequence, holding its own data.
+    """
+
+    def __init__(self, sequence, indices):
+        """
+        Parameters
+        ----------
+        sequence : `CharacterDataSequence`
+            The sequence to be viewed. If this is itself a view, then the new
+            view is of the sequence viewed by it.
+        indices : slice or sequence of ints
+            The 0-based indexes of the characters of ``sequence`` in the view,
+            in order. The list (or range) of indexes is stored by the view,
+            and so should not be changed afterwards.
+        """
+        if isinstance(sequence, CharacterDataSequenceView):
+            if isinstance(indices, slice):
+                indices = sequence._indices[indices]
+            else:
+                indices = [sequence._indices[idx] for idx in indices]
+            sequence = sequence._sequence
+        elif isinstance(indices, slice):
+            indices = range(len(sequence))[indices]
+        self._sequence = sequence
+        self._indices = indices
+
+    def __deepcopy__(self, memo=None):
+        if memo is None:
+            memo = {}
+        other = self._sequence.__class__()
+        memo[id(self)] = other
+        character_values = []
+        character_types = []
+        character_annotations = []
+        for value, character_type, annotations in self.cell_iter():
+            character_values.append(value)
+            character_types.append(character_type)
+            character_annotations.append(annotations)
+        other.extend(
+                character_values=copy.deepcopy(character_values, memo),
+                character_types=copy.deepcopy(character_types, memo),
+                character_annotations=copy.deepcopy(character_annotations, memo))
+        other.deep_copy_annotations_from(self._sequence, memo)
+        return other
+
+    def _raise_read_only(self, *args, **kwargs):
+        raise TypeError("'{}' object is read-only".format(self.__class__.__name__))
+
+    append = _raise_read_only
+    extend = _raise_read_only
+    extend_state_codes = _raise_read_only
+    __setitem__ = _raise_read_only
+    __delitem__ = _raise_read_only
+    set_at = _raise_read_only
+    insert = _raise_read_only
+    set_character_type_at = _raise_read_only
+    set_annotations_at = _raise_read_only
+
+    def _get_annotations(self):
+        return self._sequence.annotations
+    annotations = property(_get_annotations)
+
+    def _has_annotations(self):
+        return self._sequence.has_annotations
+    has_annotations = property(_has_annotations)
+
+    def _get_packed_state_codes(self):
+        """
+        Returns pair of the list of states of the viewed sequence, and list of
+        the indexes into it of the values of ``self``, if the viewed sequence
+        is a `PackedCharacterDataSequence`, or |None| otherwise.
+        """
+        if not isinstance(self._sequence, PackedCharacterDataSequence):
+            return None
+        state_codes = self._sequence._state_codes
+        return self._sequence._states, [state_codes[idx] for idx in self._indices]
+
+    def values(self):
+        """
+        Returns list of values of this vector.
+
+        Returns
+        -------
+        v : list
+            List of values making up this vector. This is a new list, and so
+            changes to it are not reflected in this vector.
+        """
+        packed_state_codes = self._get_packed_state_codes()
+        if packed_state_codes is not None:
+            states, state_codes = packed_state_codes
+            return [states[code] for code in state_codes]
+        values = self._sequence.values()
+        return [values[idx] for idx in self._indices]
+
+    def symbols_as_list(self):
+        """
+        Returns list of string representation of values of this vector.
+
+        Returns
+        -------
+        v : list
+            List of string representation of values making up this vector.
+        """
+        return [str(v) for v in self.values()]
+
+    def symbols_as_string(self, sep=None):
+        """
+        Returns values of this vector as a single string, with individual value
+        elements separated by ``sep`` (by default, as for the viewed
+        sequence).
+
+        Returns
+        -------
+        s : string
+            String representation of values making up this vector.
+        """
+        if sep is None:
+            if isinstance(self._sequence, ContinuousCharacterDataSequence):
+                sep = " "
+            else:
+                sep = ""
+        return sep.join(self.symbols_as_list())
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self._sequence.value_at(i) for i in self._indices[idx]]
+        return self._sequence.value_at(self._indices[idx])
 
-        Parameters
-        ----------
-        idx : integer
-            Index of element to set.
-        character_value : object
-            Value to be stored.
-        character_type : |CharacterType|
-            Description of character value.
-        character_annotations : |AnnotationSet|
-            Metadata annotations associated with this character.
+    def __next__(self):
+        for v in self.values():
+            yield v
+
+    next = __next__ # Python 2 legacy support
+
+    def cell_iter(self):
         """
-        self._character_values.insert(idx, character_value)
-        self._character_types.insert(idx, character_type)
-        self._character_annotations.insert(idx, character_annotations)
+        Iterate over triplets of character values and associated
+        |CharacterType| and |AnnotationSet| instances.
+        """
+        sequence = self._sequence
+        for idx in self._indices:
+            if sequence.has_annotations_at(idx):
+                annotations = sequence.annotations_at(idx)
+            else:
+                annotations = None
+            yield sequence.value_at(idx), sequence.character_type_at(idx), annotations
 
     def value_at(self, idx):
         """
@@ -328,7 +1046,7 @@ class CharacterDataSequence(
         c : object
             Value of character at index ``idx``.
         """
-        return self._character_values[idx]
+        return self._sequence.value_at(self._indices[idx])
 
     def character_type_at(self, idx):
         """
@@ -344,7 +1062,7 @@ class CharacterDataSequence(
         c : |CharacterType|
             |CharacterType| associated with character index ``idx``.
         """
-        return self._character_types[idx]
+        return self._sequence.character_type_at(self._indices[idx])
 
     def annotations_at(self, idx):
         """
@@ -360,9 +1078,7 @@ class CharacterDataSequence(
         c : |AnnotationSet|
             |AnnotationSet| representing metadata annotations of character at index ``idx``.
         """
-        if self._character_annotations[idx] is None:
-            self._character_annotations[idx] = basemodel.AnnotationSet(self._character_types[idx])
-        return self._character_annotations[idx]
+        return self._sequence.annotations_at(self._indices[idx])
 
     def has_annotations_at(self, idx):
         """
@@ -379,29 +1095,7 @@ class CharacterDataSequence(
             |True| if character at ``idx`` has metadata annotations, |False|
             otherwise.
         """
-        return not self._character_annotations[idx] is None
-
-    def set_character_type_at(self, idx, character_type):
-        """
-        Set type of character at ``idx``.
-
-        Parameters
-        ----------
-        idx : integer
-            Index of element character type to set.
-        """
-        self._character_types[idx] = character_type
-
-    def set_annotations_at(self, idx, annotations):
-        """
-        Set metadata annotations of character at ``idx``.
-
-        Parameters
-        ----------
-        idx : integer
-            Index of element annotations to set.
-        """
-        self._character_annotations[idx] = annotations
+        return self._sequence.has_annotations_at(self._indices[idx])
 
 ###############################################################################
 ## Subset of Character (Columns)
@@ -605,6 +1299,83 @@ class CharacterMatrix(
         """
         return cls._get_from(**kwargs)
 
+    def yield_from_files(cls,
+            files,
+            schema,
+            taxon_namespace=None,
+            **kwargs):
+        """
+        Iterates over the sequences of character data from files, returning
+        them one-by-one instead of instantiating the full character matrix in
+        memory at once.
+
+        For operations where it is sufficient to process each sequence
+        individually (e.g., counting states or calculating some statistic,
+        after which the sequence itself is not needed), this approach keeps
+        the memory footprint bounded by the size of the largest sequence,
+        rather than that of the entire alignment. Sequences in sequential
+        (non-interleaved) FASTA, PHYLIP, and NEXUS data are parsed
+        incrementally; interleaved PHYLIP and NEXUS matrices cannot be
+        streamed by sequence, and are read in full (one source or block at a
+        time) before their sequences are yielded.
+
+        Parameters
+        ----------
+        files : iterable of file paths or file-like objects.
+            Iterable of sources, which can either be strings specifying file
+            paths or file-like objects open for reading. If a source element is
+            a string (``isinstance(i,str) == True``), then it is assumed to be
+            a path to a file. Otherwise, the source is assumed to be a file-like
+            object.
+        schema : string
+            The name of the data format (e.g., "fasta", "phylip", or "nexus").
+        taxon_namespace : |TaxonNamespace| instance
+            The operational taxonomic unit concept namespace to use to manage
+            taxon definitions.
+        \*\*kwargs : keyword arguments
+            These will be passed directly to the schema-parser implementation.
+
+        Yields
+        ------
+        t : |Taxon|
+            The taxon associated with the sequence.
+        s : |CharacterDataSequence|
+            The sequence, of the ``character_sequence_type`` of this class,
+            as read from the file. Sequences are not added to any character
+            matrix.
+
+        Examples
+        --------
+
+        ::
+
+            sequence_yielder = dendropy.DnaCharacterMatrix.yield_from_files(
+                    files=["path/to/seqs1.fasta", "path/to/seqs2.fasta"],
+                    schema="fasta",
+                    )
+            gc_contents = {}
+            for taxon, sequence in sequence_yielder:
+                symbols = sequence.symbols_as_string()
+                gc = symbols.count("G") + symbols.count("C")
+                gc_contents[taxon.label] = float(gc) / len(symbols)
+
+        """
+        if taxon_namespace is None:
+            taxon_namespace = taxonmodel.process_kwargs_dict_for_taxon_namespace(kwargs, None)
+            if taxon_namespace is None:
+                taxon_namespace = taxonmodel.TaxonNamespace()
+        else:
+            assert "taxon_set" not in kwargs
+        kwargs["data_type"] = cls.data_type
+        sequence_yielder = dataio.get_sequence_yielder(
+                files,
+                schema,
+                taxon_namespace=taxon_namespace,
+                char_matrix_type=cls,
+                **kwargs)
+        return sequence_yielder
+    yield_from_files = classmethod(yield_from_files)
+
     def concatenate(cls, char_matrices):
         """
         Creates and returns a single character matrix from multiple
@@ -1615,6 +2386,96 @@ class CharacterMatrix(
                     del(vec[cell_idx])
         return clone
 
+    def character_subset_view(self, character_subset):
+        """
+        Returns a read-only view of the columns given by the CharacterSubset,
+        ``character_subset``, in their order in this matrix (see
+        :meth:`CharacterMatrix.character_indices_view()`).
+        """
+        if textprocessing.is_str_type(character_subset):
+            if character_subset not in self.character_subsets:
+                raise KeyError(character_subset)
+            else:
+                character_subset = self.character_subsets[character_subset]
+        return self.character_indices_view(sorted(character_subset.character_indices))
+
+    def character_indices_view(self, indices):
+        """
+        Returns a new CharacterMatrix (of the same type) consisting only of
+        the columns given by ``indices``, without copying any data.
+
+        Each sequence of the new matrix is a read-only
+        `CharacterDataSequenceView` of the corresponding sequence of this
+        matrix, so changes to the data of this matrix are reflected in the
+        new matrix, while attempts to change the data of the new matrix
+        raise `TypeError`. Unlike with
+        :meth:`CharacterMatrix.export_character_indices()`, columns are
+        given in the order of ``indices``, and can be repeated (as, e.g.,
+        in a bootstrap replicate). The new matrix can be used wherever a
+        matrix is only read: e.g., to calculate statistics, or to be
+        written out. A copy (e.g., using ``copy.deepcopy()``) of it is a
+        matrix holding its own data.
+
+        Parameters
+        ----------
+        indices : slice or iterable of ints
+            The 0-based indexes of the columns to be included, in order, or a
+            slice of the columns.
+
+        Returns
+        -------
+        m : |CharacterMatrix|
+            A matrix of the same type as ``self``, referencing the same taxon
+            set, state alphabets and annotations, with no character subsets.
+
+        Examples
+        --------
+
+        ::
+
+            # the first codon positions, in order
+            first_positions = char_matrix.character_indices_view(slice(0, None, 3))
+            print(popgenstat.nucleotide_diversity(first_positions))
+            first_positions.write(path="first_positions.fasta", schema="fasta")
+
+        """
+        if not isinstance(indices, slice):
+            indices = list(indices)
+        view = self.__class__.__new__(self.__class__)
+        view.__dict__.update(self.__dict__)
+        view.__dict__.pop("_annotations", None)
+        view._taxon_sequence_map = {}
+        view.character_types = list(self.character_types)
+        view.comments = list(self.comments)
+        view.character_subsets = container.OrderedCaselessDict()
+        view.copy_annotations_from(self)
+        # the indexes are stored once for all viewed sequences of the same
+        # length (or views with the same indexes)
+        view_indices_map = {}
+        for taxon, sequence in self._taxon_sequence_map.items():
+            if isinstance(sequence, CharacterDataSequenceView):
+                key = ("view", id(sequence._indices))
+                base_indices = sequence._indices
+                sequence = sequence._sequence
+            else:
+                key = ("sequence", len(sequence))
+                base_indices = range(len(sequence))
+            try:
+                view_indices = view_indices_map[key][1]
+            except KeyError:
+                if isinstance(indices, slice):
+                    view_indices = base_indices[indices]
+                else:
+                    num_base_indices = len(base_indices)
+                    for idx in indices:
+                        if idx < 0 or idx >= num_base_indices:
+                            raise IndexError("Character index {} out of range for sequence of taxon '{}'".format(idx, taxon.label))
+                    view_indices = [base_indices[idx] for idx in indices]
+                # ``base_indices`` kept referenced while its id is in use
+                view_indices_map[key] = (base_indices, view_indices)
+            view._taxon_sequence_map[taxon] = CharacterDataSequenceView(sequence, view_indices)
+        return view
+
     ###########################################################################
     ### Representation
 
@@ -1708,9 +2569,317 @@ class ContinuousCharacterMatrix(CharacterMatrix):
 
 ### Discrete Characters ##################################################
 
-class DiscreteCharacterDataSequence(CharacterDataSequence):
+class DiscreteCharacterDataSequence(PackedCharacterDataSequence):
     pass
 
+class SitePatterns(object):
+    """
+    The distinct site patterns (columns) of a |DiscreteCharacterMatrix|, with
+    the number of sites (the weight) of each, as returned by
+    :meth:`DiscreteCharacterMatrix.site_patterns()`.
+
+    Each distinct value (typically, a |StateIdentity|) of the matrix is
+    stored once, in ``states``, and each site pattern is a tuple of the
+    integer indexes in ``states`` of its values, in the order of ``taxa``.
+    Calculations that give the same result for identical sites need only be
+    carried out once for each pattern and then multiplied by its weight, or
+    mapped back to the sites using ``site_pattern_indices``.
+
+    Attributes
+    ----------
+    taxa : list of |Taxon|
+        The taxa of the rows of the patterns.
+    states : list
+        The distinct values of the matrix.
+    patterns : list of tuples of int
+        The distinct site patterns, in order of first occurrence.
+    weights : list of int
+        The number of sites of each pattern.
+    site_pattern_indices : list of int
+        The index of the pattern of each site.
+    """
+
+    def __init__(self, taxa, states, patterns, weights, site_pattern_indices):
+        self.taxa = taxa
+        self.states = states
+        self.patterns = patterns
+        self.weights = weights
+        self.site_pattern_indices = site_pattern_indices
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def _get_num_sites(self):
+        return len(self.site_pattern_indices)
+    num_sites = property(_get_num_sites)
+
+    def pattern_sites(self, pattern_index):
+        """
+        Returns list of indexes of the sites with pattern ``pattern_index``.
+        """
+        return [site_index for site_index, idx in enumerate(self.site_pattern_indices) if idx == pattern_index]
+
+    def expand(self, pattern_values):
+        """
+        Returns a list of values, one for each site, given a list of values,
+        one for each pattern, e.g. the per-pattern scores of a calculation.
+        """
+        return [pattern_values[idx] for idx in self.site_pattern_indices]
+
+    def pattern_sequences(self):
+        """
+        Returns a list of lists of values, one for each taxon, in the order of
+        ``taxa``, giving the values of each pattern in turn.
+        """
+        if not self.patterns:
+            return [[] for taxon in self.taxa]
+        states = self.states
+        return [[states[code] for code in row] for row in zip(*self.patterns)]
+
+    def taxon_state_sets_map(self, gaps_as_missing=True):
+        """
+        Returns a dictionary that maps taxon objects to lists of sets of
+        fundamental state indices, one for each pattern, as with
+        :meth:`DiscreteCharacterMatrix.taxon_state_sets_map()`.
+
+        Used with ``weights`` in parsimony scoring, e.g.::
+
+            site_patterns = char_matrix.site_patterns()
+            score = fitch_down_pass(
+                    tree.postorder_node_iter(),
+                    taxon_state_sets_map=site_patterns.taxon_state_sets_map(),
+                    weights=site_patterns.weights)
+
+        Parameters
+        ----------
+        gaps_as_missing : boolean
+            If |True| [default] then gap characters will be treated as missing
+            data values. If |False|, then they will be treated as an additional
+            (fundamental) state.
+
+        Returns
+        -------
+        d : dict
+            A dictionary with class:|Taxon| objects as keys and a list of sets
+            of fundamental state indexes as values.
+        """
+        if gaps_as_missing:
+            state_indexes = [state.fundamental_indexes_with_gaps_as_missing for state in self.states]
+        else:
+            state_indexes = [state.fundamental_indexes for state in self.states]
+        taxon_to_state_indices = {}
+        if not self.patterns:
+            for taxon in self.taxa:
+                taxon_to_state_indices[taxon] = []
+            return taxon_to_state_indices
+        for taxon, row in zip(self.taxa, zip(*self.patterns)):
+            taxon_to_state_indices[taxon] = [set(state_indexes[code]) for code in row]
+        return taxon_to_state_indices
+
+class BootstrapReplicates(basemodel.Serializable):
+    """
+    Nonparametric bootstrap replicates of a |DiscreteCharacterMatrix|, as
+    returned by :meth:`DiscreteCharacterMatrix.bootstrap_replicates()`.
+
+    Each replicate is a resampling, with replacement, of the sites (columns)
+    of the matrix. Replicates are not stored, but generated when requested,
+    as vectors of weights of the site patterns of the matrix (for scoring),
+    or as read-only views of the matrix (for writing); no data is copied.
+    Each replicate is drawn from its own random number generator, seeded
+    from ``seed`` and the index of the replicate, so any replicate can be
+    (re)generated independently of the others, in any order or process.
+
+    Attributes
+    ----------
+    char_matrix : |DiscreteCharacterMatrix|
+        The matrix being resampled.
+    site_patterns : `SitePatterns`
+        The site patterns of ``char_matrix``.
+    num_replicates : int
+        The number of replicates.
+    seed : int
+        The seed from which the random number generators of the replicates
+        are seeded.
+
+    Examples
+    --------
+
+    ::
+
+        replicates = char_matrix.bootstrap_replicates(1000, seed=1234)
+
+        # score a tree against each replicate, encoding the data once
+        fitch = BitParallelFitch(char_matrix=char_matrix)
+        scores = []
+        for site_weights in replicates.site_weights_iter():
+            fitch.set_weights(site_weights)
+            scores.append(fitch.score(tree))
+
+        # or write the replicates as successive data sets, for an external
+        # program
+        replicates.write(path="replicates.phy", schema="phylip")
+
+    """
+
+    def __init__(self, char_matrix, num_replicates, seed):
+        """
+        Parameters
+        ----------
+        char_matrix : |DiscreteCharacterMatrix|
+            The matrix to be resampled.
+        num_replicates : int
+            The number of replicates.
+        seed : int
+            A non-negative integer from which the random number generators of
+            the replicates are seeded.
+        """
+        if num_replicates < 0:
+            raise ValueError("Number of replicates must be non-negative: {}".format(num_replicates))
+        if seed < 0:
+            raise ValueError("Seed must be non-negative: {}".format(seed))
+        self.char_matrix = char_matrix
+        self.site_patterns = char_matrix.site_patterns()
+        self.num_replicates = num_replicates
+        self.seed = seed
+
+    def __len__(self):
+        return self.num_replicates
+
+    def __iter__(self):
+        for replicate_index in range(self.num_replicates):
+            yield self.pattern_weights(replicate_index)
+
+    def _check_replicate_index(self, replicate_index):
+        if replicate_index < 0 or replicate_index >= self.num_replicates:
+            raise IndexError("Replicate index {} out of range".format(replicate_index))
+
+    def replicate_rng(self, replicate_index):
+        """
+        Returns a new random number generator for replicate
+        ``replicate_index``, seeded from ``seed`` and ``replicate_index``
+        (and so distinct for each).
+        """
+        self._check_replicate_index(replicate_index)
+        return random.Random((self.seed << 32) + replicate_index)
+
+    def _sample_sites(self, replicate_index):
+        rng = self.replicate_rng(replicate_index)
+        num_sites = self.site_patterns.num_sites
+        # much faster than ``rng.randrange(num_sites)``
+        rand = rng.random
+        return [int(rand() * num_sites) for idx in range(num_sites)]
+
+    def sampled_sites(self, replicate_index):
+        """
+        Returns list of the (0-based) indexes of the sites drawn for
+        replicate ``replicate_index``, in order, with a site repeated as many
+        times as it was drawn.
+        """
+        return sorted(self._sample_sites(replicate_index))
+
+    def pattern_weights(self, replicate_index):
+        """
+        Returns list of the number of sites drawn for replicate
+        ``replicate_index`` of each site pattern, in the order of
+        ``site_patterns.patterns``.
+        """
+        site_pattern_indices = self.site_patterns.site_pattern_indices
+        counts = collections.Counter(site_pattern_indices[idx] for idx in self._sample_sites(replicate_index))
+        return [counts.get(idx, 0) for idx in range(len(self.site_patterns))]
+
+    def site_weights(self, replicate_index):
+        """
+        Returns list of the number of times each site was drawn for
+        replicate ``replicate_index``, in order, e.g., as the ``weights``
+        of :func:`~dendropy.calculate.treescore.parsimony_score()`.
+        """
+        counts = collections.Counter(self._sample_sites(replicate_index))
+        return [counts.get(idx, 0) for idx in range(self.site_patterns.num_sites)]
+
+    def site_weights_iter(self):
+        """
+        Iterates over the site weights (see :meth:`site_weights()`) of each
+        replicate in turn.
+        """
+        for replicate_index in range(self.num_replicates):
+            yield self.site_weights(replicate_index)
+
+    def replicate_char_matrix(self, replicate_index):
+        """
+        Returns a read-only view (see
+        :meth:`CharacterMatrix.character_indices_view()`) of the sites drawn
+        for replicate ``replicate_index``, in order.
+        """
+        return self.char_matrix.character_indices_view(self.sampled_sites(replicate_index))
+
+    def replicate_char_matrix_iter(self):
+        """
+        Iterates over the views (see :meth:`replicate_char_matrix()`) of each
+        replicate in turn.
+        """
+        for replicate_index in range(self.num_replicates):
+            yield self.replicate_char_matrix(replicate_index)
+
+    def _format_and_write_to_stream(self, stream, schema, **kwargs):
+        """
+        Writes out the matrix of each replicate in turn, each as a complete
+        document in ``schema`` format (as with, e.g., the multiple data sets
+        read by the PHYLIP programs), to the file-like object ``stream``.
+
+        Parameters
+        ----------
+        stream : file or file-like object
+            Destination for data.
+        schema : string
+            Must be a recognized character file schema, such as "nexus",
+            "phylip", etc, for which a specialized writer is available. If this
+            is not implemented for the schema specified, then a
+            UnsupportedSchemaError is raised.
+
+        \*\*kwargs : keyword arguments, optional
+            Keyword arguments will be passed directly to the writer for the
+            specified schema. See documentation for details on keyword
+            arguments supported by writers of various schemas.
+
+        """
+        writer = dataio.get_writer(schema, **kwargs)
+        for char_matrix in self.replicate_char_matrix_iter():
+            writer.write_char_matrices([char_matrix], stream)
+
+    def write(self, **kwargs):
+        """
+        Writes out the matrix of each replicate in turn, each as a complete
+        document in ``schema`` format.
+
+        **Mandatory Destination-Specification Keyword Argument (Exactly One of the Following Required):**
+
+            - **file** (*file*) -- File or file-like object opened for writing.
+            - **path** (*str*) -- Path to file to which to write.
+
+        **Mandatory Schema-Specification Keyword Argument:**
+
+            - **schema** (*str*) -- Identifier of format of data. See
+              "|Schemas|" for more details.
+
+        **Optional Schema-Specific Keyword Arguments:**
+
+            These provide control over how the data is formatted, and supported
+            argument names and values depend on the schema as specified by the
+            value passed as the "``schema``" argument. See "|Schemas|" for more
+            details.
+
+        Examples
+        --------
+
+        ::
+
+                replicates.write(path="replicates.phy",
+                        schema="phylip",
+                        strict=True)
+
+        """
+        return basemodel.Serializable._write_to(self, **kwargs)
+
 class DiscreteCharacterMatrix(CharacterMatrix):
 
     character_sequence_type = DiscreteCharacterDataSequence
@@ -1781,6 +2950,162 @@ class DiscreteCharacterMatrix(CharacterMatrix):
                 state_alphabet=self.default_state_alphabet,
                 purge_other_state_alphabets=purge_other_state_alphabets)
 
+    def site_patterns(self, char_indices=None):
+        """
+        Returns the distinct site patterns of this matrix, with the number of
+        sites of each, and the mapping of sites to patterns, as a
+        `SitePatterns` object.
+
+        Parameters
+        ----------
+        char_indices : iterable of ints
+            An iterable of indexes of characters to include (by column). If not
+            given or |None| [default], then all characters are included.
+
+        Returns
+        -------
+        p : `SitePatterns`
+            The site patterns.
+
+        Examples
+        --------
+
+        ::
+
+            site_patterns = char_matrix.site_patterns()
+            print("{} sites, {} patterns".format(
+                site_patterns.num_sites, len(site_patterns)))
+            for pattern, weight in zip(site_patterns.patterns, site_patterns.weights):
+                print("".join(site_patterns.states[code].symbol for code in pattern), weight)
+
+        """
+        taxa = list(self)
+        states = []
+        state_identity_map = {}
+        state_value_map = {}
+        def _get_code(value):
+            try:
+                code = state_value_map[value]
+                if states[code].__class__ is value.__class__:
+                    state_identity_map[id(value)] = code
+                    return code
+            except (KeyError, TypeError):
+                pass
+            code = len(states)
+            states.append(value)
+            state_identity_map[id(value)] = code
+            try:
+                state_value_map.setdefault(value, code)
+            except TypeError:
+                pass
+            return code
+        rows = []
+        nsites = None
+        for taxon in taxa:
+            seq = self[taxon]
+            packed_state_codes = None
+            if char_indices is None:
+                if isinstance(seq, PackedCharacterDataSequence):
+                    packed_state_codes = (seq._states, seq._state_codes)
+                elif isinstance(seq, CharacterDataSequenceView):
+                    packed_state_codes = seq._get_packed_state_codes()
+            if packed_state_codes is not None:
+                seq_states, seq_state_codes = packed_state_codes
+                local_codes = []
+                for state in seq_states:
+                    code = state_identity_map.get(id(state))
+                    if code is None:
+                        code = _get_code(state)
+                    local_codes.append(code)
+                row = [local_codes[code] for code in seq_state_codes]
+            else:
+                if char_indices is None:
+                    values = seq.values()
+                else:
+                    values = [seq[idx] for idx in char_indices]
+                row = []
+                for value in values:
+                    code = state_identity_map.get(id(value))
+                    if code is None:
+                        code = _get_code(value)
+                    row.append(code)
+            if nsites is None:
+                nsites = len(row)
+            elif len(row) != nsites:
+                raise ValueError("Sequences of unequal length: sequence for taxon '{}' has {} characters, but {} expected".format(
+                    taxon.label, len(row), nsites))
+            rows.append(row)
+        patterns = []
+        weights = []
+        site_pattern_indices = []
+        pattern_index_map = {}
+        for pattern in zip(*rows):
+            idx = pattern_index_map.get(pattern)
+            if idx is None:
+                idx = len(patterns)
+                pattern_index_map[pattern] = idx
+                patterns.append(pattern)
+                weights.append(1)
+            else:
+                weights[idx] += 1
+            site_pattern_indices.append(idx)
+        return SitePatterns(
+                taxa=taxa,
+                states=states,
+                patterns=patterns,
+                weights=weights,
+                site_pattern_indices=site_pattern_indices)
+
+    def bootstrap_replicates(self, num_replicates, seed=None, rng=None):
+        """
+        Returns nonparametric bootstrap replicates of this matrix, as a
+        `BootstrapReplicates` object, which generates each replicate when
+        requested, as weights of the site patterns or sites of this matrix,
+        or as a read-only view of the resampled sites, without copying the
+        data.
+
+        Parameters
+        ----------
+        num_replicates : int
+            The number of replicates.
+        seed : int
+            A non-negative integer from which the random number generator of
+            each replicate is seeded, so that the replicates can be
+            reproduced. If not given or |None| [default], then a seed is drawn
+            from ``rng``.
+        rng : ``random.Random`` object
+            The random number generator from which to draw ``seed`` if it is
+            not given. If not given or |None| [default], then the global
+            random number generator is used.
+
+        Returns
+        -------
+        r : `BootstrapReplicates`
+            The replicates.
+
+        Examples
+        --------
+
+        ::
+
+            replicates = char_matrix.bootstrap_replicates(1000, seed=1234)
+            taxon_state_sets_map = replicates.site_patterns.taxon_state_sets_map()
+            for pattern_weights in replicates:
+                score = fitch_down_pass(
+                        tree.postorder_node_iter(),
+                        taxon_state_sets_map=taxon_state_sets_map,
+                        weights=pattern_weights)
+
+        """
+        if seed is None:
+            if rng is None:
+                rng = GLOBAL_RNG
+            seed = rng.getrandbits(32)
+        return BootstrapReplicates(
+                char_matrix=self,
+                num_replicates=num_replicates,
+                seed=seed)
+
     def taxon_state_sets_map(self,
             char_indices=None,
             gaps_as_missing=True,
@@ -1885,26 +3210,26 @@ class DiscreteCharacterMatrix(CharacterMatrix):
             A vector of integers representing the folded site frequency
             spectrum.
         """
-        site_columns = zip(*self.sequences())
+        site_patterns = self.site_patterns()
         nsites = 0
         if is_pad_vector_to_unfolded_length:
             sfs = [0 for idx in range(len(self._taxon_sequence_map)+1)]
         else:
             sfs = [0 for idx in range(int(math.ceil(len(self._taxon_sequence_map)/2.0))+1)]
-        for site in site_columns:
-            counter = collections.Counter(site)
-            nsites += 1
+        for pattern, weight in zip(site_patterns.patterns, site_patterns.weights):
+            counter = collections.Counter(pattern)
+            nsites += weight
             if len(counter) == 1:
-                sfs[0] += 1
+                sfs[0] += weight
                 continue
             del counter[counter.most_common(1)[0][0]]
-            sfs[sum(counter.values())] += 1
+            sfs[sum(counter.values())] += weight
         assert sum(sfs) == nsites
         return sfs
 
 ### Fixed Alphabet Characters ##################################################
 
-class FixedAlphabetCharacterDataSequence(CharacterDataSequence):
+class FixedAlphabetCharacterDataSequence(PackedCharacterDataSequence):
     pass
 
 class FixedAlphabetCharacterMatrix(DiscreteCharacterMatrix):
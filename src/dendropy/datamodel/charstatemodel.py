@@ -32,6 +32,11 @@ from dendropy.datamodel import basemodel
 from dendropy.utility import textprocessing
 from dendropy.utility import container
 
+# Code assigned to symbols that are not recognized by a state alphabet in the
+# byte translation tables used for fast translation of symbols to states.
+_UNRECOGNIZED_SYMBOL_CODE = 0xFF
+_UNRECOGNIZED_SYMBOL_CODE_BYTE = bytes(bytearray([_UNRECOGNIZED_SYMBOL_CODE]))
+
 ###############################################################################
 ## StateAlphabet
 
@@ -171,6 +176,7 @@ class StateAlphabet(
         self._canonical_symbol_state_map = None
         self._full_symbol_state_map = None
         self._index_state_map = None
+        self._symbol_translation_table = None
         self._fundamental_states_to_ambiguous_state_map = None
         self._fundamental_states_to_polymorphic_state_map = None
 
@@ -566,6 +572,70 @@ class StateAlphabet(
         self._canonical_symbol_state_map = container.FrozenOrderedDict(temp_canonical_symbol_state_map)
         self._full_symbol_state_map = container.FrozenOrderedDict(temp_full_symbol_state_map)
         self._index_state_map = container.FrozenOrderedDict(temp_index_state_map)
+        self._symbol_translation_table = self._build_symbol_translation_table()
+
+    def _build_symbol_translation_table(self):
+        # Maps each (single-character, ASCII) symbol to the index of its state
+        # in ``self._state_identities``, and every other byte value to
+        # ``_UNRECOGNIZED_SYMBOL_CODE``, for use with ``bytes.translate()``.
+        if len(self._state_identities) > _UNRECOGNIZED_SYMBOL_CODE:
+            return None
+        table = bytearray([_UNRECOGNIZED_SYMBOL_CODE]) * 256
+        for symbol, state in self._full_symbol_state_map.items():
+            if symbol is None or len(symbol) != 1 or ord(symbol) > 127:
+                continue
+            table[ord(symbol)] = state._index
+        return bytes(table)
+
+    def translate_symbols(self,
+            symbols,
+            ignored_symbols=None,
+            ignore_unrecognized_symbols=False):
+        """
+        Translates a string of single-character symbols to the indexes of the
+        corresponding states in ``self.states``, in a single pass using a
+        precompiled byte translation table.
+
+        Parameters
+        ----------
+        symbols : string
+            String of (single-character) symbols to translate.
+        ignored_symbols : string
+            Characters to skip (e.g., whitespace).
+        ignore_unrecognized_symbols : bool
+            If |True|, then symbols not recognized by this alphabet will be
+            skipped. Otherwise, |None| will be returned if any such symbol is
+            found.
+
+        Returns
+        -------
+        c : bytes or |None|
+            Byte string in which each byte is the index of the state (in
+            ``self.states``) of the corresponding symbol in ``symbols``, or
+            |None| if ``symbols`` cannot be translated this way (because of
+            unrecognized or non-ASCII symbols, or an alphabet with too many
+            states to index using single bytes), in which case the symbols
+            need to be looked up individually (e.g., using
+            ``self.full_symbol_state_map``).
+        """
+        table = self._symbol_translation_table
+        if table is None:
+            return None
+        try:
+            if not isinstance(symbols, bytes):
+                symbols = symbols.encode("ascii")
+            if ignored_symbols is None:
+                ignored_symbols = b""
+            elif not isinstance(ignored_symbols, bytes):
+                ignored_symbols = ignored_symbols.encode("ascii")
+        except UnicodeError:
+            return None
+        state_codes = symbols.translate(table, ignored_symbols)
+        if _UNRECOGNIZED_SYMBOL_CODE_BYTE in state_codes:
+            if not ignore_unrecognized_symbols:
+                return None
+            state_codes = state_codes.replace(_UNRECOGNIZED_SYMBOL_CODE_BYTE, b"")
+        return state_codes
 
     def set_state_as_attribute(self, state, attr_name=None):
         """
@@ -26,6 +26,11 @@ import collections
 import math
 import copy
 import sys
+import io
+import json
+import mmap
+import array
+import multiprocessing
 from dendropy.utility import container
 from dendropy.utility import error
 from dendropy.utility import bitprocessing
@@ -37,6 +42,21 @@ from dendropy.datamodel import taxonmodel
 from dendropy.datamodel import treemodel
 from dendropy import dataio
 
+_NAN = float("nan")
+_TREE_ARRAY_COLUMNS_MAGIC = b"DPYTACOL"
+
+def _array_to_bytes(a):
+    try:
+        return a.tobytes()
+    except AttributeError:
+        return a.tostring()
+
+def _array_from_bytes(a, b):
+    try:
+        a.frombytes(b)
+    except AttributeError:
+        a.fromstring(b)
+
 ##############################################################################
 ### TreeList
 
@@ -1095,6 +1115,80 @@ class TreeList(
                 summarize_splits=summarize_splits,
                 **kwargs)
 
+    def greedy_consensus(self,
+            min_freq=None,
+            is_bipartitions_updated=False,
+            summarize_splits=True,
+            **kwargs):
+        """
+        Returns a greedy consensus (or "extended majority-rule" consensus) tree
+        of all trees in self, built by adding bipartitions in order of
+        descending frequency as long as they are compatible with those already
+        added. Only bipartitions with a frequency of at least ``min_freq``, if
+        given, are considered.
+        """
+        ta = self._get_tree_array(kwargs)
+        return ta.greedy_consensus_tree(min_freq=min_freq,
+                summarize_splits=summarize_splits,
+                **kwargs)
+
+    def calc_node_age_vectors(self,
+            ultrametricity_precision=constants.DEFAULT_ULTRAMETRICITY_PRECISION,
+            is_force_max_age=False,
+            is_force_min_age=False,
+            **kwargs):
+        """
+        Calculates the ages of the nodes of all trees in self, reporting all
+        deviations from ultrametricity rather than raising an error at the
+        first one found. The ages are not set on the trees themselves, but,
+        unless ``is_bipartitions_updated`` is |True|, the bipartitions of each
+        tree are encoded (see :meth:`Tree.encode_bipartitions()`) when the
+        trees are added to the |TreeArray| used for the calculation. See
+        :meth:`TreeArray.calc_node_age_vectors()` for details.
+
+        Parameters
+        ----------
+        ultrametricity_precision : numeric or bool or None
+            Nodes for which the ages implied by the different child nodes
+            differ by more than this are reported as deviating from
+            ultrametricity.
+        is_force_max_age : bool
+            If |True|, then each node is set to the oldest age implied by its
+            child nodes.
+        is_force_min_age : bool
+            If |True|, then each node is set to the youngest age implied by its
+            child nodes.
+        **kwargs : keyword arguments
+            Passed on to the construction of the |TreeArray| holding the
+            trees (e.g., ``taxon_label_age_map`` to specify the ages of tips,
+            or ``is_bipartitions_updated``).
+
+        Returns
+        -------
+        split_bitmasks : list[tuple[int]]
+            The split bitmasks of each tree, in postorder.
+        node_ages : list[``array.array``]
+            The ages of the nodes of each tree, aligned with the split bitmasks
+            of the tree in ``split_bitmasks``.
+        tree_heights : ``array.array``
+            The age of the root of each tree.
+        ultrametricity_deviations : list[tuple]
+            A tuple, (tree index, split bitmask, deviation), for each node
+            deviating from ultrametricity.
+
+        Raises
+        ------
+        TypeError
+            If any keyword arguments are not recognized.
+        """
+        ta = self._get_tree_array(kwargs)
+        if kwargs:
+            raise TypeError("Unrecognized or unsupported arguments: {}".format(kwargs))
+        return ta.calc_node_age_vectors(
+                ultrametricity_precision=ultrametricity_precision,
+                is_force_max_age=is_force_max_age,
+                is_force_min_age=is_force_min_age)
+
     def maximum_product_of_split_support_tree(
             self,
             include_external_splits=False,
@@ -1208,6 +1302,44 @@ class TreeList(
         except ZeroDivisionError:
             return 0
 
+    def tree_distance_matrix(self,
+            metric="unweighted_robinson_foulds",
+            edge_weight_attr="length",
+            is_bipartitions_updated=False,
+            num_processes=1):
+        """
+        Returns the distances between all pairs of trees in the collection as
+        a condensed distance matrix. See
+        :func:`dendropy.calculate.treecompare.tree_distance_matrix` for details.
+
+        Parameters
+        ----------
+        metric : string
+            One of: "unweighted_robinson_foulds", "weighted_robinson_foulds",
+            or "euclidean".
+        edge_weight_attr : string
+            Name of attribute on edges of trees to be used as the weight for
+            the weighted metrics.
+        is_bipartitions_updated : bool
+            If |False| (default), then the bipartitions of all the trees will
+            be updated before comparison.
+        num_processes : int
+            Number of processes over which to distribute the calculations.
+
+        Returns
+        -------
+        d : ``array.array``
+            The distances between trees ``i`` and ``j``, ``i`` < ``j``, in
+            the order (0,1), (0,2), ..., (0,n-1), (1,2), ..., (n-2,n-1).
+        """
+        from dendropy.calculate import treecompare
+        return treecompare.tree_distance_matrix(
+                trees=self,
+                metric=metric,
+                edge_weight_attr=edge_weight_attr,
+                is_bipartitions_updated=is_bipartitions_updated,
+                num_processes=num_processes)
+
     def frequency_of_split(self, **kwargs):
         """
         DEPRECATED: use 'frequency_of_bipartition()' instead.
@@ -1337,7 +1469,10 @@ class SplitDistribution(taxonmodel.TaxonNamespaceAssociated):
         is_bipartitions_updated : bool
             If |False| [default], then the tree will have its splits encoded or
             updated. Otherwise, if |True|, then the tree is assumed to have its
-            splits already encoded and updated.
+            splits already encoded and updated. Unless ``ignore_node_ages`` is
+            |True|, node ages are calculated in the same traversal of the tree
+            as the splits if these are encoded here, and in a separate
+            traversal otherwise.
 
         Returns
         --------
@@ -1350,17 +1485,10 @@ class SplitDistribution(taxonmodel.TaxonNamespaceAssociated):
         """
         assert tree.taxon_namespace is self.taxon_namespace
         self.total_trees_counted += 1
-        if not self.ignore_node_ages:
-            if self.taxon_label_age_map:
-                set_node_age_fn = self._set_node_age
-            else:
-                set_node_age_fn = None
-            tree.calc_node_ages(
-                    ultrametricity_precision=self.ultrametricity_precision,
-                    is_force_max_age=self.is_force_max_age,
-                    is_force_min_age=self.is_force_min_age,
-                    set_node_age_fn=set_node_age_fn,
-                    )
+        if not self.ignore_node_ages and self.taxon_label_age_map:
+            set_node_age_fn = self._set_node_age
+        else:
+            set_node_age_fn = None
         if tree.weight is not None and self.use_tree_weights:
             weight_to_use = float(tree.weight)
         else:
@@ -1371,39 +1499,46 @@ class SplitDistribution(taxonmodel.TaxonNamespaceAssociated):
         else:
             self.tree_rooting_types_counted.add(False)
         if not is_bipartitions_updated:
-            tree.encode_bipartitions()
+            # node ages (if needed) are calculated in the same traversal of
+            # the tree as the bipartitions
+            bipartitions, tree_edge_lengths, tree_node_ages = tree.encode_bipartitions_and_calc_node_ages(
+                    ultrametricity_precision=self.ultrametricity_precision,
+                    is_force_max_age=self.is_force_max_age,
+                    is_force_min_age=self.is_force_min_age,
+                    set_node_age_fn=set_node_age_fn,
+                    is_calc_node_ages=not self.ignore_node_ages)
+        else:
+            if not self.ignore_node_ages:
+                tree.calc_node_ages(
+                        ultrametricity_precision=self.ultrametricity_precision,
+                        is_force_max_age=self.is_force_max_age,
+                        is_force_min_age=self.is_force_min_age,
+                        set_node_age_fn=set_node_age_fn,
+                        )
+            bipartitions = tree.bipartition_encoding
+            ## if edge is stored as an attribute, might be faster to:
+            # edge = bipartition.edge
+            edges = [tree.bipartition_edge_map[bipartition] for bipartition in bipartitions]
+            tree_edge_lengths = [edge.length for edge in edges]
+            if not self.ignore_node_ages:
+                tree_node_ages = [edge.head_node.age if edge.head_node is not None else None for edge in edges]
         splits = []
         edge_lengths = []
         node_ages = []
-        for bipartition in tree.bipartition_encoding:
+        for idx, bipartition in enumerate(bipartitions):
             split = bipartition.split_bitmask
-
-            ## if edge is stored as an attribute, might be faster to:
-            # edge = bipartition.edge
-            edge = tree.bipartition_edge_map[bipartition]
-
             splits.append(split)
             self.split_counts[split] += weight_to_use
             if not self.ignore_edge_lengths:
-                sel = self.split_edge_lengths.setdefault(split,[])
-                if edge.length is None:
+                elen = tree_edge_lengths[idx]
+                if elen is None:
                     elen = default_edge_length_value
-                else:
-                    elen = edge.length
-                sel.append(elen)
+                self.split_edge_lengths[split].append(elen)
                 edge_lengths.append(elen)
-            else:
-                sel = None
             if not self.ignore_node_ages:
-                sna = self.split_node_ages.setdefault(split, [])
-                if edge.head_node is not None:
-                    nage = edge.head_node.age
-                else:
-                    nage = None
-                sna.append(nage)
+                nage = tree_node_ages[idx]
+                self.split_node_ages[split].append(nage)
                 node_ages.append(nage)
-            else:
-                sna = None
         return splits, edge_lengths, node_ages
 
     def splits_considered(self):
@@ -1765,6 +1900,74 @@ class SplitDistribution(taxonmodel.TaxonNamespaceAssociated):
                 )
         return con_tree
 
+    def greedy_consensus_tree(self,
+            min_freq=None,
+            is_rooted=None,
+            summarize_splits=True,
+            **split_summarization_kwargs
+            ):
+        """
+        Returns a greedy consensus (or "extended majority-rule" consensus) tree
+        from splits in ``self``.
+
+        Splits are considered in order of descending frequency, and each split
+        is added to the tree if it is compatible with all splits already added.
+        Compatibility is established against the incrementally-built cluster
+        hierarchy, so that each candidate split costs time proportional to the
+        size of the cluster that would contain it rather than to the number of
+        splits already accepted.
+
+        Parameters
+        ----------
+
+        min_freq : real or |None|
+            The minimum frequency of a split in this distribution for it to be
+            considered for addition to the tree. If |None| (default), then all
+            splits are considered.
+
+        is_rooted : bool
+            Should tree be rooted or not? If *all* trees counted for splits are
+            explicitly rooted or unrooted, then this will default to |True| or
+            |False|, respectively. Otherwise it defaults to |None|.
+
+        \*\*split_summarization_kwargs : keyword arguments
+            These will be passed directly to the underlying
+            `SplitDistributionSummarizer` object. See
+            :meth:`SplitDistributionSummarizer.configure` for options.
+
+        Returns
+        -------
+        t : greedy consensus tree
+
+        """
+        if is_rooted is None:
+            if self.is_all_counted_trees_rooted():
+                is_rooted = True
+            elif self.is_all_counted_trees_strictly_unrooted():
+                is_rooted = False
+        split_frequencies = self._get_split_frequencies()
+        to_try_to_add = []
+        for s in split_frequencies:
+            freq = split_frequencies[s]
+            if (min_freq is None) or (freq >= min_freq):
+                to_try_to_add.append((freq, s))
+        to_try_to_add.sort(reverse=True)
+        splits_for_tree = treemodel.Tree.greedy_compatible_split_bitmasks(
+                split_bitmasks=[i[1] for i in to_try_to_add],
+                all_taxa_bitmask=self.taxon_namespace.all_taxa_bitmask(),
+                is_rooted=is_rooted)
+        con_tree = treemodel.Tree.from_split_bitmasks(
+                split_bitmasks=splits_for_tree,
+                taxon_namespace=self.taxon_namespace,
+                is_rooted=is_rooted)
+        if summarize_splits:
+            self.summarize_splits_on_tree(
+                tree=con_tree,
+                is_bipartitions_updated=False,
+                **split_summarization_kwargs
+                )
+        return con_tree
+
     def summarize_splits_on_tree(self,
             tree,
             is_bipartitions_updated=False,
@@ -1799,6 +2002,115 @@ class SplitDistribution(taxonmodel.TaxonNamespaceAssociated):
                 is_bipartitions_updated=is_bipartitions_updated)
         return tree
 
+    def summarize_splits_on_trees(self,
+            trees,
+            is_bipartitions_updated=False,
+            num_processes=1,
+            chunk_size=100,
+            **split_summarization_kwargs
+            ):
+        """
+        Summarizes support of splits/edges/node on each of a (potentially
+        very large) collection of trees, yielding each tree in turn after it
+        has been decorated.
+
+        Parameters
+        ----------
+
+        trees: iterable of |Tree| instances
+            Trees to be decorated with support values. This can be an
+            iterator (e.g., over trees yielded from files, as given by
+            :meth:`Tree.yield_from_files`), in which case trees are read only
+            as fast as they are consumed, so that collections of trees that
+            are too large to be held in memory can be decorated and written
+            out as a stream.
+
+        is_bipartitions_updated: bool
+            If |True|, then bipartitions will not be recalculated.
+
+        num_processes: int
+            If greater than 1, then the trees will be decorated in parallel
+            by this number of worker processes, each of which shares a single,
+            read-only copy of the split summaries. Trees are dispatched to the
+            workers in chunks of ``chunk_size`` trees, and the decorated trees
+            are yielded in the same order as the trees in ``trees``. Note that
+            in this case the trees yielded are decorated *copies* of the
+            trees given, attached to the |TaxonNamespace| of this
+            distribution, and any function passed as
+            ``support_label_compose_fn`` must be a module-level function.
+
+        chunk_size: int
+            Number of trees dispatched to a worker process at a time when
+            ``num_processes`` is greater than 1.
+
+        \*\*split_summarization_kwargs : keyword arguments
+            These will be passed directly to the underlying
+            `SplitDistributionSummarizer` object. See
+            :meth:`SplitDistributionSummarizer.configure` for options.
+
+        """
+        if num_processes is None or num_processes <= 1:
+            for tree in trees:
+                yield self.summarize_splits_on_tree(
+                        tree=tree,
+                        is_bipartitions_updated=is_bipartitions_updated,
+                        **split_summarization_kwargs)
+            return
+        if chunk_size is None or chunk_size < 1:
+            chunk_size = 1
+        pool = multiprocessing.Pool(
+                processes=num_processes,
+                initializer=_init_split_summarization_worker,
+                initargs=(SplitDistributionSummarizer.split_summary_table(self),
+                    split_summarization_kwargs,
+                    is_bipartitions_updated))
+        # Results are consumed in the order in which the chunks were
+        # submitted; the number of chunks in flight is bounded so that trees
+        # are only drawn from ``trees`` as fast as they are yielded.
+        max_pending_chunks = 2 * num_processes
+        pending = collections.deque()
+        try:
+            chunk = []
+            for tree in trees:
+                if tree.taxon_namespace is not self.taxon_namespace:
+                    raise error.TaxonNamespaceIdentityError(self, tree)
+                chunk.append(tree)
+                if len(chunk) < chunk_size:
+                    continue
+                pending.append(pool.apply_async(_split_summarization_worker, (chunk,)))
+                chunk = []
+                while len(pending) >= max_pending_chunks:
+                    for summarized_tree in self._attach_summarized_trees(pending.popleft().get()):
+                        yield summarized_tree
+            if chunk:
+                pending.append(pool.apply_async(_split_summarization_worker, (chunk,)))
+            while pending:
+                for summarized_tree in self._attach_summarized_trees(pending.popleft().get()):
+                    yield summarized_tree
+        except:
+            pool.terminate()
+            raise
+        else:
+            pool.close()
+        finally:
+            pool.join()
+
+    def _attach_summarized_trees(self, trees):
+        # Trees returned by worker processes reference a copy of the taxon
+        # namespace; map them back onto the original taxa (which are in the
+        # same order).
+        taxon_map = {}
+        for tree in trees:
+            if tree.taxon_namespace is not self.taxon_namespace:
+                if not taxon_map:
+                    for src_taxon, taxon in zip(tree.taxon_namespace, self.taxon_namespace):
+                        taxon_map[src_taxon] = taxon
+                for nd in tree:
+                    if nd.taxon is not None:
+                        nd.taxon = taxon_map[nd.taxon]
+                tree._taxon_namespace = self.taxon_namespace
+        return trees
+
     ###########################################################################
     ### legacy
 
@@ -1990,15 +2302,44 @@ class SplitDistributionSummarizer(object):
             is_bipartitions_updated=False):
         if split_distribution.taxon_namespace is not tree.taxon_namespace:
             raise error.TaxonNamespaceIdentityError(split_distribution, tree)
+        return self.summarize_splits_on_tree_from_summary_table(
+                summary_table=self.split_summary_table(split_distribution),
+                tree=tree,
+                is_bipartitions_updated=is_bipartitions_updated)
+
+    def split_summary_table(split_distribution):
+        """
+        Returns a tuple, ``(split_frequencies, split_edge_length_summaries,
+        split_node_age_summaries)``, of the dictionaries of ``split_distribution``
+        that are consulted when summarizing splits on trees. The dictionaries
+        are not modified by the summarization, and so a single table can be
+        shared (e.g., by worker processes) across the summarization of any
+        number of trees.
+        """
+        return (split_distribution.split_frequencies,
+                split_distribution.split_edge_length_summaries,
+                split_distribution.split_node_age_summaries)
+    split_summary_table = staticmethod(split_summary_table)
+
+    def summarize_splits_on_tree_from_summary_table(self,
+            summary_table,
+            tree,
+            is_bipartitions_updated=False):
+        """
+        Decorates ``tree`` with the support, edge length and node age
+        summaries given in ``summary_table`` (see
+        :meth:`SplitDistributionSummarizer.split_summary_table`). It is the
+        responsibility of the caller to ensure that ``tree`` and the
+        split distribution from which ``summary_table`` was derived share the
+        same |TaxonNamespace|.
+        """
         if not is_bipartitions_updated:
             tree.encode_bipartitions()
         if self.support_label_compose_fn is not None:
             support_label_fn = lambda freq: self.support_label_compose_fn(freq)
         else:
             support_label_fn = lambda freq: "{:.{places}f}".format(freq, places=self.support_label_decimals)
-        node_age_summaries = split_distribution.split_node_age_summaries
-        edge_length_summaries = split_distribution.split_edge_length_summaries
-        split_freqs = split_distribution.split_frequencies
+        split_freqs, edge_length_summaries, node_age_summaries = summary_table
         assert len(self.node_age_summaries_fieldnames) == len(self.summary_stats_fieldnames)
         for node in tree:
             split_bitmask = node.edge.bipartition.split_bitmask
@@ -2096,6 +2437,24 @@ class SplitDistributionSummarizer(object):
                     node.edge.length = self.minimum_edge_length
         return tree
 
+_split_summarization_worker_data = None
+
+def _init_split_summarization_worker(summary_table, split_summarization_kwargs, is_bipartitions_updated):
+    global _split_summarization_worker_data
+    _split_summarization_worker_data = (
+            summary_table,
+            SplitDistributionSummarizer(**split_summarization_kwargs),
+            is_bipartitions_updated)
+
+def _split_summarization_worker(trees):
+    summary_table, summarizer, is_bipartitions_updated = _split_summarization_worker_data
+    for tree in trees:
+        summarizer.summarize_splits_on_tree_from_summary_table(
+                summary_table=summary_table,
+                tree=tree,
+                is_bipartitions_updated=is_bipartitions_updated)
+    return trees
+
 ###############################################################################
 ### TreeArray
 
@@ -2482,6 +2841,230 @@ class TreeArray(
         """
         return basemodel.MultiReadable._read_from(self, **kwargs)
 
+    ##############################################################################
+    ## Compact Columnar Storage
+
+    def write_columns(self, dest):
+        """
+        Writes the data in the collection to ``dest`` in a compact binary
+        columnar format.
+
+        Split bitmasks are interned: each distinct split bitmask is stored once
+        as a fixed-width little-endian byte string, and trees are stored as
+        columns of indexes into this table. Edge lengths, node ages, split
+        counts and tree weights are stored as packed arrays of doubles. Data
+        written by this method can be added to a |TreeArray| instance using
+        :meth:`TreeArray.read_columns()`, which is substantially cheaper than
+        pickling and unpickling the collection (e.g., when transferring
+        results between processes or checkpointing a long run).
+
+        Parameters
+        ----------
+        dest : string or file
+            Path to file or file-like object opened for writing in binary
+            mode.
+        """
+        if isinstance(dest, str):
+            with open(dest, "wb") as out:
+                return self.write_columns(out)
+        sd = self._split_distribution
+        split_index_map = {}
+        unique_splits = []
+        for split_bitmask in sd.split_counts:
+            split_index_map[split_bitmask] = len(unique_splits)
+            unique_splits.append(split_bitmask)
+        tree_split_counts = array.array("I")
+        tree_split_indexes = array.array("I")
+        for split_bitmasks in self._tree_split_bitmasks:
+            tree_split_counts.append(len(split_bitmasks))
+            for split_bitmask in split_bitmasks:
+                try:
+                    tree_split_indexes.append(split_index_map[split_bitmask])
+                except KeyError:
+                    split_index_map[split_bitmask] = len(unique_splits)
+                    tree_split_indexes.append(len(unique_splits))
+                    unique_splits.append(split_bitmask)
+        max_bitmask = max([self.taxon_namespace.all_taxa_bitmask(), 1] + unique_splits + self._tree_leafset_bitmasks)
+        width = bitprocessing.bytes_width(max_bitmask)
+        columns = collections.OrderedDict()
+        columns["split_bitmasks"] = b"".join(bitprocessing.int_to_bytes(s, width) for s in unique_splits)
+        columns["split_counts"] = array.array("d", (sd.split_counts.get(s, 0.0) for s in unique_splits))
+        for column_prefix, split_values in (
+                ("split_edge_length", sd.split_edge_lengths),
+                ("split_node_age", sd.split_node_ages),
+                ):
+            value_counts = array.array("I")
+            values = array.array("d")
+            for s in unique_splits:
+                v = split_values.get(s, None) or ()
+                value_counts.append(len(v))
+                values.extend(_NAN if x is None else x for x in v)
+            columns[column_prefix + "_counts"] = value_counts
+            columns[column_prefix + "s"] = values
+        columns["tree_split_counts"] = tree_split_counts
+        columns["tree_split_indexes"] = tree_split_indexes
+        tree_edge_lengths = array.array("d")
+        if not self.ignore_edge_lengths:
+            for edge_lengths in self._tree_edge_lengths:
+                tree_edge_lengths.extend(_NAN if x is None else x for x in edge_lengths)
+        columns["tree_edge_lengths"] = tree_edge_lengths
+        columns["tree_leafset_bitmasks"] = b"".join(bitprocessing.int_to_bytes(s, width) for s in self._tree_leafset_bitmasks)
+        columns["tree_weights"] = array.array("d", self._tree_weights)
+        column_sizes = []
+        for name in columns:
+            if isinstance(columns[name], array.array):
+                columns[name] = _array_to_bytes(columns[name])
+            column_sizes.append([name, len(columns[name])])
+        header = {
+            "taxon_labels": self.taxon_namespace.labels(),
+            "is_rooted_trees": self._is_rooted_trees,
+            "ignore_edge_lengths": self.ignore_edge_lengths,
+            "ignore_node_ages": self.ignore_node_ages,
+            "use_tree_weights": self.use_tree_weights,
+            "total_trees_counted": sd.total_trees_counted,
+            "sum_of_tree_weights": sd.sum_of_tree_weights,
+            "tree_rooting_types_counted": list(sd.tree_rooting_types_counted),
+            "bitmask_width": width,
+            "index_itemsize": tree_split_indexes.itemsize,
+            "columns": column_sizes,
+            }
+        header = json.dumps(header).encode("utf-8")
+        dest.write(_TREE_ARRAY_COLUMNS_MAGIC)
+        dest.write(bitprocessing.int_to_bytes(len(header), 8))
+        dest.write(header)
+        for name in columns:
+            dest.write(columns[name])
+
+    def read_columns(self, src):
+        """
+        Adds data written by :meth:`TreeArray.write_columns()` to the
+        collection.
+
+        If ``src`` is a path or a file object backed by a real file, it will
+        be memory-mapped rather than read into memory all at once.
+
+        The taxa of the data must be the same as, or (if taxa have been
+        added to one but not the other since the data was written) extend or
+        be extended by, the taxa in the |TaxonNamespace| of the collection.
+        In the latter case the missing taxa are added to the |TaxonNamespace|.
+
+        Parameters
+        ----------
+        src : string or file
+            Path to file or file-like object opened for reading in binary
+            mode. Data is read starting at the current position of the file
+            object.
+
+        Returns
+        -------
+        n : int
+            The number of trees added.
+        """
+        if isinstance(src, str):
+            with open(src, "rb") as f:
+                return self.read_columns(f)
+        try:
+            buf = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+            start = src.tell()
+        except (AttributeError, ValueError, EnvironmentError, io.UnsupportedOperation):
+            buf = src.read()
+            start = 0
+        try:
+            return self._add_from_columns_buffer(buf, start)
+        finally:
+            if isinstance(buf, mmap.mmap):
+                buf.close()
+
+    def _add_from_columns_buffer(self, buf, start=0):
+        magic_len = len(_TREE_ARRAY_COLUMNS_MAGIC)
+        if buf[start:start+magic_len] != _TREE_ARRAY_COLUMNS_MAGIC:
+            raise ValueError("Data source is not in TreeArray columnar format")
+        offset = start + magic_len
+        header_len = bitprocessing.int_from_bytes(buf[offset:offset+8])
+        offset += 8
+        header = json.loads(buf[offset:offset+header_len].decode("utf-8"))
+        offset += header_len
+        columns = {}
+        for name, size in header["columns"]:
+            columns[name] = (offset, offset+size)
+            offset += size
+        def _get_array(name, typecode):
+            a = array.array(typecode)
+            if typecode == "I" and a.itemsize != header["index_itemsize"]:
+                raise ValueError("Incompatible integer size in columnar data: {} (expecting {})".format(header["index_itemsize"], a.itemsize))
+            start, end = columns[name]
+            _array_from_bytes(a, buf[start:end])
+            return a
+        def _get_bitmasks(name):
+            start, end = columns[name]
+            width = header["bitmask_width"]
+            return [bitprocessing.int_from_bytes(buf[i:i+width]) for i in range(start, end, width)]
+        def _as_values(a):
+            return [None if x != x else x for x in a]
+
+        taxon_labels = self.taxon_namespace.labels()
+        if taxon_labels != header["taxon_labels"]:
+            if taxon_labels == header["taxon_labels"][:len(taxon_labels)]:
+                for label in header["taxon_labels"][len(taxon_labels):]:
+                    self.taxon_namespace.new_taxon(label=label)
+            elif taxon_labels[:len(header["taxon_labels"])] != header["taxon_labels"]:
+                raise ValueError("Taxa in columnar data do not match taxa in TreeArray TaxonNamespace: {} vs. {}".format(header["taxon_labels"], self.taxon_namespace.labels()))
+        tree_weights = _get_array("tree_weights", "d")
+        if len(tree_weights) == 0:
+            pass
+        elif len(self) > 0:
+            if self._is_rooted_trees is not header["is_rooted_trees"]:
+                raise TreeArray.IncompatibleRootingTreeArrayUpdate("Updating from incompatible data: 'is_rooted_trees' should be '{}', but is instead '{}'".format(header["is_rooted_trees"], self._is_rooted_trees))
+            if self.ignore_edge_lengths is not header["ignore_edge_lengths"]:
+                raise TreeArray.IncompatibleEdgeLengthsTreeArrayUpdate("Updating from incompatible data: 'ignore_edge_lengths' should be '{}', but is instead '{}'".format(header["ignore_edge_lengths"], self.ignore_edge_lengths))
+            if self.ignore_node_ages is not header["ignore_node_ages"]:
+                raise TreeArray.IncompatibleNodeAgesTreeArrayUpdate("Updating from incompatible data: 'ignore_node_ages' should be '{}', but is instead '{}'".format(header["ignore_node_ages"], self.ignore_node_ages))
+            if self.use_tree_weights is not header["use_tree_weights"]:
+                raise TreeArray.IncompatibleTreeWeightsTreeArrayUpdate("Updating from incompatible data: 'use_tree_weights' should be '{}', but is instead '{}'".format(header["use_tree_weights"], self.use_tree_weights))
+        else:
+            self._is_rooted_trees = header["is_rooted_trees"]
+            self.ignore_edge_lengths = header["ignore_edge_lengths"]
+            self.ignore_node_ages = header["ignore_node_ages"]
+            self.use_tree_weights = header["use_tree_weights"]
+
+        # split distribution
+        sd = self._split_distribution
+        unique_splits = _get_bitmasks("split_bitmasks")
+        for s, count in zip(unique_splits, _get_array("split_counts", "d")):
+            if count:
+                sd.split_counts[s] += count
+        for column_prefix, split_values in (
+                ("split_edge_length", sd.split_edge_lengths),
+                ("split_node_age", sd.split_node_ages),
+                ):
+            values = _as_values(_get_array(column_prefix + "s", "d"))
+            value_idx = 0
+            for s, num_values in zip(unique_splits, _get_array(column_prefix + "_counts", "I")):
+                if num_values:
+                    split_values[s].extend(values[value_idx:value_idx+num_values])
+                    value_idx += num_values
+        sd.total_trees_counted += header["total_trees_counted"]
+        sd.sum_of_tree_weights += header["sum_of_tree_weights"]
+        sd.tree_rooting_types_counted.update(header["tree_rooting_types_counted"])
+        sd._split_edge_length_summaries = None
+        sd._split_node_age_summaries = None
+        sd._trees_counted_for_summaries = 0
+
+        # trees
+        tree_split_indexes = _get_array("tree_split_indexes", "I")
+        tree_edge_lengths = _as_values(_get_array("tree_edge_lengths", "d"))
+        split_idx = 0
+        for num_splits in _get_array("tree_split_counts", "I"):
+            self._tree_split_bitmasks.append(tuple(unique_splits[i] for i in tree_split_indexes[split_idx:split_idx+num_splits]))
+            if self.ignore_edge_lengths:
+                self._tree_edge_lengths.append(tuple(None for x in range(num_splits)))
+            else:
+                self._tree_edge_lengths.append(tuple(tree_edge_lengths[split_idx:split_idx+num_splits]))
+            split_idx += num_splits
+        self._tree_leafset_bitmasks.extend(_get_bitmasks("tree_leafset_bitmasks"))
+        self._tree_weights.extend(tree_weights)
+        return len(tree_weights)
+
     ##############################################################################
     ## Container (List) Interface
 
@@ -2880,6 +3463,168 @@ class TreeArray(
         # return self._split_distribution.consensus_tree(*args, **kwargs)
         return tree
 
+    def greedy_consensus_tree(self,
+            min_freq=None,
+            summarize_splits=True,
+            **split_summarization_kwargs
+            ):
+        """
+        Returns a greedy consensus (or "extended majority-rule" consensus) tree
+        from splits in ``self``. See
+        :meth:`SplitDistribution.greedy_consensus_tree` for details.
+
+        Parameters
+        ----------
+
+        min_freq : real or |None|
+            The minimum frequency of a split in this distribution for it to be
+            considered for addition to the tree. If |None| (default), then all
+            splits are considered.
+
+        \*\*split_summarization_kwargs : keyword arguments
+            These will be passed directly to the underlying
+            `SplitDistributionSummarizer` object. See
+            :meth:`SplitDistributionSummarizer.configure` for options.
+
+        Returns
+        -------
+        t : greedy consensus tree
+
+        """
+        return self._split_distribution.greedy_consensus_tree(
+                min_freq=min_freq,
+                is_rooted=self.is_rooted_trees,
+                summarize_splits=summarize_splits,
+                **split_summarization_kwargs
+                )
+
+    ##############################################################################
+    ## Node Ages
+
+    def calc_node_age_vectors(self,
+            ultrametricity_precision=constants.DEFAULT_ULTRAMETRICITY_PRECISION,
+            is_force_max_age=False,
+            is_force_min_age=False):
+        """
+        Calculates the ages of the nodes of all the trees in the collection,
+        working directly on the split bitmasks and edge lengths stored for each
+        tree rather than on |Tree| objects. The age of each node is calculated
+        as by :meth:`Tree.calc_node_ages()`, except that deviations from
+        ultrametricity are collected and returned, rather than raising an
+        error at the first one found.
+
+        Tips are given an age of 0, or the age of their taxon in
+        ``taxon_label_age_map`` if this was specified when creating the
+        collection. Node ages can only be calculated on rooted trees.
+
+        Parameters
+        ----------
+        ultrametricity_precision : numeric or bool or None
+            Nodes for which the ages implied by the different child nodes
+            (i.e., the age of the child node plus the length of its edge)
+            differ by more than this are reported as deviating from
+            ultrametricity. If |None|, |False| or negative, deviations are not
+            checked.
+        is_force_max_age : bool
+            If |True|, then each node is set to the oldest age implied by its
+            child nodes, and deviations are not checked.
+        is_force_min_age : bool
+            If |True|, then each node is set to the youngest age implied by its
+            child nodes, and deviations are not checked.
+
+        Returns
+        -------
+        split_bitmasks : list[tuple[int]]
+            The split bitmasks of each tree, in postorder.
+        node_ages : list[``array.array``]
+            The ages of the nodes of each tree, aligned with the split bitmasks
+            of the tree in ``split_bitmasks``.
+        tree_heights : ``array.array``
+            The age of the root of each tree.
+        ultrametricity_deviations : list[tuple]
+            A tuple, (tree index, split bitmask, deviation), for each node of
+            each tree for which the ages implied by its child nodes differ by
+            more than ``ultrametricity_precision``, where ``deviation`` is the
+            largest absolute difference between the age implied by the first
+            child node (which is the age given to the node) and that implied
+            by any of the others.
+
+        Raises
+        ------
+        ValueError
+            If the trees are unrooted, edge lengths are ignored by the
+            collection, or the split bitmasks stored for a tree are not in
+            postorder.
+        """
+        if is_force_max_age and is_force_min_age:
+            raise ValueError("Cannot specify both 'is_force_max_age' and 'is_force_min_age'")
+        if self.ignore_edge_lengths:
+            raise ValueError("Edge lengths are ignored by this collection: cannot calculate node ages")
+        if len(self._tree_split_bitmasks) > 0 and not self._is_rooted_trees:
+            raise ValueError("Node ages can only be calculated on rooted trees")
+        is_check_ultrametricity = not (is_force_max_age
+                or is_force_min_age
+                or ultrametricity_precision is None
+                or ultrametricity_precision is False
+                or ultrametricity_precision < 0)
+        tip_ages = {}
+        if self.taxon_label_age_map:
+            for taxon in self.taxon_namespace:
+                tip_ages[self.taxon_namespace.taxon_bitmask(taxon)] = self.taxon_label_age_map.get(taxon.label, 0.0)
+        node_ages = []
+        tree_heights = array.array("d")
+        ultrametricity_deviations = []
+        for tree_idx, (split_bitmasks, edge_lengths) in enumerate(zip(self._tree_split_bitmasks, self._tree_edge_lengths)):
+            ages = array.array("d", [0.0]) * len(split_bitmasks)
+            # splits are in postorder, so the child nodes of each node are
+            # the subtrees at the top of the stack that it contains; the
+            # stack holds the index of the root of each subtree
+            stack = []
+            for split_idx, split_bitmask in enumerate(split_bitmasks):
+                implied_ages = []
+                children_bitmask = 0
+                while stack:
+                    child_split_bitmask = split_bitmasks[stack[-1]]
+                    if child_split_bitmask & split_bitmask != child_split_bitmask:
+                        break
+                    if child_split_bitmask & children_bitmask:
+                        raise ValueError("Split bitmasks of tree {} are not in postorder".format(tree_idx))
+                    children_bitmask |= child_split_bitmask
+                    child_idx = stack.pop()
+                    edge_length = edge_lengths[child_idx]
+                    if edge_length is None:
+                        edge_length = 0.0
+                    implied_ages.append(ages[child_idx] + edge_length)
+                # whatever the child nodes do not account for can only be the
+                # taxon of the node itself, if any
+                uncovered_bitmask = split_bitmask & ~children_bitmask
+                if uncovered_bitmask & (uncovered_bitmask - 1):
+                    raise ValueError("Split bitmasks of tree {} are not in postorder".format(tree_idx))
+                if not implied_ages:
+                    ages[split_idx] = tip_ages.get(split_bitmask, 0.0)
+                else:
+                    # (child nodes are popped in reverse order)
+                    if is_force_max_age:
+                        age = max(implied_ages)
+                    elif is_force_min_age:
+                        age = min(implied_ages)
+                    else:
+                        age = implied_ages[-1]
+                    ages[split_idx] = age
+                    if is_check_ultrametricity and len(implied_ages) > 1:
+                        deviation = max(abs(a - age) for a in implied_ages)
+                        if deviation > ultrametricity_precision:
+                            ultrametricity_deviations.append((tree_idx, split_bitmask, deviation))
+                stack.append(split_idx)
+            if len(stack) > 1:
+                raise ValueError("Split bitmasks of tree {} are not in postorder".format(tree_idx))
+            node_ages.append(ages)
+            if ages:
+                tree_heights.append(ages[-1])
+            else:
+                tree_heights.append(0.0)
+        return list(self._tree_split_bitmasks), node_ages, tree_heights, ultrametricity_deviations
+
     ##############################################################################
     ## Mapping of Split Support
 
@@ -2895,6 +3640,26 @@ class TreeArray(
             **kwargs
             )
 
+    def summarize_splits_on_trees(self,
+            trees,
+            is_bipartitions_updated=False,
+            num_processes=1,
+            chunk_size=100,
+            **kwargs):
+        """
+        Yields each tree in ``trees`` after decorating it with the support,
+        edge length and node age summaries of the splits in this collection,
+        optionally using multiple processes. See
+        :meth:`SplitDistribution.summarize_splits_on_trees` for details.
+        """
+        return self._split_distribution.summarize_splits_on_trees(
+            trees=trees,
+            is_bipartitions_updated=is_bipartitions_updated,
+            num_processes=num_processes,
+            chunk_size=chunk_size,
+            **kwargs
+            )
+
     ##############################################################################
     ## Tree Reconstructions
 
@@ -2925,6 +3690,46 @@ class TreeArray(
                     **split_summarization_kwargs)
         return tree
 
+    ##############################################################################
+    ## Tree Distances
+
+    def tree_distance_matrix(self,
+            metric="unweighted_robinson_foulds",
+            num_processes=1):
+        """
+        Returns the distances between all pairs of trees in the collection as
+        a condensed distance matrix. See
+        :func:`dendropy.calculate.treecompare.tree_distance_matrix` for details.
+
+        Parameters
+        ----------
+        metric : string
+            One of: "unweighted_robinson_foulds", "weighted_robinson_foulds",
+            or "euclidean". The weighted metrics use the edge lengths of the
+            trees, and so are not available if the collection is ignoring edge
+            lengths.
+        num_processes : int
+            Number of processes over which to distribute the calculations.
+
+        Returns
+        -------
+        d : ``array.array``
+            The distances between trees ``i`` and ``j``, ``i`` < ``j``, in
+            the order (0,1), (0,2), ..., (0,n-1), (1,2), ..., (n-2,n-1).
+        """
+        from dendropy.calculate import treecompare
+        if metric != treecompare.UNWEIGHTED_ROBINSON_FOULDS:
+            if self.ignore_edge_lengths:
+                raise ValueError("Edge lengths are ignored by this collection: cannot calculate '{}' distances".format(metric))
+            tree_split_weights = self._tree_edge_lengths
+        else:
+            tree_split_weights = None
+        return treecompare.split_bitmask_set_distance_matrix(
+                tree_split_bitmasks=self._tree_split_bitmasks,
+                tree_split_weights=tree_split_weights,
+                metric=metric,
+                num_processes=num_processes)
+
     ##############################################################################
     ## Topology Frequencies
 
@@ -2934,17 +3739,37 @@ class TreeArray(
         being the frequency of occurrence of trees represented by those split
         bitmask sets in the collection.
         """
-        split_bitmask_set_count_map = collections.Counter()
-        assert len(self._tree_split_bitmasks) == len(self._tree_weights)
-        for split_bitmask_set, weight in zip(self._tree_split_bitmasks, self._tree_weights):
-            split_bitmask_set_count_map[frozenset(split_bitmask_set)] += (1.0 * weight)
         split_bitmask_set_freqs = {}
         normalization_weight = self._split_distribution.calc_normalization_weight()
-        # print("===> {}".format(normalization_weight))
-        for split_bitmask_set in split_bitmask_set_count_map:
-            split_bitmask_set_freqs[split_bitmask_set] = split_bitmask_set_count_map[split_bitmask_set] / normalization_weight
+        for split_bitmasks, weight in self._topology_weights().values():
+            split_bitmask_set_freqs[frozenset(split_bitmasks)] = weight / normalization_weight
         return split_bitmask_set_freqs
 
+    def _topology_weights(self):
+        """
+        Returns a dictionary with values being a list of the (canonical) split
+        bitmasks of each distinct topology in the collection and the total
+        weight of the trees with that topology. Topologies are keyed by the
+        fingerprint of their split bitmasks, which is verified against the
+        split bitmasks of the first tree with that fingerprint; in the
+        (extremely unlikely) event of a collision, a topology is keyed by its
+        split bitmasks instead.
+        """
+        topology_weights = {}
+        assert len(self._tree_split_bitmasks) == len(self._tree_weights)
+        for split_bitmasks, weight in zip(self._tree_split_bitmasks, self._tree_weights):
+            split_bitmasks = bitprocessing.canonical_split_bitmask_set(split_bitmasks)
+            key = bitprocessing.split_bitmask_set_fingerprint(split_bitmasks)
+            entry = topology_weights.get(key, None)
+            if entry is not None and entry[0] != split_bitmasks:
+                key = split_bitmasks
+                entry = topology_weights.get(key, None)
+            if entry is None:
+                topology_weights[key] = [split_bitmasks, 1.0 * weight]
+            else:
+                entry[1] += weight
+        return topology_weights
+
     def bipartition_encoding_frequencies(self):
         """
         Returns a dictionary with keys being bipartition encodings of trees
@@ -3005,11 +3830,12 @@ class TreeArray(
         """
         if sort_descending is not None and frequency_attr_name is None:
                 raise ValueError("Attribute needs to be set on topologies to enable sorting")
-        split_bitmask_set_freqs = self.split_bitmask_set_frequencies()
+        normalization_weight = self._split_distribution.calc_normalization_weight()
         topologies = TreeList(taxon_namespace=self.taxon_namespace)
-        for split_bitmask_set, freq in split_bitmask_set_freqs.items():
+        for split_bitmasks, weight in self._topology_weights().values():
+            freq = weight / normalization_weight
             tree = self.tree_type.from_split_bitmasks(
-                    split_bitmasks=split_bitmask_set,
+                    split_bitmasks=split_bitmasks,
                     taxon_namespace=self.taxon_namespace,
                     is_rooted=self._is_rooted_trees,
                     )
@@ -27,6 +27,7 @@ import math
 from dendropy.utility.textprocessing import StringIO
 import copy
 import sys
+import os
 from dendropy.utility import GLOBAL_RNG
 from dendropy.utility import container
 from dendropy.utility import terminal
@@ -2841,6 +2842,74 @@ class Tree(
         return tree_yielder
     yield_from_files = classmethod(yield_from_files)
 
+    def write_trees(cls,
+            trees,
+            dest,
+            schema,
+            taxon_namespace=None,
+            **kwargs):
+        """
+        Writes trees to a destination as they are drawn from ``trees``,
+        instead of requiring that all of them be collected into a |TreeList|
+        first.
+
+        This is the writing counterpart to :meth:`Tree.yield_from_files`: for
+        the "newick" and "nexus" schemas, the file header, "TAXA" block and
+        translate statement (as applicable) are written once, and then each
+        tree statement is written as the tree is obtained, so that the number
+        of trees that can be written is not limited by memory.
+
+        Parameters
+        ----------
+        trees : iterable of |Tree| objects
+            The trees to be written, e.g. a list of trees or a generator that
+            yields trees one at a time. All trees must reference the same
+            |TaxonNamespace|. For the "nexus" schema, this must already hold
+            all the taxa of the trees when the first tree is drawn, as these
+            are declared (in the "TAXA" block and translate statement) before
+            the trees are written: a `ValueError` is raised for a tree drawn
+            after taxa were added to the |TaxonNamespace| (e.g., by
+            :meth:`Tree.yield_from_files` reading a source without a "TAXA"
+            block), leaving the trees written before it, in a complete
+            "TREES" block. To avoid this, read the taxa into a
+            |TaxonNamespace| first, and pass it as ``taxon_namespace`` to
+            both.
+        dest : string or file-like object
+            If a string, then it is assumed to be a path to a file to which
+            the trees will be written. Otherwise, it is assumed to be a
+            file-like object open for writing.
+        schema : string
+            The name of the data format (e.g., "newick" or "nexus").
+        taxon_namespace : |TaxonNamespace| instance
+            The |TaxonNamespace| referenced by the trees. If not given, that
+            of the first tree is used.
+        \*\*kwargs : keyword arguments
+            These will be passed directly to the writer for the schema. See
+            documentation for details on keyword arguments supported by
+            writers of various schemas.
+
+        Examples
+        --------
+
+        ::
+
+            trees = dendropy.Tree.yield_from_files(
+                    files=["path/to/trees1.nex", "path/to/trees2.nex"],
+                    schema="nexus")
+            dendropy.Tree.write_trees(
+                    trees=(tree for tree in trees if tree.is_rooted),
+                    dest="path/to/rooted.nex",
+                    schema="nexus")
+
+        """
+        writer = dataio.get_writer(schema, **kwargs)
+        if textprocessing.is_str_type(dest):
+            with open(os.path.expandvars(os.path.expanduser(dest)), "w") as f:
+                writer.write_trees(trees=trees, stream=f, taxon_namespace=taxon_namespace)
+        else:
+            writer.write_trees(trees=trees, stream=dest, taxon_namespace=taxon_namespace)
+    write_trees = classmethod(write_trees)
+
     def from_bipartition_encoding(
             cls,
             bipartition_encoding,
@@ -2909,7 +2978,10 @@ class Tree(
             tree will be skipped. So if not all splits are compatible
             with each other, then the sequence of splits given in
             ``bipartition_encoding`` should be in order of their support values
-            or some other preference criteria.
+            or some other preference criteria. If all splits are compatible
+            with each other, the tree is built in O(n log n) time by attaching
+            each split to its smallest containing cluster in order of
+            increasing size.
         taxon_namespace : |TaxonNamespace| instance
             The operational taxonomic unit concept namespace to use to manage
             taxon definitions.
@@ -2924,87 +2996,173 @@ class Tree(
         |Tree|
             The tree reconstructed from the given bipartition encoding.
         """
-        leaf_to_root_search = True
-        reconstructed_tree = cls(taxon_namespace=taxon_namespace)
-        # reconstructed_tree.is_rooted = True
-        reconstructed_tree.is_rooted = is_rooted
-        for taxon in taxon_namespace:
-            reconstructed_tree.seed_node.new_child(taxon=taxon)
         all_taxa_bitmask = taxon_namespace.all_taxa_bitmask()
-        reconstructed_tree.encode_bipartitions()
-        reconstructed_tree.bipartition_encoding = []
-        leaves = reconstructed_tree.leaf_nodes()
-        if leaf_to_root_search:
-            to_leaf_dict = {}
-            for leaf in leaves:
-                to_leaf_dict[leaf.edge.bipartition.leafset_bitmask] = leaf
-        root = reconstructed_tree.seed_node
-        root_edge = root.edge
-
         split_bitmasks_to_add = []
+        source_split_bitmasks = {}
         for s in split_bitmasks:
             m = s & all_taxa_bitmask
-            if (m != all_taxa_bitmask) and ((m-1) & m): # if not root (i.e., all "1's") and not singleton (i.e., one "1")
-                if is_rooted:
-                    split_bitmasks_to_add.append(m)
-                else:
-                    if 1 & m:
-                        split_bitmasks_to_add.append( (~m) & all_taxa_bitmask )
-                    else:
-                        # "denormalize" split_bitmasks
-                        split_bitmasks_to_add.append(m)
-
-        # Now when we add split_bitmasks in order, we will do a greedy, extended majority-rule consensus tree
-        #for freq, split_to_add, split_in_dict in to_try_to_add:
-        _get_mask = lambda x: getattr(x.bipartition, "_leafset_bitmask")
-        for split_to_add in split_bitmasks_to_add:
-            if (split_to_add & root_edge.bipartition.leafset_bitmask) != split_to_add:
-                # incompatible
-                continue
-            elif leaf_to_root_search:
-                lb = bitprocessing.least_significant_set_bit(split_to_add)
-                one_leaf = to_leaf_dict[lb]
-                parent_node = one_leaf
-                while (split_to_add & parent_node.edge.bipartition.leafset_bitmask) != split_to_add:
-                    parent_node = parent_node.parent_node
+            if not is_rooted and (1 & m):
+                # "denormalize" split_bitmasks
+                m = (~m) & all_taxa_bitmask
+            if (m != all_taxa_bitmask) and ((m-1) & m) and (m not in source_split_bitmasks): # if not root (i.e., all "1's") and not singleton (i.e., one "1") and not already added
+                source_split_bitmasks[m] = s
+                split_bitmasks_to_add.append(m)
+
+        # Splits are attached in order of increasing size, which is only valid
+        # if all of them are mutually compatible. If they are not, then we
+        # fall back to adding them in the order given, i.e., to a greedy,
+        # extended majority-rule consensus tree.
+        child_split_bitmasks = cls._nest_split_bitmasks(
+                split_bitmasks=split_bitmasks_to_add,
+                all_taxa_bitmask=all_taxa_bitmask)
+        if child_split_bitmasks is None:
+            split_bitmasks_to_add = cls.greedy_compatible_split_bitmasks(
+                    split_bitmasks=split_bitmasks_to_add,
+                    all_taxa_bitmask=all_taxa_bitmask,
+                    is_rooted=True)
+            child_split_bitmasks = cls._nest_split_bitmasks(
+                    split_bitmasks=split_bitmasks_to_add,
+                    all_taxa_bitmask=all_taxa_bitmask)
+
+        reconstructed_tree = cls(taxon_namespace=taxon_namespace)
+        reconstructed_tree.is_rooted = is_rooted
+        nodes = {}
+        for taxon in taxon_namespace:
+            nodes[taxon_namespace.taxon_bitmask(taxon)] = cls.node_factory(taxon=taxon)
+        for split_to_add in sorted(child_split_bitmasks, key=bitprocessing.num_set_bits):
+            if split_to_add == all_taxa_bitmask:
+                new_node = reconstructed_tree.seed_node
             else:
-                parent_node = reconstructed_tree.mrca(split_bitmask=split_to_add)
-            if parent_node is None or parent_node.edge.bipartition.leafset_bitmask == split_to_add:
-                continue # split is not in tree, or already in tree.
-            new_node = cls.node_factory()
-            #self.map_split_support_to_node(node=new_node, split_support=freq)
-            new_node_children = []
-            new_edge = new_node.edge
-            new_mask = 0
-            for child in parent_node.child_nodes():
-                # might need to modify the following if rooted split_bitmasks
-                # are used
-                cecm = child.edge.bipartition.leafset_bitmask
-                if (cecm & split_to_add):
-                    assert cecm != split_to_add
-                    new_mask |= cecm
-                    new_node_children.append(child)
-                    new_edge.bipartition = Bipartition(
-                            leafset_bitmask=new_mask,
-                            tree_leafset_bitmask=all_taxa_bitmask,
-                            is_mutable=False,
-                            compile_bipartition=True)
-                    reconstructed_tree.bipartition_encoding.append(new_edge.bipartition)
-            # Check to see if we have accumulated all of the bits that we
-            #   needed, but none that we don't need.
-            if new_edge.bipartition.leafset_bitmask == split_to_add:
+                new_node = cls.node_factory()
+                nodes[split_to_add] = new_node
                 if split_edge_lengths:
-                    new_edge.length = split_edge_lengths[split_to_add]
-                    #old_split = new_old_split_map[split_to_add]
-                    #new_edge.length = split_edge_lengths[old_split]
-                for child in new_node_children:
-                    parent_node.remove_child(child)
-                    new_node.add_child(child)
-                parent_node.add_child(new_node)
-                # reconstructed_tree.split_edge_map[split_to_add] = new_edge
+                    new_node.edge.length = split_edge_lengths[source_split_bitmasks[split_to_add]]
+            # children are new nodes, so we bypass the membership checks of
+            # ``Node.add_child()``
+            for child_split_bitmask in child_split_bitmasks[split_to_add]:
+                child = nodes[child_split_bitmask]
+                child._parent_node = new_node
+                new_node._child_nodes.append(child)
+        reconstructed_tree.encode_bipartitions(
+                suppress_unifurcations=False,
+                collapse_unrooted_basal_bifurcation=False)
         return reconstructed_tree
     from_split_bitmasks = classmethod(from_split_bitmasks)
 
+    def _nest_split_bitmasks(cls, split_bitmasks, all_taxa_bitmask):
+        """
+        Returns a dictionary mapping each of the (distinct, non-trivial,
+        rooted) split bitmasks in ``split_bitmasks``, as well as
+        ``all_taxa_bitmask``, to the list of bitmasks of its immediate
+        children, or |None| if the splits are not all mutually compatible.
+
+        Splits are processed in order of increasing size. Each cluster that
+        has not yet been assigned a parent is identified by its least
+        significant leaf bit, so the children of a split are found directly
+        from the set bits of ``open_clusters & split`` rather than by
+        searching the clusters built so far: each cluster is visited once
+        as a child, and the construction costs O(n log n) for sorting
+        followed by time linear in the number of splits and leaves.
+        """
+        open_clusters = all_taxa_bitmask
+        cluster_of = {}
+        for leaf_index in bitprocessing.indexes_of_set_bits(all_taxa_bitmask):
+            leaf_bitmask = 1 << leaf_index
+            cluster_of[leaf_bitmask] = leaf_bitmask
+        child_split_bitmasks = {}
+        for split_to_add in sorted(split_bitmasks, key=bitprocessing.num_set_bits) + [all_taxa_bitmask]:
+            children = []
+            leafset_bitmask = 0
+            to_visit = open_clusters & split_to_add
+            while to_visit:
+                lb = to_visit & -to_visit
+                to_visit ^= lb
+                child_split_bitmask = cluster_of.pop(lb)
+                if (child_split_bitmask | split_to_add) != split_to_add:
+                    return None
+                leafset_bitmask |= child_split_bitmask
+                children.append(child_split_bitmask)
+            if leafset_bitmask != split_to_add:
+                return None
+            open_clusters &= ~leafset_bitmask
+            lb = split_to_add & -split_to_add
+            open_clusters |= lb
+            cluster_of[lb] = split_to_add
+            child_split_bitmasks[split_to_add] = children
+        return child_split_bitmasks
+    _nest_split_bitmasks = classmethod(_nest_split_bitmasks)
+
+    def greedy_compatible_split_bitmasks(
+            split_bitmasks,
+            all_taxa_bitmask,
+            is_rooted=False):
+        """
+        Returns the list of split bitmasks that are compatible with all split
+        bitmasks preceding them in ``split_bitmasks``.
+
+        A hierarchy of clusters is built up as splits are accepted, with each
+        cluster linked to its smallest containing cluster. A candidate split is
+        located in the hierarchy by walking up from the cluster of its first
+        leaf to the smallest accepted cluster containing it, and is compatible
+        with all accepted splits if, and only if, each of the child clusters of
+        this cluster is either a subset of or disjoint with the candidate.
+
+        Parameters
+        ----------
+        split_bitmasks : iterable[int]
+            Split bitmasks in order of preference.
+        all_taxa_bitmask : int
+            Bitmask with bits set for all leaves.
+        is_rooted : bool
+            If |False| or |None|, splits are treated as unrooted bipartitions.
+
+        Returns
+        -------
+        s : list[int]
+            Non-trivial split bitmasks that were accepted, in order of
+            acceptance. For unrooted trees, these will be in the "denormalized"
+            form: the side of the bipartition not containing the first leaf.
+        """
+        parent_of = {}
+        children_of = {all_taxa_bitmask: []}
+        for leaf_index in bitprocessing.indexes_of_set_bits(all_taxa_bitmask):
+            leaf_bitmask = 1 << leaf_index
+            parent_of[leaf_bitmask] = all_taxa_bitmask
+            children_of[all_taxa_bitmask].append(leaf_bitmask)
+        accepted = []
+        for split_bitmask in split_bitmasks:
+            m = split_bitmask & all_taxa_bitmask
+            if not is_rooted and (m & 1):
+                m = (~m) & all_taxa_bitmask
+            if (not m) or (m == all_taxa_bitmask) or not ((m-1) & m) or (m in parent_of):
+                # empty, root, singleton or already added
+                continue
+            enclosing = parent_of[m & -m]
+            while (enclosing & m) != m:
+                enclosing = parent_of[enclosing]
+            inside = []
+            outside = []
+            for child in children_of[enclosing]:
+                if child & m:
+                    if (child | m) != m:
+                        # overlaps without nesting: incompatible
+                        inside = None
+                        break
+                    inside.append(child)
+                else:
+                    outside.append(child)
+            if inside is None:
+                continue
+            outside.append(m)
+            children_of[enclosing] = outside
+            children_of[m] = inside
+            parent_of[m] = enclosing
+            for child in inside:
+                parent_of[child] = m
+            accepted.append(m)
+        return accepted
+    greedy_compatible_split_bitmasks = staticmethod(greedy_compatible_split_bitmasks)
+
     def node_factory(cls, **kwargs):
         """
         Creates and returns a |Node| object.
@@ -5599,75 +5757,89 @@ class Tree(
         if is_force_max_age and is_force_min_age:
             raise ValueError("Cannot specify both 'is_force_max_age' and 'is_force_min_age'")
         for node in self.postorder_node_iter():
-            child_nodes = node.child_nodes()
             if set_node_age_fn is not None:
                 node.age = set_node_age_fn(node)
                 # print("Setting node age: {} = {}".format(node.taxon, node.age))
                 if node.age is not None:
                     continue
-            if len(child_nodes) == 0:
-               node.age = 0.0
-               if not is_return_internal_node_ages_only:
-                   ages.append(node.age)
-            else:
-                if is_force_max_age:
-                    age_to_set = max([ (child.age + child.edge.length) for child in child_nodes ])
-                elif is_force_min_age:
-                    age_to_set = min([ (child.age + child.edge.length) for child in child_nodes ])
-                else:
-                    first_child = child_nodes[0]
-                    if first_child.edge.length is not None and first_child.age is not None:
-                        age_to_set = first_child.age + first_child.edge.length
-                    elif first_child.edge.length is None:
-                        first_child.edge.length = 0.0
-                        age_to_set = first_child.age
-                    elif first_child.age is None:
-                        first_child.age = 0.0
-                        age_to_set = first_child.edge.length
-                    else:
-                        age_to_set = 0.0
-                node.age = age_to_set
-                if not (is_force_max_age or is_force_min_age or ultrametricity_precision is None or ultrametricity_precision is False or ultrametricity_precision < 0):
-                    for nnd in child_nodes[1:]:
-                        try:
-                            ocnd = nnd.age + nnd.edge.length
-                        except TypeError:
-                            nnd.edge.length = 0.0
-                            ocnd = nnd.age
-                        d = abs(node.age - ocnd)
-                        if  d > ultrametricity_precision:
-                            # try:
-                            #     self.encode_bipartitions()
-                            #     node_id = nnd.bipartition.split_as_newick_string(taxon_namespace=self.taxon_namespace)
-                            # except OSError:
-                            #     node_id = str(nnd)
-                            node_id = str(node)
-                            subtree = node._as_newick_string()
-                            desc = []
-                            for desc_nd in child_nodes:
-                                desc.append("-   {}: has age of {} and edge length of {}, resulting in parent node age of {}".format(
-                                    desc_nd,
-                                    desc_nd.age,
-                                    desc_nd.edge.length,
-                                    desc_nd.edge.length + desc_nd.age))
-                            desc = "\n".join(desc)
-                            raise error.UltrametricityError(
-                                    ("Tree is not ultrametric within threshold of {threshold}: {deviance}.\n"
-                                     "Encountered in subtree of node {node} (edge length of {length}):\n"
-                                     "\n    {subtree}\n\n"
-                                     "Age of children:\n"
-                                     "{desc}"
-                                     ).format(
-                                threshold=ultrametricity_precision,
-                                deviance=d,
-                                node=node_id,
-                                length=node.edge.length,
-                                desc=desc,
-                                subtree=subtree,
-                                ))
+            self._calc_node_age(
+                    node=node,
+                    ultrametricity_precision=ultrametricity_precision,
+                    is_force_max_age=is_force_max_age,
+                    is_force_min_age=is_force_min_age)
+            if node._child_nodes or not is_return_internal_node_ages_only:
                 ages.append(node.age)
         return ages
 
+    def _calc_node_age(self,
+            node,
+            ultrametricity_precision,
+            is_force_max_age,
+            is_force_min_age):
+        """
+        Sets the age of ``node`` given the ages of its children, which must
+        already have been set (see :meth:`Tree.calc_node_ages()`).
+        """
+        child_nodes = node._child_nodes
+        if len(child_nodes) == 0:
+            node.age = 0.0
+            return
+        if is_force_max_age:
+            age_to_set = max([ (child.age + child.edge.length) for child in child_nodes ])
+        elif is_force_min_age:
+            age_to_set = min([ (child.age + child.edge.length) for child in child_nodes ])
+        else:
+            first_child = child_nodes[0]
+            if first_child.edge.length is not None and first_child.age is not None:
+                age_to_set = first_child.age + first_child.edge.length
+            elif first_child.edge.length is None:
+                first_child.edge.length = 0.0
+                age_to_set = first_child.age
+            elif first_child.age is None:
+                first_child.age = 0.0
+                age_to_set = first_child.edge.length
+            else:
+                age_to_set = 0.0
+        node.age = age_to_set
+        if not (is_force_max_age or is_force_min_age or ultrametricity_precision is None or ultrametricity_precision is False or ultrametricity_precision < 0):
+            for nnd in child_nodes[1:]:
+                try:
+                    ocnd = nnd.age + nnd.edge.length
+                except TypeError:
+                    nnd.edge.length = 0.0
+                    ocnd = nnd.age
+                d = abs(node.age - ocnd)
+                if  d > ultrametricity_precision:
+                    # try:
+                    #     self.encode_bipartitions()
+                    #     node_id = nnd.bipartition.split_as_newick_string(taxon_namespace=self.taxon_namespace)
+                    # except OSError:
+                    #     node_id = str(nnd)
+                    node_id = str(node)
+                    subtree = node._as_newick_string()
+                    desc = []
+                    for desc_nd in child_nodes:
+                        desc.append("-   {}: has age of {} and edge length of {}, resulting in parent node age of {}".format(
+                            desc_nd,
+                            desc_nd.age,
+                            desc_nd.edge.length,
+                            desc_nd.edge.length + desc_nd.age))
+                    desc = "\n".join(desc)
+                    raise error.UltrametricityError(
+                            ("Tree is not ultrametric within threshold of {threshold}: {deviance}.\n"
+                             "Encountered in subtree of node {node} (edge length of {length}):\n"
+                             "\n    {subtree}\n\n"
+                             "Age of children:\n"
+                             "{desc}"
+                             ).format(
+                        threshold=ultrametricity_precision,
+                        deviance=d,
+                        node=node_id,
+                        length=node.edge.length,
+                        desc=desc,
+                        subtree=subtree,
+                        ))
+
     def calc_node_root_distances(self, return_leaf_distances_only=True):
         """
         Adds attribute "root_distance" to each node, with value set to the
@@ -5831,6 +6003,121 @@ class Tree(
             representing the structure of this tree, or, if ``suppress_storage``
             is |True|, then |None|.
 
+        """
+        if self._encode_bipartitions(
+                suppress_unifurcations=suppress_unifurcations,
+                collapse_unrooted_basal_bifurcation=collapse_unrooted_basal_bifurcation,
+                suppress_storage=suppress_storage,
+                is_bipartitions_mutable=is_bipartitions_mutable) is None:
+            return
+        return self.bipartition_encoding
+
+    def encode_bipartitions_and_calc_node_ages(self,
+            ultrametricity_precision=constants.DEFAULT_ULTRAMETRICITY_PRECISION,
+            is_force_max_age=False,
+            is_force_min_age=False,
+            set_node_age_fn=None,
+            is_calc_node_ages=True,
+            suppress_unifurcations=True,
+            collapse_unrooted_basal_bifurcation=True,
+            is_bipartitions_mutable=False):
+        """
+        Calculates the bipartitions of this tree as
+        :meth:`Tree.encode_bipartitions()` does, along with the ages of its
+        nodes as :meth:`Tree.calc_node_ages()` does, in a single postorder
+        traversal of the tree, and returns the bipartitions together with the
+        lengths of the edges and the ages of the nodes they correspond to.
+
+        Parameters
+        ----------
+        ultrametricity_precision : numeric or bool or None
+            See :meth:`Tree.calc_node_ages()`.
+        is_force_max_age: bool
+            See :meth:`Tree.calc_node_ages()`.
+        is_force_min_age: bool
+            See :meth:`Tree.calc_node_ages()`.
+        set_node_age_fn: function object
+            See :meth:`Tree.calc_node_ages()`.
+        is_calc_node_ages : bool
+            If |False|, then node ages are not calculated, and only the
+            bipartitions and edge lengths are returned.
+        suppress_unifurcations : bool
+            See :meth:`Tree.encode_bipartitions()`.
+        collapse_unrooted_basal_bifurcation: bool
+            See :meth:`Tree.encode_bipartitions()`.
+        is_bipartitions_mutable : bool
+            See :meth:`Tree.encode_bipartitions()`.
+
+        Returns
+        -------
+        b : list[|Bipartition|]
+            The bipartitions of this tree (also assigned to
+            ``self.bipartition_encoding``).
+        e : list[numeric]
+            The lengths of the edges corresponding to each of the
+            bipartitions in ``b``.
+        a : list[numeric] or |None|
+            The ages of the head nodes of the edges corresponding to each of
+            the bipartitions in ``b``, or |None| if ``is_calc_node_ages`` is
+            |False|.
+        """
+        if is_calc_node_ages:
+            if is_force_max_age and is_force_min_age:
+                raise ValueError("Cannot specify both 'is_force_max_age' and 'is_force_min_age'")
+            if (collapse_unrooted_basal_bifurcation
+                    and not self._is_rooted
+                    and self.seed_node is not None
+                    and len(self.seed_node._child_nodes) == 2):
+                # collapsing the basal bifurcation shifts the length of one
+                # of the basal edges onto the other, so ages must be
+                # calculated on the tree as given, before it is collapsed
+                self.calc_node_ages(
+                        ultrametricity_precision=ultrametricity_precision,
+                        is_force_max_age=is_force_max_age,
+                        is_force_min_age=is_force_min_age,
+                        set_node_age_fn=set_node_age_fn)
+                calc_node_age_fn = None
+            else:
+                def calc_node_age_fn(node):
+                    if set_node_age_fn is not None:
+                        node.age = set_node_age_fn(node)
+                        if node.age is not None:
+                            return
+                    self._calc_node_age(
+                            node=node,
+                            ultrametricity_precision=ultrametricity_precision,
+                            is_force_max_age=is_force_max_age,
+                            is_force_min_age=is_force_min_age)
+        else:
+            calc_node_age_fn = None
+        edges = self._encode_bipartitions(
+                suppress_unifurcations=suppress_unifurcations,
+                collapse_unrooted_basal_bifurcation=collapse_unrooted_basal_bifurcation,
+                suppress_storage=False,
+                is_bipartitions_mutable=is_bipartitions_mutable,
+                calc_node_age_fn=calc_node_age_fn)
+        if edges is None:
+            return [], [], ([] if is_calc_node_ages else None)
+        bipartitions = self.bipartition_encoding
+        edge_lengths = [edge.length for edge in edges]
+        if is_calc_node_ages:
+            node_ages = [edge._head_node.age for edge in edges]
+        else:
+            node_ages = None
+        return bipartitions, edge_lengths, node_ages
+
+    def _encode_bipartitions(self,
+            suppress_unifurcations,
+            collapse_unrooted_basal_bifurcation,
+            suppress_storage,
+            is_bipartitions_mutable,
+            calc_node_age_fn=None):
+        """
+        Calculates the bipartitions of this tree (see
+        :meth:`Tree.encode_bipartitions()`), calling ``calc_node_age_fn``, if
+        given, on each node retained in the tree, in postorder, and returns
+        the edges to which the bipartitions were assigned, or |None| if the
+        tree is empty.
         """
         self._split_bitmask_edge_map = None
         self._bipartition_edge_map = None
@@ -5888,6 +6175,8 @@ class Tree(
                 edge.bipartition = Bipartition(compile_bipartition=False, is_mutable=True)
                 edge.bipartition._leafset_bitmask = leafset_bitmask
                 edge.bipartition._is_rooted = self._is_rooted
+                if calc_node_age_fn is not None:
+                    calc_node_age_fn(head_node)
         # Create normalized bitmasks, where the full (self) bipartition mask is *not*
         # all the taxa, but only those found on the self; this is to handle
         # cases where we are dealing with selfs with incomplete leaf-sets.
@@ -5903,7 +6192,7 @@ class Tree(
         else:
             # self.bipartition_encoding = dict(zip(map(self._compile_bipartition_for_edge, tree_edges), tree_edges))
             self.bipartition_encoding = list(map(_compile_bipartition, tree_edges))
-        return self.bipartition_encoding
+        return tree_edges
 
     def update_bipartitions(self, *args, **kwargs):
         """
@@ -306,12 +306,671 @@ def fitch_up_pass(
         setattr(nd, state_sets_attr_name, result)
 
 
+###############################################################################
+## Bit-parallel Fitch parsimony
+
+try:
+    _popcount = int.bit_count
+except AttributeError:
+    def _popcount(x):
+        return bin(x).count("1")
+
+def _set_bit_indexes(x):
+    """
+    Returns list of indexes of bits set in non-negative integer ``x``.
+    """
+    bits = bin(x)[:1:-1] # least significant bit first, without the "0b"
+    indexes = []
+    idx = bits.find("1")
+    while idx >= 0:
+        indexes.append(idx)
+        idx = bits.find("1", idx+1)
+    return indexes
+
+class BitParallelFitch(object):
+    """
+    Fitch (1971) unordered parsimony, evaluated for all characters at once.
+
+    The state sets of a node are encoded as a list of (arbitrarily large)
+    integers, one for each fundamental state, in which bit $i$ is set if the
+    state set of character (or site pattern) $i$ includes that state. The
+    intersections, unions, and counts of steps of the Fitch algorithm are
+    then calculated for all characters with a handful of integer bitwise
+    operations per node, instead of a loop over the characters. The data is
+    encoded once, when the object is created, so that any number of trees
+    can be scored against it.
+
+    Scores are the same as those of :func:`fitch_down_pass()` and
+    :func:`parsimony_score()`.
+
+    Examples
+    --------
+
+    ::
+
+        chars = dendropy.DnaCharacterMatrix.get(
+                path="pythonidae.chars.nexus",
+                schema="nexus",
+                taxon_namespace=taxon_namespace)
+        trees = dendropy.TreeList.get(
+                path="pythonidae.mb.run1.t",
+                schema="nexus",
+                taxon_namespace=taxon_namespace)
+        fitch = BitParallelFitch(char_matrix=chars, gaps_as_missing=False)
+        scores = [fitch.score(tree) for tree in trees]
+
+    """
+
+    def __init__(self,
+            char_matrix=None,
+            taxon_state_sets_map=None,
+            gaps_as_missing=True,
+            weights=None,
+            compress_site_patterns=True):
+        """
+        Parameters
+        ----------
+        char_matrix : |DiscreteCharacterMatrix|
+            The data to be scored. Exactly one of ``char_matrix`` or
+            ``taxon_state_sets_map`` must be specified.
+        taxon_state_sets_map : dict[taxon] = state sets
+            A dictionary that takes a taxon object as a key and returns a state
+            set list as a value, e.g., as returned by
+            :meth:`DiscreteCharacterMatrix.taxon_state_sets_map()`.
+        gaps_as_missing : bool
+            If |True| [default], then gaps will be treated as missing data.
+            If |False|, then gaps will be treated as a new/additional state.
+            Only used with ``char_matrix``.
+        weights : iterable
+            A list of weights for each character (column). If not given, all
+            characters have a weight of 1.
+        compress_site_patterns : bool
+            If |True| [default], then each distinct site pattern of
+            ``char_matrix`` is encoded only once, and weighted by its number
+            of sites (see :meth:`DiscreteCharacterMatrix.site_patterns()`).
+            Only used with ``char_matrix``.
+        """
+        if (char_matrix is None) == (taxon_state_sets_map is None):
+            raise TypeError("Exactly one of 'char_matrix' or 'taxon_state_sets_map' must be specified")
+        self.site_patterns = None
+        if char_matrix is not None:
+            self._encode_char_matrix(
+                    char_matrix=char_matrix,
+                    gaps_as_missing=gaps_as_missing,
+                    compress_site_patterns=compress_site_patterns)
+        else:
+            self._encode_taxon_state_sets_map(taxon_state_sets_map)
+        if self.site_patterns is not None:
+            self.num_characters = self.site_patterns.num_sites
+        else:
+            self.num_characters = self.num_columns
+        self._all_columns_mask = (1 << self.num_columns) - 1
+        self.set_weights(weights)
+
+    def set_weights(self, weights):
+        """
+        Sets the weights of the characters, without encoding the data anew:
+        e.g., to score trees against each of a series of bootstrap
+        replicates (see :meth:`DiscreteCharacterMatrix.bootstrap_replicates()`).
+
+        Parameters
+        ----------
+        weights : iterable
+            A list of weights for each character (column). If |None|, all
+            characters have a weight of 1.
+        """
+        if weights is not None:
+            weights = list(weights)
+            if len(weights) != self.num_characters:
+                raise ValueError("Expecting {} weights, but found {}".format(self.num_characters, len(weights)))
+        self._character_weights = weights
+        if self.site_patterns is not None:
+            if weights is None:
+                column_weights = self.site_patterns.weights
+            else:
+                column_weights = [0] * self.num_columns
+                for weight, idx in zip(weights, self.site_patterns.site_pattern_indices):
+                    column_weights[idx] += weight
+        else:
+            column_weights = weights
+        self._column_weight_masks = self._build_weight_masks(column_weights)
+
+    def _encode_char_matrix(self, char_matrix, gaps_as_missing, compress_site_patterns):
+        site_patterns = char_matrix.site_patterns()
+        if compress_site_patterns:
+            self.site_patterns = site_patterns
+            columns = site_patterns.patterns
+        else:
+            columns = site_patterns.expand(site_patterns.patterns)
+        if gaps_as_missing:
+            code_states = [state.fundamental_indexes_with_gaps_as_missing for state in site_patterns.states]
+        else:
+            code_states = [state.fundamental_indexes for state in site_patterns.states]
+        self.states = sorted(set(s for states in code_states for s in states))
+        self.num_columns = len(columns)
+        self.taxon_state_bitsets_map = {}
+        if columns:
+            rows = list(zip(*columns))
+        else:
+            rows = [() for taxon in site_patterns.taxa]
+        use_translate = len(code_states) <= 256
+        for taxon, row in zip(site_patterns.taxa, rows):
+            if use_translate:
+                row = bytearray(row)
+            bitsets = []
+            for state in self.states:
+                if use_translate:
+                    table = bytes(bytearray((ord("1") if state in states else ord("0")) for states in code_states))
+                    table = table + (b"0" * (256 - len(table)))
+                    bits = row.translate(table).decode("ascii")
+                else:
+                    bits = "".join("1" if state in code_states[code] else "0" for code in row)
+                bitsets.append(int(bits[::-1], 2) if bits else 0)
+            self.taxon_state_bitsets_map[taxon] = bitsets
+
+    def _encode_taxon_state_sets_map(self, taxon_state_sets_map):
+        self.states = sorted(set(s for state_sets in taxon_state_sets_map.values() for ss in state_sets for s in ss))
+        self.num_columns = None
+        self.taxon_state_bitsets_map = {}
+        for taxon in taxon_state_sets_map:
+            state_sets = taxon_state_sets_map[taxon]
+            if self.num_columns is None:
+                self.num_columns = len(state_sets)
+            elif len(state_sets) != self.num_columns:
+                raise ValueError("Sequences of unequal length")
+            bitsets = []
+            for state in self.states:
+                bits = "".join("1" if state in ss else "0" for ss in reversed(state_sets))
+                bitsets.append(int(bits, 2) if bits else 0)
+            self.taxon_state_bitsets_map[taxon] = bitsets
+        if self.num_columns is None:
+            self.num_columns = 0
+
+    def _build_weight_masks(self, column_weights):
+        if column_weights is None:
+            return [(1, self._all_columns_mask)]
+        weight_columns = {}
+        for idx, weight in enumerate(column_weights):
+            try:
+                weight_columns[weight].append(idx)
+            except KeyError:
+                weight_columns[weight] = [idx]
+        if len(weight_columns) == 1:
+            return [(column_weights[0], self._all_columns_mask)]
+        weight_masks = []
+        for weight in weight_columns:
+            if not weight:
+                continue
+            bits = ["0"] * self.num_columns
+            for idx in weight_columns[weight]:
+                bits[idx] = "1"
+            weight_masks.append((weight, int("".join(reversed(bits)), 2)))
+        return weight_masks
+
+    def _weighted_count(self, steps_mask):
+        score = 0
+        for weight, mask in self._column_weight_masks:
+            score += weight * _popcount(steps_mask & mask)
+        return score
+
+    def _combine_state_bitsets(self, left_bitsets, right_bitsets):
+        """
+        Returns the state sets of the parent of two nodes, given the state
+        sets of the nodes, and the mask of the characters that require a
+        step.
+        """
+        inter = [left & right for left, right in zip(left_bitsets, right_bitsets)]
+        steps_mask = self._all_columns_mask & ~reduce(operator.or_, inter, 0)
+        if steps_mask:
+            return [i | (steps_mask & (left | right)) for i, left, right in zip(inter, left_bitsets, right_bitsets)], steps_mask
+        return inter, steps_mask
+
+    def _get_node_state_bitsets(self, node, node_state_bitsets_map):
+        try:
+            return node_state_bitsets_map[node]
+        except KeyError:
+            v = self.taxon_state_bitsets_map[node.taxon]
+            node_state_bitsets_map[node] = v
+            return v
+
+    def down_pass(self,
+            postorder_nodes,
+            node_state_bitsets_map=None,
+            score_by_character_list=None):
+        """
+        Returns the parsimony score given a list of nodes in postorder, as
+        with :func:`fitch_down_pass()`.
+
+        Parameters
+        ----------
+        postorder_nodes : iterable of/over |Node| objects
+            An iterable of |Node| objects in in order of post-order
+            traversal of the tree.
+        node_state_bitsets_map : dict
+            If not |None|, a dictionary that will be populated with the state
+            sets of each node, encoded as a list of integers, one for each
+            state in ``states``. Can be decoded using
+            :meth:`BitParallelFitch.decode_state_sets()`.
+        score_by_character_list : None or list
+            If not |None|, should be a reference to a list object.
+            This list will be populated by the scores on a character-by-character
+            basis.
+
+        Returns
+        -------
+        s : int
+            Parismony score of tree.
+        """
+        if node_state_bitsets_map is None:
+            node_state_bitsets_map = {}
+        if score_by_character_list is not None:
+            assert len(score_by_character_list) == 0
+            steps_masks = []
+        score = 0
+        for nd in postorder_nodes:
+            c = nd.child_nodes()
+            if not c:
+                self._get_node_state_bitsets(nd, node_state_bitsets_map)
+                continue
+            left_bitsets = self._get_node_state_bitsets(c[0], node_state_bitsets_map)
+            for right_c in c[1:]:
+                right_bitsets = self._get_node_state_bitsets(right_c, node_state_bitsets_map)
+                left_bitsets, steps_mask = self._combine_state_bitsets(left_bitsets, right_bitsets)
+                if steps_mask:
+                    score += self._weighted_count(steps_mask)
+                    if score_by_character_list is not None:
+                        steps_masks.append(steps_mask)
+            node_state_bitsets_map[nd] = left_bitsets
+        if score_by_character_list is not None:
+            column_steps = [0] * self.num_columns
+            for steps_mask in steps_masks:
+                for idx in _set_bit_indexes(steps_mask):
+                    column_steps[idx] += 1
+            if self.site_patterns is not None:
+                character_steps = self.site_patterns.expand(column_steps)
+            else:
+                character_steps = column_steps
+            if self._character_weights is not None:
+                character_steps = [steps * weight for steps, weight in zip(character_steps, self._character_weights)]
+            score_by_character_list.extend(character_steps)
+        return score
+
+    def up_pass(self, preorder_nodes, node_state_bitsets_map):
+        """
+        Finalizes the state sets of each node in ``node_state_bitsets_map``,
+        as populated by :meth:`BitParallelFitch.down_pass()`, using the "final
+        phase" of Fitch's (1971) unordered parsimony algorithm, as with
+        :func:`fitch_up_pass()`.
+
+        Parameters
+        ----------
+        preorder_nodes : iterable of/over |Node| objects
+            An iterable of |Node| objects in in order of pre-order
+            traversal of the tree.
+        node_state_bitsets_map : dict
+            The state sets of each node, as populated by
+            :meth:`BitParallelFitch.down_pass()`.
+
+        Notes
+        -----
+        Currently this requires a bifurcating tree (even at the root).
+        """
+        for nd in preorder_nodes:
+            c = nd.child_nodes()
+            p = nd.parent_node
+            if (not c) or (not p):
+                continue
+            assert(len(c) == 2)
+            left_bitsets = self._get_node_state_bitsets(c[0], node_state_bitsets_map)
+            right_bitsets = self._get_node_state_bitsets(c[1], node_state_bitsets_map)
+            par_bitsets = node_state_bitsets_map[p]
+            curr_bitsets = node_state_bitsets_map[nd]
+            # characters for which the state set of the parent is not a
+            # subset of the current (downpass) state set
+            not_subset_mask = reduce(operator.or_, [par & ~curr for par, curr in zip(par_bitsets, curr_bitsets)], 0)
+            if not not_subset_mask:
+                node_state_bitsets_map[nd] = [par & curr for par, curr in zip(par_bitsets, curr_bitsets)]
+                continue
+            rl_inter_mask = reduce(operator.or_, [left & right for left, right in zip(left_bitsets, right_bitsets)], 0)
+            subset_mask = self._all_columns_mask & ~not_subset_mask
+            union_mask = not_subset_mask & ~rl_inter_mask
+            in_par_mask = not_subset_mask & rl_inter_mask
+            result = []
+            for par, curr, left, right in zip(par_bitsets, curr_bitsets, left_bitsets, right_bitsets):
+                result.append(
+                        (subset_mask & par & curr)
+                        | (union_mask & (par | curr))
+                        | (in_par_mask & ((par & (left | right)) | curr)))
+            node_state_bitsets_map[nd] = result
+
+    def score(self, tree, score_by_character_list=None):
+        """
+        Returns the parsimony score of ``tree``.
+
+        Parameters
+        ----------
+        tree : a |Tree| instance
+            A |Tree| to be scored, referencing the taxa of the data.
+        score_by_character_list : None or list
+            If not |None|, should be a reference to a list object.
+            This list will be populated by the scores on a character-by-character
+            basis.
+
+        Returns
+        -------
+        s : int
+            Parismony score of tree.
+        """
+        return self.down_pass(
+                tree.postorder_node_iter(),
+                score_by_character_list=score_by_character_list)
+
+    def decode_state_sets(self, state_bitsets):
+        """
+        Returns list of sets of fundamental state indexes, one for each
+        encoded column (i.e., for each site pattern if ``site_patterns`` is
+        not |None|, or for each character otherwise), given the state sets
+        of a node encoded as a list of integers, as populated by
+        :meth:`BitParallelFitch.down_pass()` and
+        :meth:`BitParallelFitch.up_pass()`.
+        """
+        state_sets = [set() for idx in range(self.num_columns)]
+        for state, bitset in zip(self.states, state_bitsets):
+            for idx in _set_bit_indexes(bitset):
+                state_sets[idx].add(state)
+        return state_sets
+
+class IncrementalFitchParsimony(object):
+    """
+    The parsimony score of a tree, kept up to date as the tree is
+    rearranged, e.g. in the course of a tree search.
+
+    The Fitch state sets and the parsimony score of the subtree of each node
+    are cached, and, after a rearrangement, only the nodes that have had
+    their child nodes changed, and their ancestors, are rescored. The cost of
+    evaluating a subtree-pruning-and-regrafting (SPR) or nearest-neighbor
+    interchange (NNI) move is thus proportional to the length of the paths
+    from the nodes affected by the move to the root, instead of to the size of
+    the tree.
+
+    The moves :meth:`IncrementalFitchParsimony.spr()` and
+    :meth:`IncrementalFitchParsimony.nni()` rearrange the tree and return the
+    change in score, and can be reversed with
+    :meth:`IncrementalFitchParsimony.undo()`. Other rearrangements (e.g.,
+    tree-bisection-and-reconnection, or TBR) can be carried out on the tree
+    directly, followed by a call to
+    :meth:`IncrementalFitchParsimony.invalidate()` for every node with a
+    changed set of child nodes, and then by a call to
+    :meth:`IncrementalFitchParsimony.update()` to rescore the tree.
+
+    Examples
+    --------
+
+    ::
+
+        fitch = BitParallelFitch(char_matrix=chars)
+        scorer = IncrementalFitchParsimony(tree, fitch)
+        print(scorer.score)
+        best = None
+        for subtree_node in tree.postorder_node_iter():
+            for target_node in tree.postorder_node_iter():
+                try:
+                    delta = scorer.spr(subtree_node, target_node)
+                except ValueError:
+                    # invalid move
+                    continue
+                if best is None or delta < best[0]:
+                    best = (delta, subtree_node, target_node)
+                scorer.undo()
+
+    """
+
+    def __init__(self, tree, fitch):
+        """
+        Parameters
+        ----------
+        tree : |Tree|
+            The tree to be scored. The tree should be rearranged through the
+            methods of this object, or any changes to the tree must be
+            followed by calls to
+            :meth:`IncrementalFitchParsimony.invalidate()`.
+        fitch : :class:`BitParallelFitch`
+            The encoded data with respect to which the tree is scored.
+        """
+        self.tree = tree
+        self.fitch = fitch
+        self.node_state_bitsets_map = {}
+        self._node_subtree_scores = {}
+        self._dirty_nodes = set()
+        self._moves = []
+        self.score = 0
+        self.update()
+
+    def invalidate(self, *nodes):
+        """
+        Marks each of ``nodes``, and all its (current) ancestors, for
+        rescoring on the next call to
+        :meth:`IncrementalFitchParsimony.update()`. Must be called for every
+        node whose set of child nodes has been changed other than through the
+        methods of this object, after the change.
+        """
+        dirty_nodes = self._dirty_nodes
+        for nd in nodes:
+            while nd is not None:
+                dirty_nodes.add(nd)
+                nd = nd._parent_node
+
+    def update(self):
+        """
+        Rescores the nodes of the tree marked by
+        :meth:`IncrementalFitchParsimony.invalidate()` (and any nodes not yet
+        scored), and returns the change in the parsimony score of the tree.
+        """
+        fitch = self.fitch
+        node_state_bitsets_map = self.node_state_bitsets_map
+        subtree_scores = self._node_subtree_scores
+        dirty_nodes = self._dirty_nodes
+        stack = [(self.tree.seed_node, False)]
+        while stack:
+            nd, is_children_scored = stack.pop()
+            children = nd._child_nodes
+            if is_children_scored:
+                left_bitsets = node_state_bitsets_map[children[0]]
+                score = subtree_scores[children[0]]
+                for right_c in children[1:]:
+                    left_bitsets, steps_mask = fitch._combine_state_bitsets(left_bitsets, node_state_bitsets_map[right_c])
+                    score += subtree_scores[right_c]
+                    if steps_mask:
+                        score += fitch._weighted_count(steps_mask)
+                node_state_bitsets_map[nd] = left_bitsets
+                subtree_scores[nd] = score
+                dirty_nodes.discard(nd)
+            elif nd in dirty_nodes or nd not in subtree_scores:
+                if not children:
+                    node_state_bitsets_map[nd] = fitch.taxon_state_bitsets_map[nd.taxon]
+                    subtree_scores[nd] = 0
+                    dirty_nodes.discard(nd)
+                    continue
+                stack.append((nd, True))
+                for ch in children:
+                    stack.append((ch, False))
+        old_score = self.score
+        self.score = subtree_scores[self.tree.seed_node]
+        return self.score - old_score
+
+    def _is_ancestor(self, node, other):
+        nd = other._parent_node
+        while nd is not None:
+            if nd is node:
+                return True
+            nd = nd._parent_node
+        return False
+
+    def spr(self, subtree_node, target_node):
+        """
+        Prunes the subtree of ``subtree_node``, together with its parent node,
+        and regrafts it onto the edge subtending ``target_node``, and returns
+        the change in the parsimony score of the tree.
+
+        The parent of ``subtree_node`` must have exactly two child nodes, and
+        must not be the seed node. ``target_node`` must not be in the subtree,
+        nor be the parent of ``subtree_node``, nor the seed node. The length
+        of the edge subtending the parent node is added to that of its other
+        child node when pruned, and the length of the edge subtending
+        ``target_node`` is split evenly when regrafted.
+        """
+        p = subtree_node._parent_node
+        if p is None or p._parent_node is None:
+            raise ValueError("Parent of subtree node must be an internal, non-seed node")
+        if len(p._child_nodes) != 2:
+            raise ValueError("Parent of subtree node must have exactly two child nodes")
+        tp = target_node._parent_node
+        if tp is None:
+            raise ValueError("Cannot regraft onto the seed node")
+        if target_node is p or target_node is subtree_node or self._is_ancestor(subtree_node, target_node):
+            raise ValueError("Cannot regraft subtree onto itself")
+        sub_pos = p._child_nodes.index(subtree_node)
+        sibling = p._child_nodes[1 - sub_pos]
+        gp = p._parent_node
+        gp_pos = gp._child_nodes.index(p)
+        sibling_length = sibling.edge.length
+        p_length = p.edge.length
+        # prune
+        gp.remove_child(p)
+        p.remove_child(sibling)
+        gp.insert_child(gp_pos, sibling)
+        if sibling_length is not None and p_length is not None:
+            sibling.edge.length = sibling_length + p_length
+        # regraft
+        tp = target_node._parent_node
+        target_pos = tp._child_nodes.index(target_node)
+        target_length = target_node.edge.length
+        tp.remove_child(target_node)
+        p.insert_child(1 - sub_pos, target_node)
+        tp.insert_child(target_pos, p)
+        if target_length is not None:
+            target_node.edge.length = target_length / 2.0
+            p.edge.length = target_length / 2.0
+        else:
+            p.edge.length = None
+        self._moves.append(("spr", (subtree_node, p, sub_pos, sibling, sibling_length, p_length, gp, gp_pos, target_node, target_length, tp, target_pos)))
+        self.invalidate(gp, p)
+        return self.update()
+
+    def _undo_spr(self, subtree_node, p, sub_pos, sibling, sibling_length, p_length, gp, gp_pos, target_node, target_length, tp, target_pos):
+        tp.remove_child(p)
+        p.remove_child(target_node)
+        tp.insert_child(target_pos, target_node)
+        target_node.edge.length = target_length
+        gp.remove_child(sibling)
+        p.insert_child(1 - sub_pos, sibling)
+        gp.insert_child(gp_pos, p)
+        sibling.edge.length = sibling_length
+        p.edge.length = p_length
+        self.invalidate(tp, p)
+
+    def nni(self, node1, node2):
+        """
+        Exchanges the subtrees of ``node1`` and ``node2``, and returns the
+        change in the parsimony score of the tree.
+
+        A nearest-neighbor interchange across the edge subtending an internal
+        node is carried out by exchanging a child node of the internal node
+        with a sibling of the internal node, but any two subtrees, neither of
+        which includes the other, can be exchanged.
+        """
+        if node1._parent_node is None or node2._parent_node is None:
+            raise ValueError("Cannot exchange the seed node")
+        if node1 is node2 or self._is_ancestor(node1, node2) or self._is_ancestor(node2, node1):
+            raise ValueError("Cannot exchange nested subtrees")
+        self._swap_subtrees(node1, node2)
+        self._moves.append(("nni", (node1, node2)))
+        return self.update()
+
+    def _swap_subtrees(self, node1, node2):
+        p1 = node1._parent_node
+        p2 = node2._parent_node
+        pos1 = p1._child_nodes.index(node1)
+        pos2 = p2._child_nodes.index(node2)
+        if p1 is p2:
+            p1._child_nodes[pos1] = node2
+            p1._child_nodes[pos2] = node1
+        else:
+            p1.remove_child(node1)
+            p2.remove_child(node2)
+            p1.insert_child(pos1, node2)
+            p2.insert_child(pos2, node1)
+        self.invalidate(p1, p2)
+
+    def undo(self):
+        """
+        Reverses the last move made by :meth:`IncrementalFitchParsimony.spr()`
+        or :meth:`IncrementalFitchParsimony.nni()` that has not yet been
+        reversed, and returns the change in the parsimony score of the tree.
+        """
+        if not self._moves:
+            raise IndexError("No moves to undo")
+        move, args = self._moves.pop()
+        if move == "spr":
+            self._undo_spr(*args)
+        else:
+            self._swap_subtrees(*args)
+        return self.update()
+
+    def prune_subtree(self, node, suppress_unifurcations=True):
+        """
+        Removes the subtree of ``node`` from the tree, as with
+        :meth:`Node.reversible_remove_child()` called on its parent, and
+        marks the affected nodes for rescoring. Returns the list of tuples
+        that can be passed to
+        :meth:`IncrementalFitchParsimony.reinsert_nodes()` to undo the
+        removal. :meth:`IncrementalFitchParsimony.update()` must be called
+        to rescore the tree.
+        """
+        if node._parent_node is None:
+            raise TypeError('Node has no parent and is implicit root: cannot be pruned')
+        nd_connection_list = node._parent_node.reversible_remove_child(node, suppress_unifurcations=suppress_unifurcations)
+        self.invalidate(*[blob[1] for blob in nd_connection_list])
+        return nd_connection_list
+
+    def reinsert_nodes(self, nd_connection_list):
+        """
+        Undoes the removal of nodes by
+        :meth:`IncrementalFitchParsimony.prune_subtree()`, as with
+        :meth:`Node.reinsert_nodes()`, and marks the affected nodes for
+        rescoring. :meth:`IncrementalFitchParsimony.update()` must be called
+        to rescore the tree.
+        """
+        self.tree.seed_node.reinsert_nodes(nd_connection_list)
+        self.invalidate(*[blob[0] for blob in nd_connection_list])
+
+    def reroot_at_edge(self, edge, length1=None, length2=None, suppress_unifurcations=True):
+        """
+        Reroots the tree on the edge ``edge``, as with
+        :meth:`Tree.reroot_at_edge()`, and marks the affected nodes for
+        rescoring. :meth:`IncrementalFitchParsimony.update()` must be called
+        to rescore the tree.
+        """
+        path = []
+        nd = edge.tail_node
+        while nd is not None:
+            path.append(nd)
+            nd = nd._parent_node
+        seed_node = self.tree.reroot_at_edge(
+                edge,
+                length1=length1,
+                length2=length2,
+                suppress_unifurcations=suppress_unifurcations)
+        self.invalidate(seed_node, *[nd for nd in path if nd._parent_node is not None])
+        return seed_node
+
 def parsimony_score(
         tree,
         chars,
         gaps_as_missing=True,
         weights=None,
         score_by_character_list=None,
+        compress_site_patterns=False,
         ):
     """
     Calculates the score of a tree, ``tree``, given some character data,
@@ -334,6 +993,17 @@ def parsimony_score(
         If not |None|, should be a reference to a list object.
         This list will be populated by the scores on a character-by-character
         basis.
+    compress_site_patterns : bool
+        If |False| [default], then every site is scored, and the state sets
+        of each node are stored in its "state_sets" attribute, as with
+        :func:`fitch_down_pass()` (e.g., for use with
+        :func:`fitch_up_pass()`). If |True|, then each distinct site pattern
+        of ``chars`` is scored only once, and its score multiplied by the
+        number of sites with that pattern (see
+        :meth:`DiscreteCharacterMatrix.site_patterns()`), with all patterns
+        scored at once using :class:`BitParallelFitch`: this is much faster,
+        but the state sets of the analysis are not stored on the nodes of
+        ``tree``.
 
     Returns
     -------
@@ -391,13 +1061,19 @@ def parsimony_score(
     -----
 
     If the same data is going to be used to score multiple trees or multiple times,
-    it is probably better to generate the 'taxon_state_sets_map' once and call
-    "fitch_down_pass" directly yourself, as this function generates a new map
-    each time.
+    it is probably better to create a :class:`BitParallelFitch` object once
+    and call its "score" method directly yourself, as this function encodes
+    the data anew each time.
 
     """
     if tree.taxon_namespace is not chars.taxon_namespace:
         raise TaxonNamespaceIdentityError(tree, data)
+    if compress_site_patterns:
+        fitch = BitParallelFitch(
+                char_matrix=chars,
+                gaps_as_missing=gaps_as_missing,
+                weights=weights)
+        return fitch.score(tree, score_by_character_list=score_by_character_list)
     taxon_state_sets_map = chars.taxon_state_sets_map(gaps_as_missing=gaps_as_missing)
     nodes = tree.postorder_node_iter()
     pscore = fitch_down_pass(nodes,
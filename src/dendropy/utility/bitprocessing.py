@@ -22,6 +22,7 @@ Various bitwise utilities.
 """
 
 import sys
+import hashlib
 
 if sys.hexversion >= 0x03010000:
     def bit_length(n):
@@ -47,6 +48,66 @@ else:
         s = s.lstrip('-0b') # remove leading zeros and minus sign
         return len(s)       # len('100101') --> 6
 
+if sys.hexversion >= 0x03020000:
+    def int_to_bytes(n, width):
+        """
+        Returns ``n`` (a non-negative integer) as a little-endian byte string
+        of exactly ``width`` bytes.
+        """
+        return n.to_bytes(width, "little")
+
+    def int_from_bytes(b):
+        """
+        Returns the (non-negative) integer represented by the little-endian
+        byte string ``b``.
+        """
+        return int.from_bytes(b, "little")
+else:
+    import binascii
+    def int_to_bytes(n, width):
+        """
+        Returns ``n`` (a non-negative integer) as a little-endian byte string
+        of exactly ``width`` bytes.
+        """
+        return binascii.unhexlify("{:0{w}x}".format(n, w=2*width))[::-1]
+
+    def int_from_bytes(b):
+        """
+        Returns the (non-negative) integer represented by the little-endian
+        byte string ``b``.
+        """
+        if not b:
+            return 0
+        return int(binascii.hexlify(b[::-1]), 16)
+
+def bytes_width(n):
+    """
+    Returns the number of bytes required to represent ``n`` (at least 1).
+    """
+    return max(1, (bit_length(n) + 7) // 8)
+
+def canonical_split_bitmask_set(split_bitmasks):
+    """
+    Returns the distinct bitmasks in ``split_bitmasks`` as a sorted tuple, the
+    canonical representation of a set of splits (e.g., the topology of a
+    tree) expected by :func:`split_bitmask_set_fingerprint`.
+    """
+    return tuple(sorted(set(split_bitmasks)))
+
+def split_bitmask_set_fingerprint(canonical_split_bitmasks):
+    """
+    Returns a fixed-width (128-bit) integer fingerprint of a set of splits,
+    given in its canonical representation (see
+    :func:`canonical_split_bitmask_set`). Identical sets of splits always
+    have the same fingerprint, while different sets of splits have the same
+    fingerprint with negligible probability, allowing topologies to be
+    counted using compact keys. Code that needs a guarantee against
+    collisions should keep the canonical split bitmasks of (one
+    representative of) each distinct fingerprint for verification.
+    """
+    digest = hashlib.md5(",".join(["{:x}".format(s) for s in canonical_split_bitmasks]).encode("ascii")).digest()
+    return int_from_bytes(digest)
+
 def int_as_bitstring(n, length=None, symbol0=None, symbol1=None, reverse=False):
     if length is None:
         length = bit_length(n)
@@ -60,8 +121,49 @@ def int_as_bitstring(n, length=None, symbol0=None, symbol1=None, reverse=False):
     else:
         return s
 
-def num_set_bits(n):
-    return bin(n).count("1")
+_POPCOUNT_MASKS = {}
+
+def _popcount_masks(width):
+    try:
+        return _POPCOUNT_MASKS[width]
+    except KeyError:
+        nbytes = width // 8
+        masks = [int(h * nbytes, 16) for h in ("55", "33", "0f")]
+        masks.append(int("00ff" * (nbytes // 2), 16))
+        masks.append(int("0000ffff" * (nbytes // 4), 16))
+        folds = []
+        fold_width = width
+        while fold_width > 32:
+            fold_width //= 2
+            folds.append((fold_width, (1 << fold_width) - 1))
+        masks.append(folds)
+        _POPCOUNT_MASKS[width] = masks
+        return masks
+
+try:
+    num_set_bits = int.bit_count
+except AttributeError:
+    def num_set_bits(n):
+        """
+        Returns the number of bits set in the binary representation of ``n``
+        (excluding the sign).
+        """
+        if n < 0:
+            n = -n
+        nbits = bit_length(n)
+        if nbits <= 512:
+            return bin(n).count("1")
+        # for large integers, count the bits of successively wider fields
+        # in parallel, then add the 32-bit fields by folding in halves
+        m1, m2, m4, m8, m16, folds = _popcount_masks(1 << bit_length(nbits - 1))
+        n = n - ((n >> 1) & m1)
+        n = (n & m2) + ((n >> 2) & m2)
+        n = (n + (n >> 4)) & m4
+        n = (n + (n >> 8)) & m8
+        n = (n + (n >> 16)) & m16
+        for width, mask in folds:
+            n = (n & mask) + (n >> width)
+        return n
 
 def least_significant_set_bit(n):
     """
@@ -0,0 +1,99 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Benchmarks the calculation of the unweighted Robinson-Foulds distance
+between pairs of random trees of increasing size, using the bipartition
+encodings of the trees and using Day's algorithm.
+
+Usage::
+
+    python tests/benchmarks/benchmark_robinson_foulds.py [--num-tips N [N ...]]
+
+"""
+
+import sys
+import argparse
+import random
+import timeit
+import dendropy
+from dendropy.calculate import treecompare
+
+def random_tree(taxon_namespace, rng, is_rooted):
+    tree = dendropy.Tree(taxon_namespace=taxon_namespace, is_rooted=is_rooted)
+    nodes = [dendropy.Node(taxon=taxon) for taxon in taxon_namespace]
+    while len(nodes) > 2:
+        idx1 = rng.randrange(len(nodes))
+        nd1 = nodes[idx1]
+        nodes[idx1] = nodes[-1]
+        nodes.pop()
+        idx2 = rng.randrange(len(nodes))
+        nd2 = nodes[idx2]
+        parent = dendropy.Node()
+        parent.add_child(nd1)
+        parent.add_child(nd2)
+        nodes[idx2] = parent
+    for nd in nodes:
+        tree.seed_node.add_child(nd)
+    return tree
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-tips",
+            type=int,
+            nargs="+",
+            default=[100, 1000, 10000, 100000],
+            help="Number of tips in the trees (default: %(default)s).")
+    parser.add_argument("--repeats",
+            type=int,
+            default=3,
+            help="Number of repeats of each timing (default: %(default)s).")
+    parser.add_argument("--unrooted",
+            action="store_true",
+            default=False,
+            help="Compare unrooted trees.")
+    parser.add_argument("--seed",
+            type=int,
+            default=1,
+            help="Random number seed (default: %(default)s).")
+    args = parser.parse_args()
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * max(args.num_tips)))
+    rng = random.Random(args.seed)
+    sys.stdout.write("{:>10} {:>16} {:>16} {:>10} {:>10}\n".format(
+        "tips", "bipartitions (s)", "day (s)", "speedup", "distance"))
+    for num_tips in args.num_tips:
+        taxon_namespace = dendropy.TaxonNamespace(["T{}".format(i) for i in range(num_tips)])
+        tree1 = random_tree(taxon_namespace, rng, is_rooted=not args.unrooted)
+        tree2 = random_tree(taxon_namespace, rng, is_rooted=not args.unrooted)
+        d1 = treecompare.unweighted_robinson_foulds_distance(tree1, tree2, algorithm="bipartitions")
+        d2 = treecompare.unweighted_robinson_foulds_distance(tree1, tree2, algorithm="day")
+        assert d1 == d2, (d1, d2)
+        t1 = min(timeit.repeat(
+                lambda: treecompare.unweighted_robinson_foulds_distance(tree1, tree2, algorithm="bipartitions"),
+                number=1,
+                repeat=args.repeats))
+        t2 = min(timeit.repeat(
+                lambda: treecompare.unweighted_robinson_foulds_distance(tree1, tree2, algorithm="day"),
+                number=1,
+                repeat=args.repeats))
+        sys.stdout.write("{:>10} {:>16.4f} {:>16.4f} {:>10.1f} {:>10}\n".format(
+            num_tips, t1, t2, t1 / t2, d1))
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,7 @@ import re
 import os
 import sys
 sys.path.insert(0, os.path.dirname(__file__))
+from dendropy.utility.textprocessing import StringIO
 from support import pathmap
 from support import standard_file_test_trees
 from support import compare_and_validate
@@ -444,5 +445,25 @@ class NewickTreeWriterGeneralOptionsTests(
         for nd in tree2:
             self.assertEqual(nd.edge.length, 1000)
 
+    def test_streamed_tree_writing(self):
+        tree_list = dendropy.TreeList()
+        for idx in range(5):
+            tree = newick_tree_writer_test_tree(label_pool=[
+                    "{}{}".format(c, idx) for c in ("a b", "c_d", "e'f", "g", "h", "i", "j", "k", "l", "m", "n", "o", "p", "q")])
+            tree_list.append(tree, taxon_import_strategy="add")
+        kwargs = {
+                "suppress_leaf_node_labels": False,
+                "unquoted_underscores": True,
+                "real_value_format_specifier": ".3f",
+        }
+        expected = tree_list.as_string("newick", **kwargs)
+        dest = StringIO()
+        dendropy.Tree.write_trees(
+                trees=iter(tree_list),
+                dest=dest,
+                schema="newick",
+                **kwargs)
+        self.assertEqual(dest.getvalue(), expected)
+
 if __name__ == "__main__":
     unittest.main()
@@ -25,6 +25,9 @@ import sys
 import unittest
 import dendropy
 import os
+import tempfile
+import shutil
+import threading
 sys.path.insert(0, os.path.dirname(__file__))
 from support import dendropytest
 from support import standard_file_test_trees
@@ -83,6 +86,174 @@ class NexusTreeYielderDefaultTestCase(
             self.assertIs(tree.taxon_namespace, tns)
             self.compare_to_reference_tree(tree, ref_tree)
 
+    def test_resume(self):
+        tree_file_titles = [
+            "dendropy-test-trees-n12-x2",
+            "dendropy-test-trees-n33-unrooted-annotated-x10a",
+        ]
+        tree_files = [self.schema_tree_filepaths[tree_file_title] for tree_file_title in tree_file_titles]
+        tree_sources = dendropy.Tree.yield_from_files(
+                files=tree_files,
+                schema="nexus",
+                taxon_namespace=dendropy.TaxonNamespace())
+        resume_points = []
+        for tree in tree_sources:
+            resume_points.append((tree_sources.current_file_index, tree_sources.current_file_resume_offset))
+        self.assertEqual(len(resume_points), sum(self.tree_references[t]["num_trees"] for t in tree_file_titles))
+        aggregate_tree_idx = 0
+        for file_idx, tree_file_title in enumerate(tree_file_titles):
+            num_trees = self.tree_references[tree_file_title]["num_trees"]
+            for tree_idx in range(num_trees):
+                self.assertEqual(resume_points[aggregate_tree_idx][0], file_idx)
+                resume_offset = resume_points[aggregate_tree_idx][1]
+                aggregate_tree_idx += 1
+                resumed_trees = list(dendropy.Tree.yield_from_files(
+                        files=[tree_files[file_idx]],
+                        schema="nexus",
+                        taxon_namespace=dendropy.TaxonNamespace(),
+                        resume_offsets=[resume_offset]))
+                self.assertEqual(len(resumed_trees), num_trees - tree_idx - 1)
+                for resumed_tree_idx, tree in enumerate(resumed_trees):
+                    ref_tree = self.tree_references[tree_file_title][str(tree_idx + resumed_tree_idx + 1)]
+                    self.compare_to_reference_tree(tree, ref_tree)
+
+class NewickTreeYielderResumeTestCase(
+        standard_file_test_trees.NewickTestTreesChecker,
+        dendropytest.ExtendedTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        standard_file_test_trees.NewickTestTreesChecker.create_class_fixtures(cls)
+
+    def test_resume(self):
+        for schema in ("newick", "nexus/newick"):
+            tree_file_title = "dendropy-test-trees-n33-unrooted-annotated-x10a"
+            tree_filepath = self.schema_tree_filepaths[tree_file_title]
+            num_trees = self.tree_references[tree_file_title]["num_trees"]
+            tree_sources = dendropy.Tree.yield_from_files(
+                    files=[tree_filepath],
+                    schema=schema,
+                    taxon_namespace=dendropy.TaxonNamespace())
+            resume_offsets = [tree_sources.current_file_resume_offset for tree in tree_sources]
+            self.assertEqual(len(resume_offsets), num_trees)
+            # after the last tree, reading resumes immediately after its
+            # terminating ';' (not at the end of the file), so that anything
+            # following it (here, a comment) is read on resumption
+            with open(tree_filepath, "rb") as src:
+                data = src.read()
+            self.assertEqual(resume_offsets[-1], data.rindex(b";") + 1)
+            for tree_idx, resume_offset in enumerate(resume_offsets):
+                resumed_trees = list(dendropy.Tree.yield_from_files(
+                        files=[tree_filepath],
+                        schema=schema,
+                        taxon_namespace=dendropy.TaxonNamespace(),
+                        resume_offsets=[resume_offset]))
+                self.assertEqual(len(resumed_trees), num_trees - tree_idx - 1)
+                for resumed_tree_idx, tree in enumerate(resumed_trees):
+                    ref_tree = self.tree_references[tree_file_title][str(tree_idx + resumed_tree_idx + 1)]
+                    self.compare_to_reference_tree(tree, ref_tree)
+
+    def test_completed_file_resume_offsets(self):
+        tree_file_title = "dendropy-test-trees-n33-unrooted-annotated-x10a"
+        tree_filepath = self.schema_tree_filepaths[tree_file_title]
+        tree_sources = dendropy.Tree.yield_from_files(
+                files=[tree_filepath, tree_filepath],
+                schema="newick",
+                taxon_namespace=dendropy.TaxonNamespace())
+        end_offsets = {}
+        for tree in tree_sources:
+            end_offsets[tree_sources.current_file_index] = tree_sources.current_file_resume_offset
+        # offsets of files read to the end are still known after moving on
+        for file_index in (0, 1):
+            self.assertEqual(tree_sources.get_file_resume_offset(file_index), end_offsets[file_index])
+        # and resolved (only) when requested
+        tree_sources = dendropy.Tree.yield_from_files(
+                files=[tree_filepath, tree_filepath],
+                schema="newick",
+                taxon_namespace=dendropy.TaxonNamespace())
+        for tree in tree_sources:
+            pass
+        self.assertEqual(tree_sources.get_file_resume_offset(0), end_offsets[0])
+
+class TreeYielderFollowTestCase(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        self.dirpath = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirpath)
+
+    def check_follow(self, source_filename, schema, data_filter=None):
+        with open(pathmap.tree_source_path(source_filename), "r") as src:
+            data = src.read()
+        expected_trees = dendropy.TreeList.get(data=data, schema=schema)
+        if data_filter is not None:
+            data = data_filter(data)
+        filepath = os.path.join(self.dirpath, source_filename)
+        # first write ends with a partially-written tree statement
+        split_idx = data.rindex(";", 0, len(data) // 2) + 20
+        with open(filepath, "w") as dest:
+            dest.write(data[:split_idx])
+        tree_yielder = dendropy.Tree.yield_from_files(
+                files=[filepath],
+                schema=schema,
+                follow=True,
+                follow_poll_interval=0.01,
+                follow_timeout=0.5)
+        trees = []
+        for tree in tree_yielder:
+            trees.append(tree)
+            if len(trees) == 1:
+                with open(filepath, "a") as dest:
+                    dest.write(data[split_idx:])
+        self.assertEqual(len(trees), len(expected_trees))
+        for tree, expected_tree in zip(trees, expected_trees):
+            self.assertEqual(tree.as_string("newick"), expected_tree.as_string("newick"))
+
+    def check_follow_cut_before_terminator(self, source_filename, schema):
+        with open(pathmap.tree_source_path(source_filename), "r") as src:
+            data = src.read()
+        expected_trees = dendropy.TreeList.get(data=data, schema=schema)
+        filepath = os.path.join(self.dirpath, source_filename)
+        # first write ends just before the ';' that closes a tree statement,
+        # which is appended while the yielder is waiting for it
+        split_idx = data.rindex(";", 0, len(data) // 2)
+        with open(filepath, "w") as dest:
+            dest.write(data[:split_idx])
+        def append_remaining_data():
+            with open(filepath, "a") as dest:
+                dest.write(data[split_idx:])
+        timer = threading.Timer(0.2, append_remaining_data)
+        timer.start()
+        try:
+            trees = list(dendropy.Tree.yield_from_files(
+                    files=[filepath],
+                    schema=schema,
+                    follow=True,
+                    follow_poll_interval=0.01,
+                    follow_timeout=1.0))
+        finally:
+            timer.join()
+        self.assertEqual(len(trees), len(expected_trees))
+        for tree, expected_tree in zip(trees, expected_trees):
+            self.assertEqual(tree.as_string("newick"), expected_tree.as_string("newick"))
+
+    def test_follow_nexus_cut_before_terminator(self):
+        self.check_follow_cut_before_terminator("pythonidae.reference-trees.nexus", "nexus")
+
+    def test_follow_newick_cut_before_terminator(self):
+        self.check_follow_cut_before_terminator("pythonidae.reference-trees.newick", "newick")
+
+    def test_follow_nexus(self):
+        self.check_follow("pythonidae.reference-trees.nexus", "nexus")
+
+    def test_follow_nexus_without_end(self):
+        self.check_follow("pythonidae.reference-trees.nexus", "nexus",
+                lambda data: data[:data.upper().rindex("END;")])
+
+    def test_follow_newick(self):
+        self.check_follow("pythonidae.reference-trees.newick", "newick")
+
 ## TODO:
 # - test multiple trees blocks
 # - mix of newick/nexus
@@ -26,6 +26,7 @@ import dendropy
 import os
 import sys
 sys.path.insert(0, os.path.dirname(__file__))
+from dendropy.utility.textprocessing import StringIO
 from support import dendropytest
 from support import standard_file_test_trees
 from support import compare_and_validate
@@ -60,5 +61,61 @@ class NexusStandardTreeListWriterTestCase(
                 tree_file_title=tree_file_title,
                 tree_offset=0)
 
+    def test_streamed_tree_writing(self):
+        tree_file_title = 'dendropy-test-trees-n33-unrooted-annotated-x10a'
+        tree_filepath = self.schema_tree_filepaths[tree_file_title]
+        for translate_tree_taxa in (None, True):
+            trees = dendropy.Tree.yield_from_files(
+                    files=[tree_filepath],
+                    schema="nexus",
+                    extract_comment_metadata=True)
+            dest = StringIO()
+            dendropy.Tree.write_trees(
+                    trees=trees,
+                    dest=dest,
+                    schema="nexus",
+                    translate_tree_taxa=translate_tree_taxa)
+            tree_list = dendropy.TreeList.get_from_string(dest.getvalue(),
+                    "nexus",
+                    extract_comment_metadata=True)
+            self.verify_standard_trees(
+                    tree_list=tree_list,
+                    tree_file_title=tree_file_title,
+                    tree_offset=0)
+
+    def test_streamed_tree_writing_with_undeclared_taxon(self):
+        for translate_tree_taxa in (None, True):
+            trees = dendropy.Tree.yield_from_files(
+                    files=[StringIO("((A,B),C);((A,B),(C,D));")],
+                    schema="newick")
+            dest = StringIO()
+            with self.assertRaises(ValueError):
+                dendropy.Tree.write_trees(
+                        trees=trees,
+                        dest=dest,
+                        schema="nexus",
+                        translate_tree_taxa=translate_tree_taxa)
+            self.assertNotIn("(C,D)", dest.getvalue())
+            self.assertNotIn("(3,D)", dest.getvalue())
+            # the trees written before the error are in a complete document
+            tree_list = dendropy.TreeList.get_from_string(dest.getvalue(), "nexus")
+            self.assertEqual(len(tree_list), 1)
+            self.assertEqual(len(tree_list.taxon_namespace), 3)
+        taxon_namespace = dendropy.TaxonNamespace(["A", "B", "C", "D"])
+        trees = dendropy.Tree.yield_from_files(
+                files=[StringIO("((A,B),C);((A,B),(C,D));")],
+                schema="newick",
+                taxon_namespace=taxon_namespace)
+        dest = StringIO()
+        dendropy.Tree.write_trees(
+                trees=trees,
+                dest=dest,
+                schema="nexus",
+                translate_tree_taxa=True,
+                taxon_namespace=taxon_namespace)
+        tree_list = dendropy.TreeList.get_from_string(dest.getvalue(), "nexus")
+        self.assertEqual(len(tree_list), 2)
+        self.assertEqual(len(tree_list.taxon_namespace), 4)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,123 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for iterating over the sequences of character data sources.
+"""
+
+import sys
+import os
+import unittest
+import dendropy
+sys.path.insert(0, os.path.dirname(__file__))
+from support import dendropytest
+from support import pathmap
+
+if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
+    from dendropy.utility.filesys import pre_py34_open as open
+
+class SequenceYielderTestCase(dendropytest.ExtendedTestCase):
+
+    def verify_yield_from_files(self,
+            matrix_type,
+            src_filenames,
+            schema,
+            **kwargs):
+        expected = []
+        src_paths = []
+        for src_filename in src_filenames:
+            src_path = pathmap.char_source_path(src_filename)
+            src_paths.append(src_path)
+            char_matrix = matrix_type.get(
+                    path=src_path,
+                    schema=schema,
+                    **kwargs)
+            for taxon in char_matrix:
+                expected.append((
+                    src_path,
+                    taxon.label,
+                    char_matrix[taxon].symbols_as_string()))
+        tns = dendropy.TaxonNamespace()
+        sequence_yielder = matrix_type.yield_from_files(
+                files=[src_paths[0]] + [open(p, "r") for p in src_paths[1:]],
+                schema=schema,
+                taxon_namespace=tns,
+                **kwargs)
+        observed = []
+        for taxon, sequence in sequence_yielder:
+            self.assertIn(taxon, tns)
+            self.assertIsInstance(sequence, matrix_type.character_sequence_type)
+            self.assertEqual(len(sequence_yielder.char_matrix), 0)
+            observed.append((
+                os.path.abspath(sequence_yielder.current_file_name),
+                taxon.label,
+                sequence.symbols_as_string()))
+        self.assertEqual(len(observed), len(expected))
+        for obs, exp in zip(observed, expected):
+            self.assertEqual(obs[0], os.path.abspath(exp[0]))
+            self.assertEqual(obs[1:], exp[1:])
+        self.assertEqual(len(tns), len(set(e[1] for e in expected)))
+
+    def test_fasta(self):
+        self.verify_yield_from_files(
+                dendropy.DnaCharacterMatrix,
+                ["primates.chars.fasta", "pythonidae.chars.fasta"],
+                "fasta")
+
+    def test_phylip_sequential(self):
+        self.verify_yield_from_files(
+                dendropy.DnaCharacterMatrix,
+                ["pythonidae.chars.phylip", "standard-test-chars-dna.relaxed.phylip"],
+                "phylip")
+
+    def test_phylip_interleaved(self):
+        self.verify_yield_from_files(
+                dendropy.ContinuousCharacterMatrix,
+                ["standard-test-chars-continuous.interleaved.phylip"],
+                "phylip",
+                interleaved=True)
+
+    def test_nexus(self):
+        self.verify_yield_from_files(
+                dendropy.DnaCharacterMatrix,
+                ["primates.chars.nexus", "pythonidae.chars.interleaved.nexus", "standard-test-chars-dna.matchchar.nexus"],
+                "nexus")
+
+    def test_nexus_continuous(self):
+        self.verify_yield_from_files(
+                dendropy.ContinuousCharacterMatrix,
+                ["pythonidae_continuous.chars.nexus"],
+                "nexus")
+
+    def test_data_type_mismatch(self):
+        sequence_yielder = dendropy.ProteinCharacterMatrix.yield_from_files(
+                files=[pathmap.char_source_path("primates.chars.nexus")],
+                schema="nexus")
+        with self.assertRaises(ValueError):
+            for taxon, sequence in sequence_yielder:
+                pass
+
+    def test_unsupported_schema(self):
+        with self.assertRaises(NotImplementedError):
+            dendropy.DnaCharacterMatrix.yield_from_files(
+                    files=[pathmap.char_source_path("primates.chars.nexus")],
+                    schema="nexml")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -469,6 +469,86 @@ class CharacterMatrixIteratorTests(dendropytest.ExtendedTestCase):
         observed = [taxon for taxon in char_matrix]
         self.assertEqual(observed, expected)
 
+class PackedCharacterDataSequenceTests(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        self.char_matrix = dendropy.DnaCharacterMatrix.get(
+                data=">t1\nACGT-N?\n>t2\nAAAAAAA\n", schema="fasta")
+        self.alphabet = self.char_matrix.default_state_alphabet
+
+    def test_sequence_type(self):
+        for seq in self.char_matrix.values():
+            self.assertTrue(isinstance(seq, charmatrixmodel.PackedCharacterDataSequence))
+        seq = self.char_matrix[0]
+        self.assertEqual(seq._state_codes.typecode, "B")
+        seq = charmatrixmodel.PackedCharacterDataSequence(list(seq) * 2)
+        self.assertEqual(len(seq._states), 7)
+
+    def test_list_interface(self):
+        seq = self.char_matrix[0]
+        self.assertEqual(len(seq), 7)
+        self.assertEqual(seq.symbols_as_string(), "ACGT-N?")
+        self.assertIs(seq[0], self.alphabet["A"])
+        self.assertIs(seq[-1], self.alphabet["?"])
+        self.assertEqual([str(s) for s in seq[1:3]], ["C", "G"])
+        self.assertEqual([str(s) for s in seq], list("ACGT-N?"))
+        seq[0] = self.alphabet["T"]
+        seq.append(self.alphabet["A"])
+        seq.insert(0, self.alphabet["G"])
+        del seq[-2]
+        del seq[1:3]
+        self.assertEqual(seq.symbols_as_string(), "GGT-NA")
+        seq[1:3] = [self.alphabet["C"]]
+        self.assertEqual(seq.symbols_as_string(), "GC-NA")
+        self.assertRaises(IndexError, seq.character_type_at, 10)
+
+    def test_sparse_types_and_annotations(self):
+        seq = self.char_matrix[0]
+        ct = charmatrixmodel.CharacterType(state_alphabet=self.alphabet)
+        seq.set_character_type_at(2, ct)
+        self.assertFalse(seq.has_annotations_at(1))
+        seq.annotations_at(1).add_new("a", 1)
+        self.assertTrue(seq.has_annotations_at(1))
+        seq.insert(0, self.alphabet["A"])
+        self.assertIs(seq.character_type_at(3), ct)
+        self.assertIs(seq.character_type_at(2), None)
+        self.assertTrue(seq.has_annotations_at(2))
+        del seq[0:2]
+        self.assertIs(seq.character_type_at(1), ct)
+        self.assertTrue(seq.has_annotations_at(0))
+        cells = list(seq.cell_iter())
+        self.assertEqual(len(cells), 6)
+        self.assertIs(cells[1][1], ct)
+        self.assertIs(cells[2][1], None)
+
+    def test_wide_state_codes(self):
+        seq = charmatrixmodel.PackedCharacterDataSequence(list(range(300)) * 2)
+        self.assertEqual(seq._state_codes.typecode, "H")
+        self.assertEqual(seq.values(), list(range(300)) * 2)
+        seq = charmatrixmodel.PackedCharacterDataSequence([1, True, 1.0, [1], [1]])
+        self.assertEqual([type(v) for v in seq], [int, bool, float, list, list])
+        self.assertIsNot(seq[3], seq[4])
+
+    def test_extend_state_codes(self):
+        state_codes = self.alphabet.translate_symbols("GATTACA")
+        seq = self.char_matrix.new_sequence(self.char_matrix.taxon_namespace.new_taxon("t3"))
+        seq.extend_state_codes(state_codes, self.alphabet.states)
+        seq.extend_state_codes(state_codes, self.alphabet.states)
+        self.assertEqual(seq.symbols_as_string(), "GATTACAGATTACA")
+        seq = charmatrixmodel.PackedCharacterDataSequence([self.alphabet["T"], self.alphabet["C"]])
+        seq.extend_state_codes(state_codes, self.alphabet.states)
+        self.assertEqual(seq.symbols_as_string(), "TCGATTACA")
+        self.assertIs(seq[2], self.alphabet["G"])
+        seq = charmatrixmodel.CharacterDataSequence()
+        seq.extend_state_codes(state_codes, self.alphabet.states)
+        self.assertEqual(seq.symbols_as_string(), "GATTACA")
+
+    def test_copy(self):
+        c2 = copy.deepcopy(self.char_matrix)
+        c2[0][0] = c2.default_state_alphabet["T"]
+        self.assertEqual(c2[0].symbols_as_string(), "TCGT-N?")
+        self.assertEqual(self.char_matrix[0].symbols_as_string(), "ACGT-N?")
+
 class CharacterMatrixIdentity(unittest.TestCase):
 
     def setUp(self):
@@ -1130,5 +1210,218 @@ class TestCharacterMatrixTaxa(dendropytest.ExtendedTestCase):
         self.char_matrix.purge_taxon_namespace()
         self.assertEqual(set(self.char_matrix.taxon_namespace), self.expected_taxa)
 
+class SitePatternsTests(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        self.char_matrix = dendropy.DnaCharacterMatrix.from_dict({
+            "a": "ACGTACGN-A",
+            "b": "ACCTACCN-A",
+            "c": "AGGTAGGNTA",
+            })
+        self.columns = list(zip(*self.char_matrix.sequences()))
+
+    def test_patterns_and_weights(self):
+        site_patterns = self.char_matrix.site_patterns()
+        self.assertEqual(site_patterns.taxa, list(self.char_matrix))
+        self.assertEqual(site_patterns.num_sites, len(self.columns))
+        # distinct columns: A, C/C/G, G/C/G, T, N, -/-/T
+        self.assertEqual(len(site_patterns), 6)
+        self.assertEqual(site_patterns.weights, [3, 2, 2, 1, 1, 1])
+        self.assertEqual(sum(site_patterns.weights), site_patterns.num_sites)
+        for site_idx, column in enumerate(self.columns):
+            pattern = site_patterns.patterns[site_patterns.site_pattern_indices[site_idx]]
+            self.assertEqual(tuple(site_patterns.states[code] for code in pattern), column)
+        for pattern_idx, weight in enumerate(site_patterns.weights):
+            sites = site_patterns.pattern_sites(pattern_idx)
+            self.assertEqual(len(sites), weight)
+            self.assertEqual(len(set(self.columns[site_idx] for site_idx in sites)), 1)
+        self.assertEqual(site_patterns.expand(list(range(len(site_patterns)))), site_patterns.site_pattern_indices)
+
+    def test_pattern_sequences(self):
+        site_patterns = self.char_matrix.site_patterns()
+        sequences = site_patterns.pattern_sequences()
+        self.assertEqual(len(sequences), len(self.char_matrix))
+        for taxon, sequence in zip(site_patterns.taxa, sequences):
+            self.assertEqual(site_patterns.expand(sequence), self.char_matrix[taxon].values())
+
+    def test_char_indices(self):
+        site_patterns = self.char_matrix.site_patterns(char_indices=[0, 4, 9, 8])
+        self.assertEqual(site_patterns.weights, [3, 1])
+        self.assertEqual(site_patterns.site_pattern_indices, [0, 0, 0, 1])
+
+    def test_taxon_state_sets_map(self):
+        site_patterns = self.char_matrix.site_patterns()
+        for gaps_as_missing in (True, False):
+            expected = self.char_matrix.taxon_state_sets_map(gaps_as_missing=gaps_as_missing)
+            observed = site_patterns.taxon_state_sets_map(gaps_as_missing=gaps_as_missing)
+            self.assertEqual(set(observed), set(expected))
+            for taxon in expected:
+                self.assertEqual(site_patterns.expand(observed[taxon]), expected[taxon])
+
+    def test_unequal_lengths(self):
+        self.char_matrix[self.char_matrix.taxon_namespace[0]].append(
+                dendropy.DNA_STATE_ALPHABET["A"])
+        with self.assertRaises(ValueError):
+            self.char_matrix.site_patterns()
+
+    def test_empty(self):
+        char_matrix = dendropy.DnaCharacterMatrix.from_dict({"a": "", "b": ""})
+        site_patterns = char_matrix.site_patterns()
+        self.assertEqual(len(site_patterns), 0)
+        self.assertEqual(site_patterns.pattern_sequences(), [[], []])
+
+class CharacterIndicesViewTests(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        self.char_matrix = dendropy.DnaCharacterMatrix.from_dict({
+            "a": "ACGTACGN-A",
+            "b": "ACCTACCN-A",
+            "c": "AGGTAGGNTA",
+            })
+
+    def check_view(self, view, indices):
+        self.assertEqual(list(view), list(self.char_matrix))
+        self.assertIs(view.taxon_namespace, self.char_matrix.taxon_namespace)
+        for taxon in self.char_matrix:
+            values = self.char_matrix[taxon].values()
+            expected = [values[idx] for idx in indices]
+            self.assertEqual(len(view[taxon]), len(indices))
+            self.assertEqual(list(view[taxon]), expected)
+            self.assertEqual(view[taxon].values(), expected)
+            self.assertEqual([cell[0] for cell in view[taxon].cell_iter()], expected)
+            for idx, value in enumerate(expected):
+                self.assertIs(view[taxon][idx], value)
+            self.assertEqual(view[taxon].symbols_as_string(),
+                    "".join(str(value) for value in expected))
+
+    def test_indices(self):
+        indices = [9, 0, 3, 3, 1]
+        self.check_view(self.char_matrix.character_indices_view(indices), indices)
+
+    def test_slice(self):
+        for s in (slice(1, 7, 2), slice(None, None, -1), slice(4, None)):
+            self.check_view(self.char_matrix.character_indices_view(s),
+                    list(range(10))[s])
+
+    def test_view_of_view(self):
+        view = self.char_matrix.character_indices_view(slice(1, None))
+        view = view.character_indices_view([8, 0, 2])
+        self.check_view(view, [9, 1, 3])
+        for taxon in view:
+            self.assertIs(view[taxon]._sequence, self.char_matrix[taxon])
+
+    def test_character_subset_view(self):
+        self.char_matrix.new_character_subset(label="s1", character_indices=[2, 5, 8])
+        view = self.char_matrix.character_subset_view("s1")
+        self.check_view(view, [2, 5, 8])
+        self.assertEqual(len(view.character_subsets), 0)
+        self.assertEqual(len(self.char_matrix.character_subsets), 1)
+
+    def test_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self.char_matrix.character_indices_view([0, 10])
+
+    def test_changes_reflected(self):
+        view = self.char_matrix.character_indices_view([1, 2])
+        taxon = self.char_matrix.taxon_namespace[0]
+        self.char_matrix[taxon][2] = dendropy.DNA_STATE_ALPHABET["T"]
+        self.assertEqual(str(view[taxon]), "CT")
+
+    def test_read_only(self):
+        view = self.char_matrix.character_indices_view([1, 2])
+        sequence = view[self.char_matrix.taxon_namespace[0]]
+        state = dendropy.DNA_STATE_ALPHABET["A"]
+        with self.assertRaises(TypeError):
+            sequence.append(state)
+        with self.assertRaises(TypeError):
+            sequence[0] = state
+        with self.assertRaises(TypeError):
+            del sequence[0]
+        with self.assertRaises(TypeError):
+            sequence.insert(0, state)
+
+    def test_deepcopy(self):
+        indices = [9, 0, 3, 3, 1]
+        view = self.char_matrix.character_indices_view(indices)
+        char_matrix = copy.deepcopy(view)
+        self.assertEqual(len(char_matrix), len(view))
+        for sequence, view_sequence in zip(char_matrix.sequences(), view.sequences()):
+            self.assertIs(type(sequence), dendropy.DnaCharacterDataSequence)
+            self.assertEqual(sequence.values(), view_sequence.values())
+            sequence.append(dendropy.DNA_STATE_ALPHABET["A"])
+            self.assertEqual(len(view_sequence), len(indices))
+
+    def test_taxon_state_sets_map_and_site_patterns(self):
+        indices = [0, 2, 6, 7, 8]
+        view = self.char_matrix.character_indices_view(indices)
+        exported = self.char_matrix.export_character_indices(indices)
+        self.assertEqual(view.taxon_state_sets_map(gaps_as_missing=False),
+                exported.taxon_state_sets_map(gaps_as_missing=False))
+        self.assertEqual(view.site_patterns().weights, exported.site_patterns().weights)
+        self.assertEqual(view.site_patterns().site_pattern_indices,
+                exported.site_patterns().site_pattern_indices)
+
+    def test_write(self):
+        indices = [1, 2, 5, 7, 8]
+        view = self.char_matrix.character_indices_view(indices)
+        exported = self.char_matrix.export_character_indices(indices)
+        for schema in ("fasta", "nexus", "phylip"):
+            self.assertEqual(view.as_string(schema), exported.as_string(schema))
+
+class BootstrapReplicatesTests(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        self.char_matrix = dendropy.DnaCharacterMatrix.from_dict({
+            "a": "ACGTACGN-A",
+            "b": "ACCTACCN-A",
+            "c": "AGGTAGGNTA",
+            })
+        self.replicates = self.char_matrix.bootstrap_replicates(20, seed=42)
+
+    def test_reproducible(self):
+        replicates = self.char_matrix.bootstrap_replicates(20, seed=42)
+        self.assertEqual(list(replicates), list(self.replicates))
+        self.assertEqual(replicates.sampled_sites(7), self.replicates.sampled_sites(7))
+        replicates = self.char_matrix.bootstrap_replicates(20, seed=43)
+        self.assertNotEqual(list(replicates), list(self.replicates))
+        replicates = self.char_matrix.bootstrap_replicates(20, rng=random.Random(1))
+        self.assertEqual(list(replicates),
+                list(self.char_matrix.bootstrap_replicates(20, rng=random.Random(1))))
+
+    def test_weights(self):
+        site_patterns = self.replicates.site_patterns
+        self.assertEqual(len(self.replicates), 20)
+        distinct_sites = set()
+        for replicate_index, pattern_weights in enumerate(self.replicates):
+            sites = self.replicates.sampled_sites(replicate_index)
+            self.assertEqual(len(sites), site_patterns.num_sites)
+            self.assertEqual(sites, sorted(sites))
+            distinct_sites.add(tuple(sites))
+            site_weights = self.replicates.site_weights(replicate_index)
+            self.assertEqual(site_weights, [sites.count(idx) for idx in range(site_patterns.num_sites)])
+            expected = [0] * len(site_patterns)
+            for idx in sites:
+                expected[site_patterns.site_pattern_indices[idx]] += 1
+            self.assertEqual(pattern_weights, expected)
+        self.assertTrue(len(distinct_sites) > 1)
+        self.assertEqual(list(self.replicates.site_weights_iter()),
+                [self.replicates.site_weights(idx) for idx in range(20)])
+        with self.assertRaises(IndexError):
+            self.replicates.pattern_weights(20)
+
+    def test_replicate_char_matrix(self):
+        for replicate_index in (0, 19):
+            sites = self.replicates.sampled_sites(replicate_index)
+            view = self.replicates.replicate_char_matrix(replicate_index)
+            for taxon in self.char_matrix:
+                values = self.char_matrix[taxon].values()
+                self.assertEqual(view[taxon].values(), [values[idx] for idx in sites])
+
+    def test_write(self):
+        replicates = self.char_matrix.bootstrap_replicates(3, seed=1)
+        expected = "".join(replicates.replicate_char_matrix(idx).as_string("phylip") for idx in range(3))
+        self.assertEqual(replicates.as_string("phylip"), expected)
+        self.assertEqual(expected.count("3 10\n"), 3)
+
 if __name__ == "__main__":
     unittest.main()
@@ -304,6 +304,18 @@ class StateAlphabetTester(object):
             obs_states = self.sa.get_states_for_symbols(selected_symbols)
             self.assertEqual(obs_states, selected_states, "random seed: {}".format(self.random_seed))
 
+    def test_translate_symbols(self):
+        all_symbols = [s for s in self.sa.full_symbol_state_map if s is not None and len(s) == 1]
+        for rep in range(3):
+            n = random.randint(5, 100)
+            selected_symbols = [self.rng.choice(all_symbols) for _ in range(n)]
+            state_codes = self.sa.translate_symbols(" ".join(selected_symbols), ignored_symbols=" ")
+            obs_states = [self.sa.states[code] for code in bytearray(state_codes)]
+            self.assertEqual(obs_states, self.sa.get_states_for_symbols(selected_symbols), "random seed: {}".format(self.random_seed))
+        self.assertIs(self.sa.translate_symbols(all_symbols[0] + "%"), None)
+        state_codes = self.sa.translate_symbols(all_symbols[0] + "%", ignore_unrecognized_symbols=True)
+        self.assertEqual(len(state_codes), 1)
+
     def test_states_property(self):
         check = list(self.sa.state_iter())
         self.assertEqual(len(check), len(self.sa.states))
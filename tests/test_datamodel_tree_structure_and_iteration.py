@@ -305,6 +305,46 @@ class TestTreeIterators(curated_test_tree.CuratedTestTree, unittest.TestCase):
         for nd in nodes:
             self.assertEqual(nd.age, self.node_ages[nd.label])
 
+    def test_encode_bipartitions_and_calc_node_ages(self):
+        for is_rooted in (True, False):
+            tree1, anodes, lnodes, inodes = self.get_tree(suppress_leaf_node_taxa=False)
+            tree1.is_rooted = is_rooted
+            bipartitions, edge_lengths, node_ages = tree1.encode_bipartitions_and_calc_node_ages()
+            tree2, anodes, lnodes, inodes = self.get_tree(
+                    suppress_leaf_node_taxa=False,
+                    taxon_namespace=tree1.taxon_namespace)
+            tree2.is_rooted = is_rooted
+            tree2.calc_node_ages()
+            expected_bipartitions = tree2.encode_bipartitions()
+            self.assertEqual(bipartitions, expected_bipartitions)
+            self.assertIs(tree1.bipartition_encoding, bipartitions)
+            for bipartition, edge_length, node_age in zip(bipartitions, edge_lengths, node_ages):
+                edge = tree2.bipartition_edge_map[bipartition]
+                self.assertEqual(edge_length, edge.length)
+                self.assertEqual(node_age, edge.head_node.age)
+                self.assertEqual(node_age, self.node_ages[edge.head_node.label])
+            b, e, a = tree1.encode_bipartitions_and_calc_node_ages(is_calc_node_ages=False)
+            self.assertEqual(b, expected_bipartitions)
+            self.assertEqual(e, edge_lengths)
+            self.assertIs(a, None)
+
+    def test_encode_bipartitions_and_calc_node_ages_with_unifurcations(self):
+        tree = dendropy.Tree.get(
+                data="[&R] (((A:1,B:1):2):1,(C:3,D:3):1);",
+                schema="newick")
+        bipartitions, edge_lengths, node_ages = tree.encode_bipartitions_and_calc_node_ages()
+        self.assertEqual(len(bipartitions), 7)
+        ages = dict((b.leafset_bitmask, a) for b, a in zip(bipartitions, node_ages))
+        lengths = dict((b.leafset_bitmask, e) for b, e in zip(bipartitions, edge_lengths))
+        self.assertEqual(ages[0b0011], 1.0)
+        self.assertEqual(lengths[0b0011], 3.0)
+        self.assertEqual(ages[0b1111], 4.0)
+        tree = dendropy.Tree.get(
+                data="[&R] ((A:1,B:2):1,(C:3,D:3):1);",
+                schema="newick")
+        self.assertRaises(dendropy.utility.error.UltrametricityError,
+                tree.encode_bipartitions_and_calc_node_ages)
+
     def test_ageorder_node_iter_unfiltered(self):
         tree, anodes, lnodes, inodes = self.get_tree()
         nodes = [nd for nd in tree.ageorder_node_iter()]
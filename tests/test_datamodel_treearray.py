@@ -19,6 +19,7 @@
 
 import unittest
 import os
+import io
 import sys
 sys.path.insert(0, os.path.dirname(__file__))
 from support import pathmap
@@ -58,6 +59,127 @@ class TreeArrayBasicTreeAccession(unittest.TestCase):
             tree_array.add_tree(tree)
         self.verify_tree_array(tree_array, trees)
 
+class TreeArrayColumnsReadWrite(unittest.TestCase):
+
+    def get_tree_array(self):
+        return self.get_tree_array_with_namespace(None)
+
+    def get_tree_array_with_namespace(self, taxon_namespace):
+        trees = dendropy.TreeList.get_from_path(pathmap.tree_source_path(
+                "pythonidae.reference-trees.nexus"),
+                "nexus",
+                taxon_namespace=taxon_namespace)
+        tree_array = dendropy.TreeArray(taxon_namespace=trees.taxon_namespace)
+        tree_array.add_trees(trees)
+        return tree_array
+
+    def verify_equal(self, ta1, ta2):
+        self.assertEqual(len(ta1), len(ta2))
+        self.assertEqual(ta1.is_rooted_trees, ta2.is_rooted_trees)
+        for idx in range(len(ta1)):
+            self.assertEqual(ta1.get_split_bitmask_and_edge_tuple(idx),
+                    ta2.get_split_bitmask_and_edge_tuple(idx))
+        sd1 = ta1.split_distribution
+        sd2 = ta2.split_distribution
+        self.assertEqual(sd1.total_trees_counted, sd2.total_trees_counted)
+        self.assertEqual(dict(sd1.split_counts), dict(sd2.split_counts))
+        for split in sd1.split_counts:
+            self.assertEqual(sd1.split_edge_lengths[split], sd2.split_edge_lengths[split])
+        self.assertEqual(sd1.split_frequencies, sd2.split_frequencies)
+
+    def test_round_trip(self):
+        ta1 = self.get_tree_array()
+        dest = io.BytesIO()
+        ta1.write_columns(dest)
+        ta2 = dendropy.TreeArray(taxon_namespace=ta1.taxon_namespace)
+        n = ta2.read_columns(io.BytesIO(dest.getvalue()))
+        self.assertEqual(n, len(ta1))
+        self.verify_equal(ta1, ta2)
+
+    def test_round_trip_new_taxon_namespace(self):
+        ta1 = self.get_tree_array()
+        dest = io.BytesIO()
+        ta1.write_columns(dest)
+        ta2 = dendropy.TreeArray()
+        ta2.read_columns(io.BytesIO(dest.getvalue()))
+        self.assertEqual(ta2.taxon_namespace.labels(), ta1.taxon_namespace.labels())
+        self.assertEqual(ta2.split_distribution.split_frequencies, ta1.split_distribution.split_frequencies)
+
+    def test_merge(self):
+        ta1 = self.get_tree_array()
+        dest = io.BytesIO()
+        ta1.write_columns(dest)
+        ta2 = dendropy.TreeArray(taxon_namespace=ta1.taxon_namespace)
+        ta2.read_columns(io.BytesIO(dest.getvalue()))
+        ta2.read_columns(io.BytesIO(dest.getvalue()))
+        ta1.update(self.get_tree_array_with_namespace(ta1.taxon_namespace))
+        self.verify_equal(ta1, ta2)
+
+class TreeArrayNodeAgeVectors(unittest.TestCase):
+
+    def test_node_ages(self):
+        trees = dendropy.TreeList.get_from_path(
+                pathmap.tree_source_path("cetaceans.mb.strict-clock.mcmc.trees"),
+                "nexus",
+                tree_offset=200)
+        split_bitmasks, node_ages, tree_heights, deviations = trees.calc_node_age_vectors()
+        self.assertEqual(len(node_ages), len(trees))
+        self.assertEqual(deviations, [])
+        for tree_idx, tree in enumerate(trees):
+            tree.encode_bipartitions()
+            tree.calc_node_ages()
+            self.assertEqual(list(split_bitmasks[tree_idx]),
+                    [b.split_bitmask for b in tree.bipartition_encoding])
+            self.assertEqual(len(node_ages[tree_idx]), len(tree.bipartition_encoding))
+            for bipartition, age in zip(tree.bipartition_encoding, node_ages[tree_idx]):
+                self.assertAlmostEqual(age, tree.bipartition_edge_map[bipartition].head_node.age)
+            self.assertAlmostEqual(tree_heights[tree_idx], tree.seed_node.age)
+
+    def test_ultrametricity_deviations(self):
+        trees = dendropy.TreeList.get(
+                data="[&R] ((A:1,B:2):1,(C:3,D:3):1); [&R] ((A:1,B:1):2,(C:3,D:3):1.5);",
+                schema="newick")
+        a, b, c, d = [trees.taxon_namespace.taxon_bitmask(t) for t in trees.taxon_namespace]
+        split_bitmasks, node_ages, tree_heights, deviations = trees.calc_node_age_vectors()
+        self.assertEqual(list(tree_heights), [2.0, 3.0])
+        self.assertEqual(deviations, [
+            (0, a|b, 1.0),
+            (0, a|b|c|d, 2.0),
+            (1, a|b|c|d, 1.5),
+            ])
+        split_bitmasks, node_ages, tree_heights, deviations = trees.calc_node_age_vectors(is_force_max_age=True)
+        self.assertEqual(list(tree_heights), [4.0, 4.5])
+        self.assertEqual(deviations, [])
+
+    def test_tip_ages(self):
+        trees = dendropy.TreeList.get(
+                data="[&R] ((A:2,B:1):2,(C:3,D:3):1);",
+                schema="newick")
+        split_bitmasks, node_ages, tree_heights, deviations = trees.calc_node_age_vectors(
+                taxon_label_age_map={"B": 1.0})
+        self.assertEqual(list(tree_heights), [4.0])
+        self.assertEqual(deviations, [])
+
+    def test_unrooted(self):
+        trees = dendropy.TreeList.get(
+                data="[&U] ((A:1,B:1):1,(C:1,D:1):1);",
+                schema="newick")
+        self.assertRaises(ValueError, trees.calc_node_age_vectors)
+
+    def test_splits_not_in_postorder(self):
+        trees = dendropy.TreeList.get(
+                data="[&R] ((A:1,B:1):1,(C:1,D:1):1);",
+                schema="newick")
+        ta = dendropy.TreeArray.from_tree_list(trees)
+        ta._tree_split_bitmasks[0] = tuple(reversed(ta._tree_split_bitmasks[0]))
+        ta._tree_edge_lengths[0] = tuple(reversed(ta._tree_edge_lengths[0]))
+        self.assertRaises(ValueError, ta.calc_node_age_vectors)
+
+    def test_unrecognized_arguments(self):
+        trees = dendropy.TreeList.get(
+                data="[&R] ((A:1,B:1):1,(C:1,D:1):1);",
+                schema="newick")
+        self.assertRaises(TypeError, trees.calc_node_age_vectors, bogus=1)
 
 if __name__ == "__main__":
     unittest.main()
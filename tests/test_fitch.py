@@ -31,6 +31,9 @@ if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
     from dendropy.utility.filesys import pre_py34_open as open
 import dendropy
 from dendropy.calculate.treescore import fitch_down_pass
+from dendropy.calculate.treescore import fitch_up_pass
+from dendropy.calculate.treescore import BitParallelFitch
+from dendropy.calculate.treescore import IncrementalFitchParsimony
 sys.path.insert(0, os.path.dirname(__file__))
 from support import pathmap
 
@@ -85,6 +88,141 @@ class FitchTest(unittest.TestCase):
             pscore = fitch_down_pass(node_list, taxon_state_sets_map=taxon_state_sets_map)
             # print("{} vs. {}".format(expected_scores[n], pscore))
             self.assertEqual(expected_scores[n], pscore)
+        for fitch in (
+                BitParallelFitch(char_matrix=char_mat, gaps_as_missing=gaps_as_missing),
+                BitParallelFitch(char_matrix=char_mat, gaps_as_missing=gaps_as_missing, compress_site_patterns=False),
+                BitParallelFitch(taxon_state_sets_map=taxon_state_sets_map),
+                ):
+            for n, tree in enumerate(tree_list):
+                self.assertEqual(expected_scores[n], fitch.score(tree))
+
+    def test_bit_parallel_fitch_state_sets(self):
+        dataset = dendropy.DataSet.get_from_path(
+                pathmap.char_source_path("apternodus.chars.nexus"),
+                "nexus")
+        dataset.read_from_path(
+                pathmap.tree_source_path("apternodus.tre"),
+                schema='NEXUS',
+                taxon_namespace=dataset.taxon_namespaces[0])
+        char_mat = dataset.char_matrices[0]
+        for gaps_as_missing in (True, False):
+            taxon_state_sets_map = char_mat.taxon_state_sets_map(gaps_as_missing=gaps_as_missing)
+            fitch = BitParallelFitch(char_matrix=char_mat, gaps_as_missing=gaps_as_missing)
+            for tree in dataset.tree_lists[0]:
+                tree.resolve_polytomies()
+                expected_score_by_character = []
+                expected_score = fitch_down_pass(
+                        tree.postorder_node_iter(),
+                        taxon_state_sets_map=taxon_state_sets_map,
+                        score_by_character_list=expected_score_by_character)
+                node_state_bitsets_map = {}
+                score_by_character = []
+                score = fitch.down_pass(
+                        tree.postorder_node_iter(),
+                        node_state_bitsets_map=node_state_bitsets_map,
+                        score_by_character_list=score_by_character)
+                self.assertEqual(score, expected_score)
+                self.assertEqual(score_by_character, expected_score_by_character)
+                for nd in tree:
+                    self.assertEqual(
+                            fitch.site_patterns.expand(fitch.decode_state_sets(node_state_bitsets_map[nd])),
+                            nd.state_sets)
+                fitch_up_pass(tree.preorder_node_iter(), taxon_state_sets_map=taxon_state_sets_map)
+                fitch.up_pass(tree.preorder_node_iter(), node_state_bitsets_map)
+                for nd in tree:
+                    self.assertEqual(
+                            fitch.site_patterns.expand(fitch.decode_state_sets(node_state_bitsets_map[nd])),
+                            nd.state_sets)
+                for nd in tree:
+                    del nd.state_sets
+
+    def test_bit_parallel_fitch_weights(self):
+        taxa = dendropy.TaxonNamespace()
+        taxon_state_sets_map = {}
+        t1 = taxa.require_taxon("A")
+        t2 = taxa.require_taxon("B")
+        t3 = taxa.require_taxon("C")
+        t4 = taxa.require_taxon("D")
+        t5 = taxa.require_taxon("E")
+        taxon_state_sets_map[t1] = [ set([0,1]),  set([0,1]),  set([0]),     set([0]) ]
+        taxon_state_sets_map[t2] = [ set([1]),    set([1]),    set([1]),     set([0]) ]
+        taxon_state_sets_map[t3] = [ set([0]),    set([1]),    set([1]),     set([0]) ]
+        taxon_state_sets_map[t4] = [ set([0]),    set([1]),    set([0,1]),   set([1]) ]
+        taxon_state_sets_map[t5] = [ set([1]),    set([0]),    set([1]),     set([1]) ]
+        tree = dendropy.Tree.get_from_string(
+                "(A,(B,(C,(D,E))));", "newick",
+                taxon_namespace=taxa)
+        reweighted_fitch = BitParallelFitch(taxon_state_sets_map=taxon_state_sets_map)
+        for weights in (None, [1, 1, 1, 1], [2, 0, 1, 3], [0.5, 1.5, 1.5, 2]):
+            expected_score_by_character = []
+            expected_score = fitch_down_pass(tree.postorder_node_iter(),
+                    state_sets_attr_name=None,
+                    taxon_state_sets_map=taxon_state_sets_map,
+                    weights=weights,
+                    score_by_character_list=expected_score_by_character)
+            fitch = BitParallelFitch(taxon_state_sets_map=taxon_state_sets_map, weights=weights)
+            score_by_character = []
+            self.assertEqual(fitch.score(tree, score_by_character), expected_score)
+            self.assertEqual(score_by_character, expected_score_by_character)
+            reweighted_fitch.set_weights(weights)
+            self.assertEqual(reweighted_fitch.score(tree), expected_score)
+
+    def test_incremental_fitch_parsimony(self):
+        rng = random.Random(1)
+        taxa = dendropy.TaxonNamespace()
+        chars = dendropy.StandardCharacterMatrix.get_from_path(
+                pathmap.char_source_path("apternodus.chars.nexus"),
+                "nexus",
+                taxon_namespace=taxa)
+        tree = dendropy.Tree.get_from_path(
+                pathmap.tree_source_path("apternodus.tre"),
+                "nexus",
+                taxon_namespace=taxa)
+        tree.resolve_polytomies(rng=rng)
+        for edge in tree.postorder_edge_iter():
+            edge.length = 1.0
+        fitch = BitParallelFitch(char_matrix=chars)
+        scorer = IncrementalFitchParsimony(tree, fitch)
+        self.assertEqual(scorer.score, fitch.score(tree))
+        for i in range(100):
+            original = tree.as_string("newick")
+            original_score = scorer.score
+            nodes = list(tree.preorder_node_iter())
+            node1 = rng.choice(nodes)
+            node2 = rng.choice(nodes)
+            try:
+                if i % 2:
+                    delta = scorer.spr(node1, node2)
+                else:
+                    delta = scorer.nni(node1, node2)
+            except ValueError:
+                self.assertEqual(tree.as_string("newick"), original)
+                continue
+            self.assertEqual(scorer.score, fitch.score(tree))
+            self.assertEqual(delta, scorer.score - original_score)
+            self.assertEqual(len(tree.leaf_nodes()), len(taxa))
+            if rng.random() < 0.5:
+                self.assertEqual(scorer.undo(), -delta)
+                self.assertEqual(tree.as_string("newick"), original)
+                self.assertEqual(scorer.score, original_score)
+        for i in range(10):
+            nodes = list(tree.preorder_node_iter())
+            node = rng.choice(nodes[1:])
+            original = tree.as_string("newick")
+            original_score = scorer.score
+            nd_connection_list = scorer.prune_subtree(node)
+            scorer.update()
+            self.assertEqual(scorer.score, fitch.score(tree))
+            pruned_score = scorer.score
+            scorer.reinsert_nodes(nd_connection_list)
+            self.assertEqual(scorer.update(), original_score - pruned_score)
+            self.assertEqual(scorer.score, original_score)
+            self.assertEqual(tree.as_string("newick"), original)
+        for i in range(10):
+            edge = rng.choice([nd.edge for nd in tree.preorder_node_iter()][1:])
+            scorer.reroot_at_edge(edge, 0.5, 0.5)
+            scorer.update()
+            self.assertEqual(scorer.score, fitch.score(tree))
 
 if __name__ == "__main__":
     unittest.main()
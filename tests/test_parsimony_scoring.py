@@ -485,6 +485,10 @@ class ParsimonyScoringTest(unittest.TestCase):
                 self.assertEqual(obs, exp)
             self.assertEqual(sum(score_by_character_list), pscore)
 
+            # by default, the state sets are left on the nodes
+            for nd in tree:
+                self.assertEqual(len(nd.state_sets), len(expected_per_site_scores[tree_idx]))
+
             # just to be sure it works without passing in `score_by_character_list`:
             pscore = treescore.parsimony_score(
                     tree,
@@ -492,6 +496,29 @@ class ParsimonyScoringTest(unittest.TestCase):
                     gaps_as_missing=gaps_as_missing)
             self.assertEqual(pscore, expected_scores[tree_idx])
 
+            # scoring every site pattern instead of every site
+            score_by_character_list = []
+            pscore = treescore.parsimony_score(
+                    tree,
+                    chars,
+                    gaps_as_missing=gaps_as_missing,
+                    score_by_character_list=score_by_character_list,
+                    compress_site_patterns=True)
+            self.assertEqual(pscore, expected_scores[tree_idx])
+            self.assertEqual(score_by_character_list, expected_per_site_scores[tree_idx])
+
+            # weighted
+            weights = [(idx % 3) + 1 for idx in range(len(expected_per_site_scores[tree_idx]))]
+            expected_weighted_score = sum(s * w for s, w in zip(expected_per_site_scores[tree_idx], weights))
+            for compress_site_patterns in (True, False):
+                pscore = treescore.parsimony_score(
+                        tree,
+                        chars,
+                        gaps_as_missing=gaps_as_missing,
+                        weights=weights,
+                        compress_site_patterns=compress_site_patterns)
+                self.assertEqual(pscore, expected_weighted_score)
+
 if __name__ == "__main__":
     unittest.main()
 
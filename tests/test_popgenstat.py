@@ -23,6 +23,8 @@ Tests population genetic statistic calculation.
 
 import unittest
 import math
+import random
+import collections
 import dendropy
 import os
 import sys
@@ -88,6 +90,130 @@ class TajimasDTests(dendropytest.ExtendedTestCase):
     def testTajimasD_with_missing(self):
         self.assertAlmostEqual(popgenstat.tajimas_d(self.matrix_with_missing), -1.44617198561, 4)
 
+class PairwiseDifferencesTests(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        rng = random.Random(1)
+        sequences = collections.OrderedDict()
+        for i in range(7):
+            sequences["s{}".format(i)] = "".join(["A" if rng.random() < 0.7 else rng.choice("ACGTRN-?") for j in range(700)])
+        self.char_matrix = dendropy.DnaCharacterMatrix.from_dict(sequences)
+        self.sequences = [self.char_matrix[taxon].symbols_as_string() for taxon in self.char_matrix]
+        self.weights = [rng.randint(1, 3) for j in range(700)]
+
+    def get_expected_differences(self, ignore_uncertain, weights):
+        ignored = "-?N" if ignore_uncertain else ""
+        diffs = {}
+        counts = {}
+        for i, seq1 in enumerate(self.sequences):
+            for j, seq2 in enumerate(self.sequences):
+                if i == j:
+                    continue
+                diffs[i, j] = 0
+                counts[i, j] = 0
+                for c1, c2, w in zip(seq1, seq2, weights):
+                    if c1 in ignored or c2 in ignored:
+                        continue
+                    counts[i, j] += w
+                    if c1 != c2:
+                        diffs[i, j] += w
+        return diffs, counts
+
+    def test_pairwise_differences(self):
+        sequences = [self.char_matrix[taxon] for taxon in self.char_matrix]
+        for ignore_uncertain in (True, False):
+            rows, ignored_codes = popgenstat._encode_sequences(sequences, self.char_matrix.default_state_alphabet, ignore_uncertain)
+            for weights in (None, self.weights, [w / 2.0 for w in self.weights]):
+                expected_diffs, expected_counts = self.get_expected_differences(ignore_uncertain, weights or [1] * 700)
+                for block_size in (1, 64, 65536):
+                    diffs, counts = popgenstat._pairwise_differences(rows, ignored_codes, weights, block_size=block_size)
+                    for (i, j), diff in expected_diffs.items():
+                        self.assertEqual(diffs[i][j], diff)
+                        self.assertEqual(counts[i][j], expected_counts[i, j])
+
+    def test_site_pattern_encoding(self):
+        sequences = [self.char_matrix[taxon] for taxon in self.char_matrix]
+        for ignore_uncertain in (True, False):
+            rows, ignored_codes = popgenstat._encode_sequences(sequences, self.char_matrix.default_state_alphabet, ignore_uncertain)
+            pattern_rows, pattern_ignored_codes, weights = popgenstat._encode_char_matrix(self.char_matrix, ignore_uncertain)
+            self.assertEqual(popgenstat._pairwise_differences(rows, ignored_codes),
+                    popgenstat._pairwise_differences(pattern_rows, pattern_ignored_codes, weights))
+            self.assertEqual(popgenstat._count_segregating_sites(rows, ignored_codes),
+                    popgenstat._count_segregating_sites(pattern_rows, pattern_ignored_codes, weights))
+
+class SlidingWindowStatisticsTests(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        rng = random.Random(1)
+        sequences = collections.OrderedDict()
+        for i in range(8):
+            sequences["s{}".format(i)] = "".join(["A" if rng.random() < 0.7 else rng.choice("ACGTRN-?") for j in range(100)])
+        self.char_matrix = dendropy.DnaCharacterMatrix.from_dict(sequences)
+
+    def test_window_bounds(self):
+        windows = popgenstat.SlidingWindowStatistics(self.char_matrix)
+        self.assertEqual(windows.window_bounds(40), [(0, 40), (40, 80), (80, 100)])
+        self.assertEqual(windows.window_bounds(50), [(0, 50), (50, 100)])
+        self.assertEqual(windows.window_bounds(60, 30), [(0, 60), (30, 90), (60, 100)])
+        self.assertEqual(windows.window_bounds(200, 30), [(0, 100)])
+        self.assertRaises(ValueError, windows.window_bounds, 0)
+
+    def test_window_statistics(self):
+        for ignore_uncertain in (True, False):
+            for num_processes in (None, 2):
+                windows = popgenstat.SlidingWindowStatistics(self.char_matrix,
+                        ignore_uncertain=ignore_uncertain,
+                        num_processes=num_processes)
+                rows = windows.calc(window_size=30, step_size=20)
+                self.assertEqual(len(rows), 5)
+                for row in rows:
+                    char_matrix = self.char_matrix.export_character_indices(range(row["start"], row["stop"]))
+                    self.assertEqual(row["num_segregating_sites"],
+                            popgenstat.num_segregating_sites(char_matrix, ignore_uncertain))
+                    self.assertAlmostEqual(row["average_number_of_pairwise_differences"],
+                            popgenstat.average_number_of_pairwise_differences(char_matrix, ignore_uncertain))
+                    self.assertAlmostEqual(row["wattersons_theta"],
+                            popgenstat.wattersons_theta(char_matrix, ignore_uncertain))
+                    self.assertAlmostEqual(row["tajimas_d"],
+                            popgenstat.tajimas_d(char_matrix, ignore_uncertain))
+                    self.assertEqual(row["unfolded_site_frequency_spectrum"],
+                            popgenstat.unfolded_site_frequency_spectrum(char_matrix, ignore_uncertain=ignore_uncertain))
+
+    def test_nucleotide_diversity(self):
+        char_matrix = dendropy.DnaCharacterMatrix.from_dict(collections.OrderedDict([
+            ("s1", "AACGTTAACG"),
+            ("s2", "AACGTAAACG"),
+            ("s3", "ATCGTTAAGG"),
+            ("s4", "AACCTTAACG"),
+            ]))
+        windows = popgenstat.SlidingWindowStatistics(char_matrix)
+        for start, stop in windows.window_bounds(4, 3):
+            self.assertAlmostEqual(windows.nucleotide_diversity(start, stop),
+                    popgenstat.nucleotide_diversity(char_matrix.export_character_indices(range(start, stop))))
+
+    def test_character_indices_view(self):
+        windows = popgenstat.SlidingWindowStatistics(self.char_matrix)
+        for start, stop in windows.window_bounds(30, 20):
+            char_matrix = self.char_matrix.character_indices_view(slice(start, stop))
+            self.assertEqual(windows.num_segregating_sites(start, stop),
+                    popgenstat.num_segregating_sites(char_matrix))
+            self.assertAlmostEqual(windows.average_number_of_pairwise_differences(start, stop),
+                    popgenstat.average_number_of_pairwise_differences(char_matrix))
+            self.assertAlmostEqual(popgenstat.nucleotide_diversity(char_matrix),
+                    popgenstat.nucleotide_diversity(self.char_matrix.export_character_indices(range(start, stop))))
+
+    def test_ancestral_sequence(self):
+        ancestral_sequence = self.char_matrix[3]
+        windows = popgenstat.SlidingWindowStatistics(self.char_matrix,
+                ancestral_sequence=ancestral_sequence)
+        for start, stop in windows.window_bounds(30, 20):
+            char_matrix = self.char_matrix.export_character_indices(range(start, stop))
+            self.assertEqual(windows.unfolded_site_frequency_spectrum(start, stop, pad=False),
+                    popgenstat.unfolded_site_frequency_spectrum(char_matrix,
+                        ancestral_sequence=ancestral_sequence[start:stop],
+                        ignore_uncertain=True,
+                        pad=False))
+
 class SinglePopTest(dendropytest.ExtendedTestCase):
 
     data = dendropy.DnaCharacterMatrix.get_from_path(pathmap.char_source_path('COII_Apes.nex'), schema="nexus")
@@ -128,5 +254,25 @@ class PopulationPairSummaryStatisticsTests(dendropytest.ExtendedTestCase):
         self.assertAlmostEqual(pp.tajimas_d, 1.65318627677, 4)
         self.assertAlmostEqual(pp.wakeleys_psi, 0.8034976, 2)
 
+    def test_uncertain_states_between_populations(self):
+        # 'N' in s3 is opposite a 'C' in s1 and an 'A' in s2: it is ignored
+        # in comparisons within populations, but (as only the gap and
+        # no-data states themselves are ignored there) counted as a
+        # difference in comparisons between populations
+        seqs = dendropy.DnaCharacterMatrix.from_dict(collections.OrderedDict([
+            ("s1", "ACGTAC"),
+            ("s2", "ACGTAA"),
+            ("s3", "TCGTAN"),
+            ("s4", "TCGAAC"),
+            ])).sequences()
+        pp = popgenstat.PopulationPairSummaryStatistics(seqs[:2], seqs[2:])
+        # between-population differences: s1-s3 2, s1-s4 2, s2-s3 2, s2-s4 3
+        self.assertAlmostEqual(pp.average_number_of_pairwise_differences_between, 2.25)
+        self.assertAlmostEqual(pp.average_number_of_pairwise_differences_within, 2.0)
+        self.assertAlmostEqual(pp.average_number_of_pairwise_differences_net, 0.25)
+        self.assertAlmostEqual(pp.average_number_of_pairwise_differences, 1.5)
+        # (2 * 2 * 2 * sqrt(0.1875) / 1.5) / 12
+        self.assertAlmostEqual(pp.wakeleys_psi, 0.1924500897)
+
 if __name__ == "__main__":
     unittest.main()
@@ -620,6 +620,22 @@ class TestVarianceCovariance(unittest.TestCase):
             for j, y in enumerate(x):
                 self.assertAlmostEqual(cov[i][j], e[i][j])
 
+class PotentialScaleReductionFactorTests(unittest.TestCase):
+
+    def testPsrf(self):
+        chains = [[1.0, 2.0, 3.0], [2.0, 3.0, 4.0]]
+        chain_means, chain_variances = zip(*[statistics.mean_and_sample_variance(c) for c in chains])
+        psrf = statistics.potential_scale_reduction_factor(
+                chain_sizes=[len(c) for c in chains],
+                chain_means=chain_means,
+                chain_variances=chain_variances)
+        # W = 1, B/n = 0.5, V = (2/3)(1) + (3/2)(0.5)
+        self.assertAlmostEqual(psrf, (2.0/3.0 + 0.75) ** 0.5)
+
+    def testPsrfUndefined(self):
+        self.assertIs(statistics.potential_scale_reduction_factor([3], [1.0], [1.0]), None)
+        self.assertIs(statistics.potential_scale_reduction_factor([3, 3], [1.0, 2.0], [0.0, 0.0]), None)
+
 class FishersExactTests(dendropytest.ExtendedTestCase):
     """
     Fisher's exact test.
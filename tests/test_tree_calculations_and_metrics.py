@@ -33,6 +33,7 @@ from support import pathmap
 import dendropy
 from dendropy.calculate import treemeasure
 from dendropy.calculate import treecompare
+from dendropy.utility import error
 from dendropy.utility.textprocessing import StringIO
 
 def _get_reference_tree_list(taxon_namespace=None):
@@ -1025,6 +1026,32 @@ class TreeCompareTests(dendropytest.ExtendedTestCase):
 #                if (i * i+j+1) % 6 == 0:
 #                    print
 
+    def testDayRobinsonFouldsDistances(self):
+        for rooting in ("force-rooted", "force-unrooted"):
+            trees = dendropy.TreeList.get_from_path(
+                    pathmap.tree_source_path("dendropy-test-trees-multifurcating-rooted.nexus"),
+                    "nexus",
+                    rooting=rooting)
+            for t1 in trees:
+                for t2 in trees:
+                    self.assertEqual(
+                            treecompare.unweighted_robinson_foulds_distance(t1, t2, algorithm="day"),
+                            treecompare.symmetric_difference(t1, t2))
+        for i, t1 in enumerate(self.tree_list1[:-1]):
+            for j, t2 in enumerate(self.tree_list2[i+1:]):
+                self.assertEqual(
+                        treecompare.day_robinson_foulds_distance(t1, t2),
+                        treecompare.symmetric_difference(t1, t2))
+
+    def testDayRobinsonFouldsDistanceDifferentLeafSets(self):
+        t1 = dendropy.Tree.get_from_string("(A,(B,(C,D)));", "newick", rooting="force-rooted")
+        t2 = dendropy.Tree.get_from_string("(A,(B,(C,E)));", "newick", rooting="force-rooted", taxon_namespace=t1.taxon_namespace)
+        with self.assertRaises(ValueError):
+            treecompare.day_robinson_foulds_distance(t1, t2)
+        t3 = dendropy.Tree.get_from_string("(A,(B,C));", "newick", rooting="force-rooted", taxon_namespace=t1.taxon_namespace)
+        with self.assertRaises(ValueError):
+            treecompare.day_robinson_foulds_distance(t1, t3)
+
     def testEuclideanDistances(self):
         expected = {
             (0,1):442.518379997, (0,2):458.269219125, (0,3):492.707662859, (0,4):457.731995932, (0,5):463.419798784, (0,6):462.181969494,
@@ -1065,6 +1092,102 @@ class TreeCompareTests(dendropytest.ExtendedTestCase):
 #                if (i * i+j+1) % 6 == 0:
 #                    print
 
+class TreeDistanceMatrixTests(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        self.trees = _get_reference_tree_list()
+
+    def check_distance_matrix(self, metric, pairwise_fn, distances):
+        num_trees = len(self.trees)
+        self.assertEqual(len(distances), num_trees * (num_trees - 1) // 2)
+        for i in range(num_trees):
+            for j in range(i+1, num_trees):
+                expected = pairwise_fn(self.trees[i], self.trees[j])
+                idx = treecompare.condensed_matrix_index(num_trees, i, j)
+                self.assertEqual(idx, treecompare.condensed_matrix_index(num_trees, j, i))
+                self.assertAlmostEqual(distances[idx], expected)
+
+    def test_tree_list(self):
+        for metric, pairwise_fn in (
+                ("unweighted_robinson_foulds", treecompare.symmetric_difference),
+                ("weighted_robinson_foulds", treecompare.weighted_robinson_foulds_distance),
+                ("euclidean", treecompare.euclidean_distance),
+                ):
+            self.check_distance_matrix(metric, pairwise_fn,
+                    self.trees.tree_distance_matrix(metric=metric))
+
+    def test_tree_array(self):
+        tree_array = self.trees.as_tree_array()
+        for metric, pairwise_fn in (
+                ("unweighted_robinson_foulds", treecompare.symmetric_difference),
+                ("weighted_robinson_foulds", treecompare.weighted_robinson_foulds_distance),
+                ("euclidean", treecompare.euclidean_distance),
+                ):
+            self.check_distance_matrix(metric, pairwise_fn,
+                    tree_array.tree_distance_matrix(metric=metric))
+
+    def test_parallel(self):
+        self.check_distance_matrix("unweighted_robinson_foulds",
+                treecompare.symmetric_difference,
+                self.trees.tree_distance_matrix(num_processes=2))
+
+    def test_tree_array_without_edge_lengths(self):
+        tree_array = self.trees.as_tree_array(ignore_edge_lengths=True)
+        with self.assertRaises(ValueError):
+            tree_array.tree_distance_matrix(metric="euclidean")
+
+    def test_invalid_metric(self):
+        with self.assertRaises(ValueError):
+            self.trees.tree_distance_matrix(metric="xxx")
+
+class ReferenceTreeComparatorTests(dendropytest.ExtendedTestCase):
+
+    def check_rows(self, reference_tree, trees, rows):
+        self.assertEqual(len(rows), len(trees))
+        for tree, row in zip(trees, rows):
+            self.assertEqual(list(row.keys()), list(treecompare.ReferenceTreeComparator.METRICS))
+            fp, fn = treecompare.false_positives_and_negatives(reference_tree, tree)
+            self.assertEqual(row["false_positives"], fp)
+            self.assertEqual(row["false_negatives"], fn)
+            self.assertEqual(row["unweighted_robinson_foulds"], treecompare.symmetric_difference(reference_tree, tree))
+            self.assertAlmostEqual(row["weighted_robinson_foulds"], treecompare.weighted_robinson_foulds_distance(reference_tree, tree))
+            self.assertAlmostEqual(row["euclidean"], treecompare.euclidean_distance(reference_tree, tree))
+
+    def test_compare_trees(self):
+        trees = _get_reference_tree_list()
+        reference_tree = trees[2]
+        comparator = treecompare.ReferenceTreeComparator(reference_tree)
+        self.check_rows(reference_tree, trees, comparator.compare_trees(trees))
+        for tree in trees:
+            self.assertEqual(
+                    [b.split_bitmask for b in comparator.find_missing_bipartitions(tree)],
+                    [b.split_bitmask for b in treecompare.find_missing_bipartitions(reference_tree, tree)])
+            self.assertEqual(comparator.symmetric_difference(tree), treecompare.symmetric_difference(reference_tree, tree))
+
+    def test_compare_trees_selected_metrics(self):
+        trees = _get_reference_tree_list()
+        comparator = treecompare.ReferenceTreeComparator(trees[0])
+        row = comparator.compare(trees[1], metrics=("euclidean", "false_positives"))
+        self.assertEqual(list(row.keys()), ["euclidean", "false_positives"])
+
+    def test_compare_files(self):
+        path = pathmap.tree_source_path("pythonidae.reference-trees.nexus")
+        trees = dendropy.TreeList.get_from_path(path, "nexus")
+        reference_tree = trees[3]
+        comparator = treecompare.ReferenceTreeComparator(reference_tree)
+        num_taxa = len(reference_tree.taxon_namespace)
+        for num_processes in (1, 2):
+            rows = comparator.compare_files([path, path], "nexus", num_processes=num_processes)
+            self.check_rows(reference_tree, list(trees) * 2, rows)
+        self.assertEqual(len(reference_tree.taxon_namespace), num_taxa)
+
+    def test_distinct_taxon_namespace(self):
+        tree1 = dendropy.Tree.get_from_string("(A,(B,(C,D)));", "newick")
+        tree2 = dendropy.Tree.get_from_string("(A,(B,(C,D)));", "newick")
+        comparator = treecompare.ReferenceTreeComparator(tree1)
+        with self.assertRaises(error.TaxonNamespaceIdentityError):
+            comparator.compare(tree2)
+
 class FrequencyOfBipartitionsTests(unittest.TestCase):
 
     def testCount1(self):
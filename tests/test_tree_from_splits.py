@@ -55,5 +55,53 @@ class TreeFromBipartitionsTest(unittest.TestCase):
             _LOG.debug("Reconstructed: {}".format(t_tree.as_string("newick")))
             self.assertEqual(treecompare.symmetric_difference(ref_tree, t_tree), 0)
 
+    def testEdgeLengths(self):
+        ref_tree = dendropy.Tree.get_from_path(
+                pathmap.tree_source_path("pythonidae.beast.summary.tre"),
+                "nexus",
+                rooting="force-rooted")
+        bipartition_encoding = ref_tree.encode_bipartitions()
+        t_tree = dendropy.Tree.from_bipartition_encoding(
+                bipartition_encoding,
+                taxon_namespace=ref_tree.taxon_namespace,
+                is_rooted=True,
+                edge_lengths=[ref_tree.bipartition_edge_map[b].length for b in bipartition_encoding])
+        for bipartition in t_tree.bipartition_encoding:
+            if bipartition.is_trivial() or bipartition.leafset_bitmask == t_tree.seed_node.edge.bipartition.leafset_bitmask:
+                continue
+            self.assertEqual(t_tree.bipartition_edge_map[bipartition].length,
+                    ref_tree.bipartition_edge_map[bipartition].length)
+
+    def testIncompatibleSplitsInOrderOfPreference(self):
+        taxon_namespace = dendropy.TaxonNamespace(["A", "B", "C", "D", "E"])
+        # (A,B) and (B,C) conflict: the first given is retained
+        for split_bitmasks, expected in (
+                ([0b00011, 0b00110, 0b11000], "((A,B),C,(D,E));"),
+                ([0b00110, 0b00011, 0b11000], "(A,(B,C),(D,E));"),
+                ):
+            tree = dendropy.Tree.from_split_bitmasks(
+                    split_bitmasks=split_bitmasks,
+                    taxon_namespace=taxon_namespace,
+                    is_rooted=True)
+            expected_tree = dendropy.Tree.get(
+                    data=expected,
+                    schema="newick",
+                    rooting="force-rooted",
+                    taxon_namespace=taxon_namespace)
+            self.assertEqual(treecompare.symmetric_difference(expected_tree, tree), 0)
+
+    def testLargeCaterpillar(self):
+        num_tips = 2000
+        taxon_namespace = dendropy.TaxonNamespace(["T{}".format(i) for i in range(num_tips)])
+        split_bitmasks = [(1 << i) - 1 for i in range(2, num_tips)]
+        tree = dendropy.Tree.from_split_bitmasks(
+                split_bitmasks=reversed(split_bitmasks),
+                taxon_namespace=taxon_namespace,
+                is_rooted=True)
+        self.assertEqual(len(tree.leaf_nodes()), num_tips)
+        self.assertEqual(
+                sorted(nd.edge.bipartition.leafset_bitmask for nd in tree.postorder_internal_node_iter(exclude_seed_node=True)),
+                split_bitmasks)
+
 if __name__ == "__main__":
     unittest.main()
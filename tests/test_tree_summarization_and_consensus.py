@@ -28,6 +28,8 @@ import random
 import itertools
 from dendropy.calculate import treecompare
 from dendropy.calculate import statistics
+from dendropy.calculate import treesum
+from dendropy.utility import bitprocessing
 import os
 import sys
 sys.path.insert(0, os.path.dirname(__file__))
@@ -66,6 +68,96 @@ class TestConsensusTree(unittest.TestCase):
                 s2 = round(float(edge2.head_node.label), 2)
                 self.assertAlmostEqual(s1, s2, 2)
 
+    def testGreedyConsensus(self):
+        con_tree = self.tree_list.greedy_consensus(
+                is_bipartitions_updated=False,
+                support_label_decimals=2)
+        con_tree.encode_bipartitions()
+        # all majority-rule splits are in the greedy consensus tree
+        for bipartition in self.mb_con_tree.bipartition_encoding:
+            self.assertIn(bipartition, con_tree.bipartition_edge_map)
+        # expected splits, using pairwise compatibility checks
+        sd = self.tree_list.split_distribution(is_bipartitions_updated=False)
+        split_frequencies = sd.split_frequencies
+        fill_bitmask = self.tree_list.taxon_namespace.all_taxa_bitmask()
+        expected_splits = []
+        for freq, split in sorted([(split_frequencies[s], s) for s in split_frequencies], reverse=True):
+            for accepted_split in expected_splits:
+                if not dendropy.Bipartition.is_compatible_bitmasks(split, accepted_split, fill_bitmask):
+                    break
+            else:
+                expected_splits.append(split)
+        expected_splits = set(dendropy.Bipartition.normalize_bitmask(s, fill_bitmask) for s in expected_splits)
+        expected_splits = set(s for s in expected_splits if bitprocessing.num_set_bits(s) > 1
+                and bitprocessing.num_set_bits(s) < len(self.tree_list.taxon_namespace) - 1)
+        observed_splits = set(b.split_bitmask for b in con_tree.bipartition_encoding if not b.is_trivial())
+        self.assertEqual(observed_splits, expected_splits)
+
+    def testGreedyCompatibleSplitsRooted(self):
+        rng = random.Random(1)
+        num_leaves = 12
+        fill_bitmask = (1 << num_leaves) - 1
+        for rep in range(20):
+            candidates = [rng.randint(1, fill_bitmask) for i in range(40)]
+            expected_splits = []
+            for split in candidates:
+                if (split == fill_bitmask
+                        or bitprocessing.num_set_bits(split) < 2
+                        or split in expected_splits):
+                    continue
+                for accepted_split in expected_splits:
+                    if (split & accepted_split) and (split | accepted_split) not in (split, accepted_split):
+                        break
+                else:
+                    expected_splits.append(split)
+            observed_splits = dendropy.Tree.greedy_compatible_split_bitmasks(
+                    split_bitmasks=candidates,
+                    all_taxa_bitmask=fill_bitmask,
+                    is_rooted=True)
+            self.assertEqual(observed_splits, expected_splits)
+
+class TestConvergenceDiagnostics(unittest.TestCase):
+
+    def testAverageStandardDeviationOfSplitFrequencies(self):
+        all_taxa_bitmask = 0b11111
+        split_frequencies = [
+                {0b00011: 1.0, 0b00110: 0.5, 0b01100: 0.05, 0b00001: 1.0, 0b11111: 1.0},
+                {0b00011: 0.5, 0b00110: 1.0, 0b01100: 0.05, 0b00001: 1.0, 0b11111: 1.0},
+                ]
+        sdsfs = treesum.split_frequency_standard_deviations(
+                split_frequencies=split_frequencies,
+                all_taxa_bitmask=all_taxa_bitmask,
+                is_rooted=True,
+                min_freq=0.1)
+        # trivial splits and splits below minimum frequency are excluded
+        self.assertEqual(set(sdsfs.keys()), set([0b00011, 0b00110]))
+        expected_sd = (0.125 ** 0.5)
+        for split_bitmask in sdsfs:
+            self.assertAlmostEqual(sdsfs[split_bitmask], expected_sd)
+        asdsf, max_sdsf = treesum.average_standard_deviation_of_split_frequencies(
+                split_frequencies=split_frequencies + [{0b00011: 0.75}],
+                all_taxa_bitmask=all_taxa_bitmask,
+                is_rooted=True,
+                min_freq=0.1)
+        sd1 = statistics.mean_and_sample_variance([1.0, 0.5, 0.75])[1] ** 0.5
+        sd2 = statistics.mean_and_sample_variance([0.5, 1.0, 0.0])[1] ** 0.5
+        self.assertAlmostEqual(asdsf, (sd1 + sd2) / 2)
+        self.assertAlmostEqual(max_sdsf, max(sd1, sd2))
+
+    def testIdenticalSamples(self):
+        trees = dendropy.TreeList.get_from_path(
+                pathmap.tree_source_path("pythonidae.mb.run1.t"),
+                "nexus")
+        sd = trees.split_distribution(is_bipartitions_updated=False)
+        asdsf, max_sdsf = treesum.average_standard_deviation_of_split_frequencies(
+                split_frequencies=[sd.split_frequencies, sd.split_frequencies],
+                all_taxa_bitmask=trees.taxon_namespace.all_taxa_bitmask())
+        self.assertEqual(asdsf, 0.0)
+        self.assertEqual(max_sdsf, 0.0)
+        self.assertEqual(treesum.average_standard_deviation_of_split_frequencies(
+                split_frequencies=[sd.split_frequencies],
+                all_taxa_bitmask=trees.taxon_namespace.all_taxa_bitmask()), (None, None))
+
 class TestBasicCredibilityScoring(unittest.TestCase):
 
     def get_trees(self):
@@ -218,6 +310,54 @@ class TestTreeEdgeSummarization(unittest.TestCase):
             obs_edge = target_tree.bipartition_edge_map[exp_bipartition]
             self.assertAlmostEqual(obs_edge.head_node.age, exp_edge.head_node.age)
 
+    def testNodeAgesCountedWhileEncodingBipartitions(self):
+        trees = dendropy.TreeList.get_from_path(
+                pathmap.tree_source_path("cetaceans.mb.strict-clock.mcmc.trees"),
+                "nexus",
+                tree_offset=200)
+        sd1 = dendropy.SplitDistribution(taxon_namespace=trees.taxon_namespace, ignore_node_ages=False)
+        sd2 = dendropy.SplitDistribution(taxon_namespace=trees.taxon_namespace, ignore_node_ages=False)
+        for tree in trees:
+            sd1.count_splits_on_tree(tree, is_bipartitions_updated=False)
+        for tree in trees:
+            tree.encode_bipartitions()
+            sd2.count_splits_on_tree(tree, is_bipartitions_updated=True)
+        self.assertEqual(set(sd1.split_node_ages), set(sd2.split_node_ages))
+        for split in sd1.split_node_ages:
+            self.assertEqual(sd1.split_edge_lengths[split], sd2.split_edge_lengths[split])
+            self.assertEqual(len(sd1.split_node_ages[split]), len(sd2.split_node_ages[split]))
+            for age1, age2 in zip(sd1.split_node_ages[split], sd2.split_node_ages[split]):
+                self.assertAlmostEqual(age1, age2)
+
+    def testParallelSummarizationOnManyTrees(self):
+        trees = dendropy.TreeList.get_from_path(
+                pathmap.tree_source_path("cetaceans.mb.strict-clock.mcmc.trees"),
+                "nexus",
+                tree_offset=200)
+        tree_array = dendropy.TreeArray(
+                taxon_namespace=trees.taxon_namespace,
+                ignore_node_ages=False)
+        tree_array.add_trees(trees)
+        kwargs = {
+                "set_edge_lengths": "mean-age",
+                "set_support_as_node_label": True,
+                }
+        serial_trees = list(tree_array.summarize_splits_on_trees(
+                trees=trees.clone(1),
+                **kwargs))
+        parallel_trees = list(tree_array.summarize_splits_on_trees(
+                trees=iter(trees.clone(1)),
+                num_processes=2,
+                chunk_size=7,
+                **kwargs))
+        self.assertEqual(len(serial_trees), len(trees))
+        self.assertEqual(len(parallel_trees), len(trees))
+        for tree1, tree2 in zip(serial_trees, parallel_trees):
+            self.assertIs(tree2.taxon_namespace, trees.taxon_namespace)
+            for nd in tree2.leaf_node_iter():
+                self.assertIn(nd.taxon, trees.taxon_namespace)
+            self.assertEqual(tree1.as_string("newick"), tree2.as_string("newick"))
+
 class TestTopologyCounter(dendropytest.ExtendedTestCase):
 
     def get_regime(self,
@@ -384,5 +524,68 @@ class TestTopologyCounter(dendropytest.ExtendedTestCase):
             b = frozenset(tree.encode_bipartitions())
             self.assertAlmostEqual(tree.frequency, expected_freqs[b])
 
+    def get_simple_trees(self):
+        taxon_namespace = dendropy.TaxonNamespace()
+        all_tree_strs = [
+            "[&U] (A,(B,(C,(D,E))));",
+            "[&U] (B,(C,(D,(A,E))));",
+            "[&U] (D,(A,(B,(C,E))));",
+            ]
+        weights = [5, 3, 1]
+        test_tree_strs = []
+        for idx, tree_str in enumerate(all_tree_strs):
+            test_tree_strs.extend([tree_str] * weights[idx])
+        test_trees = dendropy.TreeList.get_from_string(
+                "\n".join(test_tree_strs),
+                'newick',
+                taxon_namespace=taxon_namespace)
+        expected_freqs = {}
+        for idx, tree_str in enumerate(all_tree_strs):
+            tree = dendropy.Tree.get_from_string(tree_str, 'newick', taxon_namespace=taxon_namespace)
+            expected_freqs[frozenset(tree.encode_bipartitions())] = weights[idx]
+        return test_trees, expected_freqs
+
+    def testTopologyCounter(self):
+        test_trees, expected_counts = self.get_simple_trees()
+        tc = treesum.TopologyCounter()
+        for tree in test_trees:
+            tc.count(tree)
+        self.assertEqual(tc.total_trees_counted, len(test_trees))
+        for topology_hash in tc.topology_hash_map:
+            self.assertTrue(0 <= topology_hash < 2**128)
+        tree_freqs = tc.calc_tree_freqs(taxon_namespace=test_trees.taxon_namespace)
+        self.assertEqual(len(tree_freqs), len(expected_counts))
+        for tree, (count, freq) in tree_freqs.items():
+            b = frozenset(tree.encode_bipartitions())
+            self.assertEqual(count, expected_counts[b])
+            self.assertAlmostEqual(freq, float(expected_counts[b]) / len(test_trees))
+        tc2 = treesum.TopologyCounter()
+        tc2.update_topology_hash_map(tc.topology_hash_map, tc.topology_split_bitmasks)
+        tc2.update_topology_hash_map(tc.topology_hash_map, tc.topology_split_bitmasks)
+        self.assertEqual(tc2.total_trees_counted, 2 * len(test_trees))
+        self.assertEqual(sorted(tc2.topology_hash_map.values()), sorted(2 * c for c in expected_counts.values()))
+
+    def testTopologyFingerprintCollisions(self):
+        test_trees, expected_counts = self.get_simple_trees()
+        fingerprint = bitprocessing.split_bitmask_set_fingerprint
+        try:
+            # every topology has the same fingerprint
+            bitprocessing.split_bitmask_set_fingerprint = lambda split_bitmasks: 0
+            tc = treesum.TopologyCounter()
+            for tree in test_trees:
+                tc.count(tree)
+            ta = test_trees.as_tree_array()
+            topologies = ta.topologies()
+        finally:
+            bitprocessing.split_bitmask_set_fingerprint = fingerprint
+        tree_freqs = tc.calc_tree_freqs(taxon_namespace=test_trees.taxon_namespace)
+        self.assertEqual(len(tree_freqs), len(expected_counts))
+        for tree, (count, freq) in tree_freqs.items():
+            self.assertEqual(count, expected_counts[frozenset(tree.encode_bipartitions())])
+        self.assertEqual(len(topologies), len(expected_counts))
+        for tree in topologies:
+            b = frozenset(tree.encode_bipartitions())
+            self.assertAlmostEqual(tree.frequency, float(expected_counts[b]) / len(test_trees))
+
 if __name__ == "__main__":
     unittest.main()